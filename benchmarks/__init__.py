@@ -0,0 +1,4 @@
+"""
+성능 벤치마크 패키지
+합성 데이터셋 생성과 추천 시스템 성능 측정 도구
+"""
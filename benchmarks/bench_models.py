@@ -0,0 +1,254 @@
+"""
+추천 모델 비교 벤치마크
+합성 SQLite 데이터셋에서 오토인코더(RecommenderModel float, 동적 int8
+TorchScript)와 행렬 분해(ALS, float32/float16/int8 도서 행렬)를 같은 학습/평가
+회원으로 학습하여 모델 크기, 학습 시간,
+사용자 1명/배치 추론 지연시간, recall@k를 비교
+
+사용법:
+    python -m benchmarks.bench_models --scale 10k --epochs 30
+    python -m benchmarks.bench_models --scale 100k --baseline old.json
+"""
+import argparse
+import json
+import logging
+import platform
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import torch
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from benchmarks.bench_recommender import (
+    DEFAULT_DATA_DIR,
+    DEFAULT_RESULTS_DIR,
+    git_commit,
+    peak_rss_mb,
+    summarize,
+)
+from benchmarks.synthetic import SyntheticConfig, load_or_generate
+from bookstar.config import settings
+from bookstar.jobs.export import quantize_model, script_model, serialized_bytes
+from bookstar.jobs.train import (
+    evaluate,
+    interaction_loader,
+    interaction_matrix,
+    recommend_rows,
+    train_epoch,
+)
+from bookstar.models.factorization import QUANTIZATIONS, train_als
+from bookstar.models.recommender import RecommenderModel
+from bookstar.services.catalog import build_catalog
+
+
+def model_bytes(model) -> int:
+    """추론에 필요한 파라미터 메모리 (바이트)"""
+    if isinstance(model, RecommenderModel):
+        return sum(p.numel() * p.element_size() for p in model.parameters())
+    if isinstance(model, torch.jit.ScriptModule):
+        return serialized_bytes(model)
+    return model.nbytes
+
+
+def measure_model(
+    model,
+    eval_rows: list[tuple[np.ndarray, np.ndarray]],
+    k: int,
+    batch_size: int = 32
+) -> dict[str, Any]:
+    """정확도와 사용자 1명/배치 추론 지연시간을 측정합니다"""
+    inputs = [columns for columns, _ in eval_rows]
+    recommend_rows(model, inputs[:1], k)  # 워밍업
+
+    single_ms = []
+    for columns in inputs:
+        start = time.perf_counter()
+        recommend_rows(model, [columns], k)
+        single_ms.append((time.perf_counter() - start) * 1000)
+
+    batch_ms = []
+    for start_row in range(0, len(inputs), batch_size):
+        batch = inputs[start_row:start_row + batch_size]
+        start = time.perf_counter()
+        recommend_rows(model, batch, k)
+        batch_ms.append((time.perf_counter() - start) * 1000)
+
+    return {
+        'model_bytes': model_bytes(model),
+        'metrics': evaluate(model, [eval_rows], k),
+        'single_user': summarize(single_ms),
+        f'batch_{batch_size}': summarize(batch_ms),
+    }
+
+
+def train_models(
+    engine: Engine,
+    epochs: int,
+    seed: int
+) -> tuple[dict[str, Any], dict[str, float], list[tuple[np.ndarray, np.ndarray]]]:
+    """
+    같은 학습 회원으로 두 모델을 학습합니다
+
+    Returns:
+        (이름 -> 모델, 이름 -> 학습 시간(초), 평가 회원 (입력, 정답) 목록)
+    """
+    config = settings.training
+    with Session(engine) as db:
+        catalog = build_catalog(db)
+
+    def loader(split):
+        return interaction_loader(
+            engine, catalog.aladin_map, split, config.batch_size,
+            eval_modulo=config.eval_modulo,
+        )
+
+    train_rows = [columns for batch in loader("train") for columns in batch]
+    eval_rows = [pair for batch in loader("eval") for pair in batch]
+
+    torch.manual_seed(seed)
+    start = time.perf_counter()
+    autoencoder = RecommenderModel(catalog.size)
+    optimizer = torch.optim.Adagrad(
+        autoencoder.parameters(), lr=settings.recommendation.learning_rate
+    )
+    batches = [
+        train_rows[i:i + config.batch_size]
+        for i in range(0, len(train_rows), config.batch_size)
+    ]
+    for _ in range(epochs):
+        train_epoch(autoencoder, optimizer, batches, catalog.size, config.corruption)
+    autoencoder_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    factorization = train_als(
+        interaction_matrix(train_rows, catalog.size),
+        factors=config.factors,
+        regularization=config.regularization,
+        alpha=config.alpha,
+        iterations=config.als_iterations,
+        seed=seed,
+    )
+    factorization_s = time.perf_counter() - start
+
+    models: dict[str, Any] = {
+        'autoencoder': autoencoder,
+        'autoencoder_int8': script_model(quantize_model(autoencoder)),
+    }
+    train_s = {
+        'autoencoder': round(autoencoder_s, 2),
+        'autoencoder_int8': round(autoencoder_s, 2),
+    }
+    for kind in QUANTIZATIONS:
+        models[f'factorization_{kind}'] = factorization.quantize(kind)
+        train_s[f'factorization_{kind}'] = round(factorization_s, 2)
+    return models, train_s, eval_rows
+
+
+def run_model_benchmark(
+    scale: str = "10k",
+    epochs: int = 30,
+    k: int = 10,
+    seed: int = 42,
+    db_path: Path | None = None,
+    regenerate: bool = False
+) -> dict:
+    """모델 비교 벤치마크를 실행하고 결과 딕셔너리를 반환합니다"""
+    config = SyntheticConfig.from_scale(scale, seed=seed)
+    db_path = db_path or DEFAULT_DATA_DIR / f"synthetic_{scale}_seed{seed}.sqlite"
+    engine = load_or_generate(db_path, config, regenerate=regenerate)
+
+    models, train_s, eval_rows = train_models(engine, epochs, seed)
+    results = {}
+    for name, model in models.items():
+        results[name] = {
+            'train_s': train_s[name],
+            **measure_model(model, eval_rows, k),
+        }
+
+    return {
+        'meta': {
+            'benchmark': 'models',
+            'scale': scale,
+            'seed': seed,
+            'epochs': epochs,
+            'k': k,
+            'dataset': {
+                'interactions': config.num_interactions,
+                'books': config.num_books,
+                'members': config.num_members,
+            },
+            'eval_users': len(eval_rows),
+            'git_commit': git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+        },
+        'results': results,
+        'peak_rss_mb': peak_rss_mb(),
+    }
+
+
+def compare(current: dict, baseline: dict) -> list[str]:
+    """기준선 대비 모델별 p50 지연시간/recall 변화"""
+    lines = []
+    k = current['meta']['k']
+    for name, result in current['results'].items():
+        base = baseline.get('results', {}).get(name)
+        if not base:
+            continue
+        for label, new, old in (
+            ("single p50_ms", result['single_user']['p50_ms'],
+             base['single_user']['p50_ms']),
+            (f"recall@{k}", result['metrics'][f'recall@{k}'],
+             base['metrics'].get(f'recall@{k}', 0.0)),
+        ):
+            change = (new - old) / old * 100 if old else 0.0
+            lines.append(
+                f"{name:<24} {label:<14} {old:>10.3f} -> {new:>10.3f} "
+                f"({change:+.1f}%)"
+            )
+    return lines
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="추천 모델 비교 벤치마크")
+    parser.add_argument("--scale", default="10k", help="1k, 10k, 100k, 1m")
+    parser.add_argument("--epochs", type=int, default=30, help="오토인코더 에포크 수")
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--db", type=Path, help="합성 SQLite 파일 경로")
+    parser.add_argument("--regenerate", action="store_true", help="데이터셋 재생성")
+    parser.add_argument("--output", type=Path, help="결과 JSON 경로")
+    parser.add_argument("--baseline", type=Path, help="비교할 기준선 JSON")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+
+    result = run_model_benchmark(
+        scale=args.scale,
+        epochs=args.epochs,
+        k=args.k,
+        seed=args.seed,
+        db_path=args.db,
+        regenerate=args.regenerate,
+    )
+
+    output = args.output or DEFAULT_RESULTS_DIR / f"models_{args.scale}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(
+        json.dumps(result, indent=2, ensure_ascii=False), encoding='utf-8'
+    )
+    print(json.dumps(result, indent=2, ensure_ascii=False))  # noqa: T201
+    print(f"결과 저장: {output}")  # noqa: T201
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding='utf-8'))
+        print("\n".join(compare(result, baseline)))  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+"""
+추천 시스템 엔드투엔드 벤치마크
+합성 SQLite 데이터셋에서 추천 단계별 지연시간(cold/warm)과 최대 RSS를 측정하여
+커밋 간 비교 가능한 JSON 기준선으로 저장
+
+사용법:
+    python -m benchmarks.bench_recommender --scale 10k
+    python -m benchmarks.bench_recommender --scale 100k --baseline old.json
+"""
+import argparse
+import json
+import logging
+import platform
+import resource
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+from sqlalchemy import distinct, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from benchmarks.synthetic import SyntheticConfig, load_or_generate
+from bookstar.models.models import MemberBook
+from bookstar.services.recommendation import (
+    RecommendationService,
+    clear_caches,
+    recommend_books,
+)
+
+DEFAULT_DATA_DIR = Path(__file__).parent / "data"
+DEFAULT_RESULTS_DIR = Path(__file__).parent / "results"
+
+
+def peak_rss_mb() -> float:
+    """프로세스 최대 RSS (MB)"""
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(max_rss / divisor, 2)
+
+
+def summarize(samples_ms: list[float]) -> dict[str, float]:
+    """지연시간 표본을 백분위수로 요약합니다"""
+    values = np.asarray(samples_ms)
+    return {
+        'n': len(values),
+        'mean_ms': round(float(values.mean()), 3),
+        'p50_ms': round(float(np.percentile(values, 50)), 3),
+        'p95_ms': round(float(np.percentile(values, 95)), 3),
+        'p99_ms': round(float(np.percentile(values, 99)), 3),
+        'max_ms': round(float(values.max()), 3),
+    }
+
+
+def git_commit() -> str | None:
+    """현재 커밋 해시 (git 저장소가 아니면 None)"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=Path(__file__).parent
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def sample_users(session: Session, count: int, seed: int) -> list[int]:
+    """이력이 있는 회원 중 벤치마크 대상 사용자를 무작위로 고릅니다"""
+    member_ids = (
+        session.execute(select(distinct(MemberBook.member_id))).scalars().all()
+    )
+    rng = np.random.default_rng(seed)
+    chosen = rng.choice(member_ids, size=min(count, len(member_ids)), replace=False)
+    return [int(uid) for uid in chosen]
+
+
+def _read_lists(session: Session, user_id: int) -> tuple[list[str], list[str]]:
+    rows = session.execute(
+        select(MemberBook.book_id, MemberBook.reading_status)
+        .where(MemberBook.member_id == user_id)
+    ).all()
+    read_list = [
+        str(bid) for bid, status in rows if status.value in ("READED", "READING")
+    ]
+    want_list = [
+        str(bid) for bid, status in rows if status.value == "WANT_TO_READ"
+    ]
+    return read_list, want_list
+
+
+def benchmark_targets(
+    session_factory: sessionmaker
+) -> dict[str, Callable[[int], object]]:
+    """측정 대상 함수 목록 (사용자 ID를 받아 한 번 실행)"""
+
+    def content(user_id: int) -> object:
+        with session_factory() as db:
+            return RecommendationService(db).get_content_based_recommendations(user_id)
+
+    def similar_users(user_id: int) -> object:
+        with session_factory() as db:
+            return RecommendationService(db).get_similar_users(user_id)
+
+    def collaborative(user_id: int) -> object:
+        with session_factory() as db:
+            return RecommendationService(db).get_collaborative_recommendations(user_id)
+
+    def hybrid(user_id: int) -> object:
+        with session_factory() as db:
+            read_list, want_list = _read_lists(db, user_id)
+            return recommend_books(db, user_id, read_list, want_list)
+
+    return {
+        'get_content_based_recommendations': content,
+        'get_similar_users': similar_users,
+        'get_collaborative_recommendations': collaborative,
+        'recommend_books': hybrid,
+    }
+
+
+def run_target(
+    func: Callable[[int], object], 
+    users: list[int], 
+    warm_repeats: int
+) -> dict:
+    """
+    한 대상 함수의 cold/warm 지연시간을 측정합니다
+
+    cold: 매 호출 전에 전역 캐시를 비운 상태
+    warm: 같은 사용자에 대해 한 번 실행해 캐시를 채운 뒤 반복 호출
+    """
+    cold_ms = []
+    for user_id in users:
+        clear_caches()
+        start = time.perf_counter()
+        func(user_id)
+        cold_ms.append((time.perf_counter() - start) * 1000)
+
+    warm_ms = []
+    clear_caches()
+    for user_id in users:
+        func(user_id)
+        for _ in range(warm_repeats):
+            start = time.perf_counter()
+            func(user_id)
+            warm_ms.append((time.perf_counter() - start) * 1000)
+
+    return {
+        'cold': summarize(cold_ms),
+        'warm': summarize(warm_ms),
+        'peak_rss_mb': peak_rss_mb(),
+    }
+
+
+def compare(current: dict, baseline: dict) -> list[str]:
+    """기준선 대비 p50/p95 변화율을 사람이 읽을 수 있는 문자열로 만듭니다"""
+    lines = []
+    for name, result in current['results'].items():
+        base = baseline.get('results', {}).get(name)
+        if not base:
+            continue
+        for mode in ('cold', 'warm'):
+            for metric in ('p50_ms', 'p95_ms'):
+                new, old = result[mode][metric], base[mode][metric]
+                change = (new - old) / old * 100 if old else 0.0
+                lines.append(
+                    f"{name:<36} {mode:<5} {metric:<7} "
+                    f"{old:>10.3f} -> {new:>10.3f} ({change:+.1f}%)"
+                )
+    return lines
+
+
+def run_benchmark(
+    scale: str = "10k",
+    users: int = 50,
+    warm_repeats: int = 3,
+    seed: int = 42,
+    db_path: Path | None = None,
+    regenerate: bool = False
+) -> dict:
+    """벤치마크 전체를 실행하고 결과 딕셔너리를 반환합니다"""
+    config = SyntheticConfig.from_scale(scale, seed=seed)
+    db_path = db_path or DEFAULT_DATA_DIR / f"synthetic_{scale}_seed{seed}.sqlite"
+
+    generate_start = time.perf_counter()
+    engine = load_or_generate(db_path, config, regenerate=regenerate)
+    setup_seconds = time.perf_counter() - generate_start
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+
+    with session_factory() as session:
+        target_users = sample_users(session, users, seed)
+
+    results = {}
+    for name, func in benchmark_targets(session_factory).items():
+        results[name] = run_target(func, target_users, warm_repeats)
+
+    return {
+        'meta': {
+            'benchmark': 'recommender',
+            'scale': scale,
+            'seed': seed,
+            'dataset': {
+                'interactions': config.num_interactions,
+                'books': config.num_books,
+                'members': config.num_members,
+            },
+            'users_sampled': len(target_users),
+            'warm_repeats': warm_repeats,
+            'setup_seconds': round(setup_seconds, 2),
+            'git_commit': git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+        },
+        'results': results,
+        'peak_rss_mb': peak_rss_mb(),
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="추천 시스템 벤치마크")
+    parser.add_argument("--scale", default="10k", help="1k, 10k, 100k, 1m")
+    parser.add_argument("--users", type=int, default=50, help="측정 대상 사용자 수")
+    parser.add_argument("--warm-repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--db", type=Path, help="합성 SQLite 파일 경로")
+    parser.add_argument("--regenerate", action="store_true", help="데이터셋 재생성")
+    parser.add_argument("--output", type=Path, help="결과 JSON 경로")
+    parser.add_argument("--baseline", type=Path, help="비교할 기준선 JSON")
+    args = parser.parse_args(argv)
+
+    # 서비스 로그가 측정에 영향을 주지 않도록 경고 이상만 출력
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger('performance').propagate = False
+
+    result = run_benchmark(
+        scale=args.scale,
+        users=args.users,
+        warm_repeats=args.warm_repeats,
+        seed=args.seed,
+        db_path=args.db,
+        regenerate=args.regenerate,
+    )
+
+    output = args.output or DEFAULT_RESULTS_DIR / f"recommender_{args.scale}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(
+        json.dumps(result, indent=2, ensure_ascii=False), encoding='utf-8'
+    )
+    print(json.dumps(result, indent=2, ensure_ascii=False))  # noqa: T201
+    print(f"결과 저장: {output}")  # noqa: T201
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding='utf-8'))
+        print("\n".join(compare(result, baseline)))  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
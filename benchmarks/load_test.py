@@ -0,0 +1,375 @@
+"""
+/recommend_books HTTP 부하 테스트
+합성 SQLite 데이터셋에 연결된 bookstar.main.app을 프로세스 내 uvicorn 서버로
+띄우고, 목표 동시성으로 요청을 보내 처리량/지연시간/오류율/이벤트 루프 지연을 측정
+
+네트워크나 MySQL 없이 오프라인으로 실행되며, 결과 JSON은 커밋 간 비교할 수 있습니다.
+클라이언트와 서버가 같은 프로세스(GIL)를 공유하므로 측정값은 워커 1개의
+보수적인 상한으로 해석합니다.
+
+사용법:
+    python -m benchmarks.load_test --scale 10k --concurrency 16 --duration 30
+"""
+import argparse
+import asyncio
+import json
+import logging
+import socket
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+import httpx
+import numpy as np
+import uvicorn
+from sqlalchemy import func, select
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.bench_recommender import (
+    DEFAULT_DATA_DIR,
+    DEFAULT_RESULTS_DIR,
+    git_commit,
+    peak_rss_mb,
+    summarize,
+)
+from benchmarks.synthetic import SyntheticConfig, load_or_generate
+from bookstar.database.connection import get_db
+from bookstar.main import app
+from bookstar.models.models import Member, MemberBook
+
+USER_GROUPS = ("cold", "regular", "heavy")
+
+
+@dataclass
+class UserPopulation:
+    """사용자 그룹별 ID 목록과 요청 비율"""
+
+    groups: dict[str, list[int]]
+    mix: dict[str, float]
+
+    def sampler(self, seed: int):
+        """그룹 비율에 따라 (그룹, 사용자 ID)를 뽑는 함수를 반환합니다"""
+        rng = np.random.default_rng(seed)
+        names = [name for name in USER_GROUPS if self.groups.get(name)]
+        weights = np.array([self.mix.get(name, 0.0) for name in names])
+        weights = weights / weights.sum()
+
+        def sample() -> tuple[str, int]:
+            group = names[rng.choice(len(names), p=weights)]
+            user_ids = self.groups[group]
+            return group, user_ids[rng.integers(len(user_ids))]
+
+        return sample
+
+
+def build_population(
+    session_factory: sessionmaker, 
+    mix: dict[str, float]
+) -> UserPopulation:
+    """
+    합성 데이터에서 사용자 그룹을 구성합니다
+
+    - cold: 도서 이력이 없는 회원 (랜덤 추천 경로)
+    - heavy: 이력 수 상위 10% 회원
+    - regular: 나머지 이력 보유 회원
+    """
+    with session_factory() as db:
+        activity = db.execute(
+            select(MemberBook.member_id, func.count())
+            .group_by(MemberBook.member_id)
+            .order_by(func.count().desc())
+        ).all()
+        all_members = db.execute(select(Member.id)).scalars().all()
+
+    active_ids = [int(member_id) for member_id, _ in activity]
+    heavy_count = max(len(active_ids) // 10, 1)
+    active_set = set(active_ids)
+    return UserPopulation(
+        groups={
+            'cold': [int(mid) for mid in all_members if mid not in active_set],
+            'regular': active_ids[heavy_count:],
+            'heavy': active_ids[:heavy_count],
+        },
+        mix=mix,
+    )
+
+
+@dataclass
+class LoadResults:
+    """부하 테스트 중 수집된 측정값"""
+
+    latencies_ms: dict[str, list[float]] = field(
+        default_factory=lambda: {name: [] for name in USER_GROUPS}
+    )
+    status_codes: Counter = field(default_factory=Counter)
+    errors: Counter = field(default_factory=Counter)
+    loop_lag_ms: list[float] = field(default_factory=list)
+
+
+class InProcessServer:
+    """별도 스레드의 이벤트 루프에서 uvicorn 서버를 실행하고 루프 지연을 측정"""
+
+    def __init__(self, lag_interval_ms: float = 10):
+        self.lag_interval = lag_interval_ms / 1000
+        self.lag_samples_ms: list[float] = []
+        self._measure_lag = False
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._sock.bind(("127.0.0.1", 0))
+        self.port = self._sock.getsockname()[1]
+        self.server = uvicorn.Server(uvicorn.Config(
+            app, log_level="warning", access_log=False, lifespan="on"
+        ))
+        self._thread = threading.Thread(
+            target=lambda: asyncio.run(self._serve()), name="load-test-server",
+            daemon=True
+        )
+
+    async def _lag_probe(self) -> None:
+        while not self.server.should_exit:
+            start = time.perf_counter()
+            await asyncio.sleep(self.lag_interval)
+            if self._measure_lag:
+                lag = time.perf_counter() - start - self.lag_interval
+                self.lag_samples_ms.append(max(lag, 0.0) * 1000)
+
+    async def _serve(self) -> None:
+        probe = asyncio.create_task(self._lag_probe())
+        await self.server.serve(sockets=[self._sock])
+        await probe
+
+    def start(self, timeout: float = 30) -> None:
+        self._thread.start()
+        deadline = time.monotonic() + timeout
+        while not self.server.started:
+            if time.monotonic() > deadline:
+                raise RuntimeError("부하 테스트 서버가 시작되지 않았습니다")
+            time.sleep(0.05)
+
+    def wait_until_ready(self, timeout: float = 300) -> dict:
+        """/ready가 200을 반환할 때까지(워밍업 완료) 기다립니다"""
+        deadline = time.monotonic() + timeout
+        url = f"http://127.0.0.1:{self.port}/ready"
+        while True:
+            response = httpx.get(url, timeout=5)
+            if response.status_code == 200:
+                return response.json()
+            if time.monotonic() > deadline:
+                raise RuntimeError("부하 테스트 서버 워밍업이 끝나지 않았습니다")
+            time.sleep(0.1)
+
+    def start_lag_measurement(self) -> None:
+        self.lag_samples_ms.clear()
+        self._measure_lag = True
+
+    def stop(self) -> None:
+        self._measure_lag = False
+        self.server.should_exit = True
+        self._thread.join(timeout=30)
+
+
+async def drive(
+    base_url: str,
+    population: UserPopulation,
+    concurrency: int,
+    duration_s: float,
+    warmup_s: float,
+    seed: int,
+    on_measure_start=None
+) -> tuple[LoadResults, float]:
+    """
+    동시성 수만큼의 클라이언트로 지정된 시간 동안 요청을 보냅니다
+
+    Returns:
+        (측정 결과, 실제 측정 시간(초))
+    """
+    results = LoadResults()
+    sample = population.sampler(seed)
+    limits = httpx.Limits(max_connections=concurrency)
+
+    client = httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30)
+    async with client:
+        async def worker(stop_at: float, record: bool) -> None:
+            while time.perf_counter() < stop_at:
+                group, user_id = sample()
+                start = time.perf_counter()
+                try:
+                    response = await client.post(
+                        "/recommend_books", json={"user_id": user_id}
+                    )
+                    status = response.status_code
+                except httpx.HTTPError as e:
+                    if record:
+                        results.errors[type(e).__name__] += 1
+                    continue
+                if record:
+                    results.latencies_ms[group].append(
+                        (time.perf_counter() - start) * 1000
+                    )
+                    results.status_codes[status] += 1
+
+        if warmup_s > 0:
+            warmup_end = time.perf_counter() + warmup_s
+            await asyncio.gather(
+                *(worker(warmup_end, False) for _ in range(concurrency))
+            )
+
+        if on_measure_start is not None:
+            on_measure_start()
+        measure_start = time.perf_counter()
+        stop_at = measure_start + duration_s
+        await asyncio.gather(*(worker(stop_at, True) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - measure_start
+
+    return results, elapsed
+
+
+def build_report(results: LoadResults, elapsed_s: float) -> dict:
+    """측정 결과를 비교 가능한 요약 딕셔너리로 만듭니다"""
+    all_latencies = [
+        latency for samples in results.latencies_ms.values() for latency in samples
+    ]
+    completed = len(all_latencies)
+    failed_requests = sum(results.errors.values()) + sum(
+        count for status, count in results.status_codes.items() if status >= 400
+    )
+    total = completed + sum(results.errors.values())
+    return {
+        'requests': total,
+        'throughput_rps': round(completed / elapsed_s, 2) if elapsed_s else 0.0,
+        'error_rate': round(failed_requests / total, 4) if total else 0.0,
+        'status_codes': {str(code): n for code, n in results.status_codes.items()},
+        'errors': dict(results.errors),
+        'latency': summarize(all_latencies) if all_latencies else None,
+        'latency_by_group': {
+            group: summarize(samples)
+            for group, samples in results.latencies_ms.items() if samples
+        },
+        'event_loop_lag': (
+            summarize(results.loop_lag_ms) if results.loop_lag_ms else None
+        ),
+    }
+
+
+def parse_mix(value: str) -> dict[str, float]:
+    """'cold=0.2,regular=0.6,heavy=0.2' 형식의 그룹 비율을 파싱합니다"""
+    mix = {}
+    for part in value.split(","):
+        name, _, ratio = part.partition("=")
+        if name.strip() not in USER_GROUPS:
+            raise argparse.ArgumentTypeError(f"알 수 없는 사용자 그룹: {name}")
+        mix[name.strip()] = float(ratio)
+    return mix
+
+
+def run_load_test(
+    scale: str = "10k",
+    concurrency: int = 16,
+    duration_s: float = 30,
+    warmup_s: float = 5,
+    mix: dict[str, float] | None = None,
+    seed: int = 42,
+    db_path: Path | None = None,
+    app_log_level: str = "WARNING"
+) -> dict:
+    """부하 테스트 전체를 실행하고 결과 딕셔너리를 반환합니다"""
+    mix = mix or {'cold': 0.2, 'regular': 0.6, 'heavy': 0.2}
+    config = SyntheticConfig.from_scale(scale, seed=seed)
+    db_path = db_path or DEFAULT_DATA_DIR / f"synthetic_{scale}_seed{seed}.sqlite"
+    engine = load_or_generate(db_path, config)
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+    population = build_population(session_factory, mix)
+
+    def get_synthetic_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = get_synthetic_db
+    server = InProcessServer()
+    try:
+        server.start()
+        readiness = server.wait_until_ready()
+        # lifespan에서 설정된 로그 레벨을 낮춰 콘솔 출력이 측정을 방해하지 않도록 함
+        logging.getLogger().setLevel(app_log_level)
+        results, elapsed = asyncio.run(drive(
+            f"http://127.0.0.1:{server.port}",
+            population,
+            concurrency,
+            duration_s,
+            warmup_s,
+            seed,
+            on_measure_start=server.start_lag_measurement,
+        ))
+        results.loop_lag_ms = list(server.lag_samples_ms)
+    finally:
+        server.stop()
+        app.dependency_overrides.pop(get_db, None)
+
+    return {
+        'meta': {
+            'benchmark': 'load_test',
+            'endpoint': '/recommend_books',
+            'scale': scale,
+            'seed': seed,
+            'concurrency': concurrency,
+            'duration_s': duration_s,
+            'warmup_s': warmup_s,
+            'mix': mix,
+            'population': {
+                group: len(ids) for group, ids in population.groups.items()
+            },
+            'warmup': readiness,
+            'git_commit': git_commit(),
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+        },
+        'results': build_report(results, elapsed),
+        'peak_rss_mb': peak_rss_mb(),
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="/recommend_books 부하 테스트")
+    parser.add_argument("--scale", default="10k", help="1k, 10k, 100k, 1m")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=30, help="측정 시간(초)")
+    parser.add_argument("--warmup", type=float, default=5, help="워밍업 시간(초)")
+    parser.add_argument(
+        "--mix", type=parse_mix, default="cold=0.2,regular=0.6,heavy=0.2",
+        help="사용자 그룹 비율"
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--db", type=Path, help="합성 SQLite 파일 경로")
+    parser.add_argument("--app-log-level", default="WARNING")
+    parser.add_argument("--output", type=Path, help="결과 JSON 경로")
+    args = parser.parse_args(argv)
+
+    report = run_load_test(
+        scale=args.scale,
+        concurrency=args.concurrency,
+        duration_s=args.duration,
+        warmup_s=args.warmup,
+        mix=args.mix,
+        seed=args.seed,
+        db_path=args.db,
+        app_log_level=args.app_log_level,
+    )
+
+    output = args.output or (
+        DEFAULT_RESULTS_DIR / f"load_{args.scale}_c{args.concurrency}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(
+        json.dumps(report, indent=2, ensure_ascii=False), encoding='utf-8'
+    )
+    print(json.dumps(report, indent=2, ensure_ascii=False))  # noqa: T201
+    print(f"결과 저장: {output}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+워커 시작 비용 벤치마크
+새 인터프리터에서 bookstar.main을 임포트하는 데 걸리는 시간과 RSS를 측정하여
+무거운 ML 모듈(torch/sklearn/pandas)이 시작 경로에 다시 들어오는 것을 감지
+
+사용법:
+    python -m benchmarks.startup --repeats 5
+    python -m benchmarks.startup --baseline benchmarks/results/startup.json
+"""
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from benchmarks.bench_recommender import DEFAULT_RESULTS_DIR, git_commit
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# 시작 시점에 로드되면 안 되는 무거운 모듈
+HEAVY_MODULES = ("torch", "sklearn", "scipy", "pandas")
+
+# 자식 프로세스에서 실행할 측정 코드 (결과를 JSON 한 줄로 출력)
+_PROBE = """
+import json, resource, sys, time
+start = time.perf_counter()
+import {module}
+elapsed_ms = (time.perf_counter() - start) * 1000
+from bookstar.utils.lazy import is_loaded
+max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+print(json.dumps({{
+    "import_ms": elapsed_ms,
+    "rss_mb": max_rss / divisor,
+    "loaded": [
+        name for name in {heavy!r}
+        if name in sys.modules and is_loaded(sys.modules[name])
+    ],
+}}))
+"""
+
+
+def measure_once(module: str = "bookstar.main") -> dict:
+    """새 인터프리터에서 모듈 임포트 시간/RSS를 한 번 측정합니다"""
+    code = _PROBE.format(module=module, heavy=HEAVY_MODULES)
+    completed = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True, text=True, check=True, cwd=PROJECT_ROOT
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def run_startup_benchmark(module: str = "bookstar.main", repeats: int = 5) -> dict:
+    """여러 번 측정하여 중앙값 기준 결과 딕셔너리를 반환합니다"""
+    samples = [measure_once(module) for _ in range(repeats)]
+    import_ms = [sample['import_ms'] for sample in samples]
+    rss_mb = [sample['rss_mb'] for sample in samples]
+    return {
+        'meta': {
+            'benchmark': 'startup',
+            'module': module,
+            'repeats': repeats,
+            'git_commit': git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+        },
+        'results': {
+            'import_ms_median': round(statistics.median(import_ms), 2),
+            'import_ms_min': round(min(import_ms), 2),
+            'import_ms_max': round(max(import_ms), 2),
+            'rss_mb_median': round(statistics.median(rss_mb), 2),
+            'heavy_modules_loaded': samples[-1]['loaded'],
+        },
+    }
+
+
+def compare(current: dict, baseline: dict) -> list[str]:
+    """기준선 대비 임포트 시간/RSS 변화율"""
+    lines = []
+    for metric in ('import_ms_median', 'rss_mb_median'):
+        new = current['results'][metric]
+        old = baseline.get('results', {}).get(metric)
+        if not old:
+            continue
+        change = (new - old) / old * 100
+        lines.append(f"{metric:<18} {old:>10.2f} -> {new:>10.2f} ({change:+.1f}%)")
+    return lines
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="워커 시작 비용 벤치마크")
+    parser.add_argument("--module", default="bookstar.main", help="측정할 모듈")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--output", type=Path, help="결과 JSON 경로")
+    parser.add_argument("--baseline", type=Path, help="비교할 기준선 JSON")
+    args = parser.parse_args(argv)
+
+    result = run_startup_benchmark(args.module, args.repeats)
+
+    output = args.output or DEFAULT_RESULTS_DIR / "startup.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(
+        json.dumps(result, indent=2, ensure_ascii=False), encoding='utf-8'
+    )
+    print(json.dumps(result, indent=2, ensure_ascii=False))  # noqa: T201
+    print(f"결과 저장: {output}")  # noqa: T201
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding='utf-8'))
+        print("\n".join(compare(result, baseline)))  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+"""
+합성 데이터 생성 모듈
+실제 서비스와 비슷한 편향(Zipf 인기도, 카테고리 분포, 헤비 리더)을 가진
+Book / Member / MemberBook 데이터를 SQLite에 생성
+"""
+import logging
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import StaticPool
+
+from bookstar.models.models import (
+    Base,
+    Book,
+    BookCategory,
+    Member,
+    MemberBook,
+    ReadingStatus,
+)
+
+logger = logging.getLogger(__name__)
+
+# 벤치마크 규모 프리셋 (member_book 행 수 기준)
+SCALES: dict[str, int] = {
+    "1k": 1_000,
+    "10k": 10_000,
+    "100k": 100_000,
+    "1m": 1_000_000,
+}
+
+ALADIN_ID_OFFSET = 9_780_000_000_000
+INSERT_CHUNK_SIZE = 50_000
+
+
+@dataclass(frozen=True)
+class SyntheticConfig:
+    """합성 데이터 생성 설정"""
+
+    num_interactions: int
+    num_books: int
+    num_members: int
+    num_authors: int
+    cold_start_ratio: float = 0.1
+    book_popularity_exponent: float = 1.1
+    member_activity_exponent: float = 0.8
+    category_exponent: float = 1.0
+    seed: int = 42
+
+    @classmethod
+    def from_scale(cls, scale: str, seed: int = 42) -> "SyntheticConfig":
+        """규모 프리셋 이름으로 설정을 생성합니다"""
+        if scale not in SCALES:
+            raise ValueError(f"알 수 없는 규모: {scale} (가능한 값: {list(SCALES)})")
+        num_interactions = SCALES[scale]
+        num_books = max(num_interactions // 10, 50)
+        return cls(
+            num_interactions=num_interactions,
+            num_books=num_books,
+            num_members=max(num_interactions // 25, 20),
+            num_authors=max(num_books // 4, 10),
+            seed=seed,
+        )
+
+
+@dataclass(frozen=True)
+class SyntheticDataset:
+    """생성된 데이터셋 요약"""
+
+    books: int
+    members: int
+    interactions: int
+    active_members: int
+    config: SyntheticConfig
+
+    def to_dict(self) -> dict:
+        return {**asdict(self), 'config': asdict(self.config)}
+
+
+def _zipf_weights(n: int, exponent: float) -> np.ndarray:
+    """순위 기반 Zipf 확률 분포"""
+    weights = 1.0 / np.arange(1, n + 1, dtype=np.float64) ** exponent
+    return weights / weights.sum()
+
+
+def _random_words(
+    rng: np.random.Generator, 
+    vocabulary: np.ndarray, 
+    counts: np.ndarray
+) -> list[str]:
+    """어휘 사전에서 Zipf 분포로 단어를 뽑아 문장을 만듭니다"""
+    word_weights = _zipf_weights(len(vocabulary), 1.0)
+    words = rng.choice(vocabulary, size=int(counts.sum()), p=word_weights)
+    sentences = np.split(words, np.cumsum(counts)[:-1])
+    return [" ".join(sentence) for sentence in sentences]
+
+
+def _build_vocabulary(rng: np.random.Generator, size: int = 2000) -> np.ndarray:
+    """한글 음절로 구성된 임의 어휘 사전 (토크나이저 없는 텍스트 처리 검증용)"""
+    syllables = rng.integers(0xAC00, 0xD7A4, size=(size, 3))
+    lengths = rng.integers(1, 4, size=size)
+    return np.array([
+        "".join(chr(code) for code in row[:length])
+        for row, length in zip(syllables, lengths, strict=True)
+    ])
+
+
+def _insert_chunks(engine: Engine, table, rows: list[dict]) -> None:
+    with engine.begin() as conn:
+        for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+            conn.execute(table.insert(), rows[start:start + INSERT_CHUNK_SIZE])
+
+
+def generate_dataset(engine: Engine, config: SyntheticConfig) -> SyntheticDataset:
+    """
+    합성 데이터를 생성하여 엔진에 연결된 데이터베이스에 저장합니다
+
+    - 도서 인기도: Zipf 분포 (소수의 베스트셀러에 상호작용 집중)
+    - 카테고리: BookCategory 전체에 대해 Zipf 분포, 저자마다 주 카테고리 보유
+    - 회원 활동량: Zipf 분포 (헤비 리더), cold_start_ratio 비율은 이력 없음
+    - 독서 상태: 읽음 60%, 읽는 중 10%, 읽고 싶음 30%
+    """
+    rng = np.random.default_rng(config.seed)
+    Base.metadata.create_all(bind=engine)
+
+    # 1. 도서
+    categories = list(BookCategory)
+    category_order = rng.permutation(len(categories))
+    category_weights = _zipf_weights(len(categories), config.category_exponent)
+    author_categories = category_order[
+        rng.choice(len(categories), size=config.num_authors, p=category_weights)
+    ]
+    book_authors = rng.choice(
+        config.num_authors,
+        size=config.num_books,
+        p=_zipf_weights(config.num_authors, 0.7)
+    )
+    book_categories = author_categories[book_authors]
+    off_category = rng.random(config.num_books) < 0.2
+    book_categories[off_category] = rng.integers(
+        0, len(categories), size=int(off_category.sum())
+    )
+
+    vocabulary = _build_vocabulary(rng)
+    titles = _random_words(rng, vocabulary, rng.integers(1, 5, size=config.num_books))
+    descriptions = _random_words(
+        rng, vocabulary, rng.integers(5, 25, size=config.num_books)
+    )
+
+    book_rows = [
+        {
+            'id': i + 1,
+            'alading_book_id': ALADIN_ID_OFFSET + i,
+            'title': titles[i][:255],
+            'description': descriptions[i][:255],
+            'author': f"작가{book_authors[i]:05d}",
+            'book_category': categories[book_categories[i]],
+            'publisher': f"출판사{book_authors[i] % 97:02d}",
+            'page': int(rng.integers(80, 800)),
+        }
+        for i in range(config.num_books)
+    ]
+    _insert_chunks(engine, Book.__table__, book_rows)
+
+    # 2. 회원
+    member_rows = [{'id': i + 1, 'privacy': False} for i in range(config.num_members)]
+    _insert_chunks(engine, Member.__table__, member_rows)
+
+    # 3. 회원-도서 상호작용
+    num_active = max(int(config.num_members * (1 - config.cold_start_ratio)), 2)
+    active_members = rng.permutation(config.num_members)[:num_active] + 1
+    popularity_order = rng.permutation(config.num_books)
+    book_weights = _zipf_weights(config.num_books, config.book_popularity_exponent)
+    member_weights = _zipf_weights(num_active, config.member_activity_exponent)
+
+    max_pairs = num_active * config.num_books
+    target = min(config.num_interactions, max_pairs)
+    pairs = np.empty(0, dtype=np.int64)
+    while len(pairs) < target:
+        draw = int((target - len(pairs)) * 1.3) + 16
+        members = rng.choice(num_active, size=draw, p=member_weights)
+        books = popularity_order[
+            rng.choice(config.num_books, size=draw, p=book_weights)
+        ]
+        candidates = members.astype(np.int64) * config.num_books + books
+        pairs = np.unique(np.concatenate([pairs, candidates]))
+    pairs = rng.permutation(pairs)[:target]
+
+    statuses = rng.choice(
+        [ReadingStatus.READED, ReadingStatus.READING, ReadingStatus.WANT_TO_READ],
+        size=target,
+        p=[0.6, 0.1, 0.3]
+    )
+    member_ids = active_members[pairs // config.num_books]
+    aladin_ids = ALADIN_ID_OFFSET + pairs % config.num_books
+    interaction_rows = [
+        {
+            # SQLite는 BIGINT 기본키를 자동 증가시키지 않으므로 직접 지정
+            'id': i + 1,
+            'member_id': int(member_ids[i]),
+            'book_id': int(aladin_ids[i]),
+            'reading_status': statuses[i],
+        }
+        for i in range(target)
+    ]
+    _insert_chunks(engine, MemberBook.__table__, interaction_rows)
+
+    dataset = SyntheticDataset(
+        books=config.num_books,
+        members=config.num_members,
+        interactions=target,
+        active_members=len(np.unique(member_ids)),
+        config=config,
+    )
+    logger.info(f"합성 데이터 생성 완료: {dataset.to_dict()}")
+    return dataset
+
+
+def create_sqlite_engine(path: str | Path | None = None) -> Engine:
+    """SQLite 엔진을 생성합니다 (path가 없으면 메모리 DB)"""
+    if path is None:
+        # 여러 스레드/세션이 같은 메모리 DB를 공유하도록 StaticPool 사용
+        return create_engine(
+            "sqlite://",
+            connect_args={'check_same_thread': False},
+            poolclass=StaticPool,
+        )
+    return create_engine(
+        f"sqlite:///{path}", connect_args={'check_same_thread': False}
+    )
+
+
+def load_or_generate(
+    path: str | Path, 
+    config: SyntheticConfig, 
+    regenerate: bool = False
+) -> Engine:
+    """
+    SQLite 파일에 합성 데이터가 있으면 재사용하고 없으면 새로 생성합니다
+
+    같은 규모/시드의 데이터셋을 여러 벤치마크 실행에서 재사용하여
+    커밋 간 결과를 비교할 수 있도록 합니다.
+    """
+    db_path = Path(path)
+    if regenerate and db_path.exists():
+        db_path.unlink()
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+
+    engine = create_sqlite_engine(db_path)
+    Base.metadata.create_all(bind=engine)
+    with engine.connect() as conn:
+        existing = conn.execute(
+            select(func.count()).select_from(MemberBook.__table__)
+        ).scalar()
+
+    if not existing:
+        generate_dataset(engine, config)
+    return engine
@@ -1,184 +1,951 @@
 """
 설정 관리 모듈
 TOML 파일에서 설정을 읽어와 전역적으로 사용할 수 있도록 제공
+
+설정은 시작 시 한 번 파싱되어 불변(frozen) 데이터클래스 스냅샷으로 보관됩니다.
+핫 패스에서는 `settings.recommendation.read_book_weight`처럼 속성으로 읽고,
+기존 코드와의 호환을 위해 `settings.logging['level']` 형태의 접근도 지원합니다.
 """
+import logging
 import os
+import threading
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, fields, replace
 from pathlib import Path
 from typing import Any
 
 import toml
 
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+# 실행 중 다시 읽어도 바로 반영되는 섹션 (나머지는 재시작 후 적용)
+# 그 밖의 섹션은 시작할 때 만든 싱글턴(DB 엔진, 결과 캐시, 회로 차단기 등)과
+# 어긋나지 않도록 reload()에서 기존 값을 유지합니다.
+HOT_RELOADABLE_SECTIONS = frozenset({
+    'recommendation', 'logging', 'profiling', 'config_watch'
+})
+# 위 섹션 중 일부 필드만 바로 반영되는 섹션 (로그 핸들러/파일 설정은 시작할 때
+# 한 번 만들어지므로 재시작 후 적용)
+HOT_RELOADABLE_FIELDS = {
+    'logging': frozenset({
+        'level', 'performance_threshold_ms', 'db_threshold_ms', 'api_threshold_ms',
+        'heavy_threshold_ms', 'max_queries_per_request', 'enable_server_timing',
+    }),
+}
+VALID_LOG_LEVELS = ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
+VALID_MODEL_TYPES = ('autoencoder', 'factorization')
+VALID_QUANTIZATIONS = ('float32', 'float16', 'int8')
+VALID_SIMILARITY_METRICS = ('euclidean', 'jaccard')
+
+
+class _SectionMapping:
+    """설정 섹션을 딕셔너리처럼 읽을 수 있도록 하는 믹스인"""
+
+    __slots__ = ()
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.keys():
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.keys()
+
+    def keys(self) -> list[str]:
+        return [f.name for f in fields(self)]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in self.keys() else default
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def _check(section: str, name: str, valid: bool, value: Any, rule: str) -> None:
+    if not valid:
+        raise ValueError(f"잘못된 설정 값: [{section}] {name} = {value!r} ({rule})")
+
+
+@dataclass(frozen=True, slots=True)
+class AwsSettings(_SectionMapping):
+    """AWS 설정"""
+
+    region: str
+    bucket_name: str | None
+    access_key_id: str | None
+    secret_access_key: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class DatabaseSettings(_SectionMapping):
+    """데이터베이스 설정"""
+
+    user: str | None
+    password: str | None
+    host: str
+    port: int
+    name: str
+
+    def __post_init__(self):
+        _check('database', 'port', 1 <= self.port <= 65535, self.port, "1~65535")
+
+    @property
+    def url(self) -> str:
+        return (
+            f"mysql+pymysql://{self.user}:{self.password}"
+            f"@{self.host}:{self.port}/{self.name}"
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class AppSettings(_SectionMapping):
+    """애플리케이션 설정"""
+
+    cors_origins: list[str]
+    title: str
+    description: str
+    version: str
+
+
+@dataclass(frozen=True, slots=True)
+class ServerSettings(_SectionMapping):
+    """서버 설정"""
+
+    host: str
+    port: int
+
+    def __post_init__(self):
+        _check('server', 'port', 1 <= self.port <= 65535, self.port, "1~65535")
+
+
+@dataclass(frozen=True, slots=True)
+class RecommendationSettings(_SectionMapping):
+    """추천 시스템 설정"""
+
+    default_recommendations_count: int
+    similar_users_count: int
+    content_weight: float
+    collaborative_weight: float
+    # 사용자 선호도 계산 가중치
+    read_book_weight: float
+    unread_book_weight: float
+    category_preference_weight: float
+    author_preference_weight: float
+    text_similarity_weight: float
+    # 요청 시간 예산
+    deadline_ms: float
+    min_statement_timeout_ms: float
+    min_stage_budget_ms: float
+    # PyTorch 모델 훈련 설정
+    num_epochs: int
+    learning_rate: float
+
+    def __post_init__(self):
+        for name in ('default_recommendations_count', 'similar_users_count',
+                     'num_epochs'):
+            value = getattr(self, name)
+            _check('recommendation', name, value >= 1, value, "1 이상")
+        for name in ('content_weight', 'collaborative_weight'):
+            value = getattr(self, name)
+            _check('recommendation', name, 0 <= value <= 1, value, "0~1")
+        for name in ('read_book_weight', 'unread_book_weight',
+                     'category_preference_weight', 'author_preference_weight',
+                     'text_similarity_weight', 'deadline_ms',
+                     'min_stage_budget_ms'):
+            value = getattr(self, name)
+            _check('recommendation', name, value >= 0, value, "0 이상")
+        _check(
+            'recommendation', 'min_statement_timeout_ms',
+            self.min_statement_timeout_ms >= 1, self.min_statement_timeout_ms,
+            "1 이상"
+        )
+        _check(
+            'recommendation', 'learning_rate', self.learning_rate > 0,
+            self.learning_rate, "0보다 커야 함"
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ProfilingSettings(_SectionMapping):
+    """요청 샘플링 프로파일러 설정"""
+
+    enabled: bool
+    sample_rate: float
+    slow_threshold_ms: float
+    sampling_interval_ms: float
+    output_dir: str
+    top_n: int
+    max_files: int
+    max_total_mb: float
+
+    def __post_init__(self):
+        _check(
+            'profiling', 'sample_rate', 0 <= self.sample_rate <= 1,
+            self.sample_rate, "0~1"
+        )
+        _check(
+            'profiling', 'slow_threshold_ms', self.slow_threshold_ms >= 0,
+            self.slow_threshold_ms, "0 이상"
+        )
+        _check(
+            'profiling', 'sampling_interval_ms', self.sampling_interval_ms > 0,
+            self.sampling_interval_ms, "0보다 커야 함"
+        )
+        for name in ('top_n', 'max_files'):
+            value = getattr(self, name)
+            _check('profiling', name, value >= 1, value, "1 이상")
+
+
+@dataclass(frozen=True, slots=True)
+class LoggingSettings(_SectionMapping):
+    """로깅 관련 설정"""
+
+    level: str
+    use_json: bool
+    enable_console: bool
+    log_dir: str
+    performance_threshold_ms: int
+    max_file_size_mb: int
+    backup_count: int
+    enable_access_log: bool
+    enable_performance_log: bool
+    enable_traceback_log: bool
+    enable_server_timing: bool
+    # 직관적인 임계값 설정
+    db_threshold_ms: int
+    api_threshold_ms: int
+    heavy_threshold_ms: int
+    # 요청당 쿼리 수가 이 값을 넘으면 N+1 의심 경고
+    max_queries_per_request: int
+    # 로그 파일 로테이션 설정 (모든 로그에 일관된 보관 정책)
+    main_log_retention_days: int
+    error_log_retention_days: int
+    access_log_retention_days: int
+    performance_log_retention_days: int
+    traceback_log_retention_days: int
+
+    def __post_init__(self):
+        _check(
+            'logging', 'level', self.level.upper() in VALID_LOG_LEVELS,
+            self.level, f"{', '.join(VALID_LOG_LEVELS)} 중 하나"
+        )
+        for name in ('performance_threshold_ms', 'db_threshold_ms',
+                     'api_threshold_ms', 'heavy_threshold_ms', 'max_file_size_mb'):
+            value = getattr(self, name)
+            _check('logging', name, value > 0, value, "0보다 커야 함")
+        for name in ('backup_count', 'max_queries_per_request'):
+            value = getattr(self, name)
+            _check('logging', name, value >= 0, value, "0 이상")
+        for name in ('main_log_retention_days', 'error_log_retention_days',
+                     'access_log_retention_days', 'performance_log_retention_days',
+                     'traceback_log_retention_days'):
+            value = getattr(self, name)
+            _check('logging', name, value >= 1, value, "1 이상")
+
+
+@dataclass(frozen=True, slots=True)
+class ConfigWatchSettings(_SectionMapping):
+    """설정 파일 변경 감지(핫 리로드) 설정"""
+
+    enabled: bool
+    poll_interval_s: float
+
+    def __post_init__(self):
+        _check(
+            'config_watch', 'poll_interval_s', self.poll_interval_s > 0,
+            self.poll_interval_s, "0보다 커야 함"
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class WarmupSettings(_SectionMapping):
+    """시작 시 워밍업 설정"""
+
+    enabled: bool
+    background: bool
+    precompute_top_members: int
+    snapshot_refresh_s: float
+
+    def __post_init__(self):
+        _check(
+            'warmup', 'precompute_top_members', self.precompute_top_members >= 0,
+            self.precompute_top_members, "0 이상"
+        )
+        _check(
+            'warmup', 'snapshot_refresh_s', self.snapshot_refresh_s >= 0,
+            self.snapshot_refresh_s, "0 이상"
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ArtifactSettings(_SectionMapping):
+    """추천 아티팩트 설정"""
+
+    directory: str
+    load_on_startup: bool
+    neighbors_k: int
+    keep_versions: int
+    similarity: str
+    text_neighbors_k: int
+    text_chunk_size: int
+
+    def __post_init__(self):
+        for name in ('neighbors_k', 'keep_versions', 'text_chunk_size'):
+            value = getattr(self, name)
+            _check('artifacts', name, value >= 1, value, "1 이상")
+        _check(
+            'artifacts', 'text_neighbors_k', self.text_neighbors_k >= 0,
+            self.text_neighbors_k, "0 이상"
+        )
+        _check(
+            'artifacts', 'similarity',
+            self.similarity in VALID_SIMILARITY_METRICS, self.similarity,
+            f"다음 중 하나: {', '.join(VALID_SIMILARITY_METRICS)}"
+        )
+
+    @property
+    def path(self) -> Path:
+        """아티팩트 루트 경로 (상대 경로는 프로젝트 루트 기준)"""
+        return PROJECT_ROOT / self.directory
+
+
+@dataclass(frozen=True, slots=True)
+class ModelRegistrySettings(_SectionMapping):
+    """학습된 모델 레지스트리 설정"""
+
+    directory: str
+    max_loaded_models: int
+    load_on_startup: bool
+    mirror_to_s3: bool
+    s3_prefix: str
+
+    def __post_init__(self):
+        _check(
+            'model_registry', 'max_loaded_models', self.max_loaded_models >= 1,
+            self.max_loaded_models, "1 이상"
+        )
+
+    @property
+    def path(self) -> Path:
+        """레지스트리 루트 경로 (상대 경로는 프로젝트 루트 기준)"""
+        return PROJECT_ROOT / self.directory
+
+
+@dataclass(frozen=True, slots=True)
+class InferenceSettings(_SectionMapping):
+    """모델 추론(마이크로 배치) 설정"""
+
+    serve_model: bool
+    num_threads: int
+    max_batch_size: int
+    max_wait_ms: float
+
+    def __post_init__(self):
+        _check(
+            'inference', 'num_threads', self.num_threads >= 0,
+            self.num_threads, "0 이상 (0은 torch 기본값)"
+        )
+        _check(
+            'inference', 'max_batch_size', self.max_batch_size >= 1,
+            self.max_batch_size, "1 이상"
+        )
+        _check(
+            'inference', 'max_wait_ms', self.max_wait_ms >= 0,
+            self.max_wait_ms, "0 이상"
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ResultCacheSettings(_SectionMapping):
+    """추천 결과 캐시(stale-while-revalidate) 설정"""
+
+    enabled: bool
+    soft_ttl_s: float
+    hard_ttl_s: float
+    refresh_concurrency: int
+    max_entries: int
+
+    def __post_init__(self):
+        _check(
+            'result_cache', 'soft_ttl_s', self.soft_ttl_s >= 0,
+            self.soft_ttl_s, "0 이상"
+        )
+        _check(
+            'result_cache', 'hard_ttl_s', self.hard_ttl_s >= self.soft_ttl_s,
+            self.hard_ttl_s, f"soft_ttl_s({self.soft_ttl_s}) 이상"
+        )
+        _check(
+            'result_cache', 'refresh_concurrency', self.refresh_concurrency >= 1,
+            self.refresh_concurrency, "1 이상"
+        )
+        _check(
+            'result_cache', 'max_entries', self.max_entries >= 1,
+            self.max_entries, "1 이상"
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class CircuitBreakerSettings(_SectionMapping):
+    """추천 서비스 DB 회로 차단기 설정"""
+
+    enabled: bool
+    failure_threshold: int
+    slow_call_ms: float
+    window_s: float
+    open_s: float
+    half_open_probes: int
+
+    def __post_init__(self):
+        _check(
+            'circuit_breaker', 'failure_threshold', self.failure_threshold >= 1,
+            self.failure_threshold, "1 이상"
+        )
+        for name in ('slow_call_ms', 'window_s', 'open_s'):
+            value = getattr(self, name)
+            _check('circuit_breaker', name, value > 0, value, "0보다 큼")
+        _check(
+            'circuit_breaker', 'half_open_probes', self.half_open_probes >= 1,
+            self.half_open_probes, "1 이상"
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class TrainingSettings(_SectionMapping):
+    """오프라인 모델 학습 설정 (에포크 수/학습률은 [recommendation])"""
+
+    model_type: str
+    batch_size: int
+    num_workers: int
+    corruption: float
+    checkpoint_dir: str
+    checkpoint_every: int
+    eval_modulo: int
+    eval_k: int
+    factors: int
+    regularization: float
+    alpha: float
+    als_iterations: int
+    quantization: str
+    export_min_overlap: float
+    export_max_recall_drop: float
+
+    def __post_init__(self):
+        _check(
+            'training', 'model_type',
+            self.model_type in VALID_MODEL_TYPES, self.model_type,
+            f"다음 중 하나: {', '.join(VALID_MODEL_TYPES)}"
+        )
+        _check(
+            'training', 'quantization',
+            self.quantization in VALID_QUANTIZATIONS, self.quantization,
+            f"다음 중 하나: {', '.join(VALID_QUANTIZATIONS)}"
+        )
+        for name in (
+            'batch_size', 'checkpoint_every', 'eval_modulo', 'eval_k',
+            'factors', 'als_iterations',
+        ):
+            value = getattr(self, name)
+            _check('training', name, value >= 1, value, "1 이상")
+        for name in ('regularization', 'alpha'):
+            value = getattr(self, name)
+            _check('training', name, value >= 0, value, "0 이상")
+        _check(
+            'training', 'num_workers', self.num_workers >= 0,
+            self.num_workers, "0 이상"
+        )
+        _check(
+            'training', 'corruption', 0 <= self.corruption < 1,
+            self.corruption, "0 이상 1 미만"
+        )
+        for name in ('export_min_overlap', 'export_max_recall_drop'):
+            value = getattr(self, name)
+            _check('training', name, 0 <= value <= 1, value, "0 이상 1 이하")
+
+    @property
+    def checkpoint_path(self) -> Path:
+        """체크포인트 디렉토리 (상대 경로는 프로젝트 루트 기준)"""
+        return PROJECT_ROOT / self.checkpoint_dir
+
+
+@dataclass(frozen=True, slots=True)
+class SettingsSnapshot:
+    """한 시점의 전체 설정 (교체 단위)"""
+
+    aws: AwsSettings
+    database: DatabaseSettings
+    app: AppSettings
+    server: ServerSettings
+    recommendation: RecommendationSettings
+    profiling: ProfilingSettings
+    logging: LoggingSettings
+    config_watch: ConfigWatchSettings
+    warmup: WarmupSettings
+    artifacts: ArtifactSettings
+    model_registry: ModelRegistrySettings
+    inference: InferenceSettings
+    result_cache: ResultCacheSettings
+    circuit_breaker: CircuitBreakerSettings
+    training: TrainingSettings
+
+    def changed_fields(self, other: "SettingsSnapshot") -> dict[str, set[str]]:
+        """
+        다른 스냅샷과 비교하여 값이 바뀐 섹션별 필드 이름을 반환합니다
+
+        Returns:
+            {섹션 이름: 바뀐 필드 이름 집합} (바뀐 것이 없으면 빈 딕셔너리)
+        """
+        changes = {}
+        for section in fields(self):
+            old = getattr(self, section.name)
+            new = getattr(other, section.name)
+            if old == new:
+                continue
+            changes[section.name] = {
+                f.name for f in fields(old)
+                if getattr(old, f.name) != getattr(new, f.name)
+            }
+        return changes
+
+    @classmethod
+    def from_sources(
+        cls, 
+        config: dict[str, Any], 
+        secrets: dict[str, Any]
+    ) -> "SettingsSnapshot":
+        """
+        config.toml / .env.toml 내용과 환경변수로 스냅샷을 생성합니다
+
+        우선순위: 환경변수 > .env.toml > config.toml
+
+        Raises:
+            ValueError: 설정 값이 허용 범위를 벗어난 경우
+        """
+        aws_secrets = secrets.get('aws', {})
+        db_secrets = secrets.get('database', {})
+        app_config = config.get('app', {})
+        server_config = config.get('server', {})
+        rec_config = config.get('recommendation', {})
+        profiling_config = config.get('profiling', {})
+        logging_config = config.get('logging', {})
+        watch_config = config.get('config_watch', {})
+        warmup_config = config.get('warmup', {})
+        artifact_config = config.get('artifacts', {})
+        registry_config = config.get('model_registry', {})
+        inference_config = config.get('inference', {})
+        result_cache_config = config.get('result_cache', {})
+        breaker_config = config.get('circuit_breaker', {})
+        training_config = config.get('training', {})
+
+        return cls(
+            aws=AwsSettings(
+                region=os.getenv(
+                    'AWS_REGION', 
+                    aws_secrets.get('region', 'ap-northeast-2')
+                ),
+                bucket_name=os.getenv(
+                    'AWS_BUCKET_NAME', 
+                    aws_secrets.get('bucket_name')
+                ),
+                access_key_id=os.getenv(
+                    'AWS_ACCESS_KEY_ID', 
+                    aws_secrets.get('access_key_id')
+                ),
+                secret_access_key=os.getenv(
+                    'AWS_SECRET_ACCESS_KEY', 
+                    aws_secrets.get('secret_access_key')
+                ),
+            ),
+            database=DatabaseSettings(
+                user=os.getenv('DB_USER', db_secrets.get('user')),
+                password=os.getenv('DB_PASSWORD', db_secrets.get('password')),
+                host=os.getenv('DB_HOST', db_secrets.get('host', 'localhost')),
+                port=int(os.getenv('DB_PORT', str(db_secrets.get('port', 3306)))),
+                name=os.getenv('DB_NAME', db_secrets.get('name', 'bookstar')),
+            ),
+            app=AppSettings(
+                cors_origins=list(app_config.get('cors_origins', ["*"])),
+                title=app_config.get('title', 'BookStar AI'),
+                description=app_config.get(
+                    'description', 'AI 기반 도서 추천 시스템'
+                ),
+                version=app_config.get('version', '1.0.0'),
+            ),
+            server=ServerSettings(
+                host=os.getenv('SERVER_HOST', server_config.get('host', '0.0.0.0')),
+                port=int(os.getenv(
+                    'SERVER_PORT', str(server_config.get('port', 8000))
+                )),
+            ),
+            recommendation=RecommendationSettings(
+                default_recommendations_count=int(rec_config.get(
+                    'default_recommendations_count', 10
+                )),
+                similar_users_count=int(rec_config.get('similar_users_count', 3)),
+                content_weight=float(rec_config.get('content_weight', 0.7)),
+                collaborative_weight=float(
+                    rec_config.get('collaborative_weight', 0.3)
+                ),
+                read_book_weight=float(rec_config.get('read_book_weight', 0.7)),
+                unread_book_weight=float(rec_config.get('unread_book_weight', 1.0)),
+                category_preference_weight=float(rec_config.get(
+                    'category_preference_weight', 2.0
+                )),
+                author_preference_weight=float(rec_config.get(
+                    'author_preference_weight', 1.5
+                )),
+                text_similarity_weight=float(rec_config.get(
+                    'text_similarity_weight', 1.0
+                )),
+                deadline_ms=float(rec_config.get('deadline_ms', 300.0)),
+                min_statement_timeout_ms=float(rec_config.get(
+                    'min_statement_timeout_ms', 50.0
+                )),
+                min_stage_budget_ms=float(rec_config.get(
+                    'min_stage_budget_ms', 50.0
+                )),
+                num_epochs=int(rec_config.get('num_epochs', 300)),
+                learning_rate=float(rec_config.get('learning_rate', 0.122)),
+            ),
+            profiling=ProfilingSettings(
+                enabled=bool(profiling_config.get('enabled', False)),
+                sample_rate=float(profiling_config.get('sample_rate', 0.01)),
+                slow_threshold_ms=profiling_config.get('slow_threshold_ms', 500),
+                sampling_interval_ms=profiling_config.get(
+                    'sampling_interval_ms', 5
+                ),
+                output_dir=profiling_config.get('output_dir', 'logs/profiles'),
+                top_n=int(profiling_config.get('top_n', 30)),
+                max_files=int(profiling_config.get('max_files', 200)),
+                max_total_mb=profiling_config.get('max_total_mb', 100),
+            ),
+            logging=LoggingSettings(
+                level=os.getenv('LOG_LEVEL', logging_config.get('level', 'INFO')),
+                use_json=bool(logging_config.get('use_json', False)),
+                enable_console=bool(logging_config.get('enable_console', True)),
+                log_dir=logging_config.get('log_dir', 'logs'),
+                performance_threshold_ms=int(logging_config.get(
+                    'performance_threshold_ms', 100
+                )),
+                max_file_size_mb=int(logging_config.get('max_file_size_mb', 10)),
+                backup_count=int(logging_config.get('backup_count', 5)),
+                enable_access_log=bool(
+                    logging_config.get('enable_access_log', True)
+                ),
+                enable_performance_log=bool(
+                    logging_config.get('enable_performance_log', True)
+                ),
+                enable_traceback_log=bool(
+                    logging_config.get('enable_traceback_log', True)
+                ),
+                enable_server_timing=bool(
+                    logging_config.get('enable_server_timing', True)
+                ),
+                db_threshold_ms=int(logging_config.get('db_query_threshold_ms', 50)),
+                api_threshold_ms=int(logging_config.get(
+                    'api_processing_threshold_ms', 200
+                )),
+                heavy_threshold_ms=int(logging_config.get(
+                    'heavy_computation_threshold_ms', 500
+                )),
+                max_queries_per_request=int(logging_config.get(
+                    'max_queries_per_request', 20
+                )),
+                main_log_retention_days=int(logging_config.get(
+                    'main_log_retention_days', 14
+                )),
+                error_log_retention_days=int(logging_config.get(
+                    'error_log_retention_days', 30
+                )),
+                access_log_retention_days=int(logging_config.get(
+                    'access_log_retention_days', 7
+                )),
+                performance_log_retention_days=int(logging_config.get(
+                    'performance_log_retention_days', 10
+                )),
+                traceback_log_retention_days=int(logging_config.get(
+                    'traceback_log_retention_days', 60
+                )),
+            ),
+            config_watch=ConfigWatchSettings(
+                enabled=bool(watch_config.get('enabled', True)),
+                poll_interval_s=float(watch_config.get('poll_interval_s', 5.0)),
+            ),
+            warmup=WarmupSettings(
+                enabled=bool(warmup_config.get('enabled', True)),
+                background=bool(warmup_config.get('background', True)),
+                precompute_top_members=int(
+                    warmup_config.get('precompute_top_members', 100)
+                ),
+                snapshot_refresh_s=float(
+                    warmup_config.get('snapshot_refresh_s', 600.0)
+                ),
+            ),
+            artifacts=ArtifactSettings(
+                directory=artifact_config.get('directory', 'artifacts'),
+                load_on_startup=bool(artifact_config.get('load_on_startup', True)),
+                neighbors_k=int(artifact_config.get('neighbors_k', 20)),
+                keep_versions=int(artifact_config.get('keep_versions', 5)),
+                similarity=artifact_config.get('similarity', 'euclidean'),
+                text_neighbors_k=int(artifact_config.get('text_neighbors_k', 20)),
+                text_chunk_size=int(artifact_config.get('text_chunk_size', 5000)),
+            ),
+            model_registry=ModelRegistrySettings(
+                directory=registry_config.get('directory', 'artifacts/models'),
+                max_loaded_models=int(registry_config.get('max_loaded_models', 2)),
+                load_on_startup=bool(registry_config.get('load_on_startup', False)),
+                mirror_to_s3=bool(registry_config.get('mirror_to_s3', False)),
+                s3_prefix=registry_config.get('s3_prefix', 'models/'),
+            ),
+            inference=InferenceSettings(
+                serve_model=bool(inference_config.get('serve_model', False)),
+                num_threads=int(inference_config.get('num_threads', 0)),
+                max_batch_size=int(inference_config.get('max_batch_size', 32)),
+                max_wait_ms=float(inference_config.get('max_wait_ms', 2.0)),
+            ),
+            result_cache=ResultCacheSettings(
+                enabled=bool(result_cache_config.get('enabled', True)),
+                soft_ttl_s=float(result_cache_config.get('soft_ttl_s', 300.0)),
+                hard_ttl_s=float(result_cache_config.get('hard_ttl_s', 3600.0)),
+                refresh_concurrency=int(
+                    result_cache_config.get('refresh_concurrency', 2)
+                ),
+                max_entries=int(result_cache_config.get('max_entries', 100000)),
+            ),
+            circuit_breaker=CircuitBreakerSettings(
+                enabled=bool(breaker_config.get('enabled', True)),
+                failure_threshold=int(breaker_config.get('failure_threshold', 5)),
+                slow_call_ms=float(breaker_config.get('slow_call_ms', 2000.0)),
+                window_s=float(breaker_config.get('window_s', 30.0)),
+                open_s=float(breaker_config.get('open_s', 15.0)),
+                half_open_probes=int(breaker_config.get('half_open_probes', 1)),
+            ),
+            training=TrainingSettings(
+                batch_size=int(training_config.get('batch_size', 256)),
+                num_workers=int(training_config.get('num_workers', 2)),
+                corruption=float(training_config.get('corruption', 0.2)),
+                checkpoint_dir=training_config.get(
+                    'checkpoint_dir', 'artifacts/checkpoints'
+                ),
+                checkpoint_every=int(training_config.get('checkpoint_every', 10)),
+                eval_modulo=int(training_config.get('eval_modulo', 10)),
+                eval_k=int(training_config.get('eval_k', 10)),
+                model_type=training_config.get('model_type', 'autoencoder'),
+                factors=int(training_config.get('factors', 64)),
+                regularization=float(training_config.get('regularization', 0.1)),
+                alpha=float(training_config.get('alpha', 10.0)),
+                als_iterations=int(training_config.get('als_iterations', 15)),
+                quantization=training_config.get('quantization', 'int8'),
+                export_min_overlap=float(
+                    training_config.get('export_min_overlap', 0.9)
+                ),
+                export_max_recall_drop=float(
+                    training_config.get('export_max_recall_drop', 0.02)
+                ),
+            ),
+        )
+
 
 class Settings:
     """설정 클래스"""
     
-    def __init__(self):
+    def __init__(
+        self, 
+        config_path: str | Path | None = None, 
+        secrets_path: str | Path | None = None
+    ):
+        self.config_path = Path(config_path or PROJECT_ROOT / "config.toml")
+        self.secrets_path = Path(secrets_path or PROJECT_ROOT / ".env.toml")
         self._config = None
         self._secrets = None
+        self._reload_lock = threading.Lock()
+        self._subscribers: list[SettingsSubscriber] = []
         self._load_config()
         self._load_secrets()
+        self._snapshot = SettingsSnapshot.from_sources(self._config, self._secrets)
     
     def _load_config(self):
         """TOML 설정 파일을 로드합니다."""
-        # 프로젝트 루트 경로 찾기
-        current_path = Path(__file__).parent
-        project_root = current_path.parent.parent
-        config_path = project_root / "config.toml"
-        
-        if not config_path.exists():
-            raise FileNotFoundError(f"설정 파일을 찾을 수 없습니다: {config_path}")
+        if not self.config_path.exists():
+            raise FileNotFoundError(
+                f"설정 파일을 찾을 수 없습니다: {self.config_path}"
+            )
         
-        with open(config_path, encoding='utf-8') as f:
+        with open(self.config_path, encoding='utf-8') as f:
             self._config = toml.load(f)
     
     def _load_secrets(self):
         """민감한 정보가 담긴 .env.toml 파일을 로드합니다."""
-        current_path = Path(__file__).parent
-        project_root = current_path.parent.parent
-        env_path = project_root / ".env.toml"
-        
         self._secrets = {}
         
-        if env_path.exists():
-            with open(env_path, encoding='utf-8') as f:
+        if self.secrets_path.exists():
+            with open(self.secrets_path, encoding='utf-8') as f:
                 self._secrets = toml.load(f)
         
         # .env.toml 파일이 없어도 에러 없이 계속 진행 (환경변수 사용)
+
+    def subscribe(self, callback: "SettingsSubscriber") -> None:
+        """
+        설정 스냅샷이 교체될 때 호출될 콜백을 등록합니다
+
+        콜백은 (이전 스냅샷, 새 스냅샷)을 인자로 받으며, 값이 실제로 바뀐
+        경우에만 호출됩니다.
+        """
+        if callback not in self._subscribers:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: "SettingsSubscriber") -> None:
+        """등록된 콜백을 제거합니다"""
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def reload(self) -> SettingsSnapshot:
+        """
+        설정 파일과 환경변수를 다시 읽어 스냅샷을 원자적으로 교체합니다
+
+        HOT_RELOADABLE_SECTIONS의 섹션만 새 값으로 바꾸고(HOT_RELOADABLE_FIELDS에
+        있는 섹션은 그 필드만), 나머지는 바뀌었어도 기존 값을 유지하며 재시작이
+        필요하다는 경고를 남깁니다.
+        새 설정이 검증에 실패하면 기존 스냅샷을 그대로 유지하고 예외를 전파합니다.
+        이미 섹션 객체를 잡고 있는 코드는 교체 전 값을 끝까지 일관되게 사용합니다.
+        값이 바뀐 경우 교체 후 구독자 콜백을 순서대로 호출합니다.
+
+        Returns:
+            새로 적용된 설정 스냅샷
+        """
+        with self._reload_lock:
+            previous = (self._config, self._secrets)
+            try:
+                self._load_config()
+                self._load_secrets()
+                loaded = SettingsSnapshot.from_sources(self._config, self._secrets)
+            except Exception:
+                self._config, self._secrets = previous
+                raise
+            old_snapshot = self._snapshot
+            changes = old_snapshot.changed_fields(loaded)
+            for section, names in changes.items():
+                if section in HOT_RELOADABLE_SECTIONS:
+                    names = names - HOT_RELOADABLE_FIELDS.get(section, names)
+                if names:
+                    logger.warning(
+                        f"[{section}] {', '.join(sorted(names))} 변경은 워커를 "
+                        f"재시작해야 적용됩니다 (기존 값 유지)"
+                    )
+            sections = {}
+            for section in HOT_RELOADABLE_SECTIONS:
+                new_section = getattr(loaded, section)
+                hot_fields = HOT_RELOADABLE_FIELDS.get(section)
+                if hot_fields is not None:
+                    applied = changes.get(section, set()) & hot_fields
+                    new_section = replace(
+                        getattr(old_snapshot, section),
+                        **{name: getattr(new_section, name) for name in applied}
+                    )
+                sections[section] = new_section
+            snapshot = replace(old_snapshot, **sections)
+            self._snapshot = snapshot
+
+            if snapshot != old_snapshot:
+                for callback in list(self._subscribers):
+                    try:
+                        callback(old_snapshot, snapshot)
+                    except Exception as e:
+                        logger.error(
+                            f"설정 변경 콜백 실패: {callback.__qualname__}: {e}",
+                            exc_info=True
+                        )
+            return snapshot
+
+    @property
+    def snapshot(self) -> SettingsSnapshot:
+        """현재 설정 스냅샷"""
+        return self._snapshot
     
     @property
-    def aws(self) -> dict[str, Any]:
+    def aws(self) -> AwsSettings:
         """AWS 설정"""
-        aws_secrets = self._secrets.get('aws', {})
-        return {
-            'region': os.getenv(
-                'AWS_REGION', 
-                aws_secrets.get('region', 'ap-northeast-2')
-            ),
-            'bucket_name': os.getenv(
-                'AWS_BUCKET_NAME', 
-                aws_secrets.get('bucket_name')
-            ),
-            'access_key_id': os.getenv(
-                'AWS_ACCESS_KEY_ID', 
-                aws_secrets.get('access_key_id')
-            ),
-            'secret_access_key': os.getenv(
-                'AWS_SECRET_ACCESS_KEY', 
-                aws_secrets.get('secret_access_key')
-            )
-        }
+        return self._snapshot.aws
     
     @property
-    def database(self) -> dict[str, Any]:
+    def database(self) -> DatabaseSettings:
         """데이터베이스 설정"""
-        db_secrets = self._secrets.get('database', {})
-        return {
-            'user': os.getenv('DB_USER', db_secrets.get('user')),
-            'password': os.getenv('DB_PASSWORD', db_secrets.get('password')),
-            'host': os.getenv('DB_HOST', db_secrets.get('host', 'localhost')),
-            'port': int(os.getenv('DB_PORT', str(db_secrets.get('port', 3306)))),
-            'name': os.getenv('DB_NAME', db_secrets.get('name', 'bookstar'))
-        }
+        return self._snapshot.database
     
     @property
     def database_url(self) -> str:
         """데이터베이스 연결 URL"""
-        db = self.database
-        return f"mysql+pymysql://{db['user']}:{db['password']}@{db['host']}:{db['port']}/{db['name']}"
+        return self._snapshot.database.url
     
     @property
-    def app(self) -> dict[str, Any]:
+    def app(self) -> AppSettings:
         """애플리케이션 설정"""
-        app_config = self._config.get('app', {})
-        return {
-            'cors_origins': app_config.get('cors_origins', ["*"]),
-            'title': app_config.get('title', 'BookStar AI'),
-            'description': app_config.get('description', 'AI 기반 도서 추천 시스템'),
-            'version': app_config.get('version', '1.0.0')
-        }
+        return self._snapshot.app
         
     @property
-    def server(self) -> dict[str, Any]:
+    def server(self) -> ServerSettings:
         """서버 설정"""
-        server_config = self._config.get('server', {})
-        return {
-            'host': os.getenv('SERVER_HOST', server_config.get('host', '0.0.0.0')),
-            'port': int(os.getenv('SERVER_PORT', str(server_config.get('port', 8000))))
-        }
+        return self._snapshot.server
         
     @property
-    def recommendation(self) -> dict[str, Any]:
+    def recommendation(self) -> RecommendationSettings:
         """추천 시스템 설정"""
-        rec_config = self._config.get('recommendation', {})
-        return {
-            'default_recommendations_count': rec_config.get(
-                'default_recommendations_count', 10
-            ),
-            'similar_users_count': rec_config.get('similar_users_count', 3),
-            'content_weight': rec_config.get('content_weight', 0.7),
-            'collaborative_weight': rec_config.get('collaborative_weight', 0.3),
-            # 사용자 선호도 계산 가중치
-            'read_book_weight': rec_config.get('read_book_weight', 0.7),
-            'unread_book_weight': rec_config.get('unread_book_weight', 1.0),
-            'category_preference_weight': rec_config.get(
-                'category_preference_weight', 2.0
-            ),
-            'author_preference_weight': rec_config.get(
-                'author_preference_weight', 1.5
-            ),
-            # PyTorch 모델 훈련 설정
-            'num_epochs': rec_config.get('num_epochs', 300),
-            'learning_rate': rec_config.get('learning_rate', 0.122)
-        }
+        return self._snapshot.recommendation
     
     @property
-    def logging(self) -> dict:
+    def profiling(self) -> ProfilingSettings:
+        """요청 샘플링 프로파일러 설정"""
+        return self._snapshot.profiling
+    
+    @property
+    def logging(self) -> LoggingSettings:
         """로깅 관련 설정"""
-        logging_config = self._config.get('logging', {})
-        
-        return {
-            'level': os.getenv('LOG_LEVEL', logging_config.get('level', 'INFO')),
-            'use_json': logging_config.get('use_json', False),
-            'enable_console': logging_config.get('enable_console', True),
-            'log_dir': logging_config.get('log_dir', 'logs'),
-            'performance_threshold_ms': logging_config.get(
-                'performance_threshold_ms', 100
-            ),
-            'max_file_size_mb': logging_config.get('max_file_size_mb', 10),
-            'backup_count': logging_config.get('backup_count', 5),
-            'enable_access_log': logging_config.get('enable_access_log', True),
-            'enable_performance_log': logging_config.get(
-                'enable_performance_log', True
-            ),
-            'enable_traceback_log': logging_config.get(
-                'enable_traceback_log', True
-            ),
-            # 직관적인 임계값 설정
-            'db_threshold_ms': logging_config.get('db_query_threshold_ms', 50),
-            'api_threshold_ms': logging_config.get(
-                'api_processing_threshold_ms', 200
-            ),
-            'heavy_threshold_ms': logging_config.get(
-                'heavy_computation_threshold_ms', 500
-            ),
-            # 로그 파일 로테이션 설정 (모든 로그에 일관된 보관 정책)
-            'main_log_retention_days': logging_config.get(
-                'main_log_retention_days', 14
-            ),
-            'error_log_retention_days': logging_config.get(
-                'error_log_retention_days', 30
-            ),
-            'access_log_retention_days': logging_config.get(
-                'access_log_retention_days', 7
-            ),
-            'performance_log_retention_days': logging_config.get(
-                'performance_log_retention_days', 10
-            ),
-            'traceback_log_retention_days': logging_config.get(
-                'traceback_log_retention_days', 60
-            )
-        }
+        return self._snapshot.logging
+
+    @property
+    def config_watch(self) -> ConfigWatchSettings:
+        """설정 파일 변경 감지 설정"""
+        return self._snapshot.config_watch
+
+    @property
+    def warmup(self) -> WarmupSettings:
+        """시작 시 워밍업 설정"""
+        return self._snapshot.warmup
+
+    @property
+    def artifacts(self) -> ArtifactSettings:
+        """추천 아티팩트 설정"""
+        return self._snapshot.artifacts
+
+    @property
+    def model_registry(self) -> ModelRegistrySettings:
+        """모델 레지스트리 설정"""
+        return self._snapshot.model_registry
+
+    @property
+    def inference(self) -> InferenceSettings:
+        """모델 추론 설정"""
+        return self._snapshot.inference
+
+    @property
+    def result_cache(self) -> ResultCacheSettings:
+        """추천 결과 캐시 설정"""
+        return self._snapshot.result_cache
+
+    @property
+    def circuit_breaker(self) -> CircuitBreakerSettings:
+        """추천 서비스 DB 회로 차단기 설정"""
+        return self._snapshot.circuit_breaker
+
+    @property
+    def training(self) -> TrainingSettings:
+        """오프라인 모델 학습 설정"""
+        return self._snapshot.training
+
+
+SettingsSubscriber = Callable[[SettingsSnapshot, SettingsSnapshot], None]
 
 
 # 전역 설정 인스턴스
-settings = Settings() 
\ No newline at end of file
+settings = Settings() 
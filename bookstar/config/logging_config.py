@@ -38,6 +38,9 @@ class JSONFormatter(logging.Formatter):
         if hasattr(record, 'request_id'):
             log_entry['request_id'] = record.request_id
         
+        if hasattr(record, 'timings'):
+            log_entry['timings'] = record.timings
+        
         # 예외 정보가 있으면 포함
         if record.exc_info:
             exc_type, exc_value, exc_traceback = record.exc_info
@@ -0,0 +1,117 @@
+"""
+설정 파일 변경 감지 모듈
+config.toml / .env.toml의 수정 시각을 주기적으로 확인하거나 SIGHUP 신호를 받아
+워커 재시작 없이 설정 스냅샷을 다시 로드
+"""
+import logging
+import signal
+import threading
+from pathlib import Path
+
+from .config import Settings, SettingsSnapshot
+
+logger = logging.getLogger(__name__)
+
+
+class ConfigWatcher:
+    """설정 파일 수정 시각을 폴링하여 변경 시 Settings.reload()를 호출하는 스레드"""
+
+    def __init__(self, settings: Settings, poll_interval_s: float | None = None):
+        self.settings = settings
+        self.poll_interval_s = poll_interval_s
+        self.paths: tuple[Path, ...] = (settings.config_path, settings.secrets_path)
+        self._mtimes = self._read_mtimes()
+        self._stop_event = threading.Event()
+        self._reload_requested = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._previous_sighup_handler = None
+
+    def _read_mtimes(self) -> dict[Path, int | None]:
+        mtimes = {}
+        for path in self.paths:
+            try:
+                mtimes[path] = path.stat().st_mtime_ns
+            except FileNotFoundError:
+                mtimes[path] = None
+        return mtimes
+
+    def _interval(self) -> float:
+        if self.poll_interval_s is not None:
+            return self.poll_interval_s
+        return self.settings.config_watch.poll_interval_s
+
+    def check(self, force: bool = False) -> SettingsSnapshot | None:
+        """
+        설정 파일이 바뀌었으면 다시 로드합니다
+
+        Args:
+            force: 수정 시각과 관계없이 다시 로드 (SIGHUP)
+
+        Returns:
+            새로 적용된 스냅샷 (다시 로드하지 않았거나 실패하면 None)
+        """
+        mtimes = self._read_mtimes()
+        if not force and mtimes == self._mtimes:
+            return None
+        self._mtimes = mtimes
+
+        previous = self.settings.snapshot
+        try:
+            snapshot = self.settings.reload()
+        except Exception as e:
+            logger.error(f"설정 다시 로드 실패, 기존 설정 유지: {e}")
+            return None
+
+        # 재시작이 필요한 섹션 변경은 reload()가 경고하고 기존 값을 유지함
+        changes = previous.changed_fields(snapshot)
+        if not changes:
+            logger.info("설정 파일을 다시 읽었지만 바로 반영할 값이 없습니다")
+            return snapshot
+
+        for section, names in changes.items():
+            logger.info(f"설정 변경 적용: [{section}] {', '.join(sorted(names))}")
+        return snapshot
+
+    def request_reload(self) -> None:
+        """다음 폴링을 기다리지 않고 다시 로드하도록 요청합니다 (신호 처리기용)"""
+        self._reload_requested.set()
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            self._reload_requested.wait(self._interval())
+            if self._stop_event.is_set():
+                break
+            forced = self._reload_requested.is_set()
+            self._reload_requested.clear()
+            self.check(force=forced)
+
+    def start(self) -> None:
+        """감시 스레드를 시작하고, 가능하면 SIGHUP 처리기를 등록합니다"""
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="config-watcher", daemon=True
+        )
+        self._thread.start()
+
+        # 신호 처리기는 메인 스레드에서만 등록할 수 있음
+        if (
+            hasattr(signal, 'SIGHUP')
+            and threading.current_thread() is threading.main_thread()
+        ):
+            self._previous_sighup_handler = signal.signal(
+                signal.SIGHUP, lambda signum, frame: self.request_reload()
+            )
+
+    def stop(self) -> None:
+        """감시 스레드를 멈추고 SIGHUP 처리기를 원래대로 되돌립니다"""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._reload_requested.set()
+        self._thread.join(timeout=5)
+        self._thread = None
+        if self._previous_sighup_handler is not None:
+            signal.signal(signal.SIGHUP, self._previous_sighup_handler)
+            self._previous_sighup_handler = None
@@ -6,19 +6,111 @@ from sqlalchemy.engine import Engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 
 from bookstar.config import settings
+from bookstar.database.query_stats import fingerprint, format_parameters, query_stats
+from bookstar.utils.deadline import DeadlineExceeded, get_current_deadline
+from bookstar.utils.profiling import get_current_timings
 
 # 데이터베이스 로거 설정
 db_logger = logging.getLogger('database')
 
+# SQLite 진행 핸들러를 호출할 VM 명령 수 간격 (작을수록 정확하지만 느림)
+SQLITE_PROGRESS_STEPS = 1000
+# MySQL: MAX_EXECUTION_TIME을 넘겨 중단된 쿼리의 오류 코드
+MYSQL_EXECUTION_TIMEOUT = 3024
+# apply_statement_timeout이 SELECT 뒤에 붙이는 힌트 (앞부분/끝)
+_HINT_HEAD = "SELECT /*+ MAX_EXECUTION_TIME("
+_HINT_TAIL = ") */"
+
+
+def _sqlite_timeout(conn, timeout_ms: int | None) -> None:
+    """SQLite 연결에 쿼리 실행 시간 제한을 설정합니다 (진행 핸들러로 중단)"""
+    info = conn.connection.info
+    if timeout_ms is None:
+        if info.pop('statement_timeout', False):
+            conn.connection.driver_connection.set_progress_handler(None, 0)
+        return
+    give_up_at = time.perf_counter() + timeout_ms / 1000
+    conn.connection.driver_connection.set_progress_handler(
+        lambda: time.perf_counter() > give_up_at, SQLITE_PROGRESS_STEPS
+    )
+    info['statement_timeout'] = True
+
+
+@event.listens_for(Engine, "before_cursor_execute", retval=True)
+def apply_statement_timeout(
+    conn, cursor, statement, parameters, context, executemany
+):
+    """
+    요청 deadline의 남은 시간으로 쿼리 실행 시간을 제한합니다
+
+    - MySQL: SELECT 문에 MAX_EXECUTION_TIME 옵티마이저 힌트 추가
+    - SQLite: 진행 핸들러로 제한 시간이 지나면 쿼리 중단 (벤치마크/테스트)
+    제한을 넘긴 쿼리는 DeadlineExceeded로 실패합니다 (raise_deadline_exceeded).
+    요청 밖(deadline 없음)에서는 제한하지 않습니다.
+    """
+    deadline = get_current_deadline()
+    timeout_ms = (
+        deadline.statement_timeout_ms(settings.recommendation.min_statement_timeout_ms)
+        if deadline is not None else None
+    )
+    dialect = conn.dialect.name
+    if dialect == 'mysql':
+        head = statement.lstrip()
+        if timeout_ms is not None and head[:6].upper() == 'SELECT':
+            statement = f"{_HINT_HEAD}{timeout_ms}{_HINT_TAIL}{head[6:]}"
+    elif dialect == 'sqlite':
+        _sqlite_timeout(conn, timeout_ms)
+    return statement, parameters
+
+
+def _strip_timeout_hint(statement: str) -> str:
+    """
+    apply_statement_timeout이 붙인 힌트를 뗀 쿼리문
+
+    힌트의 남은 시간 값은 실행마다 달라서, 그대로 지문을 만들면 fingerprint의
+    캐시가 매번 빗나갑니다.
+    """
+    if not statement.startswith(_HINT_HEAD):
+        return statement
+    end = statement.find(_HINT_TAIL, len(_HINT_HEAD))
+    return "SELECT" + statement[end + len(_HINT_TAIL):] if end >= 0 else statement
+
+
+def _is_statement_timeout(dialect: str, error: BaseException | None) -> bool:
+    """DBAPI 오류가 apply_statement_timeout의 실행 시간 제한으로 난 것인지 여부"""
+    if dialect == 'mysql':
+        args = getattr(error, 'args', ())
+        return bool(args) and args[0] == MYSQL_EXECUTION_TIMEOUT
+    if dialect == 'sqlite':
+        return 'interrupted' in str(error)
+    return False
+
+
+@event.listens_for(Engine, "handle_error")
+def raise_deadline_exceeded(context):
+    """
+    요청 deadline으로 중단된 쿼리의 OperationalError를 DeadlineExceeded로 바꿉니다
+
+    DB 장애와 구분하여 회로 차단기에 실패로 기록되지 않게 하고, 호출하는 쪽이
+    예산이 바닥난 단계만 생략하도록 합니다.
+    """
+    deadline = get_current_deadline()
+    if deadline is None or not deadline.limited:
+        return
+    if _is_statement_timeout(context.dialect.name, context.original_exception):
+        raise DeadlineExceeded(deadline.budget_ms, deadline.elapsed_ms())
+
+
 # SQLAlchemy 쿼리 로깅을 위한 이벤트 리스너
 @event.listens_for(Engine, "before_cursor_execute")
 def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
     """쿼리 실행 전 로깅"""
     conn.info.setdefault('query_start_time', []).append(time.perf_counter())
-    db_logger.debug(
-        f"쿼리 실행 시작: {statement[:200]}...",
-        extra={'query_type': 'start', 'parameters': str(parameters)[:500]}
-    )
+    if db_logger.isEnabledFor(logging.DEBUG):
+        db_logger.debug(
+            f"쿼리 실행 시작: {statement[:200]}...",
+            extra={'query_type': 'start'}
+        )
 
 @event.listens_for(Engine, "after_cursor_execute")
 def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
@@ -26,16 +118,42 @@ def after_cursor_execute(conn, cursor, statement, parameters, context, executema
     total = time.perf_counter() - conn.info['query_start_time'].pop(-1)
     total_ms = total * 1000
     
-    if total_ms > settings.logging['db_threshold_ms']:  # config.toml 설정 사용
+    # 지문별 쿼리 통계 집계
+    query_fingerprint = fingerprint(_strip_timeout_hint(statement))
+    query_stats.record(query_fingerprint, total_ms)
+    
+    # 요청 단위 쿼리 수/행 수 집계 (Server-Timing 헤더용)
+    timings = get_current_timings()
+    if timings is not None:
+        query_count = timings.record_query(
+            total_ms, cursor.rowcount, query_fingerprint
+        )
+        max_queries = settings.logging.max_queries_per_request
+        if query_count == max_queries + 1:
+            repeated, repeated_count = (
+                timings.query_fingerprints.most_common(1)[0]
+            )
+            db_logger.warning(
+                f"[{timings.request_id}] 요청당 쿼리 수 {max_queries}회 초과 "
+                f"(N+1 의심) - 가장 많이 반복된 쿼리 {repeated_count}회: "
+                f"{repeated[:200]}",
+                extra={
+                    'query_type': 'n_plus_one',
+                    'request_id': timings.request_id,
+                    'query_count': query_count
+                }
+            )
+    
+    if total_ms > settings.logging.db_threshold_ms:  # config.toml 설정 사용
         db_logger.warning(
             f"느린 쿼리 감지: {total_ms:.2f}ms - {statement[:200]}...",
             extra={
                 'query_type': 'slow',
                 'execution_time_ms': total_ms,
-                'parameters': str(parameters)[:500]
+                'parameters': format_parameters(parameters)
             }
         )
-    else:
+    elif db_logger.isEnabledFor(logging.DEBUG):
         db_logger.debug(
             f"쿼리 실행 완료: {total_ms:.2f}ms",
             extra={
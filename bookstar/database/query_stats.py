@@ -0,0 +1,103 @@
+"""
+SQL 쿼리 통계 모듈
+쿼리문을 리터럴/IN 목록이 제거된 지문(fingerprint)으로 정규화하여
+지문별 실행 횟수, 누적 시간, 최대 시간을 메모리에 집계
+"""
+import re
+import reprlib
+import threading
+from functools import lru_cache
+from typing import Any
+
+_STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.|'')*'")
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|%s|\?|(?<![:\w]):\w+")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_ROW = r"\(\s*\?(?:\s*,\s*\?)*\s*\)"
+_VALUES_LIST = re.compile(rf"{_ROW}(?:\s*,\s*{_ROW})+")
+_WHITESPACE = re.compile(r"\s+")
+
+_parameters_repr = reprlib.Repr()
+_parameters_repr.maxlist = 10
+_parameters_repr.maxtuple = 10
+_parameters_repr.maxdict = 10
+_parameters_repr.maxstring = 50
+_parameters_repr.maxother = 50
+
+
+@lru_cache(maxsize=2048)
+def fingerprint(statement: str) -> str:
+    """
+    쿼리문을 지문으로 정규화합니다
+
+    문자열/숫자 리터럴과 바인드 파라미터는 `?`로, 길이가 다른 IN 목록은
+    `IN (...)`으로 치환하여 같은 형태의 쿼리가 하나의 지문으로 모이도록 합니다.
+    """
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _PLACEHOLDER.sub("?", normalized)
+    normalized = _NUMBER.sub("?", normalized)
+    normalized = _IN_LIST.sub("IN (...)", normalized)
+    normalized = _VALUES_LIST.sub("(...)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+def format_parameters(parameters: Any) -> str:
+    """
+    로그용으로 파라미터를 요약합니다
+
+    큰 IN 목록 전체를 문자열로 만들지 않도록 앞부분 일부만 표현합니다.
+    """
+    return _parameters_repr.repr(parameters)
+
+
+class QueryStats:
+    """지문별 쿼리 실행 통계 (스레드 안전)"""
+
+    def __init__(self, max_fingerprints: int = 1000):
+        self.max_fingerprints = max_fingerprints
+        self._stats: dict[str, list[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, query_fingerprint: str, elapsed_ms: float) -> None:
+        """쿼리 실행 한 건을 기록합니다"""
+        with self._lock:
+            entry = self._stats.get(query_fingerprint)
+            if entry is None:
+                if len(self._stats) >= self.max_fingerprints:
+                    return
+                self._stats[query_fingerprint] = [1, elapsed_ms, elapsed_ms]
+                return
+            entry[0] += 1
+            entry[1] += elapsed_ms
+            if elapsed_ms > entry[2]:
+                entry[2] = elapsed_ms
+
+    def snapshot(self, top_n: int | None = None) -> list[dict[str, Any]]:
+        """누적 시간 순으로 정렬된 통계 목록을 반환합니다"""
+        with self._lock:
+            items = [
+                (fp, int(count), total_ms, max_ms)
+                for fp, (count, total_ms, max_ms) in self._stats.items()
+            ]
+        items.sort(key=lambda item: item[2], reverse=True)
+        if top_n is not None:
+            items = items[:top_n]
+        return [
+            {
+                'fingerprint': fp,
+                'count': count,
+                'total_ms': round(total_ms, 2),
+                'avg_ms': round(total_ms / count, 2),
+                'max_ms': round(max_ms, 2),
+            }
+            for fp, count, total_ms, max_ms in items
+        ]
+
+    def reset(self) -> None:
+        """모든 통계를 초기화합니다"""
+        with self._lock:
+            self._stats.clear()
+
+
+# 전역 쿼리 통계 인스턴스
+query_stats = QueryStats()
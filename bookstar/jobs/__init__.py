@@ -0,0 +1,3 @@
+"""
+오프라인 작업 (아티팩트 빌드 등)
+"""
@@ -0,0 +1,159 @@
+"""
+추천 아티팩트 빌드/관리 명령
+DB에서 카탈로그와 상호작용을 읽어 이웃 목록(회원 이웃, 제목/소개 유사 도서)까지
+미리 계산한 아티팩트를 만들고, CURRENT 포인터를 바꿔 배포하거나 이전 버전으로 되돌림
+
+사용법:
+    python -m bookstar.jobs.artifacts build
+    python -m bookstar.jobs.artifacts build --database-url sqlite:///benchmarks/data/x.sqlite
+    python -m bookstar.jobs.artifacts list
+    python -m bookstar.jobs.artifacts promote 20261019T101500-a1b2c3
+    python -m bookstar.jobs.artifacts rollback
+    python -m bookstar.jobs.artifacts verify
+"""
+import argparse
+import json
+import logging
+import time
+from dataclasses import replace
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from bookstar.config import settings
+from bookstar.services import artifacts
+from bookstar.services.catalog import (
+    build_catalog,
+    build_neighbor_index,
+    compute_neighbors,
+)
+from bookstar.services.text_neighbors import build_text_neighbors
+
+logger = logging.getLogger(__name__)
+
+
+def build(
+    root: Path,
+    database_url: str | None = None,
+    neighbors_k: int | None = None,
+    promote: bool = True,
+    keep_versions: int | None = None,
+    text_neighbors_k: int | None = None
+) -> Path:
+    """
+    아티팩트를 빌드하고 (promote면) CURRENT로 지정합니다
+
+    Returns:
+        생성된 버전 디렉토리 경로
+    """
+    config = settings.artifacts
+    neighbors_k = neighbors_k or config.neighbors_k
+    if text_neighbors_k is None:
+        text_neighbors_k = config.text_neighbors_k
+    keep_versions = keep_versions or config.keep_versions
+
+    if database_url is None:
+        from bookstar.database.connection import SessionLocal as session_factory
+    else:
+        session_factory = sessionmaker(bind=create_engine(database_url))
+
+    timings = {}
+    with session_factory() as db:
+        start = time.perf_counter()
+        catalog = build_catalog(db)
+        neighbor_index = build_neighbor_index(db, config.similarity)
+        timings['load_s'] = round(time.perf_counter() - start, 2)
+
+        if text_neighbors_k > 0:
+            start = time.perf_counter()
+            text_neighbors, text_scores = build_text_neighbors(
+                db, catalog, text_neighbors_k, config.text_chunk_size
+            )
+            catalog = replace(
+                catalog, text_neighbors=text_neighbors, text_scores=text_scores
+            )
+            timings['text_neighbors_s'] = round(time.perf_counter() - start, 2)
+
+    if neighbor_index is not None:
+        start = time.perf_counter()
+        neighbor_index.neighbors = compute_neighbors(neighbor_index, neighbors_k)
+        timings['neighbors_s'] = round(time.perf_counter() - start, 2)
+
+    path = artifacts.write_artifact(
+        root, catalog, neighbor_index, metadata={'timings': timings}
+    )
+    if promote:
+        artifacts.set_current(root, path.name)
+        removed = artifacts.prune_versions(root, keep_versions)
+        if removed:
+            logger.info(f"오래된 아티팩트 삭제: {removed}")
+    return path
+
+
+def describe(root: Path) -> list[dict]:
+    """버전 목록과 요약 (CURRENT 표시)"""
+    current = artifacts.read_current(root)
+    rows = []
+    for version in artifacts.list_versions(root):
+        manifest = artifacts.load_manifest(root, version)
+        rows.append({
+            'version': version,
+            'current': version == current,
+            'created_at': manifest['created_at'],
+            'counts': manifest['counts'],
+        })
+    return rows
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="추천 아티팩트 빌드/관리")
+    parser.add_argument(
+        "--root", type=Path, default=None,
+        help="아티팩트 루트 디렉토리 (기본: [artifacts] directory)"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = commands.add_parser("build", help="DB에서 새 아티팩트 빌드")
+    build_parser.add_argument("--database-url", help="기본 DB 대신 사용할 URL")
+    build_parser.add_argument("--neighbors-k", type=int, help="미리 계산할 이웃 수")
+    build_parser.add_argument(
+        "--text-neighbors-k", type=int, help="제목/소개 유사 도서 수 (0 = 안 함)"
+    )
+    build_parser.add_argument(
+        "--no-promote", action="store_true", help="CURRENT를 바꾸지 않음"
+    )
+    commands.add_parser("list", help="버전 목록")
+    promote_parser = commands.add_parser("promote", help="CURRENT 변경")
+    promote_parser.add_argument("version")
+    commands.add_parser("rollback", help="CURRENT를 이전 버전으로")
+    verify_parser = commands.add_parser("verify", help="체크섬 검증")
+    verify_parser.add_argument("version", nargs="?")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    root = args.root or settings.artifacts.path
+
+    if args.command == "build":
+        path = build(
+            root,
+            database_url=args.database_url,
+            neighbors_k=args.neighbors_k,
+            promote=not args.no_promote,
+            text_neighbors_k=args.text_neighbors_k,
+        )
+        print(f"아티팩트 생성: {path}")  # noqa: T201
+    elif args.command == "list":
+        print(json.dumps(describe(root), indent=2, ensure_ascii=False))  # noqa: T201
+    elif args.command == "promote":
+        artifacts.set_current(root, args.version)
+        print(f"CURRENT: {args.version}")  # noqa: T201
+    elif args.command == "rollback":
+        print(f"CURRENT: {artifacts.rollback(root)}")  # noqa: T201
+    elif args.command == "verify":
+        _, _, manifest = artifacts.load_artifact(root, args.version, verify=True)
+        print(f"검증 완료: {manifest['version']}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
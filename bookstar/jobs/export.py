@@ -0,0 +1,201 @@
+"""
+RecommenderModel int8 TorchScript 내보내기 명령
+레지스트리의 float 오토인코더에 nn.Linear 동적 int8 양자화를 적용하고 TorchScript로
+변환하여, 서빙 호스트가 RecommenderModel 클래스 정의 없이 로드할 수 있게 저장
+(가중치 약 1/4, CPU 행렬곱 int8 커널 사용)
+
+저장 전에 평가용 회원(학습 job과 같은 분할)에서 float 모델과 상위 k개를 비교하여
+겹치는 비율이 export_min_overlap 미만이거나 recall@k가 export_max_recall_drop보다
+많이 떨어지면 저장하지 않습니다.
+
+사용법:
+    python -m bookstar.jobs.export
+    python -m bookstar.jobs.export --source 3f2a9c0d1b4e5f60 --promote
+    python -m bookstar.jobs.export --database-url sqlite:///benchmarks/data/x.sqlite
+"""
+import argparse
+import io
+import json
+import logging
+import warnings
+from typing import Any
+
+import numpy as np
+import torch
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from bookstar.config import settings
+from bookstar.jobs.train import evaluate, interaction_loader, recommend_rows
+from bookstar.models.recommender import RecommenderModel
+from bookstar.services import model_registry
+from bookstar.services.catalog import build_catalog
+
+logger = logging.getLogger(__name__)
+
+
+class ExportError(Exception):
+    """내보낼 모델이 없거나 양자화 모델이 정확도 기준을 통과하지 못한 경우"""
+
+
+def quantize_model(model: RecommenderModel) -> RecommenderModel:
+    """nn.Linear 층을 동적 int8 양자화한 사본 (활성값은 요청마다 양자화)"""
+    model.eval()
+    with warnings.catch_warnings():
+        # torch.ao.quantization 지원 종료 예고 경고 (torchao 미설치 환경 유지)
+        warnings.simplefilter("ignore", DeprecationWarning)
+        warnings.simplefilter("ignore", UserWarning)
+        return torch.ao.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+
+
+def script_model(model: torch.nn.Module) -> torch.jit.ScriptModule:
+    """TorchScript 모듈로 변환합니다 (저장 후 Python 클래스 없이 로드 가능)"""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", FutureWarning)
+        scripted = torch.jit.script(model.eval())
+    scripted.eval()
+    return scripted
+
+
+def serialized_bytes(model: torch.jit.ScriptModule) -> int:
+    """torch.jit.save 결과 크기 (바이트)"""
+    buffer = io.BytesIO()
+    torch.jit.save(model, buffer)
+    return len(buffer.getvalue())
+
+
+def compare_models(
+    reference: RecommenderModel,
+    candidate: torch.nn.Module,
+    batches: list[list[tuple[np.ndarray, np.ndarray]]],
+    k: int
+) -> dict[str, Any]:
+    """
+    평가용 회원에서 두 모델의 정확도와 상위 k개 일치 정도를 비교합니다
+
+    Returns:
+        reference/candidate 지표, overlap@k (상위 k개 중 겹치는 비율의 평균),
+        recall_drop (reference recall@k - candidate recall@k)
+    """
+    overlaps = []
+    for batch in batches:
+        inputs = [columns for columns, _ in batch]
+        for (expected, _), (actual, _) in zip(
+            recommend_rows(reference, inputs, k),
+            recommend_rows(candidate, inputs, k),
+            strict=True,
+        ):
+            if len(expected):
+                overlaps.append(len(np.intersect1d(expected, actual)) / len(expected))
+
+    reference_metrics = evaluate(reference, batches, k)
+    candidate_metrics = evaluate(candidate, batches, k)
+    return {
+        'reference': reference_metrics,
+        'candidate': candidate_metrics,
+        f'overlap@{k}': float(np.mean(overlaps)) if overlaps else 1.0,
+        'recall_drop': (
+            reference_metrics[f'recall@{k}'] - candidate_metrics[f'recall@{k}']
+        ),
+    }
+
+
+def export_model(
+    engine: Engine,
+    source: str = model_registry.DEFAULT_REF,
+    promote: bool = False,
+    k: int | None = None
+) -> dict[str, Any]:
+    """
+    레지스트리의 float 오토인코더를 int8 TorchScript로 변환하여 저장합니다
+
+    Args:
+        source: 변환할 모델의 참조 또는 버전 이름
+        promote: 저장 후 current로 승격할지 여부
+
+    Returns:
+        원본/새 버전, 크기, 정확도 비교 요약
+
+    Raises:
+        ExportError: 원본이 오토인코더가 아니거나 카탈로그 크기가 다르거나
+            정확도 기준을 통과하지 못한 경우
+    """
+    config = settings.training
+    k = k or config.eval_k
+    registry = model_registry.get_registry()
+    source_version = registry.resolve(source)
+    if source_version is None:
+        raise ExportError(f"모델 참조가 없습니다: {source}")
+    model = registry.load(source_version)
+    if not isinstance(model, RecommenderModel):
+        raise ExportError(
+            f"float 오토인코더 모델만 내보낼 수 있습니다: {source_version}"
+        )
+
+    with Session(engine) as db:
+        catalog = build_catalog(db)
+    if model.fc1.in_features != catalog.size:
+        raise ExportError(
+            f"모델 크기({model.fc1.in_features})가 카탈로그 크기({catalog.size})와 "
+            f"다릅니다"
+        )
+    batches = list(interaction_loader(
+        engine, catalog.aladin_map, "eval", config.batch_size,
+        eval_modulo=config.eval_modulo,
+    ))
+
+    exported = script_model(quantize_model(model))
+    comparison = compare_models(model, exported, batches, k)
+    overlap = comparison[f'overlap@{k}']
+    if overlap < config.export_min_overlap:
+        raise ExportError(
+            f"상위 {k}개 일치율이 기준보다 낮습니다: "
+            f"{overlap:.3f} < {config.export_min_overlap}"
+        )
+    if comparison['recall_drop'] > config.export_max_recall_drop:
+        raise ExportError(
+            f"recall@{k} 감소폭이 기준보다 큽니다: "
+            f"{comparison['recall_drop']:.3f} > {config.export_max_recall_drop}"
+        )
+
+    summary = {
+        'source_version': source_version,
+        'quantization': "dynamic_int8",
+        'float_bytes': sum(p.numel() * p.element_size() for p in model.parameters()),
+        'exported_bytes': serialized_bytes(exported),
+        'accuracy': comparison,
+    }
+    version = registry.save(exported, metadata=summary)
+    if promote:
+        registry.promote(version)
+    summary['version'] = version
+    logger.info(f"int8 TorchScript 내보내기 완료: {summary}")
+    return summary
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="RecommenderModel int8 TorchScript 내보내기"
+    )
+    parser.add_argument("--database-url", help="기본 DB 대신 사용할 URL")
+    parser.add_argument(
+        "--source", default=model_registry.DEFAULT_REF, help="변환할 참조 또는 버전"
+    )
+    parser.add_argument("--promote", action="store_true", help="current로 승격")
+    parser.add_argument("--k", type=int, help="비교할 상위 k (기본: [training] eval_k)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    engine = create_engine(args.database_url or settings.database_url)
+    try:
+        summary = export_model(engine, args.source, promote=args.promote, k=args.k)
+    finally:
+        engine.dispose()
+    print(json.dumps(summary, indent=2, ensure_ascii=False))  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,439 @@
+"""
+추천 모델 오프라인 학습 명령 (RecommenderModel 또는 행렬 분해)
+member_book 상호작용을 회원 순으로 스트리밍하여 회원별 열 번호 배열로 만들고,
+미니배치 단위로만 밀집 텐서로 바꿔 학습 (메모리 사용량은 배치 크기에 비례)
+행렬 분해 모델은 같은 스트림을 희소 행렬(상호작용 수에 비례)로 모아 ALS로 학습
+학습이 끝나면 평가 지표와 함께 모델 레지스트리에 저장하고 current로 승격
+
+사용법:
+    python -m bookstar.jobs.train
+    python -m bookstar.jobs.train --database-url sqlite:///benchmarks/data/x.sqlite \\
+        --epochs 20 --workers 4
+    python -m bookstar.jobs.train --resume --no-promote
+    python -m bookstar.jobs.train --model-type factorization
+"""
+import argparse
+import itertools
+import json
+import logging
+import os
+import time
+from collections.abc import Callable, Iterable, Iterator
+from operator import itemgetter
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import torch
+from sqlalchemy import create_engine, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from torch.utils.data import DataLoader, IterableDataset, get_worker_info
+
+from bookstar.config import settings
+from bookstar.models.factorization import FactorizationModel, train_als
+from bookstar.models.models import Member, MemberBook
+from bookstar.models.recommender import RecommenderModel
+from bookstar.services import model_registry
+from bookstar.services.catalog import IdMap, build_catalog
+from bookstar.services.inference import InferenceRequest, dense_rows, score_topk
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_FILE = "checkpoint.pt"
+
+
+def split_holdout(
+    member_id: int, columns: np.ndarray, fraction: float = 0.2
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    평가용 회원의 도서를 입력/정답으로 나눕니다 (member_id 기준으로 항상 같은 결과)
+
+    Returns:
+        (모델 입력 열 번호, 맞혀야 할 열 번호)
+    """
+    if len(columns) < 2:
+        return columns, np.empty(0, dtype=columns.dtype)
+    rng = np.random.default_rng(member_id)
+    shuffled = rng.permutation(columns)
+    num_hidden = max(1, int(len(columns) * fraction))
+    return np.sort(shuffled[num_hidden:]), np.sort(shuffled[:num_hidden])
+
+
+class InteractionStream(IterableDataset):
+    """
+    회원별 상호작용 열 번호를 스트리밍하는 데이터셋
+
+    DataLoader 워커마다 member_id % 워커 수로 회원을 나눠 자기 몫만 조회하고,
+    워커 프로세스에서는 엔진을 새로 만들어 연결을 공유하지 않습니다.
+    split이 "train"이면 열 번호 배열을, "eval"이면 (입력, 정답) 쌍을 생성합니다.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        id_map: IdMap,
+        split: str = "train",
+        eval_modulo: int = 10,
+        chunk_size: int = 10_000
+    ):
+        if split not in ("train", "eval"):
+            raise ValueError(f"알 수 없는 split: {split}")
+        self.engine = engine
+        self.id_map = id_map
+        self.split = split
+        self.eval_modulo = eval_modulo
+        self.chunk_size = chunk_size
+
+    def _member_rows(self, engine: Engine, shard: int, num_shards: int) -> Iterator:
+        stmt = (
+            select(MemberBook.member_id, MemberBook.book_id)
+            .join(Member, Member.id == MemberBook.member_id)
+            .where(MemberBook.book_id.is_not(None))
+            .order_by(MemberBook.member_id)
+        )
+        if num_shards > 1:
+            stmt = stmt.where(MemberBook.member_id % num_shards == shard)
+        with engine.connect() as conn:
+            result = conn.execution_options(
+                stream_results=True, yield_per=self.chunk_size
+            ).execute(stmt)
+            yield from itertools.groupby(result, key=itemgetter(0))
+
+    def __iter__(self) -> Iterator[Any]:
+        worker = get_worker_info()
+        if worker is None:
+            engine, shard, num_shards = self.engine, 0, 1
+        else:
+            engine = create_engine(self.engine.url)
+            shard, num_shards = worker.id, worker.num_workers
+
+        try:
+            for member_id, rows in self._member_rows(engine, shard, num_shards):
+                is_eval = member_id % self.eval_modulo == 0
+                if is_eval != (self.split == "eval"):
+                    continue
+                book_ids = np.fromiter((bid for _, bid in rows), dtype=np.int64)
+                columns = np.unique(self.id_map.find(book_ids)).astype(np.int64)
+                if len(columns) == 0:
+                    continue
+                if self.split == "train":
+                    yield columns
+                else:
+                    inputs, hidden = split_holdout(member_id, columns)
+                    if len(hidden):
+                        yield inputs, hidden
+        finally:
+            if engine is not self.engine:
+                engine.dispose()
+
+
+def _collate_columns(batch: list[np.ndarray]) -> list[np.ndarray]:
+    # 밀집화는 학습 루프에서 (워커 -> 메인 프로세스로 희소 배열만 전달)
+    return batch
+
+
+def interaction_loader(
+    engine: Engine,
+    id_map: IdMap,
+    split: str,
+    batch_size: int,
+    num_workers: int = 0,
+    eval_modulo: int = 10
+) -> DataLoader:
+    """회원별 열 번호 배열 목록을 미니배치로 내보내는 DataLoader"""
+    return DataLoader(
+        InteractionStream(engine, id_map, split, eval_modulo),
+        batch_size=batch_size,
+        num_workers=num_workers,
+        collate_fn=_collate_columns,
+    )
+
+
+def interaction_matrix(rows: list[np.ndarray], num_books: int):
+    """회원별 열 번호 배열 목록 -> (회원 수, 도서 수) 이진 CSR 행렬"""
+    from scipy.sparse import csr_matrix
+
+    indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+    np.cumsum([len(columns) for columns in rows], out=indptr[1:])
+    indices = np.concatenate(rows) if rows else np.empty(0, dtype=np.int64)
+    return csr_matrix(
+        (np.ones(len(indices), dtype=np.float32), indices, indptr),
+        shape=(len(rows), num_books),
+    )
+
+
+def train_epoch(
+    model: RecommenderModel,
+    optimizer: torch.optim.Optimizer,
+    batches: Iterable[list[np.ndarray]],
+    num_books: int,
+    corruption: float = 0.2
+) -> dict[str, float]:
+    """
+    디노이징 오토인코더 방식으로 한 에포크 학습합니다
+
+    입력의 일부 도서를 가리고 원래 이력 전체를 복원하도록 BCE로 학습합니다.
+    """
+    model.train()
+    loss_fn = torch.nn.BCELoss()
+    total_loss, num_batches, num_users = 0.0, 0, 0
+    for batch in batches:
+        targets = dense_rows(batch, num_books)
+        inputs = targets
+        if corruption > 0:
+            inputs = targets * (torch.rand_like(targets) >= corruption)
+        optimizer.zero_grad()
+        loss = loss_fn(model(inputs), targets)
+        loss.backward()
+        optimizer.step()
+        total_loss += loss.item()
+        num_batches += 1
+        num_users += len(batch)
+    return {
+        'loss': total_loss / num_batches if num_batches else 0.0,
+        'users': num_users,
+    }
+
+
+def recommend_rows(
+    model: RecommenderModel | FactorizationModel,
+    rows: list[np.ndarray],
+    k: int
+) -> list[tuple[np.ndarray, np.ndarray]]:
+    """모델 종류와 관계없이 사용자별 상위 k개 (열 번호, 점수)"""
+    if isinstance(model, FactorizationModel):
+        return model.recommend_batch(rows, k)
+    model.eval()
+    return score_topk(model, [InferenceRequest(columns, k) for columns in rows])
+
+
+def evaluate(
+    model: RecommenderModel | FactorizationModel,
+    batches: Iterable[list[tuple[np.ndarray, np.ndarray]]],
+    k: int
+) -> dict[str, float]:
+    """
+    평가용 회원의 가려진 도서를 상위 k개 안에 얼마나 맞히는지 계산합니다
+
+    Returns:
+        recall@k (맞힌 수 / min(k, 정답 수)의 평균), hit_rate@k, 평가 회원 수
+    """
+    recalls, hits = [], []
+    for batch in batches:
+        inputs = [columns for columns, _ in batch]
+        for (columns, _), (_, hidden) in zip(
+            recommend_rows(model, inputs, k), batch, strict=True
+        ):
+            found = len(np.intersect1d(columns, hidden))
+            recalls.append(found / min(k, len(hidden)))
+            hits.append(found > 0)
+    return {
+        f'recall@{k}': float(np.mean(recalls)) if recalls else 0.0,
+        f'hit_rate@{k}': float(np.mean(hits)) if hits else 0.0,
+        'eval_users': len(recalls),
+    }
+
+
+def save_checkpoint(
+    path: Path,
+    model: RecommenderModel,
+    optimizer: torch.optim.Optimizer,
+    epoch: int
+) -> None:
+    """체크포인트를 임시 파일에 쓴 뒤 교체합니다"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    torch.save({
+        'epoch': epoch,
+        'num_books': model.fc1.in_features,
+        'model': model.state_dict(),
+        'optimizer': optimizer.state_dict(),
+    }, temp_path)
+    os.replace(temp_path, path)
+
+
+def load_checkpoint(
+    path: Path,
+    model: RecommenderModel,
+    optimizer: torch.optim.Optimizer
+) -> int:
+    """
+    체크포인트가 있고 도서 수가 같으면 이어서 학습할 상태를 불러옵니다
+
+    Returns:
+        완료된 에포크 수 (불러오지 않았으면 0)
+    """
+    if not path.exists():
+        return 0
+    checkpoint = torch.load(path, weights_only=True)
+    if checkpoint['num_books'] != model.fc1.in_features:
+        logger.warning("카탈로그 크기가 바뀌어 체크포인트를 무시합니다")
+        return 0
+    model.load_state_dict(checkpoint['model'])
+    optimizer.load_state_dict(checkpoint['optimizer'])
+    return int(checkpoint['epoch'])
+
+
+def _train_autoencoder(
+    loader: Callable[[str], DataLoader],
+    num_books: int,
+    epochs: int,
+    learning_rate: float,
+    checkpoint_path: Path,
+    resume: bool
+) -> tuple[RecommenderModel, dict[str, Any]]:
+    config = settings.training
+    model = RecommenderModel(num_books)
+    optimizer = torch.optim.Adagrad(model.parameters(), lr=learning_rate)
+    start_epoch = load_checkpoint(checkpoint_path, model, optimizer) if resume else 0
+
+    history = []
+    for epoch in range(start_epoch, epochs):
+        stats = train_epoch(
+            model, optimizer, loader("train"), num_books, config.corruption
+        )
+        history.append(stats['loss'])
+        logger.info(f"에포크 {epoch + 1}/{epochs}: {stats}")
+        if (epoch + 1) % config.checkpoint_every == 0 or epoch + 1 == epochs:
+            save_checkpoint(checkpoint_path, model, optimizer, epoch + 1)
+
+    return model, {
+        'epochs': epochs,
+        'resumed_from_epoch': start_epoch,
+        'final_loss': history[-1] if history else None,
+    }
+
+
+def _train_factorization(
+    loader: Callable[[str], DataLoader],
+    num_books: int,
+    seed: int
+) -> tuple[FactorizationModel, dict[str, Any]]:
+    """학습용 회원 이력을 희소 행렬로 모아 ALS 학습 후 양자화합니다"""
+    config = settings.training
+    rows = [columns for batch in loader("train") for columns in batch]
+
+    model = train_als(
+        interaction_matrix(rows, num_books),
+        factors=config.factors,
+        regularization=config.regularization,
+        alpha=config.alpha,
+        iterations=config.als_iterations,
+        seed=seed,
+    ).quantize(config.quantization)
+    return model, {
+        'train_users': len(rows),
+        'factors': config.factors,
+        'iterations': config.als_iterations,
+        'quantization': config.quantization,
+        'item_matrix_bytes': model.nbytes,
+    }
+
+
+def train(
+    engine: Engine,
+    epochs: int | None = None,
+    learning_rate: float | None = None,
+    batch_size: int | None = None,
+    num_workers: int | None = None,
+    checkpoint_dir: Path | None = None,
+    resume: bool = False,
+    promote: bool = True,
+    seed: int = 0,
+    model_type: str | None = None
+) -> dict[str, Any]:
+    """
+    모델을 학습하고 평가한 뒤 레지스트리에 저장합니다
+
+    Args:
+        model_type: autoencoder 또는 factorization (기본: [training] model_type)
+
+    Returns:
+        버전, 학습/평가 지표, 소요시간 요약
+    """
+    config = settings.training
+    model_type = model_type or config.model_type
+    epochs = epochs if epochs is not None else settings.recommendation.num_epochs
+    learning_rate = learning_rate or settings.recommendation.learning_rate
+    batch_size = batch_size or config.batch_size
+    num_workers = num_workers if num_workers is not None else config.num_workers
+    checkpoint_path = (checkpoint_dir or config.checkpoint_path) / CHECKPOINT_FILE
+
+    torch.manual_seed(seed)
+    with Session(engine) as db:
+        catalog = build_catalog(db)
+    num_books = catalog.size
+
+    def loader(split: str) -> DataLoader:
+        return interaction_loader(
+            engine, catalog.aladin_map, split, batch_size, num_workers,
+            config.eval_modulo,
+        )
+
+    start = time.perf_counter()
+    if model_type == "factorization":
+        model, summary = _train_factorization(loader, num_books, seed)
+    else:
+        model, summary = _train_autoencoder(
+            loader, num_books, epochs, learning_rate, checkpoint_path, resume
+        )
+    train_s = time.perf_counter() - start
+
+    summary.update({
+        'model_type': model_type,
+        'num_books': num_books,
+        'train_s': round(train_s, 2),
+        'metrics': evaluate(model, loader("eval"), config.eval_k),
+    })
+
+    registry = model_registry.get_registry()
+    version = registry.save(model, metadata=summary)
+    if promote:
+        registry.promote(version)
+    summary['version'] = version
+    logger.info(f"학습 완료: {summary}")
+    return summary
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="추천 모델 오프라인 학습")
+    parser.add_argument("--database-url", help="기본 DB 대신 사용할 URL")
+    parser.add_argument("--epochs", type=int, help="기본: [recommendation] num_epochs")
+    parser.add_argument("--learning-rate", type=float)
+    parser.add_argument("--batch-size", type=int)
+    parser.add_argument("--workers", type=int, help="DataLoader 워커 수")
+    parser.add_argument("--checkpoint-dir", type=Path)
+    parser.add_argument("--resume", action="store_true", help="체크포인트에서 이어서")
+    parser.add_argument(
+        "--no-promote", action="store_true", help="current로 승격하지 않음"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--model-type", choices=("autoencoder", "factorization"),
+        help="기본: [training] model_type",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    engine = create_engine(args.database_url or settings.database_url)
+    try:
+        summary = train(
+            engine,
+            epochs=args.epochs,
+            learning_rate=args.learning_rate,
+            batch_size=args.batch_size,
+            num_workers=args.workers,
+            checkpoint_dir=args.checkpoint_dir,
+            resume=args.resume,
+            promote=not args.no_promote,
+            seed=args.seed,
+            model_type=args.model_type,
+        )
+    finally:
+        engine.dispose()
+    print(json.dumps(summary, indent=2, ensure_ascii=False))  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
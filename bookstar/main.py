@@ -1,18 +1,76 @@
+import asyncio
 import logging
 import time
-from contextlib import asynccontextmanager
+from collections.abc import Iterator
+from contextlib import asynccontextmanager, contextmanager
 
 from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
 from bookstar.config import settings
+from bookstar.config.config import SettingsSnapshot
 from bookstar.config.logging_config import logging_config
+from bookstar.config.watcher import ConfigWatcher
 from bookstar.database.connection import get_db
+from bookstar.database.query_stats import query_stats
 from bookstar.models.models import MemberBook
-from bookstar.schemas.schemas import SimpleRecommendationResult, UserRequest
-from bookstar.services.recommendation import recommend_books
+from bookstar.schemas.schemas import (
+    BatchUserRequest,
+    RecommendationResponse,
+    SimpleRecommendationResult,
+    UserRequest,
+)
+from bookstar.services.inference import reset_batcher
+from bookstar.services.recommendation import (
+    DATABASE_UNAVAILABLE,
+    DegradedRecommendations,
+    database_guard,
+    fallback_recommendations,
+    get_db_breaker,
+    recommend_books,
+    recommend_books_batch,
+    retry_with_own_budget,
+)
+from bookstar.services.result_cache import get_result_cache, reset_result_cache
+from bookstar.services.warmup import (
+    SnapshotRefresher,
+    run_warmup,
+    start_background_warmup,
+    warmup_state,
+)
+from bookstar.utils import singleflight
+from bookstar.utils.deadline import DeadlineExceeded, deadline_scope
 from bookstar.utils.decorators import log_async_execution_time
+from bookstar.utils.profiler import profile_request
+from bookstar.utils.profiling import (
+    end_request_timings,
+    get_current_timings,
+    span,
+    start_request_timings,
+)
+
+
+def _apply_log_level(old: SettingsSnapshot, new: SettingsSnapshot) -> None:
+    """설정 재로드 시 바뀐 로그 레벨을 루트 로거에 반영합니다"""
+    if old.logging.level != new.logging.level:
+        logging.getLogger().setLevel(new.logging.level.upper())
+
+
+@contextmanager
+def _session_scope() -> Iterator[Session]:
+    """
+    요청과 같은 DB 세션 공급자로 세션을 엽니다
+
+    get_db 의존성이 재정의된 경우(테스트, 부하 테스트) 재정의된 공급자를 사용합니다.
+    """
+    provider = app.dependency_overrides.get(get_db, get_db)
+    sessions = provider()
+    try:
+        yield next(sessions)
+    finally:
+        sessions.close()
 
 
 # 로깅 시스템 초기화
@@ -20,29 +78,80 @@ from bookstar.utils.decorators import log_async_execution_time
 async def lifespan(app: FastAPI):
     """애플리케이션 생명주기 관리"""
     # 애플리케이션 시작 시 - 모든 로깅 설정 적용
+    log_settings = settings.logging
     logging_config.setup_logging(
-        log_level=settings.logging['level'],
-        use_json=settings.logging['use_json'],
-        enable_console=settings.logging['enable_console'],
-        max_file_size_mb=settings.logging['max_file_size_mb'],
-        backup_count=settings.logging['backup_count'],
-        enable_access_log=settings.logging['enable_access_log'],
-        enable_performance_log=settings.logging['enable_performance_log'],
-        enable_traceback_log=settings.logging['enable_traceback_log'],
-        main_log_retention_days=settings.logging['main_log_retention_days'],
-        error_log_retention_days=settings.logging['error_log_retention_days'],
-        access_log_retention_days=settings.logging['access_log_retention_days'],
-        performance_log_retention_days=settings.logging['performance_log_retention_days'],
-        traceback_log_retention_days=settings.logging['traceback_log_retention_days']
+        log_level=log_settings.level,
+        use_json=log_settings.use_json,
+        enable_console=log_settings.enable_console,
+        max_file_size_mb=log_settings.max_file_size_mb,
+        backup_count=log_settings.backup_count,
+        enable_access_log=log_settings.enable_access_log,
+        enable_performance_log=log_settings.enable_performance_log,
+        enable_traceback_log=log_settings.enable_traceback_log,
+        main_log_retention_days=log_settings.main_log_retention_days,
+        error_log_retention_days=log_settings.error_log_retention_days,
+        access_log_retention_days=log_settings.access_log_retention_days,
+        performance_log_retention_days=log_settings.performance_log_retention_days,
+        traceback_log_retention_days=log_settings.traceback_log_retention_days
     )
     
     logger = logging.getLogger(__name__)
     logger.info("BookStar AI 애플리케이션이 시작되었습니다.")
     logger.info(f"로그 설정: {settings.logging}")
     
+    # 설정 파일 변경 감지 (재시작 없이 추천/로깅 파라미터 반영)
+    settings.subscribe(_apply_log_level)
+    watcher = None
+    if settings.config_watch.enabled:
+        watcher = ConfigWatcher(settings)
+        watcher.start()
+    
+    # 워밍업 (카탈로그/KNN 인덱스/상위 회원 추천 캐시 준비)
+    warmup_settings = settings.warmup
+    artifact_dir = (
+        settings.artifacts.path if settings.artifacts.load_on_startup else None
+    )
+    warmup_state.reset()
+    if not warmup_settings.enabled:
+        warmup_state.mark("disabled")
+    elif warmup_settings.background:
+        start_background_warmup(
+            _session_scope,
+            warmup_settings.precompute_top_members,
+            artifact_dir=artifact_dir,
+            load_model=settings.model_registry.load_on_startup,
+            similarity=settings.artifacts.similarity,
+        )
+    else:
+        await asyncio.to_thread(
+            run_warmup,
+            _session_scope,
+            warmup_settings.precompute_top_members,
+            artifact_dir=artifact_dir,
+            load_model=settings.model_registry.load_on_startup,
+            similarity=settings.artifacts.similarity,
+        )
+    # 스냅샷 주기 갱신 (새 도서/회원 반영, 아티팩트는 CURRENT가 바뀔 때만 교체)
+    refresher = None
+    if warmup_settings.enabled and warmup_settings.snapshot_refresh_s > 0:
+        refresher = SnapshotRefresher(
+            _session_scope,
+            warmup_settings.snapshot_refresh_s,
+            artifact_dir=artifact_dir,
+            similarity=settings.artifacts.similarity,
+        )
+        refresher.start()
+    
     yield
     
     # 애플리케이션 종료 시
+    if refresher is not None:
+        refresher.stop()
+    if watcher is not None:
+        watcher.stop()
+    settings.unsubscribe(_apply_log_level)
+    reset_batcher()
+    reset_result_cache()
     logger.info("BookStar AI 애플리케이션이 종료되었습니다.")
 app = FastAPI(
     title="BookStar AI", 
@@ -53,7 +162,7 @@ app = FastAPI(
 # CORS 설정 추가
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.app['cors_origins'],
+    allow_origins=settings.app.cors_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -74,6 +183,9 @@ async def log_requests(request: Request, call_next):
     user_agent = request.headers.get("user-agent", "unknown")
     request_id = str(time.time_ns())[-8:]  # 간단한 요청 ID
     
+    # 요청 단위 단계별 소요시간 수집 시작
+    timings, timings_token = start_request_timings(request_id)
+    
     access_logger.info(
         f"[{request_id}] 요청 시작: {request.method} {request.url.path}",
         extra={
@@ -106,8 +218,31 @@ async def log_requests(request: Request, call_next):
             }
         )
         
+        # 단계별 소요시간 성능 로그 (요청당 한 줄)
+        timings_data = timings.to_dict()
+        spans_summary = ", ".join(
+            f"{name}={elapsed}ms"
+            for name, elapsed in timings_data['spans_ms'].items()
+        )
+        logging_config.get_performance_logger().info(
+            f"[{request_id}] {request.method} {request.url.path} "
+            f"total={process_time:.2f}ms {spans_summary} "
+            f"db={timings_data['db_queries']}queries/"
+            f"{timings_data['db_rows']}rows/{timings_data['db_time_ms']}ms",
+            extra={
+                'request_id': request_id,
+                'execution_time': process_time,
+                'path': request.url.path,
+                'timings': timings_data
+            }
+        )
+        
         # 응답 헤더에 요청 ID 추가
         response.headers["X-Request-ID"] = request_id
+        if settings.logging.enable_server_timing:
+            response.headers["Server-Timing"] = timings.server_timing_header(
+                process_time
+            )
         return response
         
     except Exception as e:
@@ -127,13 +262,145 @@ async def log_requests(request: Request, call_next):
             }
         )
         raise
+    finally:
+        end_request_timings(timings_token)
 
 
-@app.post(
-    "/recommend_books", 
-    response_model=dict[str, list[SimpleRecommendationResult]]
+@app.get("/ready")
+async def get_readiness():
+    """준비 상태 조회 API (워밍업이 끝나기 전에는 503)"""
+    state = warmup_state.to_dict()
+    return JSONResponse(status_code=200 if state['ready'] else 503, content=state)
+
+
+@app.get("/metrics")
+async def get_metrics():
+    """운영 지표 조회 API (쿼리 지문별 실행 통계, 동시 요청 합치기 횟수 등)"""
+    cache = get_result_cache()
+    breaker = get_db_breaker()
+    return {
+        "queries": query_stats.snapshot(top_n=50),
+        "singleflight": singleflight.snapshot(),
+        "result_cache": cache.stats() if cache is not None else None,
+        "circuit_breaker": breaker.stats() if breaker is not None else None,
+    }
+
+
+def _recommend_for_user(db: Session, user_id: int) -> list[dict]:
+    """사용자 도서 이력을 조회하여 추천 목록을 계산합니다"""
+    logger = logging.getLogger(__name__)
+    
+    # 사용자 도서 정보 조회 (DB를 쓸 수 없으면 대체 추천)
+    try:
+        with span("member_book"), database_guard():
+            member_books = (
+                db.query(MemberBook)
+                .filter(MemberBook.member_id == user_id)
+                .all() or []
+            )
+    except DATABASE_UNAVAILABLE as e:
+        logger.warning(
+            f"DB를 사용할 수 없어 사용자 {user_id}에게 대체 추천으로 응답: {e}",
+            extra={'user_id': user_id, 'error_type': type(e).__name__}
+        )
+        return fallback_recommendations(
+            user_id, settings.recommendation.default_recommendations_count
+        )
+    except DeadlineExceeded as e:
+        # DB 장애가 아니라 시간 예산 부족 (결과는 stale로 저장되어 다시 계산됨)
+        logger.warning(
+            f"{e} - 사용자 {user_id}에게 대체 추천으로 응답",
+            extra={'user_id': user_id, 'stage': 'member_book'}
+        )
+        return fallback_recommendations(
+            user_id,
+            settings.recommendation.default_recommendations_count,
+            degraded=('member_book',),
+        )
+
+    read_list = [
+        str(book.book_id) 
+        for book in member_books 
+        if book.reading_status.value in ["READED", "READING"]
+    ]
+    want_list = [
+        str(book.book_id) 
+        for book in member_books 
+        if book.reading_status.value == "WANT_TO_READ"
+    ]
+
+    logger.info(
+        f"사용자 도서 정보 조회 완료: 읽은 책 {len(read_list)}권, "
+        f"읽고 싶은 책 {len(want_list)}권",
+        extra={
+            'user_id': user_id,
+            'read_books_count': len(read_list),
+            'want_books_count': len(want_list)
+        }
+    )
+    
+    logger.debug(f"읽은 책 목록: {read_list}")
+    logger.debug(f"읽고 싶은 책 목록: {want_list}")
+
+    if not read_list and not want_list:
+        logger.warning(
+            f"사용자 {user_id}의 도서 이력이 없어 랜덤 추천을 진행합니다.",
+            extra={'user_id': user_id, 'recommendation_type': 'random'}
+        )
+        return recommend_books(
+            db=db,
+            user_id=user_id,
+            read_list=[],
+            want_list=[],
+            num_recommendations=settings.recommendation.default_recommendations_count
+        )
+
+    logger.info(
+        f"사용자 {user_id}의 도서 이력을 바탕으로 개인화 추천을 진행합니다.",
+        extra={'user_id': user_id, 'recommendation_type': 'personalized'}
+    )
+    return recommend_books(
+        db=db,
+        user_id=user_id,
+        read_list=read_list,
+        want_list=want_list,
+        num_recommendations=settings.recommendation.default_recommendations_count
+    )
+
+
+# 같은 사용자의 동시 추천 요청은 먼저 시작한 계산 하나의 결과를 함께 받음
+_recommend_flight = singleflight.get_group("recommend_books")
+
+
+def _profiled_recommend(db: Session, user_id: int, request_id: str) -> list[dict]:
+    """계산을 실행하는 스레드에서 프로파일링하며 추천 목록을 계산합니다"""
+    with profile_request(request_id, "recommend_books"):
+        return _recommend_for_user(db, user_id)
+
+
+def _refresh_recommendations(key: tuple[int, int]) -> list[dict] | None:
+    """
+    stale 결과를 백그라운드에서 다시 계산합니다
+
+    요청 세션은 응답 후 닫히므로 새 세션을 열고, 같은 키의 동기 계산이 진행 중이면
+    그 결과를 함께 받습니다. DB 없이 만든 대체 추천이면 None (기존 결과 유지)
+    """
+    def compute(user_id: int) -> list[dict]:
+        with _session_scope() as db:
+            return _recommend_for_user(db, user_id)
+
+    recommendations = _recommend_flight.do(
+        key, compute, key[0], retry_if=retry_with_own_budget
+    )
+    if isinstance(recommendations, DegradedRecommendations):
+        return None
+    return recommendations
+
+
+@app.post("/recommend_books", response_model=RecommendationResponse)
+@log_async_execution_time(
+    threshold_ms=lambda: settings.logging.performance_threshold_ms
 )
-@log_async_execution_time(threshold_ms=settings.logging['performance_threshold_ms'])
 async def get_recommendations(user: UserRequest, db: Session = Depends(get_db)):
     """도서 추천 API 엔드포인트"""
     logger = logging.getLogger(__name__)
@@ -141,72 +408,48 @@ async def get_recommendations(user: UserRequest, db: Session = Depends(get_db)):
     try:
         logger.info(f"도서 추천 요청: 사용자 ID = {user.user_id}")
         
-        # 사용자 도서 정보 조회
-        member_books = (
-            db.query(MemberBook)
-            .filter(MemberBook.member_id == user.user_id)
-            .all() or []
-        )
-
-        read_list = [
-            str(book.book_id) 
-            for book in member_books 
-            if book.reading_status.value in ["READED", "READING"]
-        ]
-        want_list = [
-            str(book.book_id) 
-            for book in member_books 
-            if book.reading_status.value == "WANT_TO_READ"
-        ]
+        # 샘플링 프로파일러 (config.toml [profiling] 설정 시에만 동작)
+        timings = get_current_timings()
+        request_id = timings.request_id if timings else str(time.time_ns())[-8:]
+        key = (user.user_id, settings.recommendation.default_recommendations_count)
 
-        logger.info(
-            f"사용자 도서 정보 조회 완료: 읽은 책 {len(read_list)}권, "
-            f"읽고 싶은 책 {len(want_list)}권",
-            extra={
-                'user_id': user.user_id,
-                'read_books_count': len(read_list),
-                'want_books_count': len(want_list)
-            }
+        # 결과 캐시: fresh/stale이면 바로 반환 (stale은 백그라운드 갱신 예약)
+        cache = get_result_cache()
+        recommendations, state = (
+            cache.lookup(key) if cache is not None else (None, 'miss')
         )
-        
-        logger.debug(f"읽은 책 목록: {read_list}")
-        logger.debug(f"읽고 싶은 책 목록: {want_list}")
-
-        if not read_list and not want_list:
-            logger.warning(
-                f"사용자 {user.user_id}의 도서 이력이 없어 랜덤 추천을 진행합니다.",
-                extra={'user_id': user.user_id, 'recommendation_type': 'random'}
-            )
-            recommendations = recommend_books(
-                db=db,
-                user_id=user.user_id,
-                read_list=[],
-                want_list=[],
-                num_recommendations=settings.recommendation['default_recommendations_count']
-            )
-        else:
-            logger.info(
-                f"사용자 {user.user_id}의 도서 이력을 바탕으로 "
-                f"개인화 추천을 진행합니다.",
-                extra={'user_id': user.user_id, 'recommendation_type': 'personalized'}
-            )
-            recommendations = recommend_books(
-                db=db,
-                user_id=user.user_id,
-                read_list=read_list,
-                want_list=want_list,
-                num_recommendations=settings.recommendation['default_recommendations_count']
+        if state == 'stale':
+            cache.refresh(key, _refresh_recommendations, key)
+        if state == 'miss':
+            # 요청 시간 예산 (계산 스레드와 DB 쿼리 실행 시간 제한에 전달)
+            budget_ms = (
+                user.deadline_ms if user.deadline_ms is not None
+                else settings.recommendation.deadline_ms
             )
+            with deadline_scope(budget_ms):
+                # 먼저 온 요청이 자기 예산 때문에 단계를 생략했으면 이 요청의
+                # 예산으로 다시 계산 (retry_with_own_budget)
+                recommendations = await _recommend_flight.do_async(
+                    key, _profiled_recommend, db, user.user_id, request_id,
+                    retry_if=retry_with_own_budget,
+                )
+        degraded = list(getattr(recommendations, 'degraded', ()))
+        # DB 없이 만든 대체 추천은 마지막 정상 결과를 덮어쓰지 않고,
+        # 시간 예산으로 단계를 생략한 결과는 stale로 저장 (다음 요청에서 전체 갱신)
+        if state == 'miss' and cache is not None and 'database' not in degraded:
+            cache.store(key, recommendations, stale=bool(degraded))
 
         logger.info(
             f"도서 추천 완료: 사용자 {user.user_id}에게 {len(recommendations)}권 추천",
             extra={
                 'user_id': user.user_id,
-                'recommendations_count': len(recommendations)
+                'recommendations_count': len(recommendations),
+                'result_cache': state,
+                'degraded': degraded
             }
         )
 
-        return {"recommendations": recommendations}
+        return {"recommendations": recommendations, "degraded": degraded}
 
     except Exception as e:
         logger.error(
@@ -214,4 +457,40 @@ async def get_recommendations(user: UserRequest, db: Session = Depends(get_db)):
             exc_info=True,
             extra={'user_id': user.user_id, 'error_type': type(e).__name__}
         )
-        raise HTTPException(status_code=500, detail=str(e)) from e
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+@app.post(
+    "/recommend_books/batch", 
+    response_model=dict[str, dict[int, list[SimpleRecommendationResult]]]
+)
+@log_async_execution_time(
+    threshold_ms=lambda: settings.logging.performance_threshold_ms
+)
+async def get_batch_recommendations(
+    request: BatchUserRequest, db: Session = Depends(get_db)
+):
+    """여러 사용자 도서 추천 API 엔드포인트 (콘텐츠 점수를 행렬 곱으로 한 번에 계산)"""
+    logger = logging.getLogger(__name__)
+    
+    try:
+        logger.info(f"배치 도서 추천 요청: 사용자 {len(request.user_ids)}명")
+        # 행렬 곱/DB 조회가 오래 걸리므로 이벤트 루프를 막지 않도록 스레드에서 계산
+        recommendations = await asyncio.to_thread(
+            recommend_books_batch,
+            db,
+            request.user_ids,
+            settings.recommendation.default_recommendations_count,
+        )
+        return {"recommendations": recommendations}
+    
+    except Exception as e:
+        logger.error(
+            f"배치 도서 추천 처리 중 오류 발생: {str(e)}",
+            exc_info=True,
+            extra={
+                'user_count': len(request.user_ids),
+                'error_type': type(e).__name__,
+            }
+        )
+        raise HTTPException(status_code=500, detail=str(e)) from e
@@ -8,7 +8,6 @@ from .models import (
     Member,
     MemberBook,
     ReadingStatus,
-    RecommenderModel,
 )
 
 __all__ = [
@@ -18,4 +17,12 @@ __all__ = [
     'BookCategory', 
     'ReadingStatus', 
     'RecommenderModel'
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name: str):
+    # RecommenderModel은 torch를 임포트하므로 처음 접근할 때 로드
+    if name == 'RecommenderModel':
+        from .recommender import RecommenderModel
+        return RecommenderModel
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,229 @@
+"""
+행렬 분해(암시적 피드백 ALS) 추천 모델
+전체 도서 폭의 층을 가진 오토인코더와 달리 도서마다 길이 factors인 벡터만 저장하므로
+파라미터 수와 사용자당 추론 비용이 도서 수 × factors에 비례
+(점수 = 사용자 벡터 @ 도서 행렬.T 한 번 + argpartition)
+
+도서 행렬은 float16 또는 int8(행별 스케일)로 양자화하여 메모리를 줄일 수 있고,
+사용자 벡터는 요청 시점에 사용자 이력으로 계산(fold-in)하므로 저장하지 않습니다.
+"""
+import hashlib
+import io
+from dataclasses import dataclass, replace
+from typing import ClassVar
+
+import numpy as np
+
+QUANTIZATIONS = ("float32", "float16", "int8")
+
+# 점수 계산 시 한 번에 float32로 변환할 도서 행 수 (임시 메모리 상한)
+SCORE_BLOCK_ROWS = 65_536
+
+
+@dataclass(frozen=True, eq=False)
+class FactorizationModel:
+    """도서 잠재 벡터 + fold-in에 필요한 값"""
+
+    model_type: ClassVar[str] = "factorization"
+
+    item_factors: np.ndarray          # (도서 수, factors) float32/float16/int8
+    item_scales: np.ndarray | None    # int8일 때 행별 스케일 (float32)
+    gram: np.ndarray                  # 양자화 전 도서 행렬의 YᵀY (float32)
+    regularization: float
+    alpha: float
+
+    @property
+    def num_books(self) -> int:
+        return self.item_factors.shape[0]
+
+    @property
+    def factors(self) -> int:
+        return self.item_factors.shape[1]
+
+    @property
+    def quantization(self) -> str:
+        return "int8" if self.item_scales is not None else self.item_factors.dtype.name
+
+    @property
+    def nbytes(self) -> int:
+        """도서 행렬이 차지하는 메모리 (바이트)"""
+        scales = 0 if self.item_scales is None else self.item_scales.nbytes
+        return self.item_factors.nbytes + scales
+
+    def item_vectors(self, rows: np.ndarray | slice) -> np.ndarray:
+        """도서 벡터를 float32로 복원합니다"""
+        vectors = self.item_factors[rows].astype(np.float32)
+        if self.item_scales is not None:
+            vectors *= self.item_scales[rows, None]
+        return vectors
+
+    def user_vectors(self, rows: list[np.ndarray]) -> np.ndarray:
+        """
+        사용자별 도서 이력(열 번호)으로 사용자 벡터를 계산합니다 (ALS 한 단계와 동일)
+
+        (YᵀY + α·Y_iᵀY_i + λI) x = (1 + α)·Σ y_i
+        """
+        identity = self.regularization * np.eye(self.factors, dtype=np.float32)
+        vectors = np.zeros((len(rows), self.factors), dtype=np.float32)
+        for i, columns in enumerate(rows):
+            if len(columns) == 0:
+                continue
+            items = self.item_vectors(np.asarray(columns))
+            a = self.gram + self.alpha * (items.T @ items) + identity
+            b = (1 + self.alpha) * items.sum(axis=0)
+            vectors[i] = np.linalg.solve(a, b)
+        return vectors
+
+    def scores(self, user_vectors: np.ndarray) -> np.ndarray:
+        """(사용자 수, 도서 수) 점수 (도서 행렬을 블록 단위로 float32 변환)"""
+        scores = np.empty((len(user_vectors), self.num_books), dtype=np.float32)
+        for start in range(0, self.num_books, SCORE_BLOCK_ROWS):
+            block = slice(start, min(start + SCORE_BLOCK_ROWS, self.num_books))
+            scores[:, block] = user_vectors @ self.item_vectors(block).T
+        return scores
+
+    def recommend_batch(
+        self, rows: list[np.ndarray], k: int
+    ) -> list[tuple[np.ndarray, np.ndarray]]:
+        """
+        사용자별 상위 k개 (열 번호, 점수) (이미 상호작용한 열 제외)
+        """
+        scores = self.scores(self.user_vectors(rows))
+        results = []
+        for row_scores, columns in zip(scores, rows, strict=True):
+            row_scores[np.asarray(columns, dtype=np.int64)] = -np.inf
+            count = min(k, self.num_books - len(columns))
+            if count <= 0:
+                results.append((np.empty(0, dtype=np.int64), np.empty(0, np.float32)))
+                continue
+            top = np.argpartition(-row_scores, count - 1)[:count]
+            top = top[np.argsort(-row_scores[top], kind='stable')]
+            results.append((top, row_scores[top]))
+        return results
+
+    def recommend(
+        self, columns: np.ndarray, k: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """사용자 한 명의 상위 k개 (열 번호, 점수)"""
+        return self.recommend_batch([columns], k)[0]
+
+    def quantize(self, kind: str) -> "FactorizationModel":
+        """도서 행렬을 float16 또는 int8(행별 대칭 스케일)로 양자화한 사본"""
+        if kind not in QUANTIZATIONS:
+            raise ValueError(f"알 수 없는 양자화: {kind} (가능한 값: {QUANTIZATIONS})")
+        vectors = self.item_vectors(slice(None))
+        if kind == "float32":
+            return replace(self, item_factors=vectors, item_scales=None)
+        if kind == "float16":
+            return replace(
+                self, item_factors=vectors.astype(np.float16), item_scales=None
+            )
+        scales = np.abs(vectors).max(axis=1) / 127
+        scales[scales == 0] = 1.0
+        quantized = np.round(vectors / scales[:, None]).astype(np.int8)
+        return replace(
+            self, item_factors=quantized, item_scales=scales.astype(np.float32)
+        )
+
+    def _arrays(self) -> dict[str, np.ndarray]:
+        arrays = {
+            'item_factors': self.item_factors,
+            'gram': self.gram,
+            'params': np.array([self.regularization, self.alpha], dtype=np.float64),
+        }
+        if self.item_scales is not None:
+            arrays['item_scales'] = self.item_scales
+        return arrays
+
+    def content_hash(self) -> str:
+        """배열 내용 해시 (모델 레지스트리 버전)"""
+        digest = hashlib.sha256(self.model_type.encode())
+        for name, array in sorted(self._arrays().items()):
+            array = np.ascontiguousarray(array)
+            digest.update(name.encode())
+            digest.update(array.dtype.str.encode())
+            digest.update(str(array.shape).encode())
+            digest.update(array.tobytes())
+        return digest.hexdigest()[:16]
+
+    def to_bytes(self) -> bytes:
+        buffer = io.BytesIO()
+        np.savez(buffer, **self._arrays())
+        return buffer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "FactorizationModel":
+        with np.load(io.BytesIO(data), allow_pickle=False) as arrays:
+            regularization, alpha = arrays['params'].tolist()
+            return cls(
+                item_factors=arrays['item_factors'],
+                item_scales=(
+                    arrays['item_scales'] if 'item_scales' in arrays.files else None
+                ),
+                gram=arrays['gram'],
+                regularization=regularization,
+                alpha=alpha,
+            )
+
+
+def _solve_rows(
+    matrix, fixed: np.ndarray, regularization: float, alpha: float
+) -> np.ndarray:
+    """matrix의 각 행에 대해 다른 쪽 벡터(fixed)를 고정하고 최소제곱해를 구합니다"""
+    factors = fixed.shape[1]
+    gram = fixed.T @ fixed
+    identity = regularization * np.eye(factors, dtype=np.float32)
+    solved = np.zeros((matrix.shape[0], factors), dtype=np.float32)
+    indptr, indices = matrix.indptr, matrix.indices
+    for row in range(matrix.shape[0]):
+        columns = indices[indptr[row]:indptr[row + 1]]
+        if len(columns) == 0:
+            continue
+        vectors = fixed[columns]
+        a = gram + alpha * (vectors.T @ vectors) + identity
+        b = (1 + alpha) * vectors.sum(axis=0)
+        solved[row] = np.linalg.solve(a, b)
+    return solved
+
+
+def train_als(
+    matrix,
+    factors: int = 64,
+    regularization: float = 0.1,
+    alpha: float = 10.0,
+    iterations: int = 15,
+    seed: int = 0
+) -> FactorizationModel:
+    """
+    암시적 피드백 ALS (Hu, Koren, Volinsky 2008)로 도서 벡터를 학습합니다
+
+    Args:
+        matrix: (사용자 수, 도서 수) 이진 희소 행렬 (scipy.sparse)
+        factors: 잠재 벡터 길이
+        regularization: L2 정규화 계수 λ
+        alpha: 상호작용한 칸의 신뢰도 가중치 (c = 1 + α)
+        iterations: 사용자/도서 번갈아 풀기 반복 수
+
+    Returns:
+        float32 모델 (quantize로 양자화)
+    """
+    from scipy.sparse import csr_matrix
+
+    user_items = csr_matrix(matrix, dtype=np.float32)
+    item_users = user_items.T.tocsr()
+    rng = np.random.default_rng(seed)
+    items = rng.normal(
+        scale=0.01, size=(user_items.shape[1], factors)
+    ).astype(np.float32)
+
+    for _ in range(iterations):
+        users = _solve_rows(user_items, items, regularization, alpha)
+        items = _solve_rows(item_users, users, regularization, alpha)
+
+    return FactorizationModel(
+        item_factors=items,
+        item_scales=None,
+        gram=items.T @ items,
+        regularization=regularization,
+        alpha=alpha,
+    )
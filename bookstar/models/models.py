@@ -1,8 +1,6 @@
 from enum import Enum as PyEnum
 from typing import TYPE_CHECKING
 
-import torch
-import torch.nn as nn
 from sqlalchemy import (
     BigInteger,
     Boolean,
@@ -18,7 +16,7 @@ from sqlalchemy.orm import DeclarativeBase, relationship
 from sqlalchemy.types import LargeBinary
 
 if TYPE_CHECKING:
-    pass
+    from .recommender import RecommenderModel  # noqa: F401
 
 class Base(DeclarativeBase):
     pass
@@ -103,16 +101,10 @@ class MemberBook(Base):
     member = relationship('Member', back_populates='member_books')
     book = relationship('Book', back_populates='member_books')
 
-# PyTorch 모델
-class RecommenderModel(nn.Module):
-    def __init__(self, num_books: int) -> None:
-        super().__init__()
-        self.fc1 = nn.Linear(num_books, 128)
-        self.fc2 = nn.Linear(128, 64)
-        self.fc3 = nn.Linear(64, num_books)
-        
-    def forward(self, x: torch.Tensor) -> torch.Tensor:
-        x = torch.relu(self.fc1(x))
-        x = torch.relu(self.fc2(x))
-        x = torch.sigmoid(self.fc3(x))
-        return x
+# PyTorch 모델은 torch 임포트를 피하기 위해 recommender.py로 분리
+# (기존 `from bookstar.models.models import RecommenderModel` 호환 유지)
+def __getattr__(name: str):
+    if name == 'RecommenderModel':
+        from .recommender import RecommenderModel
+        return RecommenderModel
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
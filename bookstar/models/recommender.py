@@ -0,0 +1,20 @@
+"""
+PyTorch 추천 모델 정의
+torch 임포트 비용이 크므로 ORM 모델(models.py)과 분리하여 필요할 때만 로드
+"""
+import torch
+import torch.nn as nn
+
+
+class RecommenderModel(nn.Module):
+    def __init__(self, num_books: int) -> None:
+        super().__init__()
+        self.fc1 = nn.Linear(num_books, 128)
+        self.fc2 = nn.Linear(128, 64)
+        self.fc3 = nn.Linear(64, num_books)
+        
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        x = torch.relu(self.fc1(x))
+        x = torch.relu(self.fc2(x))
+        x = torch.sigmoid(self.fc3(x))
+        return x
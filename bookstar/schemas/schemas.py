@@ -1,7 +1,10 @@
 from datetime import datetime
 from enum import Enum
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
+
+# 배치 추천 API 한 번에 받을 수 있는 최대 사용자 수
+MAX_BATCH_USERS = 100
 
 
 class ReadingStatusEnum(str, Enum):
@@ -85,9 +88,18 @@ class UserRequest(BaseModel):
     model_config = ConfigDict(from_attributes=True)
     
     user_id: int
+    # 이 요청의 시간 예산 (없으면 config.toml [recommendation] deadline_ms)
+    deadline_ms: float | None = Field(default=None, gt=0)
     # 추후 read_list 및 recommend_list 필드를 추가해 사용 가능
 
 
+class BatchUserRequest(BaseModel):
+    """배치 추천 요청 스키마"""
+    model_config = ConfigDict(from_attributes=True)
+    
+    user_ids: list[int] = Field(min_length=1, max_length=MAX_BATCH_USERS)
+
+
 class UserKeyword(BaseModel):
     model_config = ConfigDict(from_attributes=True)
     
@@ -103,4 +115,12 @@ class SimpleRecommendationResult(BaseModel):
     """간단한 추천 결과 응답 스키마"""
     model_config = ConfigDict(from_attributes=True)
     
-    book_id: int
\ No newline at end of file
+    book_id: int
+
+
+class RecommendationResponse(BaseModel):
+    """단건 추천 응답 스키마"""
+
+    recommendations: list[SimpleRecommendationResult]
+    # 시간 예산 초과/DB 장애로 생략하거나 대체한 단계 (collaborative, database)
+    degraded: list[str] = Field(default_factory=list)
@@ -0,0 +1,355 @@
+"""
+추천 아티팩트 모듈
+카탈로그 배열, 상호작용 CSR 배열, 미리 계산한 이웃 목록을 버전별 디렉토리에
+.npy 파일로 저장하고 np.load(mmap_mode='r')로 읽어, 같은 호스트의 워커들이
+OS 페이지 캐시의 같은 물리 페이지를 공유하도록 함
+
+디렉토리 구조:
+    <root>/CURRENT                  # 현재 버전 이름 (임시 파일 + os.replace로 교체)
+    <root>/<version>/manifest.json  # 형식 버전, 배열 dtype/shape/sha256, 생성 정보
+    <root>/<version>/<name>.npy     # 배열 하나당 파일 하나
+
+문자열 목록(저자 이름)은 고정 폭 유니코드 배열 대신 UTF-8 바이트 배열과 시작
+위치(offsets) 배열로 저장하여, 가장 긴 이름 기준으로 모든 항목이 커지지 않도록 함
+"""
+import hashlib
+import json
+import logging
+import os
+import secrets
+import shutil
+import threading
+import time
+from datetime import UTC, datetime
+from itertools import pairwise
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from bookstar.services.catalog import CatalogSnapshot, NeighborIndex
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+CURRENT_FILE = "CURRENT"
+MANIFEST_FILE = "manifest.json"
+
+CATALOG_ARRAYS = (
+    'book_ids', 'aladin_ids', 'category_codes', 'author_codes',
+    'author_name_bytes', 'author_name_offsets', 'popular_rows',
+)
+# KNN 인덱스가 있으면 모두 있어야 하는 배열 (미리 계산한 이웃 목록 neighbors는 선택)
+NEIGHBOR_ARRAYS = ('member_ids', 'indptr', 'indices', 'book_values')
+
+# 같은 프로세스에서 연달아 만든 버전 이름이 항상 뒤에 정렬되도록 마지막 값 기록
+_version_lock = threading.Lock()
+_last_version_us = 0
+
+
+class ArtifactError(Exception):
+    """아티팩트가 없거나 형식이 맞지 않거나 손상된 경우"""
+
+
+def new_version() -> str:
+    """
+    시간순으로 정렬되는 새 버전 이름 (UTC 마이크로초 타임스탬프-임의 문자열)
+
+    같은 프로세스에서는 직전 이름보다 최소 1마이크로초 뒤의 시각을 사용하므로,
+    같은 초에 여러 번 빌드해도 만든 순서대로 정렬되어 rollback 순서가 유지됩니다.
+    """
+    global _last_version_us
+    with _version_lock:
+        now_us = max(time.time_ns() // 1000, _last_version_us + 1)
+        _last_version_us = now_us
+    seconds, micros = divmod(now_us, 1_000_000)
+    stamp = datetime.fromtimestamp(seconds, tz=UTC).strftime('%Y%m%dT%H%M%S')
+    return f"{stamp}.{micros:06d}Z-{secrets.token_hex(3)}"
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _encode_strings(values: tuple[str, ...]) -> tuple[np.ndarray, np.ndarray]:
+    """문자열 목록을 UTF-8 바이트 배열(uint8)과 시작 위치 배열(int64, 길이 n+1)로"""
+    encoded = [value.encode('utf-8') for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(value) for value in encoded], dtype=np.int64)
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+
+def _decode_strings(data: np.ndarray, offsets: np.ndarray) -> tuple[str, ...]:
+    """_encode_strings로 저장한 배열을 문자열 튜플로 되돌립니다"""
+    raw = data.tobytes()
+    return tuple(
+        raw[start:end].decode('utf-8')
+        for start, end in pairwise(offsets.tolist())
+    )
+
+
+def write_artifact(
+    root: str | Path,
+    catalog: CatalogSnapshot,
+    neighbor_index: NeighborIndex | None,
+    metadata: dict[str, Any] | None = None,
+    version: str | None = None
+) -> Path:
+    """
+    스냅샷을 새 버전 디렉토리에 저장합니다
+
+    임시 디렉토리에 모두 쓴 뒤 이름을 바꾸므로, 중간에 실패해도 읽을 수 있는
+    반쪽짜리 버전이 남지 않습니다. CURRENT는 바꾸지 않습니다 (set_current 사용).
+
+    Returns:
+        생성된 버전 디렉토리 경로
+    """
+    root = Path(root)
+    version = version or new_version()
+    final_dir = root / version
+    if final_dir.exists():
+        raise ArtifactError(f"이미 존재하는 아티팩트 버전입니다: {version}")
+    temp_dir = root / f".{version}.tmp"
+    temp_dir.mkdir(parents=True)
+
+    author_name_bytes, author_name_offsets = _encode_strings(catalog.author_names)
+    arrays: dict[str, np.ndarray | None] = {
+        'book_ids': catalog.book_ids,
+        'aladin_ids': catalog.aladin_ids,
+        'category_codes': catalog.category_codes,
+        'author_codes': catalog.author_codes,
+        'author_name_bytes': author_name_bytes,
+        'author_name_offsets': author_name_offsets,
+        'popular_rows': catalog.popular_rows,
+        'text_neighbors': catalog.text_neighbors,
+        'text_scores': catalog.text_scores,
+    }
+    if neighbor_index is not None:
+        arrays.update({
+            'member_ids': neighbor_index.member_ids,
+            'indptr': neighbor_index.indptr,
+            'indices': neighbor_index.indices,
+            'book_values': neighbor_index.book_values,
+            'neighbors': neighbor_index.neighbors,
+        })
+
+    try:
+        manifest_arrays = {}
+        for name, array in arrays.items():
+            if array is None:
+                continue
+            array = np.ascontiguousarray(array)
+            path = temp_dir / f"{name}.npy"
+            np.save(path, array, allow_pickle=False)
+            manifest_arrays[name] = {
+                'dtype': array.dtype.str,
+                'shape': list(array.shape),
+                'sha256': _sha256(path),
+            }
+
+        manifest = {
+            'format_version': FORMAT_VERSION,
+            'version': version,
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'counts': {
+                'books': catalog.size,
+                'members': neighbor_index.size if neighbor_index else 0,
+                'neighbors_k': (
+                    int(neighbor_index.neighbors.shape[1])
+                    if neighbor_index is not None
+                    and neighbor_index.neighbors is not None else 0
+                ),
+                'text_neighbors_k': (
+                    int(catalog.text_neighbors.shape[1])
+                    if catalog.text_neighbors is not None else 0
+                ),
+            },
+            'similarity': (
+                neighbor_index.metric if neighbor_index is not None else None
+            ),
+            'metadata': metadata or {},
+            'arrays': manifest_arrays,
+        }
+        (temp_dir / MANIFEST_FILE).write_text(
+            json.dumps(manifest, indent=2, ensure_ascii=False), encoding='utf-8'
+        )
+        temp_dir.rename(final_dir)
+    except Exception:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        raise
+
+    logger.info(f"아티팩트 저장 완료: {final_dir} {manifest['counts']}")
+    return final_dir
+
+
+def read_current(root: str | Path) -> str | None:
+    """CURRENT가 가리키는 버전 이름 (없으면 None)"""
+    try:
+        version = (Path(root) / CURRENT_FILE).read_text(encoding='utf-8').strip()
+    except FileNotFoundError:
+        return None
+    return version or None
+
+
+def load_manifest(root: str | Path, version: str) -> dict[str, Any]:
+    """버전의 manifest를 읽고 형식 버전을 확인합니다"""
+    path = Path(root) / version / MANIFEST_FILE
+    try:
+        manifest = json.loads(path.read_text(encoding='utf-8'))
+    except FileNotFoundError as e:
+        raise ArtifactError(f"아티팩트 manifest가 없습니다: {path}") from e
+    except json.JSONDecodeError as e:
+        raise ArtifactError(f"아티팩트 manifest가 손상되었습니다: {path}") from e
+
+    if manifest.get('format_version') != FORMAT_VERSION:
+        raise ArtifactError(
+            f"지원하지 않는 아티팩트 형식: {manifest.get('format_version')} "
+            f"(지원: {FORMAT_VERSION})"
+        )
+    return manifest
+
+
+def list_versions(root: str | Path) -> list[str]:
+    """manifest가 있는 버전 이름 목록 (오래된 것부터)"""
+    root = Path(root)
+    if not root.exists():
+        return []
+    return sorted(
+        path.name for path in root.iterdir()
+        if path.is_dir() and (path / MANIFEST_FILE).exists()
+    )
+
+
+def set_current(root: str | Path, version: str) -> None:
+    """
+    CURRENT를 지정한 버전으로 원자적으로 교체합니다
+
+    이미 실행 중인 워커는 재시작(또는 다음 워밍업) 때 새 버전을 읽습니다.
+    """
+    root = Path(root)
+    load_manifest(root, version)
+    temp_path = root / f".{CURRENT_FILE}.{os.getpid()}.tmp"
+    temp_path.write_text(version + "\n", encoding='utf-8')
+    os.replace(temp_path, root / CURRENT_FILE)
+    logger.info(f"아티팩트 CURRENT 변경: {version}")
+
+
+def rollback(root: str | Path) -> str:
+    """
+    CURRENT를 바로 이전 버전으로 되돌립니다
+
+    Returns:
+        새로 CURRENT가 된 버전 이름
+    """
+    versions = list_versions(root)
+    current = read_current(root)
+    if current not in versions:
+        raise ArtifactError(f"CURRENT 버전을 찾을 수 없습니다: {current}")
+    position = versions.index(current)
+    if position == 0:
+        raise ArtifactError(f"{current}보다 이전 버전이 없습니다")
+    previous = versions[position - 1]
+    set_current(root, previous)
+    return previous
+
+
+def prune_versions(root: str | Path, keep: int) -> list[str]:
+    """
+    최신 keep개와 CURRENT를 제외한 오래된 버전, 남은 임시 디렉토리를 삭제합니다
+
+    Returns:
+        삭제한 버전 이름 목록
+    """
+    root = Path(root)
+    current = read_current(root)
+    versions = list_versions(root)
+    removable = [v for v in versions[:max(len(versions) - keep, 0)] if v != current]
+    for version in removable:
+        shutil.rmtree(root / version)
+    if root.exists():
+        for path in root.glob(".*.tmp"):
+            if path.is_dir():
+                shutil.rmtree(path, ignore_errors=True)
+    return removable
+
+
+def load_artifact(
+    root: str | Path,
+    version: str | None = None,
+    verify: bool = False
+) -> tuple[CatalogSnapshot, NeighborIndex | None, dict[str, Any]]:
+    """
+    아티팩트를 메모리 맵으로 읽어 스냅샷을 생성합니다
+
+    배열은 복사하지 않고 읽기 전용 메모리 맵으로 사용합니다. 조회용 딕셔너리
+    (alading_book_id -> 행 번호 등)와 저자 이름 튜플/저자 -> 코드 딕셔너리는
+    메모리 맵으로 공유되지 않고 프로세스마다 다시 만들어집니다.
+
+    Args:
+        root: 아티팩트 루트 디렉토리
+        version: 읽을 버전 (없으면 CURRENT)
+        verify: sha256 체크섬까지 검증 (파일 전체를 읽으므로 느림)
+
+    Returns:
+        (카탈로그, KNN 인덱스 또는 None, manifest)
+    """
+    root = Path(root)
+    version = version or read_current(root)
+    if version is None:
+        raise ArtifactError(f"CURRENT 아티팩트가 없습니다: {root}")
+    manifest = load_manifest(root, version)
+
+    arrays: dict[str, np.ndarray] = {}
+    for name, meta in manifest['arrays'].items():
+        path = root / version / f"{name}.npy"
+        if verify and _sha256(path) != meta['sha256']:
+            raise ArtifactError(f"체크섬이 일치하지 않습니다: {path}")
+        try:
+            array = np.load(path, mmap_mode='r', allow_pickle=False)
+        except (OSError, ValueError) as e:
+            raise ArtifactError(f"배열을 읽을 수 없습니다: {path}: {e}") from e
+        if array.dtype.str != meta['dtype'] or list(array.shape) != meta['shape']:
+            raise ArtifactError(f"배열 형식이 manifest와 다릅니다: {path}")
+        arrays[name] = array
+
+    missing = [name for name in CATALOG_ARRAYS if name not in arrays]
+    if missing:
+        raise ArtifactError(f"카탈로그 배열이 없습니다: {missing}")
+    has_neighbors = any(name in arrays for name in NEIGHBOR_ARRAYS)
+    missing = [name for name in NEIGHBOR_ARRAYS if name not in arrays]
+    if has_neighbors and missing:
+        raise ArtifactError(f"KNN 인덱스 배열이 없습니다: {missing}")
+
+    created_at = datetime.fromisoformat(manifest['created_at']).timestamp()
+    author_names = _decode_strings(
+        arrays['author_name_bytes'], arrays['author_name_offsets']
+    )
+    catalog = CatalogSnapshot(
+        book_ids=arrays['book_ids'],
+        aladin_ids=arrays['aladin_ids'],
+        category_codes=arrays['category_codes'],
+        author_codes=arrays['author_codes'],
+        author_names=author_names,
+        author_index={name: code for code, name in enumerate(author_names)},
+        popular_rows=arrays['popular_rows'],
+        text_neighbors=arrays.get('text_neighbors'),
+        text_scores=arrays.get('text_scores'),
+        built_at=created_at,
+    )
+
+    neighbor_index = None
+    if has_neighbors:
+        neighbor_index = NeighborIndex(
+            member_ids=arrays['member_ids'],
+            indptr=arrays['indptr'],
+            indices=arrays['indices'],
+            book_values=arrays['book_values'],
+            neighbors=arrays.get('neighbors'),
+            metric=manifest.get('similarity') or 'euclidean',
+            built_at=created_at,
+        )
+    return catalog, neighbor_index, manifest
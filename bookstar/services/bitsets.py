@@ -0,0 +1,89 @@
+"""
+회원별 도서 집합의 비트셋 표현
+CSR 행(회원 -> 도서 열 번호)을 행마다 uint64 워드 배열로 묶어 (회원, 도서) 쌍당
+1비트만 사용하고, 교집합/Jaccard 유사도는 AND와 popcount(np.bitwise_count)
+정수 연산으로 모든 회원에 대해 한 번에 계산
+
+메모리는 회원 수 × ceil(도서 수 / 64) × 8바이트입니다.
+"""
+import numpy as np
+
+WORD_BITS = 64
+CHUNK_ROWS = 4096  # 교집합 계산 시 한 번에 AND 하는 회원 수 (임시 배열 크기 제한)
+
+
+def num_words(num_columns: int) -> int:
+    """열 num_columns개를 담는 데 필요한 uint64 워드 수 (최소 1)"""
+    return max((num_columns + WORD_BITS - 1) // WORD_BITS, 1)
+
+
+def pack_rows(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    num_columns: int
+) -> np.ndarray:
+    """
+    CSR 행들을 비트셋으로 묶습니다
+
+    Returns:
+        (행 수, num_words(num_columns)) uint64 배열
+        (열 c는 워드 c // 64의 c % 64번째 비트)
+    """
+    num_rows = len(indptr) - 1
+    bits = np.zeros((num_rows, num_words(num_columns)), dtype=np.uint64)
+    if len(indices) == 0:
+        return bits
+    rows = np.repeat(np.arange(num_rows), np.diff(indptr))
+    columns = np.asarray(indices, dtype=np.int64)
+    masks = np.left_shift(np.uint64(1), (columns % WORD_BITS).astype(np.uint64))
+    np.bitwise_or.at(bits, (rows, columns // WORD_BITS), masks)
+    return bits
+
+
+def pack_columns(columns: np.ndarray, num_columns: int) -> np.ndarray:
+    """열 번호 배열 하나를 비트셋 한 행 (num_words,)으로 묶습니다"""
+    columns = np.asarray(columns, dtype=np.int64)
+    return pack_rows(np.array([0, len(columns)]), columns, num_columns)[0]
+
+
+def row_counts(bits: np.ndarray) -> np.ndarray:
+    """행별 켜진 비트 수 (집합 크기, int64)"""
+    return np.bitwise_count(bits).sum(axis=-1, dtype=np.int64)
+
+
+def intersection_counts(bits: np.ndarray, query: np.ndarray) -> np.ndarray:
+    """
+    모든 행과 query 비트셋의 교집합 크기 (int64, 행 수 길이)
+
+    임시 배열이 커지지 않도록 CHUNK_ROWS 행씩 AND 합니다.
+    """
+    counts = np.empty(len(bits), dtype=np.int64)
+    for start in range(0, len(bits), CHUNK_ROWS):
+        block = bits[start:start + CHUNK_ROWS]
+        counts[start:start + len(block)] = row_counts(block & query)
+    return counts
+
+
+def jaccard(
+    bits: np.ndarray,
+    counts: np.ndarray,
+    query: np.ndarray,
+    query_count: int | None = None
+) -> np.ndarray:
+    """
+    모든 행과 query의 Jaccard 유사도 |A ∩ B| / |A ∪ B| (float64)
+
+    Args:
+        counts: row_counts(bits) (미리 계산한 행별 집합 크기)
+        query_count: query의 집합 크기 (없으면 계산)
+
+    두 집합이 모두 비어 있으면 0입니다.
+    """
+    if query_count is None:
+        query_count = int(row_counts(query))
+    intersection = intersection_counts(bits, query)
+    union = counts + query_count - intersection
+    return np.divide(
+        intersection, union,
+        out=np.zeros(len(bits), dtype=np.float64), where=union > 0
+    )
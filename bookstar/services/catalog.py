@@ -0,0 +1,753 @@
+"""
+인메모리 카탈로그 모듈
+도서 카탈로그와 회원-도서 상호작용을 워밍업 시점에 한 번 읽어 NumPy 배열과
+KNN 인덱스로 보관하여, 요청마다 전체 도서/상호작용을 다시 조회하지 않도록 함
+
+스냅샷이 로드되지 않은 경우(워밍업 전, 실패, 테스트) 추천 서비스는 기존 DB 조회
+경로를 그대로 사용합니다.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from sqlalchemy import distinct, func
+from sqlalchemy.orm import Session
+
+from bookstar.models.models import Book, BookCategory, Member, MemberBook
+from bookstar.services import bitsets
+
+if TYPE_CHECKING:
+    from scipy.sparse import csr_matrix
+    from sklearn.neighbors import NearestNeighbors
+
+logger = logging.getLogger(__name__)
+
+# category_codes 값이 가리키는 카테고리 순서 (-1 = 카테고리 없음)
+CATEGORIES: tuple[BookCategory, ...] = tuple(BookCategory)
+_CATEGORY_CODES = {category: code for code, category in enumerate(CATEGORIES)}
+_CATEGORY_VALUE_CODES = {
+    category.value: code for code, category in enumerate(CATEGORIES)
+}
+
+# 역색인 목록 길이 합이 카탈로그의 1/8 이상이면 정렬 대신 마스크로 합침
+DENSE_POSTINGS_RATIO = 8
+
+# 유사 사용자 거리: euclidean (이진 벡터 KNN) | jaccard (비트셋 popcount)
+SIMILARITY_METRICS = ('euclidean', 'jaccard')
+
+# 콘텐츠 점수를 한 번에 (사용자 수, 도서 수) float64 행렬로 계산할 사용자 수
+# (임시 메모리 = CONTENT_BLOCK_USERS × 도서 수 × 8바이트)
+CONTENT_BLOCK_USERS = 64
+
+
+def top_rows(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    점수 상위 k개 위치 (점수 내림차순, 같은 점수는 앞 위치 우선)
+
+    DataFrame.nlargest(keep='first')와 같은 순서를 argpartition으로 구합니다.
+    -inf는 후보가 아닌 위치로 보고 결과에서 제외합니다.
+    """
+    count = min(k, int(np.isfinite(scores).sum()))
+    if count <= 0:
+        return np.empty(0, dtype=np.int64)
+    kth = np.partition(scores, len(scores) - count)[len(scores) - count]
+    above = np.flatnonzero(scores > kth)
+    ties = np.flatnonzero(scores == kth)[:count - len(above)]
+    top = np.concatenate([above, ties])
+    return top[np.argsort(-scores[top], kind='stable')]
+
+
+def _id_array(ids) -> np.ndarray:
+    """ID 목록(배열, 리스트, 집합, 숫자 문자열)을 int64 배열로 변환합니다"""
+    if isinstance(ids, np.ndarray):
+        return ids.astype(np.int64, copy=False)
+    if not isinstance(ids, (list, tuple)):
+        ids = list(ids)
+    if not ids:
+        return np.empty(0, dtype=np.int64)
+    return np.asarray(ids).astype(np.int64, copy=False)
+
+
+@dataclass(frozen=True)
+class IdMap:
+    """
+    외부 ID(int64) <-> 밀집 행 번호(int32) 매핑
+
+    ID별 dict 대신 정렬된 ID 배열과 np.searchsorted로 한 번에 변환하므로
+    메모리는 ID당 12바이트이고 요청 경로에서 DB로 ID를 변환하지 않습니다.
+    """
+
+    ids: np.ndarray           # 행 번호 -> 외부 ID (int64, 없으면 -1)
+    sorted_ids: np.ndarray    # 유효한 외부 ID 오름차순 (int64)
+    sorted_rows: np.ndarray   # sorted_ids 순서의 행 번호 (int32)
+
+    @classmethod
+    def build(cls, ids: np.ndarray) -> IdMap:
+        """행 번호 순서의 외부 ID 배열로 매핑을 만듭니다 (음수 ID는 없는 것으로 처리)"""
+        ids = np.asarray(ids, dtype=np.int64)
+        rows = np.flatnonzero(ids >= 0)
+        order = np.argsort(ids[rows], kind='stable')
+        return cls(
+            ids=ids,
+            sorted_ids=ids[rows][order],
+            sorted_rows=rows[order].astype(np.int32),
+        )
+
+    def __len__(self) -> int:
+        return len(self.sorted_ids)
+
+    def rows(self, ids) -> np.ndarray:
+        """외부 ID 목록 -> 행 번호 (입력과 같은 길이, 없는 ID는 -1)"""
+        ids = _id_array(ids)
+        if len(self.sorted_ids) == 0:
+            return np.full(len(ids), -1, dtype=np.int32)
+        positions = np.searchsorted(self.sorted_ids, ids)
+        positions[positions == len(self.sorted_ids)] = 0
+        found = self.sorted_ids[positions] == ids
+        return np.where(found, self.sorted_rows[positions], -1).astype(np.int32)
+
+    def find(self, ids) -> np.ndarray:
+        """외부 ID 목록 중 매핑에 있는 ID의 행 번호 (입력 순서 유지)"""
+        rows = self.rows(ids)
+        return rows[rows >= 0]
+
+    def get(self, external_id: int) -> int | None:
+        """외부 ID 하나의 행 번호 (없으면 None)"""
+        row = int(self.rows(np.array([external_id]))[0])
+        return row if row >= 0 else None
+
+    def __contains__(self, external_id: int) -> bool:
+        return self.get(external_id) is not None
+
+    def ids_of(self, rows) -> np.ndarray:
+        """행 번호 -> 외부 ID"""
+        return self.ids[rows]
+
+
+def _postings(codes: np.ndarray, num_codes: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    코드 -> 행 번호 역색인 (CSR: 코드 c의 행은 rows[indptr[c]:indptr[c + 1]])
+
+    코드별 행 번호는 오름차순이며, 코드가 -1인 행은 포함하지 않습니다.
+    """
+    has_code = codes >= 0
+    rows = np.flatnonzero(has_code)
+    rows = rows[np.argsort(codes[has_code], kind='stable')]
+    indptr = np.zeros(num_codes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(codes[has_code], minlength=num_codes), out=indptr[1:])
+    return indptr, rows
+
+
+def pad_rows(
+    top: np.ndarray,
+    excluded: np.ndarray,
+    popular: np.ndarray,
+    k: int
+) -> np.ndarray:
+    """
+    top이 k개보다 적으면 인기순 행 번호로 채웁니다 (top, excluded 행은 제외)
+
+    Args:
+        top: 점수로 고른 행 번호
+        excluded: 추천에서 제외할 행 번호 (사용자가 이미 등록한 도서)
+        popular: 인기순 행 번호 (CatalogSnapshot.popular_rows)
+    """
+    missing = k - len(top)
+    if missing <= 0:
+        return top
+    skip = np.union1d(top, excluded)
+    # 대부분 인기순 앞부분에서 채워지므로 조금씩 잘라서 확인
+    chunk_size = max(4 * k, 256)
+    padding, found = [], 0
+    for start in range(0, len(popular), chunk_size):
+        chunk = popular[start:start + chunk_size]
+        padding.append(chunk[~np.isin(chunk, skip)])
+        found += len(padding[-1])
+        if found >= missing:
+            break
+    if not found:
+        return top
+    return np.concatenate([top, np.concatenate(padding)[:missing]])
+
+
+def popularity_order(
+    aladin_ids: np.ndarray, book_values: np.ndarray, book_counts: np.ndarray
+) -> np.ndarray:
+    """
+    카탈로그 행 번호를 회원 등록 수 내림차순으로 정렬합니다 (같으면 행 번호 순)
+
+    Args:
+        aladin_ids: 행 번호 순서의 alading_book_id
+        book_values: 등록 수를 센 alading_book_id (카탈로그에 없는 ID는 무시)
+        book_counts: book_values별 등록 회원 수
+    """
+    counts = np.zeros(len(aladin_ids), dtype=np.int64)
+    rows = IdMap.build(aladin_ids).rows(book_values)
+    counts[rows[rows >= 0]] = np.asarray(book_counts, dtype=np.int64)[rows >= 0]
+    return np.argsort(-counts, kind='stable')
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    """도서 카탈로그 배열 (Book.id 오름차순, 행 번호로 서로 대응)"""
+
+    book_ids: np.ndarray          # Book.id (int64)
+    aladin_ids: np.ndarray        # Book.alading_book_id (int64, 없으면 -1)
+    category_codes: np.ndarray    # CATEGORIES 인덱스 (int16, 없으면 -1)
+    author_codes: np.ndarray      # author_names 인덱스 (int32, 없으면 -1)
+    author_names: tuple[str, ...]
+    author_index: dict[str, int]
+    popular_rows: np.ndarray      # 회원 등록 수 내림차순 행 번호 (int64, 빈칸 채우기용)
+    # 제목/소개 TF-IDF 유사 도서 (아티팩트 빌드 시에만 계산, 없으면 None)
+    text_neighbors: np.ndarray | None = None  # (도서 수, k) 행 번호 (int32, -1 패딩)
+    text_scores: np.ndarray | None = None     # text_neighbors의 코사인 유사도 (float16)
+    built_at: float = field(default_factory=time.time)
+
+    @property
+    def size(self) -> int:
+        return len(self.book_ids)
+
+    @cached_property
+    def aladin_map(self) -> IdMap:
+        """alading_book_id <-> 행 번호"""
+        return IdMap.build(self.aladin_ids)
+
+    @cached_property
+    def book_map(self) -> IdMap:
+        """Book.id <-> 행 번호"""
+        return IdMap.build(self.book_ids)
+
+    def rows_for_aladin_ids(self, aladin_ids) -> np.ndarray:
+        """alading_book_id 목록에 해당하는 행 번호 (카탈로그에 없는 ID는 제외)"""
+        return self.aladin_map.find(aladin_ids)
+
+    def rows_for_book_ids(self, book_ids) -> np.ndarray:
+        """Book.id 목록에 해당하는 행 번호 (카탈로그에 없는 ID는 제외)"""
+        return self.book_map.find(book_ids)
+
+    def text_candidates(self, read_rows: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        읽은 책들의 유사 도서 목록을 합친 후보
+
+        Returns:
+            (행 번호 오름차순, 행별 유사도 합 float64), 목록이 없으면 빈 배열
+        """
+        if self.text_neighbors is None or len(read_rows) == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        neighbors = self.text_neighbors[read_rows].ravel()
+        valid = neighbors >= 0
+        rows, inverse = np.unique(neighbors[valid], return_inverse=True)
+        scores = self.text_scores[read_rows].ravel()[valid].astype(np.float64)
+        return rows.astype(np.int64), np.bincount(inverse, weights=scores)
+
+    def preference_weights(
+        self,
+        category_weights: dict[str, float],
+        author_weights: dict[str, float],
+        rows: np.ndarray | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        사용자 선호도를 도서별 카테고리/저자 가중치 배열로 변환합니다
+
+        코드가 -1인 도서는 조회 테이블의 마지막 칸(0.0)을 가리킵니다.
+
+        Args:
+            rows: 가중치를 계산할 행 번호 (None이면 모든 도서)
+        """
+        category_table = np.zeros(len(CATEGORIES) + 1)
+        for code, category in enumerate(CATEGORIES):
+            category_table[code] = category_weights.get(category.value, 0.0)
+
+        author_table = np.zeros(len(self.author_names) + 1)
+        for name, weight in author_weights.items():
+            code = self.author_index.get(name)
+            if code is not None:
+                author_table[code] = weight
+
+        category_codes, author_codes = self.category_codes, self.author_codes
+        if rows is not None:
+            category_codes, author_codes = category_codes[rows], author_codes[rows]
+        return category_table[category_codes], author_table[author_codes]
+
+    @cached_property
+    def category_postings(self) -> tuple[np.ndarray, np.ndarray]:
+        """카테고리 코드 -> 행 번호 역색인 (indptr, rows)"""
+        return _postings(self.category_codes, len(CATEGORIES))
+
+    @cached_property
+    def author_postings(self) -> tuple[np.ndarray, np.ndarray]:
+        """저자 코드 -> 행 번호 역색인 (indptr, rows)"""
+        return _postings(self.author_codes, len(self.author_names))
+
+    def matching_rows(
+        self,
+        category_weights: dict[str, float],
+        author_weights: dict[str, float],
+        exclude: np.ndarray | None = None
+    ) -> np.ndarray:
+        """
+        선호 카테고리 또는 선호 저자의 도서 행 번호 (오름차순, 중복 없음)
+
+        가중치가 0보다 클 수 있는 도서는 이 행들뿐이므로 콘텐츠 점수는 이
+        후보에 대해서만 계산합니다. 역색인 목록이 카탈로그의 일정 비율보다 길면
+        정렬 대신 불리언 마스크로 합칩니다.
+
+        Args:
+            exclude: 후보에서 뺄 행 번호 (사용자가 이미 등록한 도서)
+        """
+        postings = []
+        indptr, rows = self.category_postings
+        for name in category_weights:
+            code = _CATEGORY_VALUE_CODES.get(name)
+            if code is not None:
+                postings.append(rows[indptr[code]:indptr[code + 1]])
+        indptr, rows = self.author_postings
+        for name in author_weights:
+            code = self.author_index.get(name)
+            if code is not None:
+                postings.append(rows[indptr[code]:indptr[code + 1]])
+        if not postings:
+            return np.empty(0, dtype=np.int64)
+
+        if sum(len(rows) for rows in postings) * DENSE_POSTINGS_RATIO < self.size:
+            matched = np.unique(np.concatenate(postings))
+            if exclude is not None and len(exclude):
+                matched = matched[~np.isin(matched, exclude)]
+            return matched
+        mask = np.zeros(self.size, dtype=bool)
+        for rows in postings:
+            mask[rows] = True
+        if exclude is not None:
+            mask[exclude] = False
+        return np.flatnonzero(mask)
+
+    @cached_property
+    def author_onehot_t(self) -> csr_matrix:
+        """(저자 수, 도서 수) 저자 원-핫 행렬의 전치 (저자 없는 도서는 빈 열)"""
+        from scipy.sparse import csr_matrix
+
+        has_author = self.author_codes >= 0
+        return csr_matrix(
+            (
+                np.ones(int(has_author.sum())),
+                (self.author_codes[has_author], np.flatnonzero(has_author)),
+            ),
+            shape=(len(self.author_names), self.size),
+        )
+
+    def preference_matrices(
+        self, preferences: Sequence[dict[str, dict[str, float]]]
+    ) -> tuple[np.ndarray, csr_matrix]:
+        """
+        사용자별 선호도를 행렬로 변환합니다
+
+        점수 합의 반올림까지 단건 경로(preference_weights)와 같도록 float64를
+        사용합니다. (float32에서는 1.4 + 2.1과 2.0 + 1.5가 같아져 순위가 달라짐)
+
+        Returns:
+            (사용자 수, 카테고리 수 + 1) 카테고리 선호도 (마지막 열은 카테고리 없는
+            도서용 0), (사용자 수, 저자 수) 희소 저자 선호도
+        """
+        from scipy.sparse import csr_matrix
+
+        category_prefs = np.zeros((len(preferences), len(CATEGORIES) + 1))
+        author_rows, author_cols, author_values = [], [], []
+        for row, user_preferences in enumerate(preferences):
+            for name, weight in user_preferences.get('categories', {}).items():
+                code = _CATEGORY_VALUE_CODES.get(name)
+                if code is not None:
+                    category_prefs[row, code] = weight
+            for name, weight in user_preferences.get('authors', {}).items():
+                code = self.author_index.get(name)
+                if code is not None:
+                    author_rows.append(row)
+                    author_cols.append(code)
+                    author_values.append(weight)
+        author_prefs = csr_matrix(
+            (np.asarray(author_values, dtype=np.float64), (author_rows, author_cols)),
+            shape=(len(preferences), len(self.author_names)),
+        )
+        return category_prefs, author_prefs
+
+    def content_topk(
+        self,
+        preferences: Sequence[dict[str, dict[str, float]]],
+        exclude: Sequence[np.ndarray],
+        k: int,
+        block_size: int = CONTENT_BLOCK_USERS,
+        text: Sequence[tuple[np.ndarray, np.ndarray]] | None = None
+    ) -> list[tuple[np.ndarray, np.ndarray]]:
+        """
+        여러 사용자의 콘텐츠 기반 상위 k개 (행 번호, 점수)를 한 번에 계산합니다
+
+        사용자 블록마다 P_cat[:, 카테고리 코드] (원-핫 곱과 같은 열 선택)과
+        P_auth @ 저자 원-핫ᵀ (희소 곱)을 더하고, exclude 행을 가린 뒤 점수가 0보다
+        큰 도서 중 상위 k개를 고릅니다. 부족하면 인기순 도서(점수 0)로 채우므로
+        결과는 사용자별 _content_from_catalog와 같습니다.
+
+        Args:
+            text: 사용자별 제목/소개 유사 도서 (행 번호, 가중치) (없으면 사용 안 함)
+        """
+        category_prefs, author_prefs = self.preference_matrices(preferences)
+        results = []
+        for start in range(0, len(preferences), block_size):
+            stop = min(start + block_size, len(preferences))
+            scores = category_prefs[start:stop][:, self.category_codes]
+            scores += (author_prefs[start:stop] @ self.author_onehot_t).toarray()
+            for offset in range(stop - start):
+                row_scores = scores[offset]
+                if text is not None:
+                    text_rows, text_weights = text[start + offset]
+                    row_scores[text_rows] += text_weights
+                row_scores[row_scores <= 0] = -np.inf
+                row_scores[exclude[start + offset]] = -np.inf
+                top = pad_rows(
+                    top_rows(row_scores, k),
+                    exclude[start + offset],
+                    self.popular_rows,
+                    k,
+                )
+                results.append((top, np.maximum(row_scores[top], 0)))
+        return results
+
+
+@dataclass
+class NeighborIndex:
+    """
+    회원-도서 상호작용(CSR 배열)과 유사 사용자 검색 인덱스
+
+    배열은 메모리 맵(np.load(mmap_mode='r'))일 수 있으므로 읽기 전용으로 다룹니다.
+    neighbors가 있으면 미리 계산된 이웃 목록을 사용하고, 없거나 더 많은 이웃이
+    필요하면 처음 필요할 때 KNN을 학습합니다. metric이 jaccard면 KNN 대신
+    회원별 비트셋에서 Jaccard 유사도를 계산합니다.
+    """
+
+    member_ids: np.ndarray             # 행 번호 -> member_id (int64, 오름차순)
+    indptr: np.ndarray                 # CSR 행 포인터 (int64)
+    indices: np.ndarray                # CSR 열 번호 (int32)
+    book_values: np.ndarray            # 열 번호 -> alading_book_id (int64)
+    neighbors: np.ndarray | None = None  # 행 번호 -> 이웃 행 번호 (int32, -1 패딩)
+    metric: str = 'euclidean'          # SIMILARITY_METRICS 중 하나
+    built_at: float = field(default_factory=time.time)
+    _matrix: csr_matrix | None = field(default=None, repr=False, compare=False)
+    _bitsets: tuple[np.ndarray, np.ndarray] | None = field(
+        default=None, repr=False, compare=False
+    )
+    _knn: NearestNeighbors | None = field(default=None, repr=False, compare=False)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    @property
+    def size(self) -> int:
+        return len(self.member_ids)
+
+    @property
+    def matrix(self) -> csr_matrix:
+        """회원 x 도서 이진 희소 행렬 (처음 접근 시 생성)"""
+        if self._matrix is None:
+            from scipy.sparse import csr_matrix
+
+            self._matrix = csr_matrix(
+                (
+                    np.ones(len(self.indices), dtype=np.float32),
+                    self.indices,
+                    self.indptr,
+                ),
+                shape=(self.size, len(self.book_values))
+            )
+        return self._matrix
+
+    @property
+    def bitsets(self) -> tuple[np.ndarray, np.ndarray]:
+        """회원별 도서 비트셋과 집합 크기 (처음 접근 시 생성)"""
+        if self._bitsets is None:
+            bits = bitsets.pack_rows(self.indptr, self.indices, len(self.book_values))
+            self._bitsets = (bits, bitsets.row_counts(bits))
+        return self._bitsets
+
+    def jaccard_neighbors(self, row: int, k: int) -> np.ndarray:
+        """
+        row 회원과 Jaccard 유사도가 높은 순서의 이웃 행 번호 (자기 자신 제외)
+
+        유사도가 같으면 행 번호(member_id)가 작은 회원이 먼저입니다.
+        """
+        bits, counts = self.bitsets
+        similarity = bitsets.jaccard(bits, counts, bits[row], int(counts[row]))
+        similarity[row] = -np.inf
+        return top_rows(similarity, min(k, self.size - 1))
+
+    def _fitted_knn(self) -> NearestNeighbors:
+        with self._lock:
+            if self._knn is None:
+                from sklearn.neighbors import NearestNeighbors
+
+                knn = NearestNeighbors(algorithm='brute', metric='euclidean')
+                knn.fit(self.matrix)
+                self._knn = knn
+            return self._knn
+
+    def row_of(self, member_id: int) -> int | None:
+        """member_id의 행 번호 (인덱스에 없으면 None)"""
+        row = int(np.searchsorted(self.member_ids, member_id))
+        if row < self.size and self.member_ids[row] == member_id:
+            return row
+        return None
+
+    def similar_users(self, user_id: int, num_similar_users: int) -> list[int]:
+        """
+        유사 사용자 ID 목록 (기존 DB 경로와 같은 유클리드 거리 KNN)
+
+        인덱스에 없는 사용자(워밍업 이후 첫 이력 등)는 빈 목록을 반환합니다.
+        """
+        row = self.row_of(user_id)
+        if row is None or self.size < 2:
+            return []
+
+        neighbors = self.neighbors
+        if neighbors is not None and num_similar_users <= neighbors.shape[1]:
+            rows = neighbors[row, :num_similar_users]
+            return self.member_ids[rows[rows >= 0]].tolist()
+
+        if self.metric == 'jaccard':
+            return self.member_ids[
+                self.jaccard_neighbors(row, num_similar_users)
+            ].tolist()
+
+        n_neighbors = min(num_similar_users + 1, self.size)
+        _, indices = self._fitted_knn().kneighbors(
+            self.matrix[row], n_neighbors=n_neighbors
+        )
+        return [
+            int(self.member_ids[idx]) for idx in indices.flatten() if idx != row
+        ][:num_similar_users]
+
+    def books_of(self, member_ids: list[int]) -> np.ndarray:
+        """주어진 회원들이 등록한 alading_book_id의 합집합"""
+        columns = []
+        for member_id in member_ids:
+            row = self.row_of(member_id)
+            if row is not None:
+                columns.append(self.indices[self.indptr[row]:self.indptr[row + 1]])
+        if not columns:
+            return np.empty(0, dtype=np.int64)
+        return self.book_values[np.unique(np.concatenate(columns))]
+
+
+def compute_neighbors(
+    index: NeighborIndex, 
+    k: int, 
+    block_size: int = 1024
+) -> np.ndarray:
+    """
+    모든 회원의 상위 k명 이웃을 미리 계산합니다 (오프라인 빌드용)
+
+    Returns:
+        (회원 수, k) int32 배열, 자기 자신은 제외하고 부족한 칸은 -1
+    """
+    neighbors = np.full((index.size, k), -1, dtype=np.int32)
+    if index.size < 2:
+        return neighbors
+    if index.metric == 'jaccard':
+        for row in range(index.size):
+            found = index.jaccard_neighbors(row, k)
+            neighbors[row, :len(found)] = found
+        return neighbors
+    knn = index._fitted_knn()
+    n_neighbors = min(k + 1, index.size)
+    matrix = index.matrix
+    for start in range(0, index.size, block_size):
+        stop = min(start + block_size, index.size)
+        _, found = knn.kneighbors(matrix[start:stop], n_neighbors=n_neighbors)
+        for offset, row_neighbors in enumerate(found):
+            row = start + offset
+            others = row_neighbors[row_neighbors != row][:k]
+            neighbors[row, :len(others)] = others
+    return neighbors
+
+
+def build_catalog(db: Session) -> CatalogSnapshot:
+    """
+    DB에서 도서 카탈로그를 읽어 스냅샷을 생성합니다
+
+    인기순 행 번호도 같은 시점의 등록 수로 함께 만들어, 패딩에 쓰는 순서가 항상
+    그 순서가 가리키는 카탈로그와 짝을 이루도록 합니다 (KNN 인덱스와 같이 member
+    테이블에 존재하는 회원만 셉니다).
+    """
+    rows = (
+        db.query(Book.id, Book.alading_book_id, Book.book_category, Book.author)
+        .order_by(Book.id)
+        .all()
+    )
+    author_index: dict[str, int] = {}
+    book_ids = np.empty(len(rows), dtype=np.int64)
+    aladin_ids = np.empty(len(rows), dtype=np.int64)
+    category_codes = np.empty(len(rows), dtype=np.int16)
+    author_codes = np.empty(len(rows), dtype=np.int32)
+
+    for i, (book_id, aladin_id, category, author) in enumerate(rows):
+        book_ids[i] = book_id
+        aladin_ids[i] = -1 if aladin_id is None else aladin_id
+        category_codes[i] = _CATEGORY_CODES.get(category, -1)
+        if author:
+            author_codes[i] = author_index.setdefault(author, len(author_index))
+        else:
+            author_codes[i] = -1
+
+    registered = (
+        db.query(MemberBook.book_id, func.count(distinct(MemberBook.member_id)))
+        .join(Member, Member.id == MemberBook.member_id)
+        .filter(MemberBook.book_id.isnot(None))
+        .group_by(MemberBook.book_id)
+        .all()
+    )
+    book_values = np.array([book_id for book_id, _ in registered], dtype=np.int64)
+    book_counts = np.array([count for _, count in registered], dtype=np.int64)
+
+    return CatalogSnapshot(
+        book_ids=book_ids,
+        aladin_ids=aladin_ids,
+        category_codes=category_codes,
+        author_codes=author_codes,
+        author_names=tuple(author_index),
+        author_index=author_index,
+        popular_rows=popularity_order(aladin_ids, book_values, book_counts),
+    )
+
+
+def build_neighbor_index(
+    db: Session, metric: str = 'euclidean'
+) -> NeighborIndex | None:
+    """
+    회원-도서 상호작용으로 KNN 인덱스를 생성합니다
+
+    기존 경로와 같이 member 테이블에 존재하는 회원만 포함하며, 회원이 2명
+    미만이면 None을 반환합니다. 요청마다 만들던 밀집 행렬 대신 희소 행렬을 사용하고,
+    KNN은 처음 유사 사용자를 찾을 때 학습합니다.
+    """
+    rows = (
+        db.query(MemberBook.member_id, MemberBook.book_id)
+        .join(Member, Member.id == MemberBook.member_id)
+        .all()
+    )
+    pairs = np.array(
+        [(mid, bid) for mid, bid in rows if bid is not None], dtype=np.int64
+    ).reshape(-1, 2)
+    member_ids, member_rows = np.unique(pairs[:, 0], return_inverse=True)
+    if len(member_ids) < 2:
+        return None
+    book_values, book_cols = np.unique(pairs[:, 1], return_inverse=True)
+
+    # 회원 순, 도서 순으로 정렬하고 중복 (회원, 도서) 쌍은 하나로 (이진 행렬)
+    order = np.lexsort((book_cols, member_rows))
+    member_rows, book_cols = member_rows[order], book_cols[order]
+    keep = np.ones(len(order), dtype=bool)
+    keep[1:] = (np.diff(member_rows) != 0) | (np.diff(book_cols) != 0)
+    member_rows, book_cols = member_rows[keep], book_cols[keep]
+
+    indptr = np.zeros(len(member_ids) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(member_rows, minlength=len(member_ids)), out=indptr[1:])
+
+    return NeighborIndex(
+        member_ids=member_ids,
+        indptr=indptr,
+        indices=book_cols.astype(np.int32),
+        book_values=book_values,
+        metric=metric,
+    )
+
+
+@dataclass(frozen=True)
+class Snapshots:
+    """
+    함께 교체되는 카탈로그와 KNN 인덱스 묶음
+
+    교체는 묶음 참조 대입 한 번으로 이뤄지므로, 둘 다 필요한 호출부는 get_snapshots()로
+    묶음을 한 번만 읽어 서로 다른 시점의 카탈로그와 인덱스를 섞지 않습니다.
+    """
+
+    catalog: CatalogSnapshot
+    neighbor_index: NeighborIndex | None
+
+
+# 전역 스냅샷 묶음 (교체는 참조 대입 한 번으로 원자적)
+_snapshots: Snapshots | None = None
+_build_lock = threading.Lock()
+
+
+def get_snapshots() -> Snapshots | None:
+    """현재 카탈로그/KNN 인덱스 묶음 (로드 전이면 None)"""
+    return _snapshots
+
+
+def get_catalog() -> CatalogSnapshot | None:
+    """현재 카탈로그 스냅샷 (로드 전이면 None)"""
+    snapshots = _snapshots
+    return snapshots.catalog if snapshots is not None else None
+
+
+def get_neighbor_index() -> NeighborIndex | None:
+    """현재 KNN 인덱스 (로드 전이면 None)"""
+    snapshots = _snapshots
+    return snapshots.neighbor_index if snapshots is not None else None
+
+
+def install_snapshots(
+    catalog: CatalogSnapshot, 
+    neighbor_index: NeighborIndex | None
+) -> None:
+    """
+    미리 만든(또는 아티팩트에서 읽은) 스냅샷으로 전역 스냅샷을 교체합니다
+
+    ID 매핑과 카테고리/저자 역색인은 교체 전에 만들어 첫 요청이 부담하지 않도록
+    합니다.
+    """
+    global _snapshots
+    catalog.aladin_map  # noqa: B018
+    catalog.category_postings  # noqa: B018
+    catalog.author_postings  # noqa: B018
+    snapshots = Snapshots(catalog=catalog, neighbor_index=neighbor_index)
+    with _build_lock:
+        _snapshots = snapshots
+
+
+def load_snapshots(db: Session, metric: str = 'euclidean') -> dict[str, Any]:
+    """
+    카탈로그와 KNN 인덱스를 DB에서 새로 만들어 전역 스냅샷을 교체합니다
+
+    Returns:
+        단계별 소요시간(ms)과 크기 요약
+    """
+    start = time.perf_counter()
+    catalog = build_catalog(db)
+    catalog_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    neighbor_index = build_neighbor_index(db, metric)
+    neighbors_ms = (time.perf_counter() - start) * 1000
+
+    install_snapshots(catalog, neighbor_index)
+
+    summary = {
+        'source': 'database',
+        'catalog_ms': round(catalog_ms, 2),
+        'neighbors_ms': round(neighbors_ms, 2),
+        'books': catalog.size,
+        'members': neighbor_index.size if neighbor_index else 0,
+    }
+    logger.info(f"카탈로그 스냅샷 로드 완료: {summary}")
+    return summary
+
+
+def reset_snapshots() -> None:
+    """스냅샷을 비워 DB 조회 경로로 되돌립니다 (테스트, 데이터 초기화 시 사용)"""
+    global _snapshots
+    with _build_lock:
+        _snapshots = None
@@ -0,0 +1,312 @@
+"""
+RecommenderModel 추론 모듈
+동시에 들어온 요청을 짧은 시간 동안 모아 (batch, num_books) 텐서 하나로 만들고
+torch.inference_mode()에서 한 번에 계산하여, 큰 첫 번째 층 행렬곱 비용을
+여러 사용자에 나눠 부담 (CPU 전용 서버 기준)
+
+모델의 입력/출력 열은 카탈로그 행 번호(CatalogSnapshot 순서)와 같습니다.
+"""
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from collections.abc import Sequence
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from bookstar.config import settings
+from bookstar.services import model_registry
+from bookstar.services.catalog import get_snapshots
+
+if TYPE_CHECKING:
+    import torch
+
+    from bookstar.models.recommender import RecommenderModel
+
+logger = logging.getLogger(__name__)
+
+
+class BatcherStopped(RuntimeError):
+    """stop()한 배처에 추론 요청을 넣은 경우"""
+
+
+@dataclass
+class InferenceRequest:
+    """추론 요청 한 건 (사용자가 상호작용한 열 번호, 제외할 열 번호, 개수)"""
+
+    columns: np.ndarray
+    k: int
+    exclude: np.ndarray | None = None
+    future: Future = field(default_factory=Future)
+
+
+def configure_threads(num_threads: int) -> None:
+    """torch 연산 스레드 수 설정 (0이면 torch 기본값 유지)"""
+    import torch
+
+    if num_threads > 0 and torch.get_num_threads() != num_threads:
+        torch.set_num_threads(num_threads)
+
+
+def dense_rows(rows: Sequence[np.ndarray], num_books: int) -> torch.Tensor:
+    """
+    행별 열 번호 배열로 (len(rows), num_books) 이진 텐서를 만듭니다
+
+    Python 리스트로 밀집 벡터를 만들지 않고, (행, 열) 인덱스 배열을 이어 붙여
+    0 텐서에 한 번에 기록합니다. (학습 시에도 배치 단위로만 밀집화)
+    """
+    import torch
+
+    lengths = [len(columns) for columns in rows]
+    row_index = np.repeat(np.arange(len(rows)), lengths)
+    column_index = (
+        np.concatenate(rows).astype(np.int64)
+        if row_index.size else np.empty(0, dtype=np.int64)
+    )
+    dense = torch.zeros((len(rows), num_books), dtype=torch.float32)
+    dense[torch.from_numpy(row_index), torch.from_numpy(column_index)] = 1.0
+    return dense
+
+
+def build_inputs(requests: Sequence[InferenceRequest], num_books: int) -> torch.Tensor:
+    """요청들의 열 번호로 (batch, num_books) 이진 입력 텐서를 만듭니다"""
+    return dense_rows([request.columns for request in requests], num_books)
+
+
+def score_topk(
+    model: RecommenderModel, requests: Sequence[InferenceRequest]
+) -> list[tuple[np.ndarray, np.ndarray]]:
+    """
+    요청 묶음을 한 번에 계산하여 요청별 상위 k개 (열 번호, 점수)를 반환합니다
+
+    이미 상호작용한 열과 exclude 열은 -inf로 가려 결과에서 제외합니다.
+    """
+    import torch
+
+    num_books = model.fc1.in_features
+    with torch.inference_mode():
+        inputs = build_inputs(requests, num_books)
+        scores = model(inputs)
+        scores.masked_fill_(inputs > 0, float('-inf'))
+        for row, request in enumerate(requests):
+            if request.exclude is not None and len(request.exclude):
+                scores[row, torch.from_numpy(request.exclude.astype(np.int64))] = (
+                    float('-inf')
+                )
+        k = min(max(request.k for request in requests), num_books)
+        top_scores, top_columns = torch.topk(scores, k, dim=1)
+
+    results = []
+    for row, request in enumerate(requests):
+        row_scores = top_scores[row, :request.k].numpy()
+        valid = np.isfinite(row_scores)
+        results.append((top_columns[row, :request.k].numpy()[valid], row_scores[valid]))
+    return results
+
+
+class InferenceBatcher:
+    """
+    요청을 모아 한 번에 추론하는 백그라운드 스레드
+
+    첫 요청이 들어오면 max_wait_ms 동안(또는 max_batch_size개가 찰 때까지)
+    다음 요청을 기다렸다가 묶음 하나로 계산합니다. stop() 후에는 스레드를 다시
+    시작하지 않고 요청을 거절합니다.
+    """
+
+    def __init__(
+        self,
+        model: RecommenderModel,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 2.0
+    ):
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.batches = 0
+        self.batched_requests = 0
+        self._queue: queue.Queue[InferenceRequest | None] = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._stopped = False
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        columns: np.ndarray,
+        k: int,
+        exclude: np.ndarray | None = None
+    ) -> Future:
+        """
+        추론 요청을 넣고 (열 번호, 점수) 결과를 받을 Future를 반환합니다
+
+        Raises:
+            BatcherStopped: stop()한 배처인 경우
+        """
+        request = InferenceRequest(np.asarray(columns), k, exclude)
+        with self._lock:
+            if self._stopped:
+                raise BatcherStopped("중지된 배처에는 추론 요청을 넣을 수 없습니다")
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="inference-batcher", daemon=True
+                )
+                self._thread.start()
+            # 종료 신호보다 먼저 큐에 들어가도록 잠금 안에서 넣음
+            self._queue.put(request)
+        return request.future
+
+    def recommend(
+        self,
+        columns: np.ndarray,
+        k: int,
+        exclude: np.ndarray | None = None,
+        timeout: float | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """submit 후 결과를 기다립니다"""
+        return self.submit(columns, k, exclude).result(timeout=timeout)
+
+    def _collect(self, first: InferenceRequest) -> list[InferenceRequest]:
+        batch = [first]
+        deadline = time.perf_counter() + self.max_wait_ms / 1000
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                request = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if request is None:
+                # 종료 신호는 현재 묶음을 처리한 뒤 반영
+                self._queue.put(None)
+                break
+            batch.append(request)
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                break
+            batch = self._collect(first)
+            try:
+                results = score_topk(self.model, batch)
+            except Exception as e:
+                for request in batch:
+                    request.future.set_exception(e)
+                continue
+            self.batches += 1
+            self.batched_requests += len(batch)
+            for request, result in zip(batch, results, strict=True):
+                request.future.set_result(result)
+
+    def stop(self) -> None:
+        """대기 중인 요청을 처리한 뒤 스레드를 멈춥니다 (이후 submit은 거절)"""
+        with self._lock:
+            self._stopped = True
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join(timeout=5)
+
+
+# 전역 배처 (레지스트리의 현재 모델 버전이 바뀌면 새로 생성)
+_batcher: InferenceBatcher | None = None
+_batcher_version: str | None = None
+_batcher_lock = threading.Lock()
+
+
+def get_batcher() -> InferenceBatcher | None:
+    """현재 모델의 배처 (등록된 모델이 없으면 None)"""
+    global _batcher, _batcher_version
+    registry = model_registry.get_registry()
+    version = registry.resolve()
+    if version is None:
+        return None
+
+    with _batcher_lock:
+        if _batcher is not None and _batcher_version == version:
+            return _batcher
+        previous = _batcher
+        config = settings.inference
+        configure_threads(config.num_threads)
+        batcher = InferenceBatcher(
+            registry.load(version),
+            max_batch_size=config.max_batch_size,
+            max_wait_ms=config.max_wait_ms,
+        )
+        _batcher, _batcher_version = batcher, version
+    if previous is not None:
+        previous.stop()
+    return batcher
+
+
+def reset_batcher() -> None:
+    """전역 배처를 멈추고 비웁니다 (테스트, 종료 시 사용)"""
+    global _batcher, _batcher_version
+    with _batcher_lock:
+        previous, _batcher, _batcher_version = _batcher, None, None
+    if previous is not None:
+        previous.stop()
+
+
+def recommend_with_model(
+    user_id: int, k: int, known_books: Sequence[str] | None = None
+) -> list[int] | None:
+    """
+    현재 모델로 사용자에게 도서를 추천합니다
+
+    사용자 상호작용은 KNN 인덱스(CSR 배열)에서 읽으므로 DB를 조회하지 않습니다.
+    [training] model_type으로 학습한 모델(오토인코더 또는 ALS)을 그대로 사용합니다.
+
+    Args:
+        known_books: 요청 시점의 읽은/읽고 싶은 책 alading_book_id (인덱스 이후
+            등록한 도서도 입력에 넣고 결과에서 제외)
+
+    Returns:
+        추천 book_id 목록 (모델/스냅샷이 없거나 모델 크기가 카탈로그와 다르면 None)
+    """
+    snapshots = get_snapshots()
+    if snapshots is None or snapshots.neighbor_index is None:
+        return None
+    catalog, index = snapshots.catalog, snapshots.neighbor_index
+    registry = model_registry.get_registry()
+    version = registry.resolve()
+    if version is None:
+        return None
+    model = registry.load(version)
+    # 행렬 분해 모델은 점수 계산이 작은 행렬곱이므로 배처 없이 바로 계산
+    is_factorization = getattr(model, 'model_type', None) == "factorization"
+    num_books = model.num_books if is_factorization else model.fc1.in_features
+    if num_books != catalog.size:
+        logger.warning(
+            f"모델 크기({num_books})가 카탈로그 크기({catalog.size})와 달라 "
+            f"모델 추천을 건너뜁니다"
+        )
+        return None
+
+    row = index.row_of(user_id)
+    if row is None:
+        columns = np.empty(0, dtype=np.int64)
+    else:
+        own_columns = index.indices[index.indptr[row]:index.indptr[row + 1]]
+        columns = catalog.rows_for_aladin_ids(index.book_values[own_columns])
+    if known_books:
+        columns = np.union1d(columns, catalog.rows_for_aladin_ids(known_books))
+
+    if is_factorization:
+        top_columns, _ = model.recommend(columns, k)
+    else:
+        batcher = get_batcher()
+        if batcher is None:
+            return None
+        try:
+            top_columns, _ = batcher.recommend(columns, k)
+        except BatcherStopped:
+            # 모델 버전이 바뀌며 멈춘 배처를 잡은 요청은 기존 경로로
+            return None
+    return catalog.book_ids[top_columns].tolist()
@@ -0,0 +1,382 @@
+"""
+모델 레지스트리 모듈
+학습된 모델(RecommenderModel 가중치, int8 TorchScript 모듈 또는 FactorizationModel
+배열)을 내용 해시를 버전으로 하여 저장하고,
+이름 붙은 참조(기본: current)를 원자적으로 교체하여 배포
+워커는 학습하지 않고 현재 버전을 한 번 로드하여 LRU에 보관
+
+저장소 구조 (로컬 디렉토리, S3 모두 같은 키 사용):
+    versions/<version>/model.pt     # autoencoder: torch.save(state_dict)
+    versions/<version>/model.ts     # torchscript: torch.jit.save (클래스 없이 로드)
+    versions/<version>/model.npz    # factorization: 도서 행렬 등 배열
+    versions/<version>/meta.json    # 모델 종류/크기, 생성 시각, 사용자 메타데이터
+    refs/<name>                     # 참조가 가리키는 버전 이름
+"""
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol
+
+from bookstar.config import settings
+
+if TYPE_CHECKING:
+    from torch.jit import ScriptModule
+
+    from bookstar.models.factorization import FactorizationModel
+    from bookstar.models.recommender import RecommenderModel
+
+    RegisteredModel = RecommenderModel | ScriptModule | FactorizationModel
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REF = "current"
+
+
+class ModelRegistryError(Exception):
+    """모델 버전/참조가 없거나 저장소를 사용할 수 없는 경우"""
+
+
+class ModelStore(Protocol):
+    """모델 저장소 인터페이스 (키 -> 바이트)"""
+
+    def read_bytes(self, key: str) -> bytes | None:
+        """키의 내용 (없으면 None)"""
+        ...
+
+    def write_bytes(self, key: str, data: bytes) -> None:
+        """키에 내용을 원자적으로 기록"""
+        ...
+
+    def exists(self, key: str) -> bool:
+        ...
+
+
+class LocalModelStore:
+    """로컬 디렉토리 저장소 (임시 파일 + os.replace로 원자적 기록)"""
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+
+    def _path(self, key: str) -> Path:
+        path = (self.root / key).resolve()
+        if not path.is_relative_to(self.root.resolve()):
+            raise ModelRegistryError(f"저장소 밖을 가리키는 키입니다: {key}")
+        return path
+
+    def read_bytes(self, key: str) -> bytes | None:
+        try:
+            return self._path(key).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def write_bytes(self, key: str, data: bytes) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(
+            f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        temp_path.write_bytes(data)
+        os.replace(temp_path, path)
+
+    def exists(self, key: str) -> bool:
+        return self._path(key).exists()
+
+
+class S3ModelStore:
+    """S3 버킷 저장소 (boto3가 설치된 경우에만 사용 가능)"""
+
+    def __init__(
+        self,
+        bucket: str,
+        prefix: str = "",
+        region: str | None = None,
+        access_key_id: str | None = None,
+        secret_access_key: str | None = None
+    ):
+        try:
+            import boto3
+        except ImportError as e:
+            raise ModelRegistryError("S3 저장소를 사용하려면 boto3가 필요합니다") from e
+        self.bucket = bucket
+        self.prefix = prefix
+        self._client = boto3.client(
+            "s3",
+            region_name=region,
+            aws_access_key_id=access_key_id,
+            aws_secret_access_key=secret_access_key,
+        )
+
+    def read_bytes(self, key: str) -> bytes | None:
+        try:
+            response = self._client.get_object(
+                Bucket=self.bucket, Key=self.prefix + key
+            )
+        except self._client.exceptions.NoSuchKey:
+            return None
+        return response['Body'].read()
+
+    def write_bytes(self, key: str, data: bytes) -> None:
+        # S3 PUT은 객체 단위로 원자적
+        self._client.put_object(Bucket=self.bucket, Key=self.prefix + key, Body=data)
+
+    def exists(self, key: str) -> bool:
+        return self.read_bytes(key) is not None
+
+
+class MirroredModelStore:
+    """
+    기본 저장소 + 미러 저장소
+
+    기록은 양쪽에 합니다. 버전 파일은 기본 저장소에 없을 때 미러에서 가져와
+    기본 저장소에 채워 넣고 (새 호스트가 S3에서 모델을 받아오는 경우),
+    참조는 다른 호스트가 승격했을 수 있으므로 항상 미러를 먼저 읽습니다.
+    """
+
+    def __init__(self, primary: ModelStore, mirror: ModelStore):
+        self.primary = primary
+        self.mirror = mirror
+
+    def read_bytes(self, key: str) -> bytes | None:
+        if key.startswith("refs/"):
+            data = self.mirror.read_bytes(key)
+            return data if data is not None else self.primary.read_bytes(key)
+
+        data = self.primary.read_bytes(key)
+        if data is None:
+            data = self.mirror.read_bytes(key)
+            if data is not None:
+                # 버전 파일은 내용이 바뀌지 않으므로 로컬에 캐시
+                self.primary.write_bytes(key, data)
+        return data
+
+    def write_bytes(self, key: str, data: bytes) -> None:
+        # 미러에 먼저 기록하여, 로컬 참조가 미러에 없는 버전을 가리키지 않도록 함
+        self.mirror.write_bytes(key, data)
+        self.primary.write_bytes(key, data)
+
+    def exists(self, key: str) -> bool:
+        return self.primary.exists(key) or self.mirror.exists(key)
+
+
+def state_dict_hash(state_dict: dict[str, Any]) -> str:
+    """가중치 내용 해시 (같은 가중치면 직렬화 방식과 관계없이 같은 값)"""
+    digest = hashlib.sha256()
+    for name in sorted(state_dict):
+        tensor = state_dict[name].detach().cpu().contiguous()
+        digest.update(name.encode())
+        digest.update(str(tensor.dtype).encode())
+        digest.update(str(tuple(tensor.shape)).encode())
+        digest.update(tensor.numpy().tobytes())
+    return digest.hexdigest()[:16]
+
+
+def _serialize(model: RegisteredModel) -> tuple[str, str, bytes, dict[str, Any]]:
+    """모델 -> (버전, 파일 이름, 내용, meta)"""
+    if getattr(model, 'model_type', None) == "factorization":
+        meta = {
+            'model_type': "factorization",
+            'num_books': model.num_books,
+            'factors': model.factors,
+            'quantization': model.quantization,
+        }
+        return model.content_hash(), "model.npz", model.to_bytes(), meta
+
+    import torch
+
+    buffer = io.BytesIO()
+    if isinstance(model, torch.jit.ScriptModule):
+        # 양자화 층의 packed 가중치는 텐서가 아니므로 직렬화 결과를 해시
+        torch.jit.save(model, buffer)
+        payload = buffer.getvalue()
+        meta = {'model_type': "torchscript", 'num_books': model.fc1.in_features}
+        return hashlib.sha256(payload).hexdigest()[:16], "model.ts", payload, meta
+
+    state_dict = model.state_dict()
+    torch.save(state_dict, buffer)
+    meta = {'model_type': "autoencoder", 'num_books': model.fc1.in_features}
+    return state_dict_hash(state_dict), "model.pt", buffer.getvalue(), meta
+
+
+def _deserialize(meta: dict[str, Any], data: bytes, version: str) -> RegisteredModel:
+    """저장된 내용 -> 모델 (내용 해시가 버전과 다르면 ModelRegistryError)"""
+    if meta.get('model_type', "autoencoder") == "factorization":
+        from bookstar.models.factorization import FactorizationModel
+
+        model = FactorizationModel.from_bytes(data)
+        if model.content_hash() != version:
+            raise ModelRegistryError(f"모델 가중치 해시가 일치하지 않습니다: {version}")
+        return model
+
+    import torch
+
+    if meta.get('model_type') == "torchscript":
+        if hashlib.sha256(data).hexdigest()[:16] != version:
+            raise ModelRegistryError(f"모델 파일 해시가 일치하지 않습니다: {version}")
+        model = torch.jit.load(io.BytesIO(data))
+        model.eval()
+        return model
+
+    from bookstar.models.recommender import RecommenderModel
+
+    state_dict = torch.load(io.BytesIO(data), weights_only=True)
+    if state_dict_hash(state_dict) != version:
+        raise ModelRegistryError(f"모델 가중치 해시가 일치하지 않습니다: {version}")
+    model = RecommenderModel(meta['num_books'])
+    model.load_state_dict(state_dict)
+    model.eval()
+    return model
+
+
+class ModelRegistry:
+    """버전별 모델 저장/승격/로드 (로드한 모델은 LRU로 보관)"""
+
+    def __init__(self, store: ModelStore, max_loaded_models: int = 2):
+        self.store = store
+        self.max_loaded_models = max_loaded_models
+        self._loaded: OrderedDict[str, RegisteredModel] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def save(
+        self, model: RegisteredModel, metadata: dict[str, Any] | None = None
+    ) -> str:
+        """
+        모델을 저장합니다 (참조는 바꾸지 않음)
+
+        Returns:
+            버전 이름 (모델 내용 해시, 같은 모델은 다시 저장하지 않음)
+        """
+        version, file_name, payload, meta = _serialize(model)
+        if self.store.exists(f"versions/{version}/meta.json"):
+            return version
+
+        meta.update({
+            'version': version,
+            'file': file_name,
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'metadata': metadata or {},
+        })
+        # meta.json을 마지막에 기록하여, meta가 있으면 가중치도 있음을 보장
+        self.store.write_bytes(f"versions/{version}/{file_name}", payload)
+        self.store.write_bytes(
+            f"versions/{version}/meta.json",
+            json.dumps(meta, ensure_ascii=False).encode('utf-8'),
+        )
+        logger.info(f"모델 저장 완료: {version} ({meta['model_type']})")
+        return version
+
+    def metadata(self, version: str) -> dict[str, Any]:
+        data = self.store.read_bytes(f"versions/{version}/meta.json")
+        if data is None:
+            raise ModelRegistryError(f"모델 버전이 없습니다: {version}")
+        return json.loads(data)
+
+    def promote(self, version: str, ref: str = DEFAULT_REF) -> None:
+        """참조가 지정한 버전을 가리키도록 원자적으로 교체합니다"""
+        self.metadata(version)
+        self.store.write_bytes(f"refs/{ref}", version.encode())
+        logger.info(f"모델 참조 변경: {ref} -> {version}")
+
+    def resolve(self, ref: str = DEFAULT_REF) -> str | None:
+        """참조가 가리키는 버전 (참조 이름 대신 버전 이름을 넘겨도 됨)"""
+        data = self.store.read_bytes(f"refs/{ref}")
+        if data is not None:
+            return data.decode().strip()
+        if self.store.exists(f"versions/{ref}/meta.json"):
+            return ref
+        return None
+
+    def load(self, ref: str = DEFAULT_REF) -> RegisteredModel:
+        """
+        모델을 로드합니다 (이미 로드한 버전은 LRU에서 반환)
+
+        Args:
+            ref: 참조 이름 또는 버전 이름
+        """
+        version = self.resolve(ref)
+        if version is None:
+            raise ModelRegistryError(f"모델 참조가 없습니다: {ref}")
+
+        with self._lock:
+            model = self._loaded.get(version)
+            if model is not None:
+                self._loaded.move_to_end(version)
+                return model
+
+        model = self._load_version(version)
+
+        with self._lock:
+            self._loaded[version] = model
+            self._loaded.move_to_end(version)
+            while len(self._loaded) > self.max_loaded_models:
+                evicted, _ = self._loaded.popitem(last=False)
+                logger.info(f"모델 LRU에서 제거: {evicted}")
+        return model
+
+    def _load_version(self, version: str) -> RegisteredModel:
+        meta = self.metadata(version)
+        file_name = meta.get('file', 'model.pt')
+        data = self.store.read_bytes(f"versions/{version}/{file_name}")
+        if data is None:
+            raise ModelRegistryError(f"모델 가중치가 없습니다: {version}")
+        model = _deserialize(meta, data, version)
+        logger.info(f"모델 로드 완료: {version}")
+        return model
+
+    def loaded_versions(self) -> list[str]:
+        """LRU에 있는 버전 (오래 사용하지 않은 것부터)"""
+        with self._lock:
+            return list(self._loaded)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._loaded.clear()
+
+
+# 전역 레지스트리 (첫 사용 시 설정으로 생성)
+_registry: ModelRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def create_registry() -> ModelRegistry:
+    """설정([model_registry], [aws])으로 레지스트리를 생성합니다"""
+    config = settings.model_registry
+    store: ModelStore = LocalModelStore(config.path)
+    if config.mirror_to_s3:
+        aws = settings.aws
+        if not aws.bucket_name:
+            raise ModelRegistryError("mirror_to_s3에는 [aws] bucket_name이 필요합니다")
+        store = MirroredModelStore(
+            store,
+            S3ModelStore(
+                aws.bucket_name,
+                prefix=config.s3_prefix,
+                region=aws.region,
+                access_key_id=aws.access_key_id,
+                secret_access_key=aws.secret_access_key,
+            ),
+        )
+    return ModelRegistry(store, max_loaded_models=config.max_loaded_models)
+
+
+def get_registry() -> ModelRegistry:
+    """전역 모델 레지스트리"""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = create_registry()
+        return _registry
+
+
+def set_registry(registry: ModelRegistry | None) -> None:
+    """전역 레지스트리 교체 (테스트용, None이면 다음 사용 시 설정으로 다시 생성)"""
+    global _registry
+    with _registry_lock:
+        _registry = registry
@@ -1,20 +1,214 @@
+from __future__ import annotations
+
 import logging
+import threading
 from collections import defaultdict
+from contextlib import AbstractContextManager, nullcontext
+from typing import TYPE_CHECKING
 
 import numpy as np
-import pandas as pd
-from sklearn.neighbors import NearestNeighbors
-from sqlalchemy import func
+from sqlalchemy import String, case, cast, func, literal, select, union_all
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from bookstar.config import settings
-from bookstar.models.models import Book, Member, MemberBook, RecommenderModel
+from bookstar.config.config import SettingsSnapshot
+from bookstar.models.models import Book, Member, MemberBook, ReadingStatus
+from bookstar.services import model_registry, result_cache
+from bookstar.services.catalog import (
+    CATEGORIES,
+    CatalogSnapshot,
+    NeighborIndex,
+    get_catalog,
+    get_neighbor_index,
+    get_snapshots,
+    pad_rows,
+    top_rows,
+)
+from bookstar.services.inference import recommend_with_model
+from bookstar.utils import singleflight
+from bookstar.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+from bookstar.utils.deadline import (
+    Deadline,
+    DeadlineExceeded,
+    check_deadline,
+    deadline_scope,
+    get_current_deadline,
+)
 from bookstar.utils.decorators import log_database_operations, log_execution_time
+from bookstar.utils.lazy import lazy_import
+from bookstar.utils.profiling import span
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    import pandas as pd
+
+    from bookstar.models.recommender import RecommenderModel
+else:
+    # 임포트 비용이 큰 모듈은 첫 사용 시점에 로드 (워커 시작 시간/메모리 절감)
+    pd = lazy_import("pandas")
 
 # 전역 캐시 (메모리 누수 방지를 위해 클래스 외부에서 관리)
 _user_books_cache: dict[int, tuple[list[str], list[str]]] = {}
 _user_preferences_cache: dict[int, dict[str, dict[str, float]]] = {}
 _similar_users_cache: dict[str, list[int]] = {}
+# 캐시가 비어 있는 같은 키의 유사 사용자 계산은 동시에 한 번만 실행
+_similar_users_flight = singleflight.get_group("similar_users")
+
+
+def clear_caches() -> None:
+    """전역 추천 캐시를 모두 비웁니다 (벤치마크 cold 측정, 데이터 갱신 시 사용)"""
+    _user_books_cache.clear()
+    _user_preferences_cache.clear()
+    _similar_users_cache.clear()
+    result_cache.clear_result_cache()
+
+
+def clear_similar_users_cache() -> None:
+    """유사 사용자 캐시만 비웁니다 (KNN 인덱스를 새 스냅샷으로 교체했을 때)"""
+    _similar_users_cache.clear()
+
+
+# 추천 서비스 DB 접근 회로 차단기 ([circuit_breaker] 설정으로 첫 사용 시 생성)
+_db_breaker: CircuitBreaker | None = None
+_db_breaker_lock = threading.Lock()
+# DB를 쓸 수 없을 때 발생하는 예외 (대체 추천으로 응답)
+DATABASE_UNAVAILABLE = (CircuitOpenError, SQLAlchemyError)
+
+
+def get_db_breaker() -> CircuitBreaker | None:
+    """추천 서비스 DB 회로 차단기 (설정에서 꺼져 있으면 None)"""
+    global _db_breaker
+    config = settings.circuit_breaker
+    if not config.enabled:
+        return None
+    with _db_breaker_lock:
+        if _db_breaker is None:
+            _db_breaker = CircuitBreaker(
+                "database",
+                failure_threshold=config.failure_threshold,
+                slow_call_ms=config.slow_call_ms,
+                window_s=config.window_s,
+                open_s=config.open_s,
+                half_open_probes=config.half_open_probes,
+            )
+        return _db_breaker
+
+
+def reset_db_breaker() -> None:
+    """회로 차단기를 초기 상태로 되돌립니다 (테스트용)"""
+    global _db_breaker
+    with _db_breaker_lock:
+        _db_breaker = None
+
+
+def database_guard(count_slow: bool = True) -> AbstractContextManager[None]:
+    """
+    DB를 사용하는 블록을 회로 차단기로 감쌉니다
+
+    회로가 열려 있으면 CircuitOpenError, DB 오류는 SQLAlchemyError가 그대로
+    전파되므로 호출하는 쪽은 DATABASE_UNAVAILABLE을 잡아 대체 추천으로 응답합니다.
+
+    Args:
+        count_slow: False면 slow_call_ms보다 오래 걸려도 실패로 세지 않음
+            (배치, 추천 계산처럼 CPU 시간이 대부분인 블록)
+    """
+    breaker = get_db_breaker()
+    if breaker is None:
+        return nullcontext()
+    return breaker.guard(SQLAlchemyError, count_slow=count_slow)
+
+
+# 사용자 선호도 점수 계산에 쓰이는 설정 (바뀌면 선호도 캐시만 무효화)
+_PREFERENCE_SETTINGS = frozenset({
+    'read_book_weight',
+    'unread_book_weight',
+    'category_preference_weight',
+    'author_preference_weight',
+})
+
+
+# 요청 시간 예산 설정 (바뀌어도 추천 결과 캐시는 유지)
+_DEADLINE_SETTINGS = frozenset({
+    'deadline_ms',
+    'min_statement_timeout_ms',
+    'min_stage_budget_ms',
+})
+
+
+def _invalidate_changed_caches(old: SettingsSnapshot, new: SettingsSnapshot) -> None:
+    """
+    설정 재로드 시 입력이 바뀐 캐시만 비웁니다
+
+    - 선호도 가중치 변경: 선호도 점수 캐시만 비움
+    - similar_users_count 변경: 유사 사용자 캐시는 개수를 키에 포함하므로 유지
+    - 사용자 도서 목록 캐시는 설정과 무관하므로 유지
+    - 추천 결과 캐시는 비우지 않고 stale로 표시 (오래된 목록을 반환하며 갱신,
+      시간 예산 설정만 바뀐 경우는 유지)
+    """
+    changed = old.changed_fields(new).get('recommendation', set())
+    if changed & _PREFERENCE_SETTINGS:
+        _user_preferences_cache.clear()
+        logging.getLogger(__name__).info(
+            f"선호도 가중치 변경으로 선호도 캐시 초기화: {sorted(changed)}"
+        )
+    if changed - _DEADLINE_SETTINGS:
+        result_cache.expire_result_cache()
+
+
+settings.subscribe(_invalidate_changed_caches)
+
+# 선호도 계산에서 read_book_weight를 받는 상태 (나머지는 unread_book_weight)
+_READ_STATUSES = (ReadingStatus.READED, ReadingStatus.READING)
+
+
+def _preference_totals_from_catalog(
+    catalog: CatalogSnapshot,
+    read_list: list[str],
+    want_list: list[str]
+) -> tuple[dict[str, float], dict[str, float]]:
+    """
+    캐시된 도서 목록과 카탈로그 배열로 카테고리/저자별 읽음 가중치 합을 계산
+
+    행 번호로 중복을 없애고, 읽고 싶은 책 중 이미 읽은 책은 제외하여
+    DB 집계 쿼리와 같은 결과를 냅니다.
+    """
+    rec = settings.recommendation
+    read_rows = np.unique(catalog.rows_for_aladin_ids(read_list))
+    want_rows = np.setdiff1d(catalog.rows_for_aladin_ids(want_list), read_rows)
+    category_totals: dict[str, float] = defaultdict(float)
+    author_totals: dict[str, float] = defaultdict(float)
+    for rows, weight in (
+        (read_rows, rec.read_book_weight),
+        (want_rows, rec.unread_book_weight),
+    ):
+        for code in catalog.category_codes[rows].tolist():
+            if code >= 0:
+                category_totals[CATEGORIES[code].value] += weight
+        for code in catalog.author_codes[rows].tolist():
+            if code >= 0:
+                author_totals[catalog.author_names[code]] += weight
+    return dict(category_totals), dict(author_totals)
+
+
+def _text_weights(
+    catalog: CatalogSnapshot,
+    read_list: list[str],
+    excluded: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    읽은 책들의 제목/소개 유사 도서 후보와 가중치 (이미 등록한 도서 제외)
+
+    아티팩트에 유사 도서 목록이 없거나 text_similarity_weight가 0이면 빈 배열입니다.
+    """
+    weight = settings.recommendation.text_similarity_weight
+    if catalog.text_neighbors is None or weight == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0)
+    rows, scores = catalog.text_candidates(catalog.rows_for_aladin_ids(read_list))
+    keep = ~np.isin(rows, excluded)
+    return rows[keep], scores[keep] * weight
+
 
 class RecommendationService:
     """추천 서비스 클래스"""
@@ -23,7 +217,7 @@ class RecommendationService:
         self.db = db
         
     @log_database_operations()
-    @log_execution_time(threshold_ms=settings.logging['db_threshold_ms'])
+    @log_execution_time(threshold_ms=lambda: settings.logging.db_threshold_ms)
     def get_user_books_data(self, user_id: int) -> tuple[list[str], list[str]]:
         """사용자의 읽은 책과 읽고 싶은 책 목록을 효율적으로 조회"""
         logger = logging.getLogger(__name__)
@@ -64,8 +258,41 @@ class RecommendationService:
         
         return result
     
+    def get_users_books_data(
+        self, user_ids: list[int]
+    ) -> dict[int, tuple[list[str], list[str]]]:
+        """여러 사용자의 도서 목록 (캐시에 없는 사용자는 쿼리 한 번으로 조회)"""
+        missing = [uid for uid in user_ids if uid not in _user_books_cache]
+        if missing:
+            lists: dict[int, tuple[list[str], list[str]]] = {
+                uid: ([], []) for uid in missing
+            }
+            rows = (
+                self.db.query(
+                    MemberBook.member_id, MemberBook.book_id, MemberBook.reading_status
+                )
+                .filter(MemberBook.member_id.in_(missing))
+                .all()
+            )
+            for member_id, book_id, status in rows:
+                if status is None:
+                    continue
+                read_list, want_list = lists[member_id]
+                if status in _READ_STATUSES:
+                    read_list.append(str(book_id))
+                elif status == ReadingStatus.WANT_TO_READ:
+                    want_list.append(str(book_id))
+            _user_books_cache.update(lists)
+        return {uid: _user_books_cache[uid] for uid in user_ids}
+    
     def get_user_preferences(self, user_id: int) -> dict[str, dict[str, float]]:
-        """사용자 선호도를 효율적으로 계산"""
+        """
+        사용자 선호도(카테고리/저자별 가중치 합)를 계산
+
+        워밍업된 카탈로그가 있으면 메모리에서, 없으면 DB GROUP BY 한 번으로 집계하므로
+        비용은 도서 수가 아니라 카테고리/저자 수에 비례합니다.
+        도서가 한 권이라도 있으면 'categories', 'authors' 키가 항상 포함됩니다.
+        """
         if user_id in _user_preferences_cache:
             return _user_preferences_cache[user_id]
             
@@ -74,37 +301,76 @@ class RecommendationService:
         if not read_list and not want_list:
             return {}
         
-        # 단일 쿼리로 카테고리와 저자 정보 조회
-        book_ids_int = [int(bid) for bid in read_list + want_list]
-        book_data = (
-            self.db.query(Book.alading_book_id, Book.book_category, Book.author)
-            .filter(Book.alading_book_id.in_(book_ids_int))
-            .all()
-        )
-        
-        category_scores: dict[str, float] = defaultdict(float)
-        author_scores: dict[str, float] = defaultdict(float)
-        
-        for book_id, category, author in book_data:
-            read_weight = settings.recommendation['read_book_weight']
-            unread_weight = settings.recommendation['unread_book_weight']
-            weight = read_weight if str(book_id) in read_list else unread_weight
-            
-            if category:
-                cat_weight = settings.recommendation['category_preference_weight']
-                category_scores[category.value] += cat_weight * weight
-            if author:
-                auth_weight = settings.recommendation['author_preference_weight']
-                author_scores[author] += auth_weight * weight
+        catalog = get_catalog()
+        if catalog is not None:
+            category_totals, author_totals = _preference_totals_from_catalog(
+                catalog, read_list, want_list
+            )
+        else:
+            category_totals, author_totals = self._aggregate_preference_totals(
+                user_id
+            )
         
+        # 설정 스냅샷을 한 번만 읽음
+        rec = settings.recommendation
         result = {
-            'categories': dict(category_scores),
-            'authors': dict(author_scores)
+            'categories': {
+                category: rec.category_preference_weight * total
+                for category, total in category_totals.items()
+            },
+            'authors': {
+                author: rec.author_preference_weight * total
+                for author, total in author_totals.items()
+            },
         }
         _user_preferences_cache[user_id] = result
         return result
     
-    @log_execution_time(threshold_ms=settings.logging['api_threshold_ms'])
+    def _aggregate_preference_totals(
+        self, user_id: int
+    ) -> tuple[dict[str, float], dict[str, float]]:
+        """
+        DB에서 카테고리/저자별 읽음 가중치 합을 집계 (UNION ALL 쿼리 한 번)
+
+        같은 도서가 여러 상태로 등록되어 있으면 읽은 상태를 우선하여 한 번만 셉니다.
+        """
+        rec = settings.recommendation
+        per_book = (
+            select(
+                MemberBook.book_id.label('book_id'),
+                func.max(case(
+                    (MemberBook.reading_status.in_(_READ_STATUSES), 1), else_=0
+                )).label('is_read'),
+            )
+            .where(
+                MemberBook.member_id == user_id,
+                MemberBook.reading_status.is_not(None),
+            )
+            .group_by(MemberBook.book_id)
+            .subquery()
+        )
+        weight = func.sum(case(
+            (per_book.c.is_read == 1, rec.read_book_weight),
+            else_=rec.unread_book_weight,
+        ))
+        category = cast(Book.book_category, String)
+        stmt = union_all(
+            select(literal('category').label('kind'), category.label('name'), weight)
+            .join_from(per_book, Book, Book.alading_book_id == per_book.c.book_id)
+            .where(Book.book_category.is_not(None))
+            .group_by(category),
+            select(literal('author'), Book.author, weight)
+            .join_from(per_book, Book, Book.alading_book_id == per_book.c.book_id)
+            .where(Book.author.is_not(None), Book.author != '')
+            .group_by(Book.author),
+        )
+        
+        totals: dict[str, dict[str, float]] = {'category': {}, 'author': {}}
+        for kind, name, total in self.db.execute(stmt).all():
+            totals[kind][name] = float(total)
+        return totals['category'], totals['author']
+    
+    @log_execution_time(threshold_ms=lambda: settings.logging.api_threshold_ms)
     def get_content_based_recommendations(
         self, 
         user_id: int, 
@@ -113,9 +379,9 @@ class RecommendationService:
         """콘텐츠 기반 추천"""
         logger = logging.getLogger(__name__)
         if num_recommendations is None:
-            num_recommendations = settings.recommendation[
-                'default_recommendations_count'
-            ]
+            num_recommendations = (
+                settings.recommendation.default_recommendations_count
+            )
         logger.info(
             f"콘텐츠 기반 추천 시작: 사용자 {user_id}, 추천 개수 {num_recommendations}"
         )
@@ -127,6 +393,16 @@ class RecommendationService:
             logger.info(f"사용자 {user_id}의 선호도 정보가 없어 랜덤 추천으로 전환")
             return self._get_random_books(num_recommendations)
         
+        # 남은 시간 예산이 모자라면 점수 계산을 시작하지 않음 (단계 생략)
+        check_deadline(settings.recommendation.min_stage_budget_ms)
+        
+        # 워밍업된 카탈로그가 있으면 전체 도서 조회 없이 배열로 계산
+        catalog = get_catalog()
+        if catalog is not None:
+            return self._content_from_catalog(
+                catalog, user_id, preferences, num_recommendations
+            )
+        
         # 효율적인 책 데이터 조회 (id 컬럼만)
         books_query = (
             self.db.query(
@@ -204,6 +480,106 @@ class RecommendationService:
         # 상위 추천 반환
         return df.nlargest(num_recommendations, 'total_weight')
     
+    def _content_from_catalog(
+        self, 
+        catalog: CatalogSnapshot, 
+        user_id: int, 
+        preferences: dict[str, dict[str, float]], 
+        num_recommendations: int
+    ) -> pd.DataFrame:
+        """
+        카탈로그 스냅샷으로 콘텐츠 기반 점수 계산
+
+        카테고리/저자 역색인으로 선호 카테고리·저자의 도서와 읽은 책의 제목/소개
+        유사 도서만 점수를 계산하고, 가중치가 0보다 큰 후보가 부족하면 인기순
+        도서(가중치 0)로 채웁니다.
+        """
+        read_list, want_list = self.get_user_books_data(user_id)
+        excluded = catalog.rows_for_aladin_ids(read_list + want_list)
+        category_prefs = preferences.get('categories', {})
+        author_prefs = preferences.get('authors', {})
+        
+        rows = catalog.matching_rows(category_prefs, author_prefs, excluded)
+        text_rows, text_scores = _text_weights(catalog, read_list, excluded)
+        if len(text_rows):
+            rows = np.union1d(rows, text_rows)
+        category_weight, author_weight = catalog.preference_weights(
+            category_prefs, author_prefs, rows
+        )
+        text_weight = np.zeros(len(rows))
+        text_weight[np.searchsorted(rows, text_rows)] = text_scores
+        total_weight = category_weight + author_weight + text_weight
+        # 행 번호 오름차순 후보에서 고르므로 같은 점수는 앞 도서 우선 (nlargest와 같음)
+        top = top_rows(
+            np.where(total_weight > 0, total_weight, -np.inf), num_recommendations
+        )
+        chosen = pad_rows(
+            rows[top], excluded, catalog.popular_rows, num_recommendations
+        )
+        if len(chosen) == 0:
+            return pd.DataFrame()
+        
+        padding = np.zeros(len(chosen) - len(top))
+        df = pd.DataFrame({
+            "book_id": catalog.book_ids[chosen],
+            "alading_book_id": catalog.aladin_ids[chosen],
+            "category_weight": np.concatenate([category_weight[top], padding]),
+            "author_weight": np.concatenate([author_weight[top], padding]),
+            "text_weight": np.concatenate([text_weight[top], padding]),
+        })
+        df['total_weight'] = (
+            df['category_weight'] + df['author_weight'] + df['text_weight']
+        )
+        return df
+    
+    def get_content_based_recommendations_batch(
+        self, 
+        user_ids: list[int], 
+        num_recommendations: int | None = None
+    ) -> dict[int, pd.DataFrame]:
+        """
+        여러 사용자의 콘텐츠 기반 추천을 행렬 곱으로 한 번에 계산
+
+        카탈로그가 없으면 사용자별 get_content_based_recommendations로 계산하고,
+        선호도가 없는 사용자는 단건 경로와 같이 랜덤 추천을 받습니다.
+        """
+        if num_recommendations is None:
+            num_recommendations = (
+                settings.recommendation.default_recommendations_count
+            )
+        catalog = get_catalog()
+        if catalog is None:
+            return {
+                uid: self.get_content_based_recommendations(uid, num_recommendations)
+                for uid in user_ids
+            }
+        
+        books_data = self.get_users_books_data(user_ids)
+        results: dict[int, pd.DataFrame] = {}
+        scored, preferences, exclude, text = [], [], [], []
+        for uid in user_ids:
+            user_preferences = self.get_user_preferences(uid)
+            if not user_preferences:
+                results[uid] = self._get_random_books(num_recommendations)
+                continue
+            read_list, want_list = books_data[uid]
+            scored.append(uid)
+            preferences.append(user_preferences)
+            exclude.append(catalog.rows_for_aladin_ids(read_list + want_list))
+            text.append(_text_weights(catalog, read_list, exclude[-1]))
+        
+        with span("content_batch"):
+            top = catalog.content_topk(
+                preferences, exclude, num_recommendations, text=text
+            )
+        for uid, (rows, scores) in zip(scored, top, strict=True):
+            results[uid] = pd.DataFrame({
+                "book_id": catalog.book_ids[rows],
+                "alading_book_id": catalog.aladin_ids[rows],
+                "total_weight": scores,
+            })
+        return results
+    
     def _get_random_books(self, num_recommendations: int) -> pd.DataFrame:
         """랜덤 책 추천"""
         books = (
@@ -224,21 +600,51 @@ class RecommendationService:
         user_id: int, 
         num_similar_users: int | None = None
     ) -> list[int]:
-        """유사 사용자 찾기 (캐시 적용)"""
+        """유사 사용자 찾기 (캐시 적용, 같은 키의 동시 계산은 한 번만 실행)"""
         if num_similar_users is None:
-            num_similar_users = settings.recommendation['similar_users_count']
+            num_similar_users = settings.recommendation.similar_users_count
         
         cache_key = f"{user_id}_{num_similar_users}"
         if cache_key in _similar_users_cache:
             return _similar_users_cache[cache_key]
-        
-        user_data = self._build_user_books_data()
-        if not user_data or user_id not in user_data:
-            return []
-        
-        similar_users = self._find_similar_users_knn(
-            user_data, user_id, num_similar_users
+        return _similar_users_flight.do(
+            cache_key, self._load_similar_users, user_id, num_similar_users, cache_key,
+            retry_if=retry_with_own_budget,
         )
+    
+    def _load_similar_users(
+        self, 
+        user_id: int, 
+        num_similar_users: int, 
+        cache_key: str
+    ) -> list[int]:
+        """
+        유사 사용자를 계산하여 캐시에 저장 (KNN 인덱스 또는 DB 경로)
+
+        요청의 남은 시간 예산이 min_stage_budget_ms보다 적으면 계산을 시작하지 않고
+        DeadlineExceeded를 발생시킵니다. (DB 경로는 이력 조회 뒤에도 한 번 더 확인)
+        """
+        min_stage_budget_ms = settings.recommendation.min_stage_budget_ms
+        check_deadline(min_stage_budget_ms)
+        neighbor_index = get_neighbor_index()
+        if neighbor_index is not None:
+            with span("similar_users"):
+                similar_users = neighbor_index.similar_users(
+                    user_id, num_similar_users
+                )
+            _similar_users_cache[cache_key] = similar_users
+            return similar_users
+        
+        with span("similar_users"):
+            user_data = self._build_user_books_data()
+            if not user_data or user_id not in user_data:
+                return []
+            
+            # 특성 행렬/KNN 구축은 사용자 수 x 도서 수에 비례하여 가장 오래 걸림
+            check_deadline(min_stage_budget_ms)
+            similar_users = self._find_similar_users_knn(
+                user_data, user_id, num_similar_users
+            )
         
         _similar_users_cache[cache_key] = similar_users
         return similar_users
@@ -304,6 +710,9 @@ class RecommendationService:
         num_similar_users: int
     ) -> list[int]:
         """KNN으로 유사 사용자 계산"""
+        # sklearn 최상위 패키지 임포트에 scipy 등이 포함되어 첫 사용 시점에 로드
+        from sklearn.neighbors import NearestNeighbors
+        
         try:
             n_neighbors = min(num_similar_users + 1, len(user_ids))
             knn = NearestNeighbors(n_neighbors=n_neighbors)
@@ -327,16 +736,39 @@ class RecommendationService:
         user_id: int, 
         num_recommendations: int | None = None
     ) -> pd.DataFrame:
-        """협업 필터링 기반 추천"""
+        """
+        협업 필터링 기반 추천
+
+        [inference] serve_model이면 레지스트리의 현재 모델로 계산하고, 모델이 없거나
+        카탈로그와 맞지 않으면 유사 사용자(KNN) 경로를 사용합니다.
+        """
         if num_recommendations is None:
-            num_recommendations = settings.recommendation[
-                'default_recommendations_count'
-            ]
+            num_recommendations = (
+                settings.recommendation.default_recommendations_count
+            )
+        if settings.inference.serve_model:
+            read_list, want_list = self.get_user_books_data(user_id)
+            with span("model"):
+                book_ids = recommend_with_model(
+                    user_id, num_recommendations, read_list + want_list
+                )
+            if book_ids is not None:
+                return pd.DataFrame({"book_id": book_ids})
+
         similar_users = self.get_similar_users(user_id)
         
         if not similar_users:
             return pd.DataFrame()
         
+        read_list, want_list = self.get_user_books_data(user_id)
+        
+        snapshots = get_snapshots()
+        if snapshots is not None and snapshots.neighbor_index is not None:
+            return _collaborative_from_index(
+                snapshots.catalog, snapshots.neighbor_index, similar_users,
+                read_list + want_list, num_recommendations,
+            )
+        
         # 유사 사용자들이 읽은 책 조회
         similar_user_books = (
             self.db.query(MemberBook.book_id)
@@ -350,9 +782,9 @@ class RecommendationService:
         
         book_ids = [book[0] for book in similar_user_books]
         
-        # 현재 사용자가 이미 읽은 책 제외
-        read_list, want_list = self.get_user_books_data(user_id)
-        book_ids = [bid for bid in book_ids if bid not in read_list + want_list]
+        # 현재 사용자가 이미 읽은 책 제외 (book_id는 정수, 목록은 문자열)
+        excluded = set(read_list + want_list)
+        book_ids = [bid for bid in book_ids if str(bid) not in excluded]
         
         if not book_ids:
             return pd.DataFrame()
@@ -372,31 +804,249 @@ class RecommendationService:
             "book_id": book.id
         } for book in books])
 
+    def get_cached_collaborative_recommendations(
+        self,
+        user_id: int,
+        num_recommendations: int
+    ) -> pd.DataFrame | None:
+        """
+        DB를 조회하지 않고 캐시와 KNN 인덱스만으로 협업 필터링 추천 (시간 예산 초과 시)
+
+        유사 사용자/도서 목록 캐시, 카탈로그와 KNN 인덱스가 모두 있어야 하며
+        하나라도 없으면 None을 반환합니다.
+        """
+        cache_key = f"{user_id}_{settings.recommendation.similar_users_count}"
+        similar_users = _similar_users_cache.get(cache_key)
+        books = _user_books_cache.get(user_id)
+        snapshots = get_snapshots()
+        if similar_users is None or books is None:
+            return None
+        if snapshots is None or snapshots.neighbor_index is None:
+            return None
+        if not similar_users:
+            return pd.DataFrame()
+        read_list, want_list = books
+        return _collaborative_from_index(
+            snapshots.catalog, snapshots.neighbor_index, similar_users,
+            read_list + want_list, num_recommendations,
+        )
+
+
+def _collaborative_from_index(
+    catalog: CatalogSnapshot,
+    neighbor_index: NeighborIndex,
+    similar_users: list[int],
+    known_books: list[str],
+    num_recommendations: int
+) -> pd.DataFrame:
+    """유사 사용자들의 도서 중 사용자가 등록하지 않은 도서 (KNN 인덱스 배열 사용)"""
+    rows = np.setdiff1d(
+        catalog.rows_for_aladin_ids(neighbor_index.books_of(similar_users)),
+        catalog.rows_for_aladin_ids(known_books),
+    )
+    if len(rows) == 0:
+        return pd.DataFrame()
+    return pd.DataFrame({
+        "book_id": catalog.book_ids[rows[:num_recommendations]]
+    })
+
+
 def get_cached_model(db: Session, cache_key: str) -> RecommenderModel | None:
-    """모델 캐시에서 모델 조회"""
-    # 현재는 사용하지 않음
-    return None
+    """
+    모델 레지스트리에서 모델 조회
+
+    Args:
+        db: 사용하지 않음 (기존 호출부 호환)
+        cache_key: 참조 이름(예: "current") 또는 버전 이름
+
+    Returns:
+        로드된 모델 (등록된 모델이 없으면 None)
+    """
+    registry = model_registry.get_registry()
+    if registry.resolve(cache_key) is None:
+        return None
+    return registry.load(cache_key)
 
-def cache_model(cache_key: str, model: RecommenderModel):
-    """모델을 캐시에 저장"""
-    # 현재는 사용하지 않음
-    pass
+def cache_model(cache_key: str, model: RecommenderModel) -> str:
+    """
+    모델을 레지스트리에 저장하고 cache_key 참조를 새 버전으로 교체
+
+    Returns:
+        저장된 버전 이름
+    """
+    registry = model_registry.get_registry()
+    version = registry.save(model)
+    registry.promote(version, ref=cache_key)
+    return version
+
+class DegradedRecommendations(list):
+    """
+    일부 단계를 건너뛰거나 대체하여 만든 추천 목록 (list[dict])
+
+    degraded에 대체된 단계 이름을 담으며, 결과 캐시에 저장하지 않습니다.
+    """
+
+    def __init__(self, recommendations=(), degraded: tuple[str, ...] = ()):
+        super().__init__(recommendations)
+        self.degraded = degraded
 
-@log_execution_time(threshold_ms=settings.logging['heavy_threshold_ms'])
+
+def retry_with_own_budget(future: Future) -> bool:
+    """
+    합쳐진 계산의 결과 대신 이 요청이 직접 다시 계산해야 하는지 (singleflight retry_if)
+
+    먼저 시작한 요청의 시간 예산이 바닥나 계산이 중단되었거나(DeadlineExceeded) 단계를
+    생략한 결과(DB 장애로 인한 'database' 제외)이고, 이 요청에는 단계를 시작할 만큼
+    예산이 남아 있으면 True입니다. (요청 밖의 호출은 제한이 없으므로 항상 다시 계산)
+    """
+    deadline = get_current_deadline()
+    remaining_ms = deadline.remaining_ms() if deadline is not None else float('inf')
+    if remaining_ms < settings.recommendation.min_stage_budget_ms:
+        return False
+    error = future.exception()
+    if error is not None:
+        return isinstance(error, DeadlineExceeded)
+    degraded = getattr(future.result(), 'degraded', ())
+    return any(stage != 'database' for stage in degraded)
+
+
+def fallback_recommendations(
+    user_id: int,
+    num_recommendations: int,
+    known_books: list[str] | None = None,
+    degraded: tuple[str, ...] = ('database',)
+) -> DegradedRecommendations:
+    """
+    DB 없이 메모리 데이터만으로 만드는 대체 추천 (회로 차단 중, DB 오류 시)
+
+    1. 결과 캐시에 남아 있는 사용자의 마지막 추천 (hard TTL이 지났어도 사용)
+    2. 카탈로그 인기순 목록 (known_books 또는 캐시된 도서 목록의 책은 제외)
+
+    Args:
+        known_books: 사용자가 등록한 도서의 alading_book_id 문자열 목록
+            (read_list + want_list와 같은 형식, 없으면 도서 목록 캐시 사용)
+        degraded: 결과에 표시할 생략 사유 (시간 예산 초과면 해당 단계 이름)
+    """
+    cache = result_cache.get_result_cache()
+    last = (
+        cache.peek((user_id, num_recommendations)) if cache is not None else None
+    )
+    if last is not None:
+        return DegradedRecommendations(last, degraded=degraded)
+
+    if known_books is None:
+        read_list, want_list = _user_books_cache.get(user_id, ([], []))
+        known_books = read_list + want_list
+    return DegradedRecommendations(
+        _popular_recommendations(num_recommendations, known_books),
+        degraded=degraded,
+    )
+
+
+def _popular_recommendations(
+    num_recommendations: int, known_books: list[str]
+) -> list[dict]:
+    """카탈로그 인기순 추천 (known_books 제외, 카탈로그가 없으면 빈 목록)"""
+    catalog = get_catalog()
+    if catalog is None:
+        return []
+    rows = pad_rows(
+        np.empty(0, dtype=np.int64),
+        catalog.rows_for_aladin_ids(known_books),
+        catalog.popular_rows,
+        num_recommendations,
+    )
+    return [{'book_id': int(book_id)} for book_id in catalog.book_ids[rows]]
+
+
+def _skip_stage(
+    deadline: Deadline, stage: str, user_id: int, error: DeadlineExceeded
+) -> None:
+    """시간 예산이 바닥나 쿼리가 중단된 단계를 생략된 것으로 기록합니다"""
+    logging.getLogger(__name__).warning(
+        f"{error} - {stage} 단계 생략: 사용자 {user_id}",
+        extra={
+            'user_id': user_id,
+            'stage': stage,
+            'elapsed_ms': round(error.elapsed_ms, 2)
+        }
+    )
+    deadline.degrade(stage)
+
+
+def _combine_recommendations(
+    service: RecommendationService,
+    content_recommendations: pd.DataFrame,
+    collaborative_recommendations: pd.DataFrame,
+    num_recommendations: int
+) -> pd.DataFrame:
+    """콘텐츠 기반/협업 필터링 결과를 결합 (둘 다 비어 있으면 랜덤 추천)"""
+    content_empty = content_recommendations.empty
+    collaborative_empty = collaborative_recommendations.empty
+    
+    if not content_empty and not collaborative_empty:
+        # 가중치 적용하여 결합
+        content_recommendations['source'] = 'content'
+        collaborative_recommendations['source'] = 'collaborative'
+        
+        combined_df = pd.concat([
+            content_recommendations.head(num_recommendations // 2),
+            collaborative_recommendations
+        ]).drop_duplicates(subset=['book_id'])
+        
+    elif not content_empty:
+        combined_df = content_recommendations
+    elif not collaborative_empty:
+        combined_df = collaborative_recommendations
+    else:
+        # 랜덤 추천
+        combined_df = service._get_random_books(num_recommendations)
+    
+    # 최종 결과 반환
+    return combined_df.head(num_recommendations)
+
+@log_execution_time(threshold_ms=lambda: settings.logging.heavy_threshold_ms)
 def recommend_books(
     db: Session, 
     user_id: int, 
     read_list: list[str], 
     want_list: list[str], 
-    num_recommendations: int | None = None
+    num_recommendations: int | None = None,
+    deadline_ms: float | None = None
 ) -> list[dict]:
     """
     개선된 추천 시스템
     콘텐츠 기반 + 협업 필터링 하이브리드 방식
+
+    Args:
+        deadline_ms: 이 호출의 시간 예산 (없으면 현재 요청의 deadline을 따르고,
+            요청 밖(배치 작업, 벤치마크)에서는 제한 없음, 0 = 제한 없음)
+
+    콘텐츠 기반 단계가 예산을 다 쓰면 협업 필터링은 캐시로 계산하거나 생략하고,
+    생략한 단계 이름을 DegradedRecommendations.degraded로 반환합니다.
     """
+    if deadline_ms is None:
+        return _recommend_books(
+            db, user_id, read_list, want_list, num_recommendations
+        )
+    with deadline_scope(deadline_ms):
+        return _recommend_books(
+            db, user_id, read_list, want_list, num_recommendations
+        )
+
+
+def _recommend_books(
+    db: Session,
+    user_id: int,
+    read_list: list[str],
+    want_list: list[str],
+    num_recommendations: int | None
+) -> list[dict]:
+    """recommend_books 본문 (현재 deadline 안에서 실행)"""
     logger = logging.getLogger(__name__)
+    deadline = get_current_deadline() or Deadline(0)
     if num_recommendations is None:
-        num_recommendations = settings.recommendation['default_recommendations_count']
+        num_recommendations = settings.recommendation.default_recommendations_count
     logger.info(
         f"하이브리드 추천 시스템 시작: 사용자 {user_id}, 읽은 책 {len(read_list)}권, "
         f"읽고 싶은 책 {len(want_list)}권, 추천 개수 {num_recommendations}",
@@ -409,45 +1059,78 @@ def recommend_books(
     )
     
     try:
-        service = RecommendationService(db)
-        
-        # 콘텐츠 기반 추천
-        logger.info(f"콘텐츠 기반 추천 실행 중: 사용자 {user_id}")
-        content_recommendations = service.get_content_based_recommendations(
-            user_id, num_recommendations
-        )
-        
-        # 협업 필터링 기반 추천
-        logger.info(f"협업 필터링 추천 실행 중: 사용자 {user_id}")
-        collaborative_recommendations = service.get_collaborative_recommendations(
-            user_id, num_recommendations // 2
-        )
-        
-        # 두 추천 결과 결합
+        # DB 접근은 회로 차단기로 감쌈 (열려 있거나 DB 오류면 대체 추천)
+        # 블록 시간은 대부분 CPU 계산이므로 느린 호출로 세지 않음
+        # (DB 지연은 main의 member_book 조회 가드가 느린 호출로 셈)
+        with database_guard(count_slow=False):
+            service = RecommendationService(db)
+
+            # 콘텐츠 기반 추천
+            logger.info(f"콘텐츠 기반 추천 실행 중: 사용자 {user_id}")
+            with span("content"):
+                try:
+                    content_recommendations = (
+                        service.get_content_based_recommendations(
+                            user_id, num_recommendations
+                        )
+                    )
+                except DeadlineExceeded as e:
+                    _skip_stage(deadline, "content", user_id, e)
+                    content_recommendations = pd.DataFrame()
+
+            # 협업 필터링 기반 추천 (시간 예산이 모자라면 DB 없이 캐시로만 계산)
+            logger.info(f"협업 필터링 추천 실행 중: 사용자 {user_id}")
+            with span("collaborative"):
+                min_stage_budget_ms = settings.recommendation.min_stage_budget_ms
+                if deadline.remaining_ms() < min_stage_budget_ms:
+                    collaborative_recommendations = (
+                        service.get_cached_collaborative_recommendations(
+                            user_id, num_recommendations // 2
+                        )
+                    )
+                    if collaborative_recommendations is None:
+                        logger.warning(
+                            f"시간 예산({deadline.budget_ms:.0f}ms) 초과로 "
+                            f"협업 필터링 생략: 사용자 {user_id}",
+                            extra={
+                                'user_id': user_id,
+                                'elapsed_ms': round(deadline.elapsed_ms(), 2)
+                            }
+                        )
+                        deadline.degrade("collaborative")
+                        collaborative_recommendations = pd.DataFrame()
+                else:
+                    try:
+                        collaborative_recommendations = (
+                            service.get_collaborative_recommendations(
+                                user_id, num_recommendations // 2
+                            )
+                        )
+                    except DeadlineExceeded as e:
+                        _skip_stage(deadline, "collaborative", user_id, e)
+                        collaborative_recommendations = pd.DataFrame()
+
+            with span("combine"):
+                try:
+                    final_recommendations = _combine_recommendations(
+                        service,
+                        content_recommendations,
+                        collaborative_recommendations,
+                        num_recommendations,
+                    )
+                except DeadlineExceeded as e:
+                    # 두 단계 모두 비어 랜덤 추천 쿼리까지 중단되면 인기순으로 채움
+                    _skip_stage(deadline, "combine", user_id, e)
+                    final_recommendations = pd.DataFrame(
+                        _popular_recommendations(
+                            num_recommendations, read_list + want_list
+                        ),
+                        columns=['book_id'],
+                    )
+
         content_empty = content_recommendations.empty
         collaborative_empty = collaborative_recommendations.empty
         
-        if not content_empty and not collaborative_empty:
-            # 가중치 적용하여 결합
-            content_recommendations['source'] = 'content'
-            collaborative_recommendations['source'] = 'collaborative'
-            
-            combined_df = pd.concat([
-                content_recommendations.head(num_recommendations // 2),
-                collaborative_recommendations
-            ]).drop_duplicates(subset=['book_id'])
-            
-        elif not content_empty:
-            combined_df = content_recommendations
-        elif not collaborative_empty:
-            combined_df = collaborative_recommendations
-        else:
-            # 랜덤 추천
-            combined_df = service._get_random_books(num_recommendations)
-        
-        # 최종 결과 반환
-        final_recommendations = combined_df.head(num_recommendations)
-        
         logger.info(
             f"추천 완료: 사용자 {user_id}에게 {len(final_recommendations)}권 추천",
             extra={
@@ -459,14 +1142,29 @@ def recommend_books(
                 'collaborative_count': (
                     len(collaborative_recommendations) 
                     if not collaborative_empty else 0
-                )
+                ),
+                'degraded': deadline.degraded
             }
         )
         
-        return final_recommendations[
+        recommendations = final_recommendations[
             ['book_id']
         ].to_dict(orient='records')
-        
+        if deadline.degraded:
+            return DegradedRecommendations(
+                recommendations, degraded=tuple(deadline.degraded)
+            )
+        return recommendations
+
+    except DATABASE_UNAVAILABLE as e:
+        logger.warning(
+            f"DB를 사용할 수 없어 대체 추천으로 응답: 사용자 {user_id}, 사유: {e}",
+            extra={'user_id': user_id, 'error_type': type(e).__name__}
+        )
+        return fallback_recommendations(
+            user_id, num_recommendations, read_list + want_list
+        )
+
     except Exception as e:
         logger.error(
             f"추천 시스템 오류 발생: 사용자 {user_id}, 오류: {str(e)}",
@@ -481,6 +1179,71 @@ def recommend_books(
             ['book_id']
         ].to_dict(orient='records')
 
+@log_execution_time(threshold_ms=lambda: settings.logging.heavy_threshold_ms)
+def recommend_books_batch(
+    db: Session, 
+    user_ids: list[int], 
+    num_recommendations: int | None = None
+) -> dict[int, list[dict]]:
+    """
+    여러 사용자의 하이브리드 추천을 한 번에 계산 (배치 API, 캐시 미리 채우기)
+
+    콘텐츠 기반 단계는 사용자 블록 단위 행렬 곱으로 계산하고, 협업 필터링과
+    결합은 사용자별로 recommend_books와 같게 처리합니다.
+    배치 계산이 실패하면 사용자별 recommend_books(오류 시 랜덤 추천)로 계산하고,
+    DB를 쓸 수 없으면(회로 차단 중) 사용자별 대체 추천으로 응답합니다.
+    """
+    logger = logging.getLogger(__name__)
+    if num_recommendations is None:
+        num_recommendations = settings.recommendation.default_recommendations_count
+    user_ids = list(dict.fromkeys(user_ids))
+    
+    try:
+        # 사용자 수에 비례해 오래 걸리므로 느린 호출은 실패로 세지 않음
+        with database_guard(count_slow=False):
+            service = RecommendationService(db)
+            with span("content"):
+                content = service.get_content_based_recommendations_batch(
+                    user_ids, num_recommendations
+                )
+            results = {}
+            for uid in user_ids:
+                with span("collaborative"):
+                    collaborative = service.get_collaborative_recommendations(
+                        uid, num_recommendations // 2
+                    )
+                with span("combine"):
+                    final_recommendations = _combine_recommendations(
+                        service, content[uid], collaborative, num_recommendations
+                    )
+                results[uid] = final_recommendations[['book_id']].to_dict(
+                    orient='records'
+                )
+        logger.info(f"배치 추천 완료: 사용자 {len(user_ids)}명")
+        return results
+    
+    except DATABASE_UNAVAILABLE as e:
+        logger.warning(
+            f"DB를 사용할 수 없어 배치 대체 추천으로 응답: {e}",
+            extra={'user_count': len(user_ids), 'error_type': type(e).__name__}
+        )
+        return {
+            uid: fallback_recommendations(uid, num_recommendations)
+            for uid in user_ids
+        }
+
+    except Exception as e:
+        logger.error(
+            f"배치 추천 오류 발생, 사용자별 추천으로 전환: {str(e)}",
+            exc_info=True,
+            extra={'user_count': len(user_ids), 'error_type': type(e).__name__}
+        )
+        books_data = RecommendationService(db).get_users_books_data(user_ids)
+        return {
+            uid: recommend_books(db, uid, *books_data[uid], num_recommendations)
+            for uid in user_ids
+        }
+
 # 하위 호환성을 위한 기존 함수들 (deprecated)
 def create_user_item_matrix(db: Session, user_id: int):
     """Deprecated: 하위 호환성을 위해 유지"""
@@ -493,22 +1256,33 @@ def create_user_item_matrix(db: Session, user_id: int):
 def train_model(user_item_matrix, num_epochs=None, learning_rate=None):
     """Deprecated: 하위 호환성을 위해 유지"""
     if num_epochs is None:
-        num_epochs = settings.recommendation['num_epochs']
+        num_epochs = settings.recommendation.num_epochs
     if learning_rate is None:
-        learning_rate = settings.recommendation['learning_rate']
+        learning_rate = settings.recommendation.learning_rate
     logging.warning(
         "train_model은 deprecated됩니다. "
-        "RecommendationService를 사용하세요."
+        "모델 학습은 python -m bookstar.jobs.train 을 사용하세요."
     )
     return None
 
 def recommend_with_pytorch(model, user_id_index, all_books, top_n=5):
-    """Deprecated: 하위 호환성을 위해 유지"""
-    logging.warning(
-        "recommend_with_pytorch는 deprecated됩니다. "
-        "RecommendationService를 사용하세요."
-    )
-    return []
+    """
+    PyTorch 모델로 추천 (배처 없이 요청 한 건을 바로 계산)
+
+    Args:
+        model: RecommenderModel (입력/출력 열이 all_books 순서와 같아야 함)
+        user_id_index: 사용자가 상호작용한 도서의 열 번호 목록
+        all_books: 열 번호 -> 도서 ID
+        top_n: 추천 개수
+
+    Returns:
+        추천 도서 ID 목록 (이미 상호작용한 도서 제외)
+    """
+    from bookstar.services.inference import InferenceRequest, score_topk
+
+    request = InferenceRequest(np.asarray(user_id_index, dtype=np.int64), top_n)
+    columns, _ = score_topk(model, [request])[0]
+    return [all_books[column] for column in columns.tolist()]
 
 def calculate_author_weight(author, books, read_list, want_list):
     """Deprecated: 하위 호환성을 위해 유지"""
@@ -0,0 +1,219 @@
+"""
+추천 결과 캐시 (stale-while-revalidate)
+항목마다 저장 시각을 두고 두 단계 TTL로 상태를 나눔
+
+- soft_ttl_s 이내: fresh (그대로 반환)
+- soft_ttl_s ~ hard_ttl_s: stale (오래된 목록을 바로 반환하고 백그라운드에서
+  한 번만 갱신)
+- hard_ttl_s 이후 또는 없음: miss (요청 스레드에서 다시 계산)
+
+만료된 항목을 처음 받은 요청이 재계산 지연을 그대로 떠안지 않도록, 갱신은
+refresh_concurrency개 스레드에서만 실행하고 자리가 없으면 건너뜁니다.
+(다음 stale 요청이 다시 시도하며, 그동안 오래된 목록을 계속 반환)
+"""
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Literal
+
+from bookstar.config import settings
+
+logger = logging.getLogger(__name__)
+
+CacheState = Literal['fresh', 'stale', 'miss']
+
+
+class ResultCache:
+    """soft/hard TTL을 가진 LRU 결과 캐시 (스레드 안전)"""
+
+    def __init__(
+        self,
+        soft_ttl_s: float,
+        hard_ttl_s: float,
+        max_entries: int,
+        refresh_concurrency: int,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.soft_ttl_s = soft_ttl_s
+        self.hard_ttl_s = hard_ttl_s
+        self.max_entries = max_entries
+        self.refresh_concurrency = refresh_concurrency
+        self.clock = clock
+        self.hits = 0              # fresh 반환 횟수
+        self.stale_hits = 0        # stale 반환 횟수
+        self.misses = 0            # 없거나 hard TTL이 지나 다시 계산한 횟수
+        self.refreshes = 0         # 백그라운드 갱신 시작 횟수
+        self.refresh_skipped = 0   # 동시 갱신 한도로 건너뛴 횟수
+        self.refresh_errors = 0    # 예외로 끝난 갱신 횟수
+        self._entries: OrderedDict[Hashable, tuple[Any, float]] = OrderedDict()
+        self._refreshing: set[Hashable] = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=refresh_concurrency, thread_name_prefix="result-refresh"
+        )
+
+    def lookup(self, key: Hashable) -> tuple[Any, CacheState]:
+        """
+        key의 값과 상태를 반환합니다
+
+        Returns:
+            (값, 'fresh' | 'stale') 또는 (None, 'miss')
+        """
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or now - entry[1] >= self.hard_ttl_s:
+                self.misses += 1
+                return None, 'miss'
+            self._entries.move_to_end(key)
+            if now - entry[1] < self.soft_ttl_s:
+                self.hits += 1
+                return entry[0], 'fresh'
+            self.stale_hits += 1
+            return entry[0], 'stale'
+
+    def peek(self, key: Hashable) -> Any:
+        """
+        TTL과 상관없이 마지막으로 저장된 값 (없으면 None)
+
+        DB를 쓸 수 없을 때의 대체 응답용이며 조회 횟수에 세지 않습니다.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry[0] if entry is not None else None
+
+    def store(self, key: Hashable, value: Any, stale: bool = False) -> None:
+        """
+        값을 현재 시각으로 저장합니다 (max_entries 초과 시 오래 안 쓴 항목 제거)
+
+        stale이면 soft TTL이 이미 지난 것으로 저장하여, 다음 요청은 이 값을 바로
+        받고 백그라운드 갱신을 예약합니다. (일부 단계를 생략한 결과 등)
+        """
+        stored_at = self.clock() - (self.soft_ttl_s if stale else 0.0)
+        with self._lock:
+            self._entries[key] = (value, stored_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def refresh(self, key: Hashable, fn: Callable[..., Any], *args) -> bool:
+        """
+        백그라운드에서 fn(*args)로 key를 다시 계산하여 저장합니다
+
+        fn이 None을 반환하면 저장하지 않습니다 (기존 값 유지).
+        같은 key를 이미 갱신 중이거나 동시 갱신 한도에 도달했으면 예약하지 않습니다.
+
+        Returns:
+            갱신을 예약했는지 여부
+        """
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            if len(self._refreshing) >= self.refresh_concurrency:
+                self.refresh_skipped += 1
+                return False
+            self._refreshing.add(key)
+            self.refreshes += 1
+        try:
+            self._executor.submit(self._run_refresh, key, fn, args)
+        except RuntimeError:
+            # 종료 중인 executor
+            with self._lock:
+                self._refreshing.discard(key)
+            return False
+        return True
+
+    def _run_refresh(
+        self, key: Hashable, fn: Callable[..., Any], args: tuple
+    ) -> None:
+        try:
+            value = fn(*args)
+            if value is not None:
+                self.store(key, value)
+        except Exception as e:
+            with self._lock:
+                self.refresh_errors += 1
+            logger.warning(f"추천 결과 백그라운드 갱신 실패 ({key}): {e}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def expire(self) -> None:
+        """모든 항목을 stale로 표시합니다 (다음 요청부터 오래된 값 반환 + 갱신)"""
+        with self._lock:
+            stale_at = self.clock() - self.soft_ttl_s
+            for key, (value, stored_at) in self._entries.items():
+                self._entries[key] = (value, min(stored_at, stale_at))
+
+    def clear(self) -> None:
+        """모든 항목을 제거합니다 (진행 중인 갱신 결과는 끝난 뒤 저장될 수 있음)"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """상태별 조회/갱신 횟수와 현재 항목 수"""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'stale_hits': self.stale_hits,
+                'misses': self.misses,
+                'refreshes': self.refreshes,
+                'refresh_skipped': self.refresh_skipped,
+                'refresh_errors': self.refresh_errors,
+                'refreshing': len(self._refreshing),
+            }
+
+    def close(self, wait: bool = True) -> None:
+        """갱신 스레드를 멈춥니다"""
+        self._executor.shutdown(wait=wait)
+
+
+# 전역 추천 결과 캐시 ([result_cache] 설정으로 첫 사용 시 생성)
+_cache: ResultCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_result_cache() -> ResultCache | None:
+    """전역 추천 결과 캐시 (설정에서 꺼져 있으면 None)"""
+    global _cache
+    config = settings.result_cache
+    if not config.enabled:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResultCache(
+                soft_ttl_s=config.soft_ttl_s,
+                hard_ttl_s=config.hard_ttl_s,
+                max_entries=config.max_entries,
+                refresh_concurrency=config.refresh_concurrency,
+            )
+        return _cache
+
+
+def clear_result_cache() -> None:
+    """전역 추천 결과 캐시 항목을 비웁니다 (캐시가 아직 없으면 아무것도 안 함)"""
+    with _cache_lock:
+        cache = _cache
+    if cache is not None:
+        cache.clear()
+
+
+def expire_result_cache() -> None:
+    """전역 추천 결과 캐시 항목을 모두 stale로 표시합니다"""
+    with _cache_lock:
+        cache = _cache
+    if cache is not None:
+        cache.expire()
+
+
+def reset_result_cache() -> None:
+    """전역 추천 결과 캐시를 멈추고 비웁니다 (테스트, 종료 시 사용)"""
+    global _cache
+    with _cache_lock:
+        previous, _cache = _cache, None
+    if previous is not None:
+        previous.close(wait=False)
@@ -0,0 +1,174 @@
+"""
+도서 제목/소개 TF-IDF 유사 도서 목록 (오프라인 빌드용)
+title + description을 문자 n-gram(형태소 분석기 없이 한국어 처리)으로 해시하여
+희소 TF-IDF 행렬을 만들고, 도서마다 코사인 유사도 상위 k개 도서를
+(도서 수, k) 행 번호/점수 배열로 미리 계산
+
+book 테이블은 chunk_size 행씩 두 번 스트리밍합니다. 첫 번째는 문서 빈도만 세고,
+두 번째는 드물거나(df < 2) 너무 흔한(df > max_df) n-gram을 뺀 TF-IDF 행만
+보관하므로 메모리는 남은 n-gram 수에 비례합니다. 요청 경로에서는 텍스트를
+처리하지 않고 읽은 책들의 유사 도서 목록만 사용합니다.
+"""
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from bookstar.models.models import Book
+from bookstar.services.catalog import CatalogSnapshot, top_rows
+
+if TYPE_CHECKING:
+    from scipy.sparse import csr_matrix
+    from sklearn.feature_extraction.text import HashingVectorizer
+
+logger = logging.getLogger(__name__)
+
+NGRAM_RANGE = (2, 3)   # 단어 경계 안쪽 문자 2~3-gram
+NUM_FEATURES = 2 ** 20  # 해시 공간 크기 (n-gram 사전을 만들지 않음)
+BLOCK_ROWS = 512       # 유사도 행렬을 한 번에 계산할 도서 수
+
+
+def _vectorizer() -> HashingVectorizer:
+    from sklearn.feature_extraction.text import HashingVectorizer
+
+    return HashingVectorizer(
+        analyzer='char_wb',
+        ngram_range=NGRAM_RANGE,
+        n_features=NUM_FEATURES,
+        alternate_sign=False,
+        norm=None,
+    )
+
+
+def stream_book_texts(
+    db: Session, chunk_size: int = 5000
+) -> Iterator[tuple[np.ndarray, list[str]]]:
+    """book 테이블을 Book.id 순으로 chunk_size 행씩 읽습니다 (Book.id 배열, 텍스트)"""
+    stmt = (
+        select(Book.id, Book.title, Book.description)
+        .order_by(Book.id)
+        .execution_options(yield_per=chunk_size)
+    )
+    for partition in db.execute(stmt).partitions():
+        yield (
+            np.array([book_id for book_id, _, _ in partition], dtype=np.int64),
+            [f"{title or ''} {text or ''}" for _, title, text in partition],
+        )
+
+
+def document_frequencies(db: Session, chunk_size: int = 5000) -> tuple[np.ndarray, int]:
+    """
+    해시된 n-gram별 문서 빈도 (첫 번째 스트리밍)
+
+    Returns:
+        (NUM_FEATURES 길이 int64 문서 빈도, 문서 수)
+    """
+    vectorizer = _vectorizer()
+    frequencies = np.zeros(NUM_FEATURES, dtype=np.int64)
+    num_documents = 0
+    for _, texts in stream_book_texts(db, chunk_size):
+        counts = vectorizer.transform(texts)
+        frequencies += np.bincount(counts.indices, minlength=NUM_FEATURES)
+        num_documents += len(texts)
+    return frequencies, num_documents
+
+
+def tfidf_matrix(
+    db: Session,
+    catalog: CatalogSnapshot,
+    chunk_size: int = 5000,
+    max_df: float = 0.5
+) -> csr_matrix:
+    """
+    카탈로그 행 순서의 L2 정규화 TF-IDF 행렬 (float32, 두 번째 스트리밍)
+
+    tf는 1 + log(횟수), idf는 log((1 + n) / (1 + df)) + 1 (sklearn smooth_idf)
+    이고, 문서 빈도가 2 미만이거나 max_df 비율을 넘는 n-gram은 유사도에 거의
+    기여하지 않으므로 버립니다. 카탈로그에 없는 도서는 건너뜁니다.
+    """
+    from scipy.sparse import csr_matrix, diags, vstack
+    from sklearn.preprocessing import normalize
+
+    frequencies, num_documents = document_frequencies(db, chunk_size)
+    keep = (frequencies >= 2) & (frequencies <= max(max_df * num_documents, 2))
+    idf = np.where(
+        keep, np.log((1 + num_documents) / (1 + frequencies)) + 1, 0.0
+    ).astype(np.float32)
+
+    vectorizer = _vectorizer()
+    blocks, rows = [], []
+    for book_ids, texts in stream_book_texts(db, chunk_size):
+        counts = vectorizer.transform(texts).astype(np.float32)
+        counts.data = 1 + np.log(counts.data)
+        weighted = counts @ diags(idf)
+        weighted.eliminate_zeros()
+        blocks.append(weighted.tocsr())
+        rows.append(catalog.book_map.rows(book_ids))
+
+    if not blocks:
+        return csr_matrix((catalog.size, NUM_FEATURES), dtype=np.float32)
+    matrix = normalize(vstack(blocks, format='csr'))
+    catalog_rows = np.concatenate(rows)
+    present = catalog_rows >= 0
+    # 카탈로그 행 순서로 재배치 (없는 행은 빈 행)
+    order = np.full(catalog.size, -1, dtype=np.int64)
+    order[catalog_rows[present]] = np.flatnonzero(present)
+    empty = csr_matrix((1, NUM_FEATURES), dtype=np.float32)
+    matrix = vstack([matrix, empty], format='csr')
+    return matrix[np.where(order >= 0, order, matrix.shape[0] - 1)]
+
+
+def top_similar(
+    matrix: csr_matrix,
+    k: int,
+    block_rows: int = BLOCK_ROWS
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    행마다 코사인 유사도 상위 k개 행 (자기 자신 제외, 유사도 0 제외)
+
+    BLOCK_ROWS 행씩 희소 행렬 곱으로 계산하므로 밀집 (도서 수 × 도서 수) 행렬을
+    만들지 않습니다. 유사도가 같으면 행 번호가 작은 도서가 먼저입니다.
+
+    Returns:
+        (도서 수, k) int32 행 번호 (-1 패딩), (도서 수, k) float16 유사도
+    """
+    num_rows = matrix.shape[0]
+    neighbors = np.full((num_rows, k), -1, dtype=np.int32)
+    scores = np.zeros((num_rows, k), dtype=np.float16)
+    transposed = matrix.T.tocsr()
+    for start in range(0, num_rows, block_rows):
+        block = (matrix[start:start + block_rows] @ transposed).tocsr()
+        block.sort_indices()
+        for offset in range(block.shape[0]):
+            row = start + offset
+            lo, hi = block.indptr[offset], block.indptr[offset + 1]
+            columns = block.indices[lo:hi]
+            values = np.where(columns != row, block.data[lo:hi], -np.inf)
+            values[values <= 0] = -np.inf
+            top = top_rows(values, k)
+            neighbors[row, :len(top)] = columns[top]
+            scores[row, :len(top)] = values[top]
+    return neighbors, scores
+
+
+def build_text_neighbors(
+    db: Session,
+    catalog: CatalogSnapshot,
+    k: int,
+    chunk_size: int = 5000,
+    max_df: float = 0.5
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    제목/소개 유사 도서 목록을 만듭니다
+
+    Returns:
+        CatalogSnapshot.text_neighbors, text_scores로 쓸 (행 번호, 유사도) 배열
+    """
+    matrix = tfidf_matrix(db, catalog, chunk_size, max_df)
+    logger.info(f"TF-IDF 행렬: {matrix.shape[0]}권, n-gram {matrix.nnz}개")
+    return top_similar(matrix, k)
@@ -0,0 +1,365 @@
+"""
+워밍업 모듈
+배포 직후 첫 요청들이 카탈로그 로드, KNN 학습, 캐시 채우기 비용을 떠안지 않도록
+트래픽을 받기 전에 무거운 구조를 미리 만들고 준비 상태(readiness)를 관리
+"""
+import logging
+import threading
+import time
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from bookstar.config import settings
+from bookstar.models.models import MemberBook
+from bookstar.services import artifacts, catalog, model_registry, result_cache
+from bookstar.services.recommendation import (
+    DegradedRecommendations,
+    clear_similar_users_cache,
+    recommend_books_batch,
+)
+from bookstar.utils.lazy import ensure_loaded, lazy_import
+
+logger = logging.getLogger(__name__)
+
+SessionScope = Callable[[], AbstractContextManager[Session]]
+
+
+@dataclass
+class WarmupState:
+    """워밍업 진행 상태 (준비 상태 엔드포인트에서 조회)"""
+
+    # pending -> running -> ready | degraded, 워밍업을 끈 경우 disabled
+    status: str = "pending"
+    started_at: float | None = None
+    finished_at: float | None = None
+    error: str | None = None
+    steps_ms: dict[str, float] = field(default_factory=dict)
+    details: dict[str, Any] = field(default_factory=dict)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    @property
+    def is_ready(self) -> bool:
+        """트래픽을 받아도 되는지 여부 (실패해도 DB 경로로 동작하므로 준비로 간주)"""
+        return self.status in ("ready", "degraded", "disabled")
+
+    def mark(self, status: str, error: str | None = None) -> None:
+        with self._lock:
+            self.status = status
+            if status == "running":
+                self.started_at = time.time()
+            elif status != "pending":
+                self.finished_at = time.time()
+            if error is not None:
+                self.error = error
+
+    def to_dict(self) -> dict[str, Any]:
+        with self._lock:
+            duration_ms = None
+            if self.started_at is not None and self.finished_at is not None:
+                duration_ms = round((self.finished_at - self.started_at) * 1000, 2)
+            return {
+                'status': self.status,
+                'ready': self.is_ready,
+                'duration_ms': duration_ms,
+                'steps_ms': dict(self.steps_ms),
+                'details': dict(self.details),
+                'error': self.error,
+            }
+
+    def update_details(self, details: dict[str, Any]) -> None:
+        with self._lock:
+            self.details.update(details)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.status = "pending"
+            self.started_at = None
+            self.finished_at = None
+            self.error = None
+            self.steps_ms.clear()
+            self.details.clear()
+
+
+# 전역 워밍업 상태
+warmup_state = WarmupState()
+# 현재 설치된 스냅샷의 아티팩트 버전 (DB에서 만들었거나 설치 전이면 None)
+_installed_version: str | None = None
+
+
+def top_active_members(db: Session, limit: int) -> list[int]:
+    """도서 이력이 가장 많은 회원 ID 목록"""
+    rows = (
+        db.query(MemberBook.member_id)
+        .group_by(MemberBook.member_id)
+        .order_by(func.count().desc(), MemberBook.member_id)
+        .limit(limit)
+        .all()
+    )
+    return [int(member_id) for (member_id,) in rows]
+
+
+def _load_imports() -> None:
+    """지연 임포트된 pandas/sklearn 로드"""
+    from sklearn.neighbors import NearestNeighbors  # noqa: F401
+
+    ensure_loaded(lazy_import("pandas"))
+
+
+def _install_artifact(
+    artifact_dir: str | Path, similarity: str
+) -> dict[str, Any] | None:
+    """CURRENT 아티팩트를 스냅샷으로 설치 (읽을 수 없으면 None)"""
+    global _installed_version
+    try:
+        catalog_snapshot, neighbor_index, manifest = (
+            artifacts.load_artifact(artifact_dir)
+        )
+    except (artifacts.ArtifactError, OSError) as e:
+        logger.warning(f"아티팩트를 읽지 못해 DB에서 스냅샷을 만듭니다: {e}")
+        return None
+    if neighbor_index is not None and neighbor_index.metric != similarity:
+        logger.warning(
+            f"아티팩트 이웃은 {neighbor_index.metric} 방식으로 계산되었습니다 "
+            f"(설정: {similarity})"
+        )
+    catalog.install_snapshots(catalog_snapshot, neighbor_index)
+    _installed_version = manifest['version']
+    return {
+        'source': 'artifact',
+        'artifact_version': manifest['version'],
+        **manifest['counts'],
+    }
+
+
+def _load_snapshots(
+    session_scope: SessionScope,
+    artifact_dir: str | Path | None,
+    similarity: str = 'euclidean'
+) -> dict[str, Any]:
+    """아티팩트 또는 DB에서 스냅샷을 설치하고 요약을 반환"""
+    global _installed_version
+    if artifact_dir is not None:
+        summary = _install_artifact(artifact_dir, similarity)
+        if summary is not None:
+            return summary
+    with session_scope() as db:
+        summary = catalog.load_snapshots(db, similarity)
+    _installed_version = None
+    return summary
+
+
+def refresh_snapshots(
+    session_scope: SessionScope,
+    artifact_dir: str | Path | None = None,
+    similarity: str = 'euclidean'
+) -> dict[str, Any] | None:
+    """
+    스냅샷을 최신 데이터로 교체합니다 (주기 갱신, 명시적 다시 로드)
+
+    artifact_dir이 있으면 CURRENT가 가리키는 버전이 설치된 버전과 다를 때만
+    교체하고, 없으면(또는 아티팩트를 읽을 수 없으면) DB에서 다시 만듭니다.
+    교체하면 이전 KNN 인덱스로 계산한 유사 사용자 캐시를 비웁니다.
+
+    Returns:
+        교체한 스냅샷 요약 (바뀐 버전이 없어 교체하지 않았으면 None)
+    """
+    if artifact_dir is not None:
+        version = artifacts.read_current(artifact_dir)
+        installed = catalog.get_catalog() is not None
+        if installed and version is not None and version == _installed_version:
+            return None
+    summary = _load_snapshots(session_scope, artifact_dir, similarity)
+    clear_similar_users_cache()
+    logger.info(f"스냅샷 갱신 완료: {summary}")
+    return summary
+
+
+def _load_current_model() -> dict[str, Any]:
+    """레지스트리의 현재 모델을 LRU에 로드 (등록된 모델이 없으면 버전 None)"""
+    registry = model_registry.get_registry()
+    version = registry.resolve()
+    if version is not None:
+        registry.load(version)
+    return {'model_version': version}
+
+
+def _precompute(session_scope: SessionScope, limit: int) -> dict[str, Any]:
+    """
+    활동량 상위 회원의 추천을 블록 단위 배치로 계산하여 캐시를 채움
+
+    계산한 추천 목록은 /recommend_books와 같은 키로 결과 캐시에 저장합니다.
+    (DB 없이 만든 대체 추천은 저장하지 않음)
+    """
+    num_recommendations = settings.recommendation.default_recommendations_count
+    cache = result_cache.get_result_cache()
+    cached = 0
+    with session_scope() as db:
+        member_ids = top_active_members(db, limit)
+        for start in range(0, len(member_ids), catalog.CONTENT_BLOCK_USERS):
+            results = recommend_books_batch(
+                db,
+                member_ids[start:start + catalog.CONTENT_BLOCK_USERS],
+                num_recommendations,
+            )
+            if cache is None:
+                continue
+            for member_id, recommendations in results.items():
+                if isinstance(recommendations, DegradedRecommendations):
+                    continue
+                cache.store((member_id, num_recommendations), recommendations)
+                cached += 1
+    return {'precomputed_members': len(member_ids), 'cached_results': cached}
+
+
+def run_warmup(
+    session_scope: SessionScope,
+    precompute_top_members: int = 0,
+    state: WarmupState = warmup_state,
+    artifact_dir: str | Path | None = None,
+    load_model: bool = False,
+    similarity: str = 'euclidean'
+) -> WarmupState:
+    """
+    워밍업을 실행합니다
+
+    1. imports: 지연 임포트된 pandas/sklearn 로드 (요청 스레드 간 경쟁 방지)
+    2. snapshots: 카탈로그 배열과 KNN 인덱스 생성
+       (artifact_dir에 CURRENT 아티팩트가 있으면 메모리 맵으로 읽고, 없거나
+       읽을 수 없으면 DB에서 similarity 방식의 인덱스 생성)
+    3. model: (load_model) 레지스트리의 현재 모델을 로드 (워커마다 학습하지 않음)
+    4. precompute: 활동량 상위 회원의 추천을 미리 계산하여 결과 캐시 채움
+
+    어느 단계가 실패해도 예외를 전파하지 않고 degraded 상태로 준비 완료 처리합니다.
+    (스냅샷이 없으면 추천 서비스는 DB 조회 경로로 동작)
+    """
+    state.mark("running")
+
+    steps: list[tuple[str, Callable[[], dict[str, Any] | None]]] = [
+        ("imports", _load_imports),
+        ("snapshots",
+         lambda: _load_snapshots(session_scope, artifact_dir, similarity)),
+    ]
+    if load_model:
+        steps.append(("model", _load_current_model))
+    if precompute_top_members > 0:
+        steps.append(
+            ("precompute", lambda: _precompute(session_scope, precompute_top_members))
+        )
+
+    try:
+        for name, step in steps:
+            start = time.perf_counter()
+            details = step()
+            state.steps_ms[name] = round((time.perf_counter() - start) * 1000, 2)
+            if details:
+                state.details.update(details)
+    except Exception as e:
+        logger.error(f"워밍업 실패, DB 조회 경로로 서비스합니다: {e}", exc_info=True)
+        state.mark("degraded", error=f"{type(e).__name__}: {e}")
+        return state
+
+    state.mark("ready")
+    logger.info(f"워밍업 완료: {state.to_dict()}")
+    return state
+
+
+def start_background_warmup(
+    session_scope: SessionScope,
+    precompute_top_members: int = 0,
+    state: WarmupState = warmup_state,
+    artifact_dir: str | Path | None = None,
+    load_model: bool = False,
+    similarity: str = 'euclidean'
+) -> threading.Thread:
+    """워밍업을 백그라운드 스레드에서 시작합니다 (서버는 바로 요청을 받되 not-ready)"""
+    thread = threading.Thread(
+        target=run_warmup,
+        args=(
+            session_scope, precompute_top_members, state, artifact_dir, load_model,
+            similarity,
+        ),
+        name="warmup",
+        daemon=True,
+    )
+    thread.start()
+    return thread
+
+
+class SnapshotRefresher:
+    """refresh_s마다 refresh_snapshots를 호출하는 스레드 (새 도서/회원 반영)"""
+
+    def __init__(
+        self,
+        session_scope: SessionScope,
+        refresh_s: float,
+        artifact_dir: str | Path | None = None,
+        similarity: str = 'euclidean',
+        state: WarmupState = warmup_state
+    ):
+        self.session_scope = session_scope
+        self.refresh_s = refresh_s
+        self.artifact_dir = artifact_dir
+        self.similarity = similarity
+        self.state = state
+        self._stop_event = threading.Event()
+        self._refresh_requested = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def refresh(self) -> dict[str, Any] | None:
+        """
+        스냅샷을 한 번 갱신합니다 (실패하면 기존 스냅샷 유지)
+
+        Returns:
+            교체한 스냅샷 요약 (교체하지 않았거나 실패하면 None)
+        """
+        try:
+            summary = refresh_snapshots(
+                self.session_scope, self.artifact_dir, self.similarity
+            )
+        except Exception as e:
+            logger.error(f"스냅샷 갱신 실패, 기존 스냅샷 유지: {e}", exc_info=True)
+            return None
+        if summary is not None:
+            self.state.update_details(
+                {**summary, 'snapshot_refreshed_at': time.time()}
+            )
+        return summary
+
+    def request_refresh(self) -> None:
+        """다음 주기를 기다리지 않고 갱신하도록 요청합니다"""
+        self._refresh_requested.set()
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            self._refresh_requested.wait(self.refresh_s)
+            if self._stop_event.is_set():
+                break
+            self._refresh_requested.clear()
+            self.refresh()
+
+    def start(self) -> None:
+        """갱신 스레드를 시작합니다"""
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="snapshot-refresher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """갱신 스레드를 멈춥니다 (진행 중인 갱신은 끝날 때까지 최대 5초 대기)"""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._refresh_requested.set()
+        self._thread.join(timeout=5)
+        self._thread = None
@@ -0,0 +1,160 @@
+"""
+회로 차단기(circuit breaker) 모듈
+window_s 동안 실패(또는 slow_call_ms보다 느린 호출)가 failure_threshold번 쌓이면
+열림(open) 상태가 되어 open_s 동안 호출을 바로 거절하고, 그 뒤에는 반열림
+(half_open) 상태에서 half_open_probes개 호출만 시험으로 통과시켜 성공하면
+닫힘(closed)으로 돌아감
+
+DB 장애(MySQL 페일오버 등) 동안 요청 스레드가 연결/쿼리 타임아웃을 기다리며
+쌓이지 않도록, 열려 있는 동안에는 호출하는 쪽이 DB 없이 대체 응답을 만듭니다.
+"""
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Literal
+
+BreakerState = Literal['closed', 'open', 'half_open']
+
+
+class CircuitOpenError(Exception):
+    """회로가 열려 있어 호출을 거절함"""
+
+    def __init__(self, name: str, retry_after_s: float):
+        super().__init__(f"{name} 회로 차단 중 ({retry_after_s:.1f}초 후 재시도)")
+        self.name = name
+        self.retry_after_s = retry_after_s
+
+
+class CircuitBreaker:
+    """실패/느린 호출 횟수 기반 회로 차단기 (스레드 안전)"""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int,
+        slow_call_ms: float,
+        window_s: float,
+        open_s: float,
+        half_open_probes: int = 1,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.slow_call_ms = slow_call_ms
+        self.window_s = window_s
+        self.open_s = open_s
+        self.half_open_probes = half_open_probes
+        self.clock = clock
+        self.state: BreakerState = 'closed'
+        self.opened = 0       # 열린 횟수
+        self.rejected = 0     # 열려 있어 거절한 호출 수
+        self.slow_calls = 0   # 느려서 실패로 센 호출 수
+        self._failures: deque[float] = deque()  # window_s 안의 실패 시각
+        self._opened_at = 0.0
+        self._probes = 0      # 반열림 상태에서 진행 중인 시험 호출 수
+        self._lock = threading.Lock()
+
+    def _open(self, now: float) -> None:
+        self.state = 'open'
+        self.opened += 1
+        self._opened_at = now
+        self._probes = 0
+        self._failures.clear()
+
+    def allow(self) -> bool:
+        """호출을 통과시킬지 여부 (반열림 상태에서는 시험 호출 자리를 차지)"""
+        now = self.clock()
+        with self._lock:
+            if self.state == 'open' and now - self._opened_at >= self.open_s:
+                self.state = 'half_open'
+                self._probes = 0
+            if self.state == 'closed':
+                return True
+            if self.state == 'half_open' and self._probes < self.half_open_probes:
+                self._probes += 1
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self, elapsed_ms: float = 0.0) -> None:
+        """
+        통과시킨 호출이 성공했음을 기록합니다
+
+        slow_call_ms보다 오래 걸린 호출은 실패로 셉니다.
+        """
+        if elapsed_ms > self.slow_call_ms:
+            with self._lock:
+                self.slow_calls += 1
+            self.record_failure()
+            return
+        with self._lock:
+            if self.state == 'half_open':
+                self.state = 'closed'
+                self._probes = 0
+                self._failures.clear()
+
+    def record_failure(self) -> None:
+        """통과시킨 호출이 실패했음을 기록합니다"""
+        now = self.clock()
+        with self._lock:
+            if self.state == 'half_open':
+                self._open(now)
+                return
+            if self.state == 'open':
+                return
+            self._failures.append(now)
+            while self._failures and now - self._failures[0] > self.window_s:
+                self._failures.popleft()
+            if len(self._failures) >= self.failure_threshold:
+                self._open(now)
+
+    def release(self) -> None:
+        """성공/실패로 세지 않을 호출의 시험 호출 자리를 돌려줍니다"""
+        with self._lock:
+            if self.state == 'half_open' and self._probes > 0:
+                self._probes -= 1
+
+    @contextmanager
+    def guard(
+        self,
+        failures: type[BaseException] | tuple[type[BaseException], ...],
+        count_slow: bool = True
+    ) -> Iterator[None]:
+        """
+        블록을 회로 차단기로 감쌉니다
+
+        열려 있으면 CircuitOpenError를 발생시키고, 블록에서 failures 예외가
+        나면 실패로, 정상 종료하면 소요시간과 함께 성공으로 기록합니다.
+        (그 밖의 예외는 어느 쪽으로도 세지 않음)
+
+        Args:
+            count_slow: False면 오래 걸려도 실패로 세지 않음 (배치 작업 등)
+        """
+        if not self.allow():
+            with self._lock:
+                retry_after_s = max(self.open_s - (self.clock() - self._opened_at), 0)
+            raise CircuitOpenError(self.name, retry_after_s)
+        start = time.perf_counter()
+        try:
+            yield
+        except failures:
+            self.record_failure()
+            raise
+        except BaseException:
+            self.release()
+            raise
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.record_success(elapsed_ms if count_slow else 0.0)
+
+    def stats(self) -> dict[str, int | str]:
+        """현재 상태와 윈도 안의 실패 수, 열림/거절/느린 호출 횟수"""
+        with self._lock:
+            return {
+                'state': self.state,
+                'failures': len(self._failures),
+                'opened': self.opened,
+                'rejected': self.rejected,
+                'slow_calls': self.slow_calls,
+            }
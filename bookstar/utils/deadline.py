@@ -0,0 +1,134 @@
+"""
+요청 단위 시간 예산(deadline) 모듈
+요청이 시작될 때 예산(ms)을 정하고, 추천 단계마다 남은 시간을 확인하여 예산을
+다 쓴 뒤의 선택 단계(협업 필터링 등)는 건너뛰거나 캐시로 대체
+
+현재 deadline은 ContextVar로 전달되므로 asyncio.to_thread로 실행한 계산과
+DB 이벤트 훅(쿼리 실행 시간 제한)에서도 같은 객체를 봅니다.
+(백그라운드 갱신 스레드처럼 컨텍스트를 복사하지 않은 곳에서는 제한 없음)
+"""
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+
+class DeadlineExceeded(Exception):
+    """
+    시간 예산을 다 써서 쿼리가 실행 시간 제한으로 중단되었거나, 남은 예산이
+    모자라 무거운 계산을 시작하지 않음
+
+    DB 장애가 아니므로 SQLAlchemyError를 상속하지 않으며, 회로 차단기 실패로
+    세지 않고 예산이 바닥난 단계만 생략합니다.
+    """
+
+    def __init__(
+        self, budget_ms: float, elapsed_ms: float, minimum_ms: float | None = None
+    ):
+        """
+        Args:
+            minimum_ms: 단계 시작 전 확인(Deadline.check)에서 요구한 최소 남은 시간
+                (없으면 쿼리가 실행 시간 제한으로 중단된 경우)
+        """
+        if minimum_ms is None:
+            message = (
+                f"시간 예산 {budget_ms:.0f}ms 초과로 쿼리 중단 "
+                f"({elapsed_ms:.0f}ms 경과)"
+            )
+        else:
+            message = (
+                f"남은 시간 예산이 {minimum_ms:.0f}ms 미만이라 단계를 시작하지 않음 "
+                f"(예산 {budget_ms:.0f}ms, {elapsed_ms:.0f}ms 경과)"
+            )
+        super().__init__(message)
+        self.budget_ms = budget_ms
+        self.elapsed_ms = elapsed_ms
+        self.minimum_ms = minimum_ms
+
+
+@dataclass
+class Deadline:
+    """한 요청의 시간 예산과 예산 부족으로 축소 처리된 단계"""
+
+    budget_ms: float  # 0 이하면 제한 없음
+    started_at: float = field(default_factory=time.perf_counter)
+    degraded: list[str] = field(default_factory=list)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    @property
+    def limited(self) -> bool:
+        """시간 제한이 있는지 여부"""
+        return self.budget_ms > 0
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started_at) * 1000
+
+    def remaining_ms(self) -> float:
+        """남은 시간 (제한이 없으면 inf, 초과하면 음수)"""
+        if not self.limited:
+            return float('inf')
+        return self.budget_ms - self.elapsed_ms()
+
+    def expired(self) -> bool:
+        """예산을 다 썼는지 여부"""
+        return self.remaining_ms() <= 0
+
+    def check(self, minimum_ms: float) -> None:
+        """남은 시간이 minimum_ms보다 적으면 DeadlineExceeded를 발생시킵니다"""
+        if self.remaining_ms() < minimum_ms:
+            raise DeadlineExceeded(self.budget_ms, self.elapsed_ms(), minimum_ms)
+
+    def degrade(self, stage: str) -> None:
+        """단계를 건너뛰거나 대체했음을 기록합니다 (같은 단계는 한 번만)"""
+        with self._lock:
+            if stage not in self.degraded:
+                self.degraded.append(stage)
+
+    def statement_timeout_ms(self, minimum_ms: float) -> int | None:
+        """
+        DB 쿼리 실행 시간 제한 (남은 시간, 최소 minimum_ms, 10ms 단위 올림)
+
+        예산을 다 썼어도 minimum_ms는 허용하여, 꼭 필요한 쿼리가 바로 실패하지 않고
+        짧게 시도한 뒤 실패하도록 합니다. 제한이 없으면 None입니다.
+        """
+        if not self.limited:
+            return None
+        remaining = max(self.remaining_ms(), minimum_ms)
+        return int(-(-remaining // 10) * 10)
+
+
+_current_deadline: ContextVar[Deadline | None] = ContextVar(
+    'current_deadline', default=None
+)
+
+
+def get_current_deadline() -> Deadline | None:
+    """현재 컨텍스트의 deadline (없으면 None)"""
+    return _current_deadline.get()
+
+
+def check_deadline(minimum_ms: float) -> None:
+    """
+    현재 deadline의 남은 시간이 minimum_ms보다 적으면 DeadlineExceeded 발생
+
+    무거운 계산을 시작하기 전에 호출하여, 예산이 모자라면 시작하지 않고 호출하는
+    쪽이 그 단계를 생략하게 합니다. (deadline이 없으면 아무것도 안 함)
+    """
+    deadline = _current_deadline.get()
+    if deadline is not None:
+        deadline.check(minimum_ms)
+
+
+@contextmanager
+def deadline_scope(budget_ms: float) -> Iterator[Deadline]:
+    """블록 동안 budget_ms 예산의 새 deadline을 현재 deadline으로 설정합니다"""
+    deadline = Deadline(budget_ms)
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
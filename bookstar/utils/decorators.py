@@ -13,13 +13,20 @@ from typing import Any, ParamSpec, TypeVar
 P = ParamSpec('P')
 T = TypeVar('T')
 
+# 실행시간 임계값: 고정값 또는 호출할 때마다 읽을 함수 (설정 재로드 반영)
+Threshold = float | Callable[[], float] | None
+
+
+def _threshold_value(threshold_ms: Threshold) -> float | None:
+    return threshold_ms() if callable(threshold_ms) else threshold_ms
+
 
 def log_execution_time(
     logger: logging.Logger | None = None,
     log_level: int = logging.INFO,
     include_args: bool = False,
     include_result: bool = False,
-    threshold_ms: float | None = None
+    threshold_ms: Threshold = None
 ):
     """
     함수 실행시간을 측정하고 로그에 기록하는 데코레이터
@@ -29,7 +36,8 @@ def log_execution_time(
         log_level: 로그 레벨
         include_args: 함수 인자를 로그에 포함할지 여부
         include_result: 함수 결과를 로그에 포함할지 여부  
-        threshold_ms: 이 시간(ms) 이상 걸린 경우만 로그 기록
+        threshold_ms: 이 시간(ms) 이상 걸린 경우만 로그 기록 (함수를 넘기면
+            호출할 때마다 다시 읽음, 예: lambda: settings.logging.db_threshold_ms)
     """
     def decorator(func: Callable[P, T]) -> Callable[P, T]:
         @functools.wraps(func)
@@ -61,7 +69,8 @@ def log_execution_time(
                 execution_time_ms = (end_time - start_time) * 1000
                 
                 # threshold 체크
-                if threshold_ms is None or execution_time_ms >= threshold_ms:
+                limit_ms = _threshold_value(threshold_ms)
+                if limit_ms is None or execution_time_ms >= limit_ms:
                     # 일반 로그
                     func_logger.log(
                         log_level,
@@ -118,7 +127,7 @@ def log_async_execution_time(
     log_level: int = logging.INFO,
     include_args: bool = False,
     include_result: bool = False,
-    threshold_ms: float | None = None
+    threshold_ms: Threshold = None
 ):
     """
     비동기 함수 실행시간을 측정하고 로그에 기록하는 데코레이터
@@ -150,7 +159,8 @@ def log_async_execution_time(
                 end_time = time.perf_counter()
                 execution_time_ms = (end_time - start_time) * 1000
                 
-                if threshold_ms is None or execution_time_ms >= threshold_ms:
+                limit_ms = _threshold_value(threshold_ms)
+                if limit_ms is None or execution_time_ms >= limit_ms:
                     func_logger.log(
                         log_level,
                         f"[{request_id}] {func.__name__} 비동기 실행 완료 - "
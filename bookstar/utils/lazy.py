@@ -0,0 +1,51 @@
+"""
+지연 임포트 유틸리티
+pandas/sklearn/torch처럼 임포트 비용이 큰 모듈을 첫 사용 시점까지 미뤄
+워커 시작 시간과 기본 메모리 사용량을 줄임
+"""
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    모듈을 첫 속성 접근 시점에 실제로 로드하는 지연 임포트
+
+    이미 임포트된 모듈이면 그대로 반환합니다. 점으로 구분된 하위 모듈은
+    상위 패키지를 즉시 임포트하므로 최상위 패키지에만 사용합니다.
+
+    Python 3.11의 LazyLoader는 첫 접근이 스레드 안전하지 않으므로,
+    여러 스레드가 동시에 사용하기 전에 워밍업 단계에서 한 번 접근해 둡니다.
+
+    Args:
+        name: 최상위 모듈 이름 (예: "pandas")
+
+    Raises:
+        ModuleNotFoundError: 모듈이 설치되어 있지 않은 경우 (임포트 시점에 바로 확인)
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f"모듈을 찾을 수 없습니다: {name}", name=name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+def is_loaded(module: ModuleType) -> bool:
+    """지연 임포트된 모듈이 실제로 로드되었는지 확인합니다 (로드를 유발하지 않음)"""
+    # isinstance()는 __class__ 접근으로 로드를 유발하므로 type()으로 비교
+    return type(module) is not importlib.util._LazyModule
+
+
+def ensure_loaded(module: ModuleType) -> ModuleType:
+    """지연 임포트된 모듈을 지금 로드합니다 (워밍업 단계에서 사용)"""
+    vars(module)
+    return module
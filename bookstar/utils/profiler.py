@@ -0,0 +1,253 @@
+"""
+샘플링 프로파일러 모듈
+느린 요청을 재현하지 않고 분석할 수 있도록 요청 처리 스레드의 콜스택을
+주기적으로 샘플링하여 상위 함수 요약과 collapsed-stack 파일로 저장
+
+동시에 프로파일링하는 요청이 많아도 샘플링 스레드는 프로세스에 하나만 둡니다.
+"""
+import logging
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from types import FrameType
+
+from bookstar.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _frame_label(frame: FrameType) -> str:
+    """collapsed-stack 형식에 사용할 프레임 이름"""
+    code = frame.f_code
+    filename = os.path.basename(code.co_filename)
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})"
+
+
+class StackSampler:
+    """
+    대상 스레드 하나의 콜스택 샘플 모음
+
+    샘플링은 프로세스에 하나뿐인 공유 스레드(_SharedSampler)가 맡으므로, 동시에
+    프로파일링하는 요청이 많아도 sys._current_frames() 호출은 간격마다 한 번입니다.
+    """
+
+    def __init__(self, thread_id: int, interval_ms: float = 5):
+        self.thread_id = thread_id
+        self.interval = interval_ms / 1000
+        self.stacks: Counter[tuple[str, ...]] = Counter()
+
+    def start(self) -> None:
+        """공유 샘플링 스레드에 등록합니다"""
+        _shared_sampler.add(self)
+
+    def stop(self) -> None:
+        """등록을 해제합니다 (이후에는 샘플이 추가되지 않음)"""
+        _shared_sampler.remove(self)
+
+    def record(self, frame: FrameType) -> None:
+        """프레임부터 거슬러 올라간 콜스택 하나를 기록합니다"""
+        stack = []
+        while frame is not None:
+            stack.append(_frame_label(frame))
+            frame = frame.f_back
+        # 루트 → 리프 순서로 저장
+        self.stacks[tuple(reversed(stack))] += 1
+
+    @property
+    def total_samples(self) -> int:
+        return sum(self.stacks.values())
+
+    def collapsed(self) -> str:
+        """flamegraph 도구에서 사용하는 collapsed-stack 문자열을 생성합니다"""
+        return "\n".join(
+            f"{';'.join(stack)} {count}"
+            for stack, count in self.stacks.most_common()
+        )
+
+    def top_functions(self, top_n: int = 30) -> list[tuple[str, int, int]]:
+        """(함수, self 샘플 수, 누적 샘플 수) 목록을 누적 샘플 순으로 반환합니다"""
+        self_counts: Counter[str] = Counter()
+        total_counts: Counter[str] = Counter()
+        for stack, count in self.stacks.items():
+            self_counts[stack[-1]] += count
+            for label in set(stack):
+                total_counts[label] += count
+        return [
+            (label, self_counts[label], total)
+            for label, total in total_counts.most_common(top_n)
+        ]
+
+
+class _SharedSampler:
+    """
+    등록된 모든 StackSampler를 스레드 하나로 샘플링합니다
+
+    간격마다 sys._current_frames()를 한 번 호출하여 등록된 스레드 ID의 프레임만
+    기록하고, 등록된 샘플러가 없으면 스레드를 끝냅니다 (다음 등록 때 다시 시작).
+    간격은 등록된 샘플러 중 가장 짧은 값을 사용합니다.
+    """
+
+    def __init__(self):
+        self._samplers: list[StackSampler] = []
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def add(self, sampler: StackSampler) -> None:
+        with self._lock:
+            self._samplers.append(sampler)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="stack-sampler", daemon=True
+                )
+                self._thread.start()
+
+    def remove(self, sampler: StackSampler) -> None:
+        # 기록도 잠금 안에서 하므로 해제 후에는 stacks가 바뀌지 않음
+        with self._lock:
+            if sampler in self._samplers:
+                self._samplers.remove(sampler)
+
+    def active_count(self) -> int:
+        with self._lock:
+            return len(self._samplers)
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._samplers:
+                    self._thread = None
+                    return
+                interval = min(sampler.interval for sampler in self._samplers)
+            time.sleep(interval)
+            frames = sys._current_frames()
+            with self._lock:
+                for sampler in self._samplers:
+                    frame = frames.get(sampler.thread_id)
+                    if frame is not None:
+                        sampler.record(frame)
+            del frames
+
+
+_shared_sampler = _SharedSampler()
+
+
+def _enforce_disk_quota(output_dir: Path, max_files: int, max_total_mb: float) -> None:
+    """오래된 프로파일 파일부터 삭제하여 파일 수와 용량 한도를 유지합니다"""
+    files = sorted(
+        (path for path in output_dir.iterdir() if path.is_file()),
+        key=lambda path: path.stat().st_mtime
+    )
+    sizes = {path: path.stat().st_size for path in files}
+    total_bytes = sum(sizes.values())
+    max_bytes = max_total_mb * 1024 * 1024
+
+    while files and (len(files) > max_files or total_bytes > max_bytes):
+        oldest = files.pop(0)
+        total_bytes -= sizes[oldest]
+        oldest.unlink(missing_ok=True)
+
+
+def dump_profile(
+    sampler: StackSampler,
+    request_id: str,
+    label: str,
+    elapsed_ms: float,
+    output_dir: str | Path,
+    top_n: int = 30,
+    max_files: int = 200,
+    max_total_mb: float = 100
+) -> Path:
+    """
+    샘플링 결과를 파일로 저장합니다
+
+    `<시각>_<요청ID>.txt`에 상위 함수 요약을, `<시각>_<요청ID>.collapsed`에
+    collapsed-stack을 저장한 뒤 디스크 사용량 한도를 적용합니다.
+
+    Returns:
+        저장된 요약 파일 경로
+    """
+    directory = Path(output_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    prefix = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{request_id}"
+
+    lines = [
+        f"request_id: {request_id}",
+        f"label: {label}",
+        f"elapsed_ms: {elapsed_ms:.2f}",
+        f"samples: {sampler.total_samples} "
+        f"(interval {sampler.interval * 1000:.1f}ms)",
+        "",
+        f"{'self':>8} {'total':>8}  function",
+    ]
+    lines.extend(
+        f"{self_count:>8} {total_count:>8}  {function}"
+        for function, self_count, total_count in sampler.top_functions(top_n)
+    )
+
+    summary_path = directory / f"{prefix}.txt"
+    summary_path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+    (directory / f"{prefix}.collapsed").write_text(
+        sampler.collapsed() + "\n", encoding='utf-8'
+    )
+
+    _enforce_disk_quota(directory, max_files, max_total_mb)
+    return summary_path
+
+
+@contextmanager
+def profile_request(request_id: str, label: str) -> Iterator[None]:
+    """
+    요청 처리 구간을 조건부로 프로파일링하는 컨텍스트 매니저
+
+    `[profiling]` 설정이 켜져 있을 때 sample_rate 비율로 무작위 선택된 요청,
+    또는 slow_threshold_ms를 넘긴 요청의 프로파일을 저장합니다.
+    설정은 요청마다 읽으므로 설정 변경 후 코드 배포 없이 적용됩니다.
+
+    Args:
+        request_id: 파일 이름에 포함할 요청 ID
+        label: 프로파일 대상 설명 (예: 엔드포인트 이름)
+    """
+    config = settings.profiling
+    if not config.enabled:
+        yield
+        return
+
+    sampled = random.random() < config.sample_rate
+    threshold_ms = config.slow_threshold_ms
+    if not sampled and threshold_ms <= 0:
+        yield
+        return
+
+    sampler = StackSampler(threading.get_ident(), config.sampling_interval_ms)
+    start_time = time.perf_counter()
+    sampler.start()
+    try:
+        yield
+    finally:
+        sampler.stop()
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        if sampled or elapsed_ms >= threshold_ms:
+            try:
+                path = dump_profile(
+                    sampler,
+                    request_id,
+                    label,
+                    elapsed_ms,
+                    config.output_dir,
+                    top_n=config.top_n,
+                    max_files=config.max_files,
+                    max_total_mb=config.max_total_mb
+                )
+                logger.info(
+                    f"[{request_id}] 프로파일 저장: {path} ({elapsed_ms:.2f}ms)",
+                    extra={'request_id': request_id, 'execution_time': elapsed_ms}
+                )
+            except OSError as e:
+                logger.warning(f"[{request_id}] 프로파일 저장 실패: {e}")
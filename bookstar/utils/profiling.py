@@ -0,0 +1,117 @@
+"""
+요청 단위 성능 프로파일링 모듈
+추천 처리 단계(span)별 소요시간과 DB 쿼리 수/행 수를 요청 단위로 집계
+"""
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class RequestTimings:
+    """한 요청 동안 수집된 단계별 소요시간과 DB 사용량"""
+
+    request_id: str
+    spans: dict[str, float] = field(default_factory=dict)
+    db_queries: int = 0
+    db_rows: int = 0
+    db_time_ms: float = 0.0
+    query_fingerprints: Counter[str] = field(default_factory=Counter)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def add_span(self, name: str, elapsed_ms: float) -> None:
+        """단계 소요시간을 누적합니다 (같은 단계가 여러 번 실행되면 합산)"""
+        with self._lock:
+            self.spans[name] = self.spans.get(name, 0.0) + elapsed_ms
+
+    def record_query(
+        self, 
+        elapsed_ms: float, 
+        rows: int, 
+        query_fingerprint: str | None = None
+    ) -> int:
+        """실행된 쿼리 한 건을 기록하고 지금까지의 쿼리 수를 반환합니다"""
+        with self._lock:
+            self.db_queries += 1
+            self.db_rows += max(rows, 0)
+            self.db_time_ms += elapsed_ms
+            if query_fingerprint is not None:
+                self.query_fingerprints[query_fingerprint] += 1
+            return self.db_queries
+
+    def server_timing_header(self, total_ms: float | None = None) -> str:
+        """Server-Timing 응답 헤더 값을 생성합니다"""
+        with self._lock:
+            metrics = [
+                f"{name};dur={elapsed:.2f}" for name, elapsed in self.spans.items()
+            ]
+            metrics.append(
+                f'db;desc="{self.db_queries} queries, {self.db_rows} rows";'
+                f"dur={self.db_time_ms:.2f}"
+            )
+        if total_ms is not None:
+            metrics.append(f"total;dur={total_ms:.2f}")
+        return ", ".join(metrics)
+
+    def to_dict(self) -> dict[str, Any]:
+        """구조화된 로그에 사용할 딕셔너리로 변환합니다"""
+        with self._lock:
+            return {
+                'spans_ms': {
+                    name: round(elapsed, 2) for name, elapsed in self.spans.items()
+                },
+                'db_queries': self.db_queries,
+                'db_rows': self.db_rows,
+                'db_time_ms': round(self.db_time_ms, 2),
+            }
+
+
+_current_timings: ContextVar[RequestTimings | None] = ContextVar(
+    'current_timings', default=None
+)
+
+
+def start_request_timings(request_id: str) -> tuple[RequestTimings, Token]:
+    """현재 컨텍스트에 새로운 요청 타이밍 수집기를 설정합니다"""
+    timings = RequestTimings(request_id=request_id)
+    token = _current_timings.set(timings)
+    return timings, token
+
+
+def end_request_timings(token: Token) -> None:
+    """요청 타이밍 수집기를 컨텍스트에서 제거합니다"""
+    _current_timings.reset(token)
+
+
+def get_current_timings() -> RequestTimings | None:
+    """현재 요청의 타이밍 수집기를 반환합니다 (요청 밖이면 None)"""
+    return _current_timings.get()
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """
+    처리 단계의 소요시간을 측정하는 컨텍스트 매니저
+
+    요청 컨텍스트 밖(배치 작업, 테스트 등)에서는 아무 것도 측정하지 않습니다.
+
+    Args:
+        name: Server-Timing 메트릭 이름으로 사용할 단계 이름 (공백 없이)
+    """
+    timings = _current_timings.get()
+    if timings is None:
+        yield
+        return
+
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add_span(name, (time.perf_counter() - start_time) * 1000)
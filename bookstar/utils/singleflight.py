@@ -0,0 +1,162 @@
+"""
+동시 요청 합치기(singleflight) 모듈
+같은 키의 계산이 이미 진행 중이면 새로 계산하지 않고 진행 중인 계산의 결과를
+기다려 함께 받음 (홈 화면 재시도/여러 탭/프리페치로 같은 사용자의 추천 요청이
+동시에 들어오는 경우)
+
+진행 중인 계산은 concurrent.futures.Future로 보관하므로 스레드풀(do)과
+async 엔드포인트(do_async)의 요청이 같은 키로 서로 합쳐집니다.
+
+먼저 시작한 계산의 결과가 그 요청에만 해당하는 이유로 부족한 경우(예: 그 요청의
+시간 예산이 바닥나 단계를 생략) retry_if로 기다린 요청이 직접 다시 계산하게 할 수
+있습니다.
+"""
+import asyncio
+import threading
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future, wait
+from typing import Any, TypeVar
+
+T = TypeVar('T')
+
+
+class SingleFlight:
+    """키별 진행 중인 계산 레지스트리 (스레드 안전)"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0       # 실제로 계산한 횟수
+        self.coalesced = 0   # 진행 중인 계산의 결과를 기다린 횟수
+        self.errors = 0      # 예외로 끝난 계산 횟수
+        self.retries = 0     # 기다린 결과 대신 다시 계산한 횟수 (retry_if)
+        self._in_flight: dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def _join(self, key: Hashable) -> tuple[Future, bool]:
+        """진행 중인 Future와 새로 계산해야 하는지 여부"""
+        with self._lock:
+            future = self._in_flight.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return future, False
+            future = Future()
+            # 기다리던 쪽이 취소되어도 공유 Future는 취소되지 않도록 실행 상태로 표시
+            future.set_running_or_notify_cancel()
+            self._in_flight[key] = future
+            self.calls += 1
+            return future, True
+
+    def _run(
+        self,
+        key: Hashable,
+        future: Future,
+        fn: Callable[..., T],
+        args: tuple,
+        kwargs: dict[str, Any]
+    ) -> T:
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            with self._lock:
+                self.errors += 1
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    def _should_retry(
+        self, future: Future, retry_if: Callable[[Future], bool] | None
+    ) -> bool:
+        if retry_if is None or not retry_if(future):
+            return False
+        with self._lock:
+            self.retries += 1
+        return True
+
+    def do(
+        self,
+        key: Hashable,
+        fn: Callable[..., T],
+        *args,
+        retry_if: Callable[[Future], bool] | None = None,
+        **kwargs
+    ) -> T:
+        """
+        key의 계산이 진행 중이면 그 결과를, 아니면 현재 스레드에서 fn을 실행한 결과를
+        반환합니다 (먼저 시작한 계산의 예외도 그대로 전달)
+
+        Args:
+            retry_if: 기다린 계산의 완료된 Future를 받아 True면 그 결과 대신 다시
+                계산 (같은 키로 다시 합쳐지므로 기다린 요청들 중 하나만 계산)
+        """
+        while True:
+            future, leader = self._join(key)
+            if leader:
+                return self._run(key, future, fn, args, kwargs)
+            wait([future])
+            if not self._should_retry(future, retry_if):
+                return future.result()
+
+    async def do_async(
+        self,
+        key: Hashable,
+        fn: Callable[..., T],
+        *args,
+        retry_if: Callable[[Future], bool] | None = None,
+        **kwargs
+    ) -> T:
+        """
+        do의 async 버전 (fn은 스레드풀에서 실행하여 이벤트 루프를 막지 않음)
+
+        기다리는 요청은 이벤트 루프에서 Future 완료만 기다립니다.
+        """
+        while True:
+            future, leader = self._join(key)
+            if leader:
+                return await asyncio.to_thread(
+                    self._run, key, future, fn, args, kwargs
+                )
+            await asyncio.wait([asyncio.wrap_future(future)])
+            if not self._should_retry(future, retry_if):
+                return future.result()
+
+    def stats(self) -> dict[str, int]:
+        """계산/합쳐진 요청/오류 횟수와 현재 진행 중인 키 수"""
+        with self._lock:
+            return {
+                'calls': self.calls,
+                'coalesced': self.coalesced,
+                'errors': self.errors,
+                'retries': self.retries,
+                'in_flight': len(self._in_flight),
+            }
+
+    def reset(self) -> None:
+        """통계를 초기화합니다 (진행 중인 계산은 유지)"""
+        with self._lock:
+            self.calls = self.coalesced = self.errors = self.retries = 0
+
+
+# 이름별 전역 레지스트리 (/metrics에 노출)
+_groups: dict[str, SingleFlight] = {}
+_groups_lock = threading.Lock()
+
+
+def get_group(name: str) -> SingleFlight:
+    """이름에 해당하는 SingleFlight (없으면 생성)"""
+    with _groups_lock:
+        group = _groups.get(name)
+        if group is None:
+            group = _groups[name] = SingleFlight(name)
+        return group
+
+
+def snapshot() -> dict[str, dict[str, int]]:
+    """이름별 통계"""
+    with _groups_lock:
+        groups = list(_groups.values())
+    return {group.name: group.stats() for group in groups}
@@ -57,7 +57,7 @@ def structured_logging_example():
 
 # 실행시간 측정 데코레이터 예제
 @log_execution_time(
-    threshold_ms=settings.logging['performance_threshold_ms']
+    threshold_ms=settings.logging.performance_threshold_ms
 )  # 설정값 사용
 def slow_function():
     """느린 함수 시뮬레이션"""
@@ -6,6 +6,7 @@ import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
+from benchmarks.synthetic import SyntheticConfig, create_sqlite_engine, generate_dataset
 from bookstar.config import settings
 from bookstar.database import Base
 
@@ -34,4 +35,39 @@ def db_session(engine):
         yield session
     finally:
         session.rollback()  # 테스트 중 변경사항 롤백
-        session.close() 
\ No newline at end of file
+        session.close()
+
+
+@pytest.fixture(scope="session")
+def synthetic_engine():
+    """합성 데이터가 채워진 메모리 SQLite 엔진 (MySQL 없이 실행 가능)"""
+    engine = create_sqlite_engine()
+    generate_dataset(
+        engine,
+        SyntheticConfig(
+            num_interactions=600,
+            num_books=120,
+            num_members=40,
+            num_authors=25,
+            seed=7,
+        )
+    )
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def synthetic_session(synthetic_engine):
+    """합성 데이터 SQLite 세션 (테스트마다 전역 추천 캐시 초기화)"""
+    from bookstar.services.recommendation import clear_caches
+
+    clear_caches()
+    Session = sessionmaker(bind=synthetic_engine)
+    session = Session()
+
+    try:
+        yield session
+    finally:
+        session.rollback()
+        session.close()
+        clear_caches()
@@ -0,0 +1,236 @@
+"""
+추천 아티팩트 저장/로드 테스트
+"""
+import json
+from contextlib import contextmanager
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from bookstar.services import artifacts, catalog
+from bookstar.services.warmup import SnapshotRefresher, WarmupState, run_warmup
+
+
+@pytest.fixture
+def snapshots(synthetic_session):
+    """합성 데이터로 만든 카탈로그와 이웃 목록까지 계산한 KNN 인덱스"""
+    snapshot = catalog.build_catalog(synthetic_session)
+    index = catalog.build_neighbor_index(synthetic_session)
+    index.neighbors = catalog.compute_neighbors(index, 5)
+    return snapshot, index
+
+
+def test_round_trip_uses_memmap(tmp_path, snapshots):
+    """저장한 아티팩트를 메모리 맵으로 읽어 같은 스냅샷이 되는지 테스트"""
+    snapshot, index = snapshots
+    path = artifacts.write_artifact(tmp_path, snapshot, index, version="v1")
+    artifacts.set_current(tmp_path, path.name)
+
+    loaded_catalog, loaded_index, manifest = artifacts.load_artifact(
+        tmp_path, verify=True
+    )
+
+    assert manifest['version'] == "v1"
+    assert manifest['counts']['neighbors_k'] == 5
+    assert isinstance(loaded_catalog.book_ids, np.memmap)
+    assert isinstance(loaded_index.indices, np.memmap)
+    assert not loaded_index.indices.flags.writeable
+    assert np.array_equal(loaded_catalog.aladin_ids, snapshot.aladin_ids)
+    assert loaded_catalog.author_names == snapshot.author_names
+    assert np.array_equal(loaded_catalog.popular_rows, snapshot.popular_rows)
+    assert np.array_equal(
+        loaded_catalog.aladin_map.sorted_ids, snapshot.aladin_map.sorted_ids
+    )
+    assert manifest['similarity'] == loaded_index.metric == "euclidean"
+    for uid in index.member_ids[:10].tolist():
+        assert loaded_index.similar_users(uid, 5) == index.similar_users(uid, 5)
+
+
+def test_round_trip_text_neighbors(tmp_path, snapshots):
+    """제목/소개 유사 도서 배열이 아티팩트에 저장되고 다시 읽히는지 테스트"""
+    snapshot, index = snapshots
+    neighbors = np.full((snapshot.size, 3), -1, dtype=np.int32)
+    neighbors[:, 0] = np.roll(np.arange(snapshot.size), 1)
+    scores = np.zeros((snapshot.size, 3), dtype=np.float16)
+    scores[:, 0] = 0.5
+    snapshot = replace(snapshot, text_neighbors=neighbors, text_scores=scores)
+
+    path = artifacts.write_artifact(tmp_path, snapshot, index, version="v1")
+    loaded_catalog, _, manifest = artifacts.load_artifact(tmp_path, path.name)
+
+    assert manifest['counts']['text_neighbors_k'] == 3
+    assert np.array_equal(loaded_catalog.text_neighbors, neighbors)
+    assert loaded_catalog.text_scores.dtype == np.float16
+    rows, sums = loaded_catalog.text_candidates(np.array([1, 2]))
+    assert rows.tolist() == [0, 1] and sums.tolist() == [0.5, 0.5]
+
+
+def test_precomputed_neighbors_match_knn(snapshots):
+    """미리 계산한 이웃 목록이 KNN 검색 결과와 같은지 테스트"""
+    _, index = snapshots
+    neighbors = index.neighbors
+    index.neighbors = None
+    try:
+        for uid in index.member_ids[:10].tolist():
+            expected = index.similar_users(uid, 5)
+            row = index.row_of(uid)
+            precomputed = [
+                int(index.member_ids[j]) for j in neighbors[row] if j >= 0
+            ]
+            assert precomputed == expected
+    finally:
+        index.neighbors = neighbors
+
+
+def test_current_rollback_and_prune(tmp_path, snapshots):
+    """CURRENT 교체, 롤백, 오래된 버전 정리 테스트"""
+    snapshot, index = snapshots
+    for version in ("v1", "v2", "v3"):
+        artifacts.write_artifact(tmp_path, snapshot, index, version=version)
+        artifacts.set_current(tmp_path, version)
+
+    assert artifacts.read_current(tmp_path) == "v3"
+    assert artifacts.rollback(tmp_path) == "v2"
+    assert artifacts.read_current(tmp_path) == "v2"
+
+    # CURRENT(v2)는 최신 keep개에 들지 않아도 지우지 않음
+    assert artifacts.prune_versions(tmp_path, keep=1) == ["v1"]
+    assert artifacts.list_versions(tmp_path) == ["v2", "v3"]
+
+    with pytest.raises(artifacts.ArtifactError):
+        artifacts.rollback(tmp_path)
+    with pytest.raises(artifacts.ArtifactError):
+        artifacts.set_current(tmp_path, "missing")
+
+
+def test_new_versions_sort_in_creation_order():
+    """같은 초에 연달아 만든 버전 이름도 만든 순서대로 정렬되는지 테스트"""
+    versions = [artifacts.new_version() for _ in range(50)]
+
+    assert sorted(versions) == versions
+    assert len(set(versions)) == len(versions)
+
+
+def test_missing_neighbor_array_is_rejected(tmp_path, snapshots):
+    """manifest에 KNN 인덱스 배열 일부가 빠지면 ArtifactError인지 테스트"""
+    snapshot, index = snapshots
+    path = artifacts.write_artifact(tmp_path, snapshot, index, version="v1")
+    manifest_path = path / artifacts.MANIFEST_FILE
+    manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+    del manifest['arrays']['indptr']
+    manifest_path.write_text(json.dumps(manifest), encoding='utf-8')
+
+    with pytest.raises(artifacts.ArtifactError, match="indptr"):
+        artifacts.load_artifact(tmp_path, "v1")
+
+
+def test_author_names_stored_as_utf8_offsets(tmp_path, snapshots):
+    """저자 이름을 고정 폭 배열이 아닌 UTF-8 바이트/offsets로 저장하는지 테스트"""
+    snapshot, index = snapshots
+    names = ("김영하", "", "Ursula K. Le Guin") + snapshot.author_names[3:]
+    snapshot = replace(
+        snapshot,
+        author_names=names,
+        author_index={name: code for code, name in enumerate(names)},
+    )
+    path = artifacts.write_artifact(tmp_path, snapshot, index, version="v1")
+
+    manifest = json.loads(
+        (path / artifacts.MANIFEST_FILE).read_text(encoding='utf-8')
+    )
+    assert manifest['arrays']['author_name_bytes']['dtype'] == "|u1"
+    assert 'author_names' not in manifest['arrays']
+    loaded, _, _ = artifacts.load_artifact(tmp_path, "v1", verify=True)
+    assert loaded.author_names == names
+    assert loaded.author_index["김영하"] == 0
+
+
+def test_corrupt_artifacts_are_rejected(tmp_path, snapshots):
+    """손상된 manifest/배열/형식 버전을 ArtifactError로 거부하는지 테스트"""
+    snapshot, index = snapshots
+    path = artifacts.write_artifact(tmp_path, snapshot, index, version="v1")
+
+    with pytest.raises(artifacts.ArtifactError):
+        artifacts.load_artifact(tmp_path)  # CURRENT 없음
+
+    with open(path / "indices.npy", "r+b") as f:
+        f.seek(-1, 2)
+        f.write(b"\xff")
+    artifacts.load_artifact(tmp_path, "v1")
+    with pytest.raises(artifacts.ArtifactError, match="체크섬"):
+        artifacts.load_artifact(tmp_path, "v1", verify=True)
+
+    manifest_path = path / artifacts.MANIFEST_FILE
+    manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+    manifest['format_version'] = artifacts.FORMAT_VERSION + 1
+    manifest_path.write_text(json.dumps(manifest), encoding='utf-8')
+    with pytest.raises(artifacts.ArtifactError, match="형식"):
+        artifacts.load_artifact(tmp_path, "v1")
+
+    manifest_path.write_text("{", encoding='utf-8')
+    with pytest.raises(artifacts.ArtifactError, match="손상"):
+        artifacts.load_artifact(tmp_path, "v1")
+
+
+def test_warmup_prefers_artifact(tmp_path, snapshots):
+    """워밍업이 CURRENT 아티팩트를 읽고, 없으면 DB에서 만드는지 테스트"""
+    snapshot, index = snapshots
+    artifacts.write_artifact(tmp_path, snapshot, index, version="v1")
+
+    @contextmanager
+    def broken_scope():
+        raise ConnectionError("db down")
+        yield
+
+    try:
+        # CURRENT가 없으면 DB 경로로 넘어가고 (여기서는 DB도 실패) degraded
+        state = run_warmup(broken_scope, state=WarmupState(), artifact_dir=tmp_path)
+        assert state.status == "degraded"
+
+        artifacts.set_current(tmp_path, "v1")
+        state = run_warmup(broken_scope, state=WarmupState(), artifact_dir=tmp_path)
+        assert state.status == "ready"
+        assert state.details['source'] == "artifact"
+        assert state.details['artifact_version'] == "v1"
+        assert catalog.get_catalog().size == snapshot.size
+        assert isinstance(catalog.get_neighbor_index().indptr, np.memmap)
+    finally:
+        catalog.reset_snapshots()
+
+
+def test_snapshot_refresher_follows_current(tmp_path, snapshots):
+    """스냅샷 갱신이 CURRENT가 바뀔 때만 새 아티팩트를 설치하는지 테스트"""
+    snapshot, index = snapshots
+    for version in ("v1", "v2"):
+        artifacts.write_artifact(tmp_path, snapshot, index, version=version)
+    artifacts.set_current(tmp_path, "v1")
+
+    @contextmanager
+    def broken_scope():
+        raise ConnectionError("db down")
+        yield
+
+    state = WarmupState()
+    refresher = SnapshotRefresher(
+        broken_scope, 60.0, artifact_dir=tmp_path, state=state
+    )
+    try:
+        catalog.reset_snapshots()
+        assert refresher.refresh()['artifact_version'] == "v1"
+        installed = catalog.get_catalog()
+        assert refresher.refresh() is None
+        assert catalog.get_catalog() is installed
+
+        artifacts.set_current(tmp_path, "v2")
+        assert refresher.refresh()['artifact_version'] == "v2"
+        assert catalog.get_catalog() is not installed
+        assert state.details['artifact_version'] == "v2"
+
+        # 아티팩트도 DB도 읽을 수 없으면 기존 스냅샷 유지
+        installed = catalog.get_catalog()
+        (tmp_path / artifacts.CURRENT_FILE).unlink()
+        assert refresher.refresh() is None
+        assert catalog.get_catalog() is installed
+    finally:
+        catalog.reset_snapshots()
@@ -0,0 +1,30 @@
+"""
+추천 모델 비교 벤치마크 테스트
+"""
+from benchmarks.bench_models import compare, measure_model, train_models
+
+
+def test_train_and_measure_models(synthetic_engine):
+    """두 모델을 학습하고 크기/지연시간/정확도를 측정하는지 테스트"""
+    models, train_s, eval_rows = train_models(synthetic_engine, epochs=1, seed=0)
+
+    assert set(models) == {
+        'autoencoder', 'autoencoder_int8', 'factorization_float32',
+        'factorization_float16', 'factorization_int8',
+    }
+    assert set(train_s) == set(models)
+
+    results = {
+        name: measure_model(model, eval_rows, 5) for name, model in models.items()
+    }
+    for quantized, original in (
+        ('factorization_int8', 'factorization_float32'),
+        ('autoencoder_int8', 'autoencoder'),
+    ):
+        assert results[quantized]['model_bytes'] < results[original]['model_bytes']
+    for result in results.values():
+        assert result['single_user']['n'] == len(eval_rows)
+        assert 0 <= result['metrics']['recall@5'] <= 1
+
+    current = {'meta': {'k': 5}, 'results': results}
+    assert len(compare(current, current)) == 2 * len(results)
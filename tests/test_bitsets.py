@@ -0,0 +1,61 @@
+"""
+회원별 도서 비트셋 테스트
+"""
+import numpy as np
+
+from bookstar.services import bitsets
+
+
+def _random_sets(num_rows=30, num_columns=150, seed=0):
+    rng = np.random.default_rng(seed)
+    sets = [
+        set(rng.choice(num_columns, rng.integers(0, 20), replace=False).tolist())
+        for _ in range(num_rows)
+    ]
+    indptr = np.zeros(num_rows + 1, dtype=np.int64)
+    np.cumsum([len(s) for s in sets], out=indptr[1:])
+    indices = np.array(
+        [c for s in sets for c in sorted(s)], dtype=np.int32
+    )
+    return sets, indptr, indices
+
+
+def test_pack_rows_round_trip():
+    """비트셋에 켜진 비트가 원래 열 번호와 같은지 테스트"""
+    sets, indptr, indices = _random_sets()
+
+    bits = bitsets.pack_rows(indptr, indices, 150)
+
+    assert bits.shape == (30, 3)
+    assert bits.dtype == np.uint64
+    unpacked = np.unpackbits(bits.view(np.uint8), axis=1, bitorder='little')
+    for row, expected in enumerate(sets):
+        assert set(np.flatnonzero(unpacked[row]).tolist()) == expected
+    assert bitsets.row_counts(bits).tolist() == [len(s) for s in sets]
+
+
+def test_jaccard_matches_python_sets():
+    """popcount로 계산한 교집합/Jaccard가 집합 연산 결과와 같은지 테스트"""
+    sets, indptr, indices = _random_sets(seed=1)
+    bits = bitsets.pack_rows(indptr, indices, 150)
+    counts = bitsets.row_counts(bits)
+    query = sets[4] | {149}
+
+    query_bits = bitsets.pack_columns(np.array(sorted(query)), 150)
+    similarity = bitsets.jaccard(bits, counts, query_bits)
+
+    assert bitsets.intersection_counts(bits, query_bits).tolist() == [
+        len(s & query) for s in sets
+    ]
+    expected = [len(s & query) / len(s | query) for s in sets]
+    assert np.allclose(similarity, expected)
+
+
+def test_empty_sets():
+    """빈 집합끼리의 유사도는 0인지 테스트"""
+    bits = bitsets.pack_rows(np.zeros(3, dtype=np.int64), np.empty(0), 0)
+
+    assert bits.shape == (2, 1)
+    assert bitsets.jaccard(bits, bitsets.row_counts(bits), bits[0]).tolist() == [
+        0.0, 0.0
+    ]
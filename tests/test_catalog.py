@@ -0,0 +1,414 @@
+"""
+인메모리 카탈로그 / KNN 인덱스 테스트
+"""
+from dataclasses import replace
+
+import numpy as np
+import pytest
+from sqlalchemy import select
+
+from bookstar.config import settings
+from bookstar.models.models import Book, MemberBook, ReadingStatus
+from bookstar.services import catalog, text_neighbors
+from bookstar.services.recommendation import (
+    RecommendationService,
+    clear_caches,
+    recommend_books,
+    recommend_books_batch,
+)
+
+
+@pytest.fixture
+def loaded_snapshots(synthetic_session):
+    """합성 데이터로 스냅샷을 로드하고 테스트 후 DB 경로로 되돌림"""
+    catalog.load_snapshots(synthetic_session)
+    yield synthetic_session
+    catalog.reset_snapshots()
+
+
+def _active_members(session, limit=8):
+    return session.execute(
+        select(MemberBook.member_id).distinct().limit(limit)
+    ).scalars().all()
+
+
+def test_build_catalog(synthetic_session):
+    """카탈로그 배열이 도서 테이블과 일치하는지 테스트"""
+    snapshot = catalog.build_catalog(synthetic_session)
+    books = synthetic_session.query(Book).order_by(Book.id).all()
+
+    assert snapshot.size == len(books)
+    assert snapshot.book_ids.tolist() == [book.id for book in books]
+    row = snapshot.aladin_map.get(books[3].alading_book_id)
+    assert catalog.CATEGORIES[snapshot.category_codes[row]] == books[3].book_category
+    assert snapshot.author_names[snapshot.author_codes[row]] == books[3].author
+
+
+def test_id_map_translates_both_directions():
+    """IdMap이 외부 ID와 행 번호를 양방향으로 변환하는지 테스트"""
+    id_map = catalog.IdMap.build(np.array([30, -1, 10, 20], dtype=np.int64))
+
+    assert len(id_map) == 3
+    assert id_map.rows([10, 20, 99, 30]).tolist() == [2, 3, -1, 0]
+    assert id_map.find(["20", "5", "10"]).tolist() == [3, 2]
+    assert id_map.find({30}).tolist() == [0]
+    assert id_map.find([]).tolist() == []
+    assert id_map.get(-1) is None
+    assert 20 in id_map and 99 not in id_map
+    assert id_map.ids_of(np.array([2, 0])).tolist() == [10, 30]
+    assert catalog.IdMap.build(np.empty(0)).rows([1]).tolist() == [-1]
+
+
+def test_snapshot_id_maps(synthetic_session):
+    """카탈로그의 alading_book_id/Book.id 매핑이 같은 행을 가리키는지 테스트"""
+    snapshot = catalog.build_catalog(synthetic_session)
+    books = synthetic_session.query(Book).order_by(Book.id).all()[::7]
+
+    aladin_rows = snapshot.rows_for_aladin_ids([b.alading_book_id for b in books])
+    book_rows = snapshot.rows_for_book_ids([b.id for b in books])
+
+    assert aladin_rows.tolist() == book_rows.tolist()
+    assert snapshot.book_ids[book_rows].tolist() == [b.id for b in books]
+
+
+def test_preference_weights(synthetic_session):
+    """선호도 가중치 배열 변환 테스트"""
+    snapshot = catalog.build_catalog(synthetic_session)
+    category = catalog.CATEGORIES[snapshot.category_codes[0]]
+    author = snapshot.author_names[snapshot.author_codes[0]]
+
+    category_weight, author_weight = snapshot.preference_weights(
+        {category.value: 2.0}, {author: 1.5, "없는 작가": 9.0}
+    )
+
+    assert category_weight[0] == 2.0
+    assert author_weight[0] == 1.5
+    other_categories = snapshot.category_codes != snapshot.category_codes[0]
+    assert np.all(category_weight[other_categories] == 0)
+
+
+def test_content_fast_path_matches_db_path(synthetic_session):
+    """카탈로그 경로와 DB 경로의 콘텐츠 기반 추천 결과가 같은지 테스트"""
+    service = RecommendationService(synthetic_session)
+    members = _active_members(synthetic_session)
+    expected = {
+        uid: service.get_content_based_recommendations(uid, 10)['book_id'].tolist()
+        for uid in members
+    }
+
+    catalog.load_snapshots(synthetic_session)
+    try:
+        clear_caches()
+        for uid in members:
+            result = service.get_content_based_recommendations(uid, 10)
+            assert result['book_id'].tolist() == expected[uid]
+    finally:
+        catalog.reset_snapshots()
+
+
+def _expected_preferences(session, uid):
+    """도서별로 한 번씩, 읽은 상태를 우선하여 가중치를 더한 기준값"""
+    rec = settings.recommendation
+    statuses: dict[int, bool] = {}
+    for book_id, status in session.execute(
+        select(MemberBook.book_id, MemberBook.reading_status)
+        .where(MemberBook.member_id == uid)
+    ):
+        if status is not None:
+            is_read = status in (ReadingStatus.READED, ReadingStatus.READING)
+            statuses[book_id] = statuses.get(book_id, False) or is_read
+    categories: dict[str, float] = {}
+    authors: dict[str, float] = {}
+    for book in session.query(Book).filter(Book.alading_book_id.in_(statuses)):
+        weight = (
+            rec.read_book_weight if statuses[book.alading_book_id]
+            else rec.unread_book_weight
+        )
+        if book.book_category:
+            categories[book.book_category.value] = (
+                categories.get(book.book_category.value, 0.0)
+                + rec.category_preference_weight * weight
+            )
+        if book.author:
+            authors[book.author] = (
+                authors.get(book.author, 0.0) + rec.author_preference_weight * weight
+            )
+    return {'categories': categories, 'authors': authors}
+
+
+def test_preferences_group_by_matches_catalog_path(synthetic_session):
+    """DB GROUP BY 집계와 카탈로그 경로의 선호도가 기준값과 같은지 테스트"""
+    service = RecommendationService(synthetic_session)
+    members = _active_members(synthetic_session)
+    expected = {uid: _expected_preferences(synthetic_session, uid) for uid in members}
+
+    from_db = {uid: service.get_user_preferences(uid) for uid in members}
+    catalog.load_snapshots(synthetic_session)
+    try:
+        clear_caches()
+        from_catalog = {uid: service.get_user_preferences(uid) for uid in members}
+    finally:
+        catalog.reset_snapshots()
+
+    for uid in members:
+        for result in (from_db[uid], from_catalog[uid]):
+            assert set(result) == {'categories', 'authors'}
+            for key in ('categories', 'authors'):
+                assert result[key] == pytest.approx(expected[uid][key])
+
+
+def test_postings_match_codes(synthetic_session):
+    """카테고리/저자 역색인이 코드별 행 번호와 같은지 테스트"""
+    snapshot = catalog.build_catalog(synthetic_session)
+
+    for codes, (indptr, rows) in (
+        (snapshot.category_codes, snapshot.category_postings),
+        (snapshot.author_codes, snapshot.author_postings),
+    ):
+        for code in range(len(indptr) - 1):
+            assert rows[indptr[code]:indptr[code + 1]].tolist() == (
+                np.flatnonzero(codes == code).tolist()
+            )
+
+    author = snapshot.author_names[0]
+    category = catalog.CATEGORIES[snapshot.category_codes[0]]
+    matched = snapshot.matching_rows({category.value: 1.0}, {author: 1.0})
+    expected = np.flatnonzero(
+        (snapshot.author_codes == 0)
+        | (snapshot.category_codes == snapshot.category_codes[0])
+    )
+    assert matched.tolist() == expected.tolist()
+
+
+def test_content_pads_with_popular_books(loaded_snapshots):
+    """선호 도서가 부족하면 인기순 도서로 채우는지 테스트 (단건/배치 같은 결과)"""
+    snapshot = catalog.get_catalog()
+    service = RecommendationService(loaded_snapshots)
+    uid = _active_members(loaded_snapshots, limit=1)[0]
+    read_list, want_list = service.get_user_books_data(uid)
+    excluded = set(snapshot.rows_for_aladin_ids(read_list + want_list).tolist())
+    author = snapshot.author_names[0]
+    preferences = {'categories': {}, 'authors': {author: 1.0}}
+
+    result = service._content_from_catalog(snapshot, uid, preferences, 30)
+
+    author_rows = [
+        row for row in np.flatnonzero(snapshot.author_codes == 0).tolist()
+        if row not in excluded
+    ]
+    popular = [
+        row for row in snapshot.popular_rows.tolist()
+        if row not in excluded and row not in author_rows
+    ]
+    expected_rows = author_rows + popular[:30 - len(author_rows)]
+    assert result['book_id'].tolist() == snapshot.book_ids[expected_rows].tolist()
+    assert (result['total_weight'].iloc[len(author_rows):] == 0).all()
+
+    exclude = [snapshot.rows_for_aladin_ids(read_list + want_list)]
+    (rows, _), = snapshot.content_topk([preferences], exclude, 30)
+    assert rows.tolist() == expected_rows
+
+
+def test_popularity_order(loaded_snapshots):
+    """인기순 행 번호가 회원 등록 수 내림차순인지 테스트"""
+    snapshot = catalog.get_catalog()
+    index = catalog.get_neighbor_index()
+    counts = np.zeros(snapshot.size, dtype=np.int64)
+    for column, book_id in enumerate(index.book_values.tolist()):
+        counts[snapshot.aladin_map.get(book_id)] = np.count_nonzero(
+            index.indices == column
+        )
+
+    popular = snapshot.popular_rows
+
+    assert sorted(popular.tolist()) == list(range(snapshot.size))
+    assert np.all(np.diff(counts[popular]) <= 0)
+
+
+def test_padding_uses_own_popular_rows(synthetic_session):
+    """빈칸은 전역 스냅샷이 아니라 계산 중인 카탈로그의 인기순으로 채우는지 테스트"""
+    snapshot = catalog.build_catalog(synthetic_session)
+    reordered = replace(snapshot, popular_rows=snapshot.popular_rows[::-1].copy())
+    catalog.install_snapshots(snapshot, None)
+    try:
+        (rows, _), = reordered.content_topk(
+            [{'categories': {}, 'authors': {}}], [np.empty(0, dtype=np.int64)], 5
+        )
+    finally:
+        catalog.reset_snapshots()
+
+    assert rows.tolist() == reordered.popular_rows[:5].tolist()
+
+
+def test_install_publishes_one_bundle(synthetic_session):
+    """카탈로그와 KNN 인덱스가 한 묶음으로 교체되고, 읽어 둔 묶음은 그대로인지 테스트"""
+    first = catalog.build_catalog(synthetic_session)
+    second = catalog.build_catalog(synthetic_session)
+    index = catalog.build_neighbor_index(synthetic_session)
+    try:
+        catalog.install_snapshots(first, index)
+        held = catalog.get_snapshots()
+        catalog.install_snapshots(second, None)
+        current = catalog.get_snapshots()
+    finally:
+        catalog.reset_snapshots()
+
+    assert held.catalog is first and held.neighbor_index is index
+    assert current.catalog is second and current.neighbor_index is None
+    assert catalog.get_snapshots() is None
+
+
+def test_top_rows_matches_nlargest():
+    """top_rows가 nlargest(keep='first')와 같은 순서로 고르는지 테스트"""
+    import pandas as pd
+
+    rng = np.random.default_rng(0)
+    for _ in range(20):
+        scores = rng.integers(0, 4, size=30).astype(np.float32)
+        scores[rng.integers(0, 30, size=5)] = -np.inf
+        candidates = np.flatnonzero(np.isfinite(scores))
+        expected = pd.Series(scores[candidates], index=candidates).nlargest(
+            8, keep='first'
+        ).index.tolist()
+
+        assert catalog.top_rows(scores, 8).tolist() == expected
+    assert len(catalog.top_rows(np.full(3, -np.inf), 2)) == 0
+
+
+def test_batch_content_matches_single_path(loaded_snapshots):
+    """행렬 곱 배치 콘텐츠 점수가 사용자별 계산과 같은 도서를 고르는지 테스트"""
+    service = RecommendationService(loaded_snapshots)
+    members = _active_members(loaded_snapshots, limit=40)
+    expected = {
+        uid: service.get_content_based_recommendations(uid, 10)['book_id'].tolist()
+        for uid in members
+    }
+
+    clear_caches()
+    batch = service.get_content_based_recommendations_batch(members, 10)
+
+    assert {uid: df['book_id'].tolist() for uid, df in batch.items()} == expected
+
+    snapshot = catalog.get_catalog()
+    preferences = [service.get_user_preferences(uid) for uid in members]
+    exclude = [np.empty(0, dtype=np.int64)] * len(members)
+    assert [
+        rows.tolist() for rows, _ in snapshot.content_topk(preferences, exclude, 5, 3)
+    ] == [
+        rows.tolist() for rows, _ in snapshot.content_topk(preferences, exclude, 5)
+    ]
+
+
+def test_text_neighbors_boost_content(synthetic_session):
+    """제목/소개 유사 도서가 후보에 더해지고 단건/배치 결과가 같은지 테스트"""
+    snapshot = catalog.build_catalog(synthetic_session)
+    neighbors, scores = text_neighbors.build_text_neighbors(
+        synthetic_session, snapshot, 5
+    )
+    catalog.install_snapshots(
+        replace(snapshot, text_neighbors=neighbors, text_scores=scores),
+        catalog.build_neighbor_index(synthetic_session),
+    )
+    try:
+        clear_caches()
+        service = RecommendationService(synthetic_session)
+        members = _active_members(synthetic_session, limit=20)
+        single = {
+            uid: service.get_content_based_recommendations(uid, 10) for uid in members
+        }
+        batch = service.get_content_based_recommendations_batch(members, 10)
+    finally:
+        catalog.reset_snapshots()
+
+    assert any((df['text_weight'] > 0).any() for df in single.values())
+    for uid in members:
+        assert batch[uid]['book_id'].tolist() == single[uid]['book_id'].tolist()
+        assert np.allclose(
+            batch[uid]['total_weight'], single[uid]['total_weight'].to_numpy()
+        )
+
+    read_rows = snapshot.rows_for_aladin_ids(
+        service.get_user_books_data(members[0])[0]
+    )
+    text_rows, text_sums = replace(
+        snapshot, text_neighbors=neighbors, text_scores=scores
+    ).text_candidates(read_rows)
+    expected = {}
+    for row in read_rows.tolist():
+        for other, score in zip(neighbors[row], scores[row], strict=True):
+            if other >= 0:
+                expected[int(other)] = expected.get(int(other), 0.0) + float(score)
+    assert text_rows.tolist() == sorted(expected)
+    assert np.allclose(text_sums, [expected[r] for r in sorted(expected)])
+
+
+def test_recommend_books_batch_matches_single(loaded_snapshots):
+    """배치 하이브리드 추천이 사용자별 recommend_books와 같은지 테스트"""
+    members = _active_members(loaded_snapshots, limit=10)
+    service = RecommendationService(loaded_snapshots)
+    expected = {
+        uid: recommend_books(
+            loaded_snapshots, uid, *service.get_user_books_data(uid), 6
+        )
+        for uid in members
+    }
+
+    clear_caches()
+    assert recommend_books_batch(loaded_snapshots, members + members[:1], 6) == (
+        expected
+    )
+
+
+def test_neighbor_index_similar_users(loaded_snapshots):
+    """KNN 인덱스가 자기 자신을 제외한 유사 사용자를 반환하는지 테스트"""
+    index = catalog.get_neighbor_index()
+    uid = int(index.member_ids[0])
+
+    similar = index.similar_users(uid, 3)
+
+    assert len(similar) == 3
+    assert uid not in similar
+    assert index.similar_users(-1, 3) == []
+
+
+def test_jaccard_neighbors_match_sets(synthetic_session):
+    """jaccard 인덱스의 이웃이 집합 연산으로 구한 Jaccard 순위와 같은지 테스트"""
+    index = catalog.build_neighbor_index(synthetic_session, metric='jaccard')
+    sets = [
+        set(index.indices[index.indptr[r]:index.indptr[r + 1]].tolist())
+        for r in range(index.size)
+    ]
+
+    for row in range(0, index.size, 7):
+        scores = [
+            -1.0 if other == row
+            else len(sets[row] & s) / max(len(sets[row] | s), 1)
+            for other, s in enumerate(sets)
+        ]
+        expected = sorted(range(index.size), key=lambda r: (-scores[r], r))[:5]
+        uid = int(index.member_ids[row])
+        assert index.similar_users(uid, 5) == index.member_ids[expected].tolist()
+
+    index.neighbors = catalog.compute_neighbors(index, 5)
+    uid = int(index.member_ids[3])
+    precomputed = index.similar_users(uid, 5)
+    index.neighbors = None
+    assert precomputed == index.similar_users(uid, 5)
+
+
+def test_collaborative_fast_path_excludes_own_books(loaded_snapshots):
+    """협업 필터링 카탈로그 경로가 사용자가 이미 등록한 책을 제외하는지 테스트"""
+    session = loaded_snapshots
+    service = RecommendationService(session)
+    snapshot = catalog.get_catalog()
+
+    for uid in _active_members(session):
+        read_list, want_list = service.get_user_books_data(uid)
+        own_rows = snapshot.rows_for_aladin_ids(read_list + want_list)
+        own_book_ids = set(snapshot.book_ids[own_rows].tolist())
+
+        result = service.get_collaborative_recommendations(uid, 5)
+
+        if not result.empty:
+            assert len(result) <= 5
+            assert own_book_ids.isdisjoint(result['book_id'].tolist())
@@ -0,0 +1,87 @@
+"""
+회로 차단기 테스트
+"""
+import pytest
+
+from bookstar.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker(
+        "test", failure_threshold=3, slow_call_ms=100, window_s=10, open_s=5,
+        clock=clock,
+    )
+
+
+def test_opens_after_failures_within_window(breaker, clock):
+    """window_s 안의 실패가 failure_threshold번 쌓여야 열리는지 테스트"""
+    breaker.record_failure()
+    breaker.record_failure()
+    clock.now = 11  # 앞의 두 실패는 윈도 밖
+    breaker.record_failure()
+    assert breaker.state == 'closed'
+    assert breaker.allow()
+
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == 'open'
+    assert not breaker.allow()
+    assert breaker.stats()['rejected'] == 1
+
+
+def test_slow_calls_count_as_failures(breaker):
+    """slow_call_ms보다 오래 걸린 성공은 실패로 세는지 테스트"""
+    for _ in range(3):
+        breaker.record_success(elapsed_ms=150)
+    assert breaker.state == 'open'
+    assert breaker.stats()['slow_calls'] == 3
+
+
+def test_half_open_probe_closes_or_reopens(breaker, clock):
+    """open_s 후 시험 호출만 통과시키고 결과에 따라 닫히거나 다시 열리는지 테스트"""
+    for _ in range(3):
+        breaker.record_failure()
+    clock.now = 5
+    assert breaker.allow()
+    assert breaker.state == 'half_open'
+    assert not breaker.allow()  # 시험 호출은 half_open_probes개까지
+
+    breaker.record_failure()
+    assert breaker.state == 'open'
+    assert not breaker.allow()
+
+    clock.now = 10
+    assert breaker.allow()
+    breaker.record_success(elapsed_ms=1)
+    assert breaker.state == 'closed'
+    assert breaker.stats()['opened'] == 2
+
+
+def test_guard_records_outcome(breaker, clock):
+    """guard()가 지정한 예외만 실패로 세고, 열려 있으면 바로 거절하는지 테스트"""
+    with pytest.raises(KeyError), breaker.guard(ConnectionError):
+        raise KeyError("not a db error")
+    assert breaker.stats()['failures'] == 0
+
+    for _ in range(3):
+        with pytest.raises(ConnectionError), breaker.guard(ConnectionError):
+            raise ConnectionError("down")
+
+    clock.now = 1
+    with pytest.raises(CircuitOpenError) as excinfo, breaker.guard(ConnectionError):
+        pytest.fail("열린 회로에서 블록이 실행됨")
+    assert excinfo.value.retry_after_s == pytest.approx(4)
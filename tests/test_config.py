@@ -1,7 +1,12 @@
 """
 설정 시스템 테스트
 """
+import dataclasses
+
+import pytest
+
 from bookstar.config import settings
+from bookstar.config.config import SettingsSnapshot
 
 
 def test_settings_load():
@@ -229,4 +234,52 @@ def test_complete_settings_integration():
         
     except Exception as e:
         msg = f"설정 로드 실패: {str(e)}"
-        raise AssertionError(msg) from e 
\ No newline at end of file
+        raise AssertionError(msg) from e
+
+
+def test_settings_snapshot_is_cached():
+    """설정 섹션이 접근할 때마다 새로 만들어지지 않는지 테스트"""
+    assert settings.recommendation is settings.recommendation
+    assert settings.logging is settings.logging
+    assert (
+        settings.recommendation.read_book_weight
+        == settings.recommendation['read_book_weight']
+    )
+
+
+def test_settings_sections_are_frozen():
+    """설정 섹션이 불변인지 테스트"""
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        settings.recommendation.content_weight = 0.5
+    with pytest.raises(KeyError):
+        settings.logging['unknown_key']
+
+
+def test_settings_validation():
+    """잘못된 설정 값이 시작 시점에 거부되는지 테스트"""
+    with pytest.raises(ValueError, match="similar_users_count"):
+        SettingsSnapshot.from_sources(
+            {'recommendation': {'similar_users_count': 0}}, {}
+        )
+    with pytest.raises(ValueError, match="level"):
+        SettingsSnapshot.from_sources({'logging': {'level': 'VERBOSE'}}, {})
+    with pytest.raises(ValueError, match="similarity"):
+        SettingsSnapshot.from_sources({'artifacts': {'similarity': 'cosine'}}, {})
+    with pytest.raises(ValueError, match="hard_ttl_s"):
+        SettingsSnapshot.from_sources(
+            {'result_cache': {'soft_ttl_s': 600, 'hard_ttl_s': 60}}, {}
+        )
+    with pytest.raises(ValueError, match="failure_threshold"):
+        SettingsSnapshot.from_sources(
+            {'circuit_breaker': {'failure_threshold': 0}}, {}
+        )
+
+
+def test_settings_reload_swaps_snapshot():
+    """reload()가 새 스냅샷으로 교체하는지 테스트"""
+    before = settings.snapshot
+    after = settings.reload()
+    assert settings.snapshot is after
+    assert after is not before
+    assert after == before
+
@@ -0,0 +1,150 @@
+"""
+설정 핫 리로드 테스트
+"""
+import os
+from dataclasses import replace
+
+from bookstar.config import settings
+from bookstar.config.config import Settings
+from bookstar.config.watcher import ConfigWatcher
+from bookstar.services import recommendation
+
+CONFIG_TEMPLATE = """
+[recommendation]
+category_preference_weight = {weight}
+similar_users_count = {similar}
+
+[logging]
+level = "INFO"
+"""
+
+
+def _write_config(path, weight=2.0, similar=3):
+    path.write_text(
+        CONFIG_TEMPLATE.format(weight=weight, similar=similar), encoding='utf-8'
+    )
+    # 같은 시각에 연속으로 쓰더라도 변경이 감지되도록 수정 시각을 앞당김
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def _make_settings(tmp_path):
+    config_path = tmp_path / "config.toml"
+    _write_config(config_path)
+    return Settings(config_path, tmp_path / ".env.toml"), config_path
+
+
+def test_watcher_reloads_changed_file(tmp_path):
+    """파일이 바뀌면 스냅샷이 교체되고 구독자가 호출되는지 테스트"""
+    local_settings, config_path = _make_settings(tmp_path)
+    calls = []
+    local_settings.subscribe(lambda old, new: calls.append(old.changed_fields(new)))
+    watcher = ConfigWatcher(local_settings, poll_interval_s=0.01)
+
+    assert watcher.check() is None
+
+    _write_config(config_path, weight=3.0)
+    snapshot = watcher.check()
+
+    assert snapshot is not None
+    assert local_settings.recommendation.category_preference_weight == 3.0
+    assert calls == [{'recommendation': {'category_preference_weight'}}]
+
+
+def test_reload_keeps_sections_that_need_restart(tmp_path, caplog):
+    """재시작이 필요한 섹션 변경은 기존 값을 유지하고 경고만 남기는지 테스트"""
+    local_settings, config_path = _make_settings(tmp_path)
+    before = local_settings.snapshot
+    config_path.write_text(
+        CONFIG_TEMPLATE.format(weight=3.0, similar=3)
+        + "\n[result_cache]\nsoft_ttl_s = 10.0\n",
+        encoding='utf-8'
+    )
+
+    after = local_settings.reload()
+
+    assert after.recommendation.category_preference_weight == 3.0
+    assert after.result_cache is before.result_cache
+    assert "[result_cache] soft_ttl_s" in caplog.text
+
+
+def test_reload_applies_only_hot_logging_fields(tmp_path, caplog):
+    """logging 섹션은 레벨/임계값만 반영하고 핸들러 설정은 유지하는지 테스트"""
+    local_settings, config_path = _make_settings(tmp_path)
+    before = local_settings.logging
+    config_path.write_text(
+        CONFIG_TEMPLATE.replace('level = "INFO"', 'level = "DEBUG"')
+        .format(weight=2.0, similar=3)
+        + 'db_query_threshold_ms = 5\nlog_dir = "elsewhere"\n',
+        encoding='utf-8'
+    )
+
+    after = local_settings.reload()
+
+    assert after.logging.level == "DEBUG"
+    assert after.logging.db_threshold_ms == 5
+    assert after.logging.log_dir == before.log_dir
+    assert "[logging] log_dir" in caplog.text
+
+
+def test_watcher_keeps_snapshot_on_invalid_config(tmp_path):
+    """잘못된 설정으로 바뀌면 기존 스냅샷을 유지하는지 테스트"""
+    local_settings, config_path = _make_settings(tmp_path)
+    before = local_settings.snapshot
+    watcher = ConfigWatcher(local_settings, poll_interval_s=0.01)
+
+    _write_config(config_path, similar=0)
+
+    assert watcher.check() is None
+    assert local_settings.snapshot is before
+
+
+def test_watcher_thread_picks_up_forced_reload(tmp_path):
+    """SIGHUP과 같은 강제 재로드 요청을 감시 스레드가 처리하는지 테스트"""
+    local_settings, config_path = _make_settings(tmp_path)
+    reloaded = []
+    local_settings.subscribe(lambda old, new: reloaded.append(new))
+    watcher = ConfigWatcher(local_settings, poll_interval_s=60)
+    watcher.start()
+    try:
+        config_path.write_text(
+            CONFIG_TEMPLATE.format(weight=1.0, similar=3), encoding='utf-8'
+        )
+        watcher.request_reload()
+        for _ in range(200):
+            if reloaded:
+                break
+            watcher._stop_event.wait(0.01)
+    finally:
+        watcher.stop()
+
+    assert reloaded
+    assert reloaded[0].recommendation.category_preference_weight == 1.0
+
+
+def test_reload_invalidates_only_affected_caches():
+    """선호도 가중치 변경 시 선호도 캐시만 비워지는지 테스트"""
+    old = settings.snapshot
+    recommendation._user_books_cache[1] = (["1"], [])
+    recommendation._user_preferences_cache[1] = {'categories': {}, 'authors': {}}
+    recommendation._similar_users_cache["1_3"] = [2, 3]
+    try:
+        new = replace(
+            old,
+            recommendation=replace(old.recommendation, similar_users_count=5)
+        )
+        recommendation._invalidate_changed_caches(old, new)
+        assert 1 in recommendation._user_preferences_cache
+
+        new = replace(
+            old,
+            recommendation=replace(
+                old.recommendation, category_preference_weight=9.0
+            )
+        )
+        recommendation._invalidate_changed_caches(old, new)
+        assert 1 not in recommendation._user_preferences_cache
+        assert 1 in recommendation._user_books_cache
+        assert "1_3" in recommendation._similar_users_cache
+    finally:
+        recommendation.clear_caches()
@@ -0,0 +1,92 @@
+"""
+요청 시간 예산(deadline) 테스트
+"""
+from dataclasses import replace
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import text
+
+from bookstar.config import settings
+from bookstar.database.connection import _strip_timeout_hint  # 이벤트 등록
+from bookstar.utils.deadline import (
+    Deadline,
+    DeadlineExceeded,
+    deadline_scope,
+    get_current_deadline,
+)
+
+# 수억 단계를 도는 재귀 쿼리 (실행 시간 제한이 없으면 수십 초)
+SLOW_QUERY = text(
+    "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n "
+    "WHERE i < 500000000) SELECT count(*) FROM n"
+)
+
+
+def test_unlimited_deadline_never_expires():
+    """예산이 0이면 제한 없이 남은 시간이 inf인지 테스트"""
+    deadline = Deadline(0)
+    assert not deadline.limited
+    assert deadline.remaining_ms() == float('inf')
+    assert not deadline.expired()
+    assert deadline.statement_timeout_ms(50) is None
+
+
+def test_statement_timeout_follows_remaining_budget():
+    """쿼리 제한 시간이 남은 예산(최소값 이상, 10ms 단위 올림)인지 테스트"""
+    deadline = Deadline(300, started_at=0.0)
+    with patch('bookstar.utils.deadline.time.perf_counter', return_value=0.0955):
+        assert deadline.remaining_ms() == pytest.approx(204.5)
+        assert deadline.statement_timeout_ms(50) == 210
+    with patch('bookstar.utils.deadline.time.perf_counter', return_value=1.0):
+        assert deadline.expired()
+        assert deadline.statement_timeout_ms(50) == 50
+
+
+def test_precheck_and_query_timeout_messages_differ():
+    """단계 시작 전 확인과 쿼리 중단이 서로 다른 메시지인지 테스트"""
+    deadline = Deadline(300, started_at=0.0)
+    with patch('bookstar.utils.deadline.time.perf_counter', return_value=0.28):
+        with pytest.raises(DeadlineExceeded) as precheck:
+            deadline.check(50)
+
+    assert precheck.value.minimum_ms == 50
+    assert "단계를 시작하지 않음" in str(precheck.value)
+    assert "쿼리 중단" not in str(precheck.value)
+    assert "쿼리 중단" in str(DeadlineExceeded(300, 310))
+
+
+def test_timeout_hint_is_stripped_before_fingerprint():
+    """MAX_EXECUTION_TIME 힌트 값이 달라도 같은 쿼리문으로 되돌리는지 테스트"""
+    statements = [
+        f"SELECT /*+ MAX_EXECUTION_TIME({ms}) */ id FROM book WHERE id = %s"
+        for ms in (120, 340)
+    ]
+
+    assert {_strip_timeout_hint(s) for s in statements} == {
+        "SELECT id FROM book WHERE id = %s"
+    }
+    assert _strip_timeout_hint("UPDATE book SET x = 1") == "UPDATE book SET x = 1"
+
+
+def test_deadline_scope_sets_current_deadline():
+    """deadline_scope 안에서만 현재 deadline이 설정되는지 테스트"""
+    assert get_current_deadline() is None
+    with deadline_scope(100) as deadline:
+        assert get_current_deadline() is deadline
+        deadline.degrade("collaborative")
+        deadline.degrade("collaborative")
+    assert get_current_deadline() is None
+    assert deadline.degraded == ["collaborative"]
+
+
+def test_sqlite_statement_timeout_from_deadline(synthetic_engine):
+    """deadline 안의 느린 SQLite 쿼리가 남은 예산만큼만 실행되고 중단되는지 테스트"""
+    config = replace(settings.recommendation, min_statement_timeout_ms=1.0)
+    with patch.object(type(settings), 'recommendation', config):
+        with synthetic_engine.connect() as conn:
+            # DB 오류(SQLAlchemyError)가 아닌 DeadlineExceeded로 실패
+            with deadline_scope(1), pytest.raises(DeadlineExceeded):
+                conn.execute(SLOW_QUERY)
+            # deadline 밖에서는 제한 해제
+            assert conn.execute(text("SELECT 1")).scalar() == 1
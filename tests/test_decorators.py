@@ -166,6 +166,23 @@ def test_different_thresholds(threshold_ms):
     assert result == "done"
 
 
+def test_threshold_read_at_call_time():
+    """임계값 함수를 넘기면 호출할 때마다 다시 읽는지 테스트"""
+    threshold = {'ms': 10_000}
+    logger = MagicMock()
+
+    @log_execution_time(logger=logger, threshold_ms=lambda: threshold['ms'])
+    def test_function():
+        return "done"
+
+    test_function()
+    assert not logger.log.called
+
+    threshold['ms'] = 0
+    test_function()
+    assert logger.log.called
+
+
 def test_decorator_with_exception():
     """예외 발생 시 데코레이터 동작 테스트"""
     
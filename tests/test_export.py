@@ -0,0 +1,110 @@
+"""
+RecommenderModel int8 TorchScript 내보내기 테스트
+"""
+from dataclasses import replace
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+import torch
+from sqlalchemy.orm import Session
+
+from bookstar.config import settings
+from bookstar.jobs import export as export_job
+from bookstar.jobs import train as train_job
+from bookstar.models.recommender import RecommenderModel
+from bookstar.services import model_registry
+from bookstar.services.catalog import build_catalog
+from bookstar.services.model_registry import LocalModelStore, ModelRegistry
+
+
+@pytest.fixture
+def registry(tmp_path):
+    registry = ModelRegistry(LocalModelStore(tmp_path / "models"))
+    model_registry.set_registry(registry)
+    yield registry
+    model_registry.set_registry(None)
+
+
+@pytest.fixture
+def catalog_size(synthetic_engine):
+    with Session(synthetic_engine) as db:
+        return build_catalog(db).size
+
+
+def test_quantized_script_matches_float_model():
+    """int8 TorchScript 모듈의 점수가 float 모델과 거의 같은지 테스트"""
+    torch.manual_seed(0)
+    model = RecommenderModel(50).eval()
+    exported = export_job.script_model(export_job.quantize_model(model))
+    inputs = (torch.rand(4, 50) > 0.7).float()
+
+    with torch.inference_mode():
+        difference = (model(inputs) - exported(inputs)).abs().max().item()
+
+    assert isinstance(exported, torch.jit.ScriptModule)
+    assert difference < 0.05
+    assert isinstance(model.fc1, torch.nn.Linear)  # 원본은 그대로
+
+
+def test_compare_models_reports_overlap():
+    """같은 모델끼리 비교하면 일치율 1, recall 감소 0인지 테스트"""
+    model = RecommenderModel(30)
+    batches = [[(np.array([1, 2]), np.array([3])), (np.array([4]), np.array([5]))]]
+
+    comparison = export_job.compare_models(model, model, batches, k=5)
+
+    assert comparison['overlap@5'] == 1.0
+    assert comparison['recall_drop'] == 0.0
+    assert comparison['reference']['eval_users'] == 2
+
+
+def test_exported_model_loads_without_class(
+    synthetic_engine, registry, catalog_size
+):
+    """내보낸 모델이 레지스트리에서 TorchScript로 로드되어 추천에 쓰이는지 테스트"""
+    torch.manual_seed(0)
+    source = registry.save(RecommenderModel(catalog_size))
+    registry.promote(source)
+    config = replace(settings.training, export_min_overlap=0.0)
+
+    with patch.object(type(settings), 'training', config):
+        summary = export_job.export_model(synthetic_engine, promote=True)
+
+    assert summary['source_version'] == source
+    assert summary['exported_bytes'] < summary['float_bytes']
+    assert registry.resolve() == summary['version']
+    meta = registry.metadata(summary['version'])
+    assert meta['model_type'] == "torchscript"
+    assert meta['file'] == "model.ts"
+
+    registry.clear()
+    loaded = registry.load()
+    assert isinstance(loaded, torch.jit.ScriptModule)
+    assert not isinstance(loaded, RecommenderModel)
+    (columns, scores), = train_job.recommend_rows(loaded, [np.array([0, 1])], 5)
+    assert len(columns) == 5
+    assert not {0, 1} & set(columns.tolist())
+
+
+def test_export_rejects_inaccurate_model(synthetic_engine, registry, catalog_size):
+    """정확도 기준을 통과하지 못하면 저장하지 않는지 테스트"""
+    registry.promote(registry.save(RecommenderModel(catalog_size)))
+    config = replace(settings.training, export_min_overlap=1.0)
+
+    with (
+        patch.object(type(settings), 'training', config),
+        patch.object(export_job, 'compare_models', return_value={
+            'reference': {}, 'candidate': {}, 'overlap@10': 0.5, 'recall_drop': 0.0,
+        }),
+        pytest.raises(export_job.ExportError, match="일치율"),
+    ):
+        export_job.export_model(synthetic_engine, k=10)
+
+    assert len(list((registry.store.root / "versions").iterdir())) == 1
+
+
+def test_export_requires_autoencoder(synthetic_engine, registry):
+    """원본 모델이 없으면 ExportError를 내는지 테스트"""
+    with pytest.raises(export_job.ExportError):
+        export_job.export_model(synthetic_engine)
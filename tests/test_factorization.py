@@ -0,0 +1,121 @@
+"""
+행렬 분해(ALS) 모델 테스트
+"""
+import numpy as np
+import pytest
+from scipy.sparse import csr_matrix
+
+from bookstar.models.factorization import FactorizationModel, train_als
+from bookstar.services import catalog, inference, model_registry
+from bookstar.services.model_registry import LocalModelStore, ModelRegistry
+
+
+@pytest.fixture(scope="module")
+def model():
+    """두 그룹(0~9번 도서, 10~19번 도서)으로 나뉜 사용자로 학습한 모델"""
+    rng = np.random.default_rng(0)
+    rows = []
+    for user in range(60):
+        group = 0 if user < 30 else 10
+        rows.append(group + rng.choice(10, size=5, replace=False))
+    indptr = np.arange(0, 5 * len(rows) + 1, 5)
+    matrix = csr_matrix(
+        (np.ones(5 * len(rows)), np.concatenate(rows), indptr), shape=(60, 20)
+    )
+    return train_als(matrix, factors=2, iterations=10)
+
+
+def test_recommends_within_group(model):
+    """같은 그룹의 도서를 추천하고 이미 본 도서는 제외하는지 테스트"""
+    columns, scores = model.recommend(np.array([0, 1, 2]), 5)
+
+    assert len(columns) == 5
+    assert set(columns.tolist()) <= set(range(3, 10))
+    assert np.all(np.diff(scores) <= 0)
+
+
+def test_recommend_handles_small_catalog(model):
+    """남은 도서보다 많이 요청하거나 이력이 없는 경우 테스트"""
+    columns, _ = model.recommend(np.arange(18), 5)
+    assert sorted(columns.tolist()) == [18, 19]
+
+    batch = model.recommend_batch([np.array([], dtype=np.int64), np.arange(20)], 3)
+    assert len(batch[0][0]) == 3
+    assert len(batch[1][0]) == 0
+
+
+@pytest.mark.parametrize("kind", ["float16", "int8"])
+def test_quantized_model_matches_float(model, kind):
+    """양자화한 도서 행렬이 작고 점수/순위가 float32와 거의 같은지 테스트"""
+    quantized = model.quantize(kind)
+    users = model.user_vectors([np.array([0, 1]), np.array([12, 15])])
+
+    assert quantized.quantization == kind
+    assert quantized.nbytes < model.nbytes
+    np.testing.assert_allclose(
+        quantized.scores(users), model.scores(users), rtol=0.05, atol=0.05
+    )
+    for columns in ([0, 1], [12, 15]):
+        expected, _ = model.recommend(np.array(columns), 3)
+        actual, _ = quantized.recommend(np.array(columns), 3)
+        assert set(actual.tolist()) & set(expected.tolist())
+
+
+def test_serialization_round_trip(model):
+    """직렬화 후에도 같은 모델/해시인지 테스트"""
+    quantized = model.quantize("int8")
+
+    restored = FactorizationModel.from_bytes(quantized.to_bytes())
+
+    assert restored.content_hash() == quantized.content_hash()
+    assert restored.content_hash() != model.content_hash()
+    assert restored.quantization == "int8"
+    np.testing.assert_array_equal(restored.item_factors, quantized.item_factors)
+
+
+def test_registry_stores_factorization_model(tmp_path, model):
+    """모델 레지스트리에 저장/로드되는지 테스트"""
+    registry = ModelRegistry(LocalModelStore(tmp_path))
+
+    version = registry.save(model.quantize("float16"))
+    loaded = registry.load(version)
+
+    assert registry.metadata(version)['model_type'] == "factorization"
+    assert isinstance(loaded, FactorizationModel)
+    assert loaded.quantization == "float16"
+    assert loaded.recommend(np.array([0, 1]), 3)[0].tolist() == (
+        model.quantize("float16").recommend(np.array([0, 1]), 3)[0].tolist()
+    )
+
+
+def test_serving_uses_factorization_model(tmp_path, synthetic_session):
+    """레지스트리의 현재 모델이 ALS면 배처 없이 바로 추천하는지 테스트"""
+    catalog.load_snapshots(synthetic_session)
+    snapshot = catalog.get_catalog()
+    index = catalog.get_neighbor_index()
+    rows = [
+        snapshot.rows_for_aladin_ids(index.books_of([uid]))
+        for uid in index.member_ids.tolist()
+    ]
+    matrix = csr_matrix(
+        (
+            np.ones(sum(len(r) for r in rows)),
+            np.concatenate(rows),
+            np.concatenate([[0], np.cumsum([len(r) for r in rows])]),
+        ),
+        shape=(len(rows), snapshot.size),
+    )
+    registry = ModelRegistry(LocalModelStore(tmp_path))
+    model_registry.set_registry(registry)
+    registry.promote(registry.save(train_als(matrix, factors=4, iterations=3)))
+    try:
+        uid = int(index.member_ids[0])
+        recommended = inference.recommend_with_model(uid, 5)
+        batcher = inference._batcher
+    finally:
+        model_registry.set_registry(None)
+        catalog.reset_snapshots()
+
+    assert batcher is None
+    assert len(recommended) == 5
+    assert not set(snapshot.book_ids[rows[0]].tolist()) & set(recommended)
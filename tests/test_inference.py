@@ -0,0 +1,189 @@
+"""
+RecommenderModel 추론 테스트
+"""
+import threading
+from dataclasses import replace
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+import torch
+
+from bookstar.config import settings
+from bookstar.models.recommender import RecommenderModel
+from bookstar.services import catalog, inference, model_registry
+from bookstar.services.inference import (
+    BatcherStopped,
+    InferenceBatcher,
+    InferenceRequest,
+    build_inputs,
+    score_topk,
+)
+from bookstar.services.model_registry import LocalModelStore, ModelRegistry
+from bookstar.services.recommendation import (
+    RecommendationService,
+    clear_caches,
+    recommend_with_pytorch,
+)
+
+
+@pytest.fixture
+def model():
+    torch.manual_seed(0)
+    return RecommenderModel(20).eval()
+
+
+def test_build_inputs_is_binary_batch():
+    """열 번호로 (batch, num_books) 이진 입력을 만드는지 테스트"""
+    requests = [
+        InferenceRequest(np.array([1, 3]), 2),
+        InferenceRequest(np.array([], dtype=np.int64), 2),
+        InferenceRequest(np.array([0]), 2),
+    ]
+
+    inputs = build_inputs(requests, 5)
+
+    assert inputs.shape == (3, 5)
+    assert inputs[0].tolist() == [0, 1, 0, 1, 0]
+    assert inputs[1].sum() == 0
+    assert inputs[2].tolist() == [1, 0, 0, 0, 0]
+
+
+def test_score_topk_masks_inputs(model):
+    """입력/제외 열을 빼고 점수 순 상위 k개를 반환하는지 테스트"""
+    columns = np.array([0, 5, 7])
+    request = InferenceRequest(columns, 5, exclude=np.array([2]))
+
+    top_columns, top_scores = score_topk(model, [request])[0]
+
+    with torch.inference_mode():
+        inputs = torch.zeros(1, 20)
+        inputs[0, columns] = 1
+        scores = model(inputs)[0].numpy()
+    scores[[0, 5, 7, 2]] = -np.inf
+    assert top_columns.tolist() == np.argsort(-scores)[:5].tolist()
+    assert np.all(np.diff(top_scores) <= 0)
+
+
+def test_score_topk_batch_matches_single(model):
+    """묶음 계산 결과가 한 건씩 계산한 결과와 같은지 테스트"""
+    requests = [
+        InferenceRequest(np.array([1, 2]), 3),
+        InferenceRequest(np.array([4]), 6),
+        InferenceRequest(np.arange(18), 5),  # 남은 열이 2개뿐
+    ]
+
+    batched = score_topk(model, requests)
+
+    for request, (columns, _) in zip(requests, batched, strict=True):
+        expected, _ = score_topk(
+            model, [InferenceRequest(request.columns, request.k)]
+        )[0]
+        assert columns.tolist() == expected.tolist()
+    assert len(batched[2][0]) == 2
+
+
+def test_batcher_groups_concurrent_requests(model):
+    """동시에 들어온 요청을 묶어서 계산하는지 테스트"""
+    batcher = InferenceBatcher(model, max_batch_size=16, max_wait_ms=50)
+    results = {}
+
+    def worker(i):
+        results[i] = batcher.recommend(np.array([i]), 3, timeout=5)[0].tolist()
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        batcher.stop()
+
+    assert batcher.batched_requests == 8
+    assert batcher.batches < 8
+    for i, columns in results.items():
+        expected, _ = score_topk(model, [InferenceRequest(np.array([i]), 3)])[0]
+        assert columns == expected.tolist()
+
+
+def test_stopped_batcher_rejects_requests(model):
+    """stop() 후 submit이 스레드를 다시 시작하지 않고 거절되는지 테스트"""
+    batcher = InferenceBatcher(model, max_wait_ms=0)
+    batcher.recommend(np.array([1]), 3, timeout=5)
+    batcher.stop()
+
+    with pytest.raises(BatcherStopped):
+        batcher.submit(np.array([1]), 3)
+    assert batcher._thread is None
+
+
+def test_recommend_with_pytorch(model):
+    """하위 호환 함수가 도서 ID로 추천을 반환하는지 테스트"""
+    all_books = [f"book-{i}" for i in range(20)]
+
+    recommended = recommend_with_pytorch(model, [0, 1], all_books, top_n=4)
+
+    assert len(recommended) == 4
+    assert not {"book-0", "book-1"} & set(recommended)
+
+
+def test_recommend_with_model(tmp_path, synthetic_session):
+    """레지스트리의 현재 모델과 스냅샷으로 추천하는지 테스트"""
+    assert inference.recommend_with_model(1, 5) is None
+
+    catalog.load_snapshots(synthetic_session)
+    snapshot = catalog.get_catalog()
+    index = catalog.get_neighbor_index()
+    registry = ModelRegistry(LocalModelStore(tmp_path))
+    model_registry.set_registry(registry)
+    try:
+        assert inference.recommend_with_model(1, 5) is None  # 등록된 모델 없음
+
+        registry.promote(registry.save(RecommenderModel(snapshot.size)))
+        uid = int(index.member_ids[0])
+        recommended = inference.recommend_with_model(uid, 5)
+
+        own = snapshot.book_ids[
+            snapshot.rows_for_aladin_ids(index.books_of([uid]))
+        ].tolist()
+        assert len(recommended) == 5
+        assert not set(own) & set(recommended)
+
+        # 카탈로그와 크기가 다른 모델은 사용하지 않음
+        registry.promote(registry.save(RecommenderModel(snapshot.size + 1)))
+        assert inference.recommend_with_model(uid, 5) is None
+    finally:
+        inference.reset_batcher()
+        model_registry.set_registry(None)
+        catalog.reset_snapshots()
+
+
+def test_serve_model_routes_collaborative_stage(tmp_path, synthetic_session):
+    """serve_model이면 협업 필터링 단계가 레지스트리 모델로 계산되는지 테스트"""
+    catalog.load_snapshots(synthetic_session)
+    snapshot = catalog.get_catalog()
+    registry = ModelRegistry(LocalModelStore(tmp_path))
+    model_registry.set_registry(registry)
+    registry.promote(registry.save(RecommenderModel(snapshot.size)))
+    config = replace(settings.inference, serve_model=True)
+    try:
+        clear_caches()
+        service = RecommendationService(synthetic_session)
+        uid = int(catalog.get_neighbor_index().member_ids[0])
+        read_list, want_list = service.get_user_books_data(uid)
+        with patch.object(type(settings), 'inference', config), patch.object(
+            service, 'get_similar_users'
+        ) as similar_users:
+            result = service.get_collaborative_recommendations(uid, 5)
+        expected = inference.recommend_with_model(uid, 5, read_list + want_list)
+    finally:
+        inference.reset_batcher()
+        model_registry.set_registry(None)
+        catalog.reset_snapshots()
+        clear_caches()
+
+    similar_users.assert_not_called()
+    assert result['book_id'].tolist() == expected
+    known = snapshot.book_ids[snapshot.rows_for_aladin_ids(read_list + want_list)]
+    assert not set(known.tolist()) & set(expected)
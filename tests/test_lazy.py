@@ -0,0 +1,51 @@
+"""
+지연 임포트와 시작 비용 테스트
+"""
+import sys
+
+import pytest
+
+from benchmarks.startup import HEAVY_MODULES, compare, measure_once
+from bookstar.utils.lazy import is_loaded, lazy_import
+
+
+def test_lazy_import_defers_loading():
+    """첫 속성 접근 전에는 모듈이 로드되지 않는지 테스트"""
+    sys.modules.pop('colorsys', None)
+    module = lazy_import('colorsys')
+    try:
+        assert not is_loaded(module)
+        assert module.rgb_to_hsv(1.0, 0.0, 0.0)[0] == 0.0
+        assert is_loaded(module)
+    finally:
+        sys.modules.pop('colorsys', None)
+
+
+def test_lazy_import_missing_module():
+    """설치되지 않은 모듈은 임포트 시점에 바로 실패하는지 테스트"""
+    with pytest.raises(ModuleNotFoundError):
+        lazy_import('bookstar_module_that_does_not_exist')
+
+
+def test_recommender_model_compat_import():
+    """기존 경로로 RecommenderModel을 임포트할 수 있는지 테스트"""
+    from bookstar.models.models import RecommenderModel
+    from bookstar.models.recommender import RecommenderModel as Moved
+
+    assert RecommenderModel is Moved
+
+
+def test_app_import_skips_heavy_modules():
+    """bookstar.main 임포트가 torch/sklearn/pandas를 로드하지 않는지 테스트"""
+    result = measure_once("bookstar.main")
+    assert result['loaded'] == []
+    assert set(HEAVY_MODULES) >= {'torch', 'sklearn', 'pandas'}
+
+
+def test_startup_compare():
+    """기준선 비교 문자열 생성 테스트"""
+    current = {'results': {'import_ms_median': 500.0, 'rss_mb_median': 80.0}}
+    baseline = {'results': {'import_ms_median': 4000.0, 'rss_mb_median': 650.0}}
+    lines = compare(current, baseline)
+    assert len(lines) == 2
+    assert "-87.5%" in lines[0]
@@ -0,0 +1,59 @@
+"""
+HTTP 부하 테스트 도구 테스트
+"""
+import argparse
+from collections import Counter
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.load_test import (
+    LoadResults,
+    build_population,
+    build_report,
+    parse_mix,
+)
+
+
+def test_parse_mix():
+    """사용자 그룹 비율 파싱 테스트"""
+    assert parse_mix("cold=0.5,heavy=0.5") == {'cold': 0.5, 'heavy': 0.5}
+
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_mix("unknown=1.0")
+
+
+def test_build_population(synthetic_engine):
+    """cold/regular/heavy 사용자 그룹 구성 테스트"""
+    population = build_population(
+        sessionmaker(bind=synthetic_engine), {'cold': 0.2, 'regular': 0.8}
+    )
+
+    cold = set(population.groups['cold'])
+    heavy = set(population.groups['heavy'])
+    regular = set(population.groups['regular'])
+    assert cold and heavy and regular
+    assert not (cold & heavy) and not (cold & regular) and not (heavy & regular)
+
+    sample = population.sampler(seed=1)
+    groups = Counter(sample()[0] for _ in range(200))
+    # 비율이 0인 heavy 그룹은 선택되지 않음
+    assert set(groups) == {'cold', 'regular'}
+
+
+def test_build_report():
+    """처리량, 오류율, 그룹별 지연시간 요약 테스트"""
+    results = LoadResults()
+    results.latencies_ms['cold'].extend([10.0, 20.0])
+    results.latencies_ms['heavy'].extend([30.0, 40.0])
+    results.status_codes.update({200: 3, 500: 1})
+    results.errors['ConnectError'] += 1
+    results.loop_lag_ms.extend([0.5, 1.5])
+
+    report = build_report(results, elapsed_s=2.0)
+
+    assert report['requests'] == 5
+    assert report['throughput_rps'] == 2.0
+    assert report['error_rate'] == 0.4
+    assert set(report['latency_by_group']) == {'cold', 'heavy'}
+    assert report['event_loop_lag']['max_ms'] == 1.5
@@ -3,7 +3,9 @@
 """
 import logging
 import tempfile
+from dataclasses import replace
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -95,9 +97,10 @@ def _cleanup_logging_handlers():
 def test_logging_setup():
     """로깅 시스템이 정상적으로 초기화되는지 테스트"""
     with tempfile.TemporaryDirectory() as temp_dir:
-        # 임시 로그 디렉토리로 설정
-        original_log_dir = settings.logging['log_dir']
-        settings.logging['log_dir'] = temp_dir
+        # 임시 로그 디렉토리로 설정 (설정 스냅샷은 불변이므로 교체본을 주입)
+        log_settings = replace(settings.logging, log_dir=temp_dir)
+        patcher = patch.object(type(settings), 'logging', log_settings)
+        patcher.start()
         
         try:
             # 로깅 시스템 초기화
@@ -120,7 +123,7 @@ def test_logging_setup():
             
         finally:
             # 원래 설정 복원
-            settings.logging['log_dir'] = original_log_dir
+            patcher.stop()
             # 핸들러 정리
             _cleanup_logging_handlers()
 
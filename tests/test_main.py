@@ -1,9 +1,18 @@
 """
 메인 API 테스트
 """
+import asyncio
+from dataclasses import replace
+from unittest.mock import patch
+
+import pytest
 from fastapi.testclient import TestClient
 
+from bookstar.config import settings
+from bookstar.database.connection import get_db
 from bookstar.main import app
+from bookstar.services.recommendation import get_db_breaker, reset_db_breaker
+from bookstar.services.result_cache import get_result_cache, reset_result_cache
 
 
 def test_app_creation():
@@ -33,4 +42,148 @@ def test_recommend_books_endpoint():
         first_recommendation = recommendations[0]
         assert "book_id" in first_recommendation
         # 새로운 응답 형태에서는 book_id만 포함됨
-        assert len(first_recommendation) == 1 
\ No newline at end of file
+        assert len(first_recommendation) == 1 
+
+def test_batch_recommend_endpoint(synthetic_session):
+    """배치 추천 엔드포인트가 사용자별 추천 목록을 반환하는지 테스트"""
+    def override_get_db():
+        yield synthetic_session
+
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        client = TestClient(app)
+        response = client.post("/recommend_books/batch", json={"user_ids": [1, 2]})
+        assert response.status_code == 200
+        recommendations = response.json()["recommendations"]
+        assert set(recommendations) == {"1", "2"}
+        for books in recommendations.values():
+            assert all(set(book) == {"book_id"} for book in books)
+
+        empty = client.post("/recommend_books/batch", json={"user_ids": []})
+        assert empty.status_code == 422
+
+        # 계산은 이벤트 루프 밖의 스레드에서 실행
+        def no_running_loop(*args):
+            with pytest.raises(RuntimeError):
+                asyncio.get_running_loop()
+            return {}
+
+        with patch('bookstar.main.recommend_books_batch', no_running_loop):
+            response = client.post("/recommend_books/batch", json={"user_ids": [1]})
+        assert response.status_code == 200
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+
+
+def test_recommend_endpoint_reports_singleflight(synthetic_session):
+    """단건 추천이 singleflight를 거쳐 계산되고 /metrics에 횟수가 노출되는지 테스트"""
+    def override_get_db():
+        yield synthetic_session
+
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        client = TestClient(app)
+        before = client.get("/metrics").json()["singleflight"]
+        calls = before.get("recommend_books", {}).get("calls", 0)
+
+        response = client.post("/recommend_books", json={"user_id": 1})
+
+        assert response.status_code == 200
+        books = response.json()["recommendations"]
+        assert all(set(book) == {"book_id"} for book in books)
+        stats = client.get("/metrics").json()["singleflight"]["recommend_books"]
+        assert stats["calls"] == calls + 1
+        assert stats["in_flight"] == 0
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+
+
+def test_recommend_endpoint_serves_stale_and_refreshes(synthetic_session):
+    """soft TTL이 지난 결과를 바로 반환하고 백그라운드에서 다시 계산하는지 테스트"""
+    def override_get_db():
+        yield synthetic_session
+
+    config = replace(settings.result_cache, soft_ttl_s=0.0)
+    app.dependency_overrides[get_db] = override_get_db
+    reset_result_cache()
+    try:
+        with patch.object(type(settings), 'result_cache', config):
+            client = TestClient(app)
+            first = client.post("/recommend_books", json={"user_id": 1})
+            second = client.post("/recommend_books", json={"user_id": 1})
+
+            assert second.status_code == 200
+            assert second.json() == first.json()
+            cache = get_result_cache()
+            cache.close()  # 백그라운드 갱신이 끝날 때까지 대기
+            stats = client.get("/metrics").json()["result_cache"]
+        assert stats["misses"] == 1
+        assert stats["stale_hits"] == 1
+        assert stats["refreshes"] == 1
+        assert stats["refresh_errors"] == 0
+    finally:
+        reset_result_cache()
+        app.dependency_overrides.pop(get_db, None)
+
+
+def test_recommend_endpoint_serves_last_result_when_circuit_open(synthetic_session):
+    """회로가 열리면 DB 없이 마지막 추천 결과로 응답하는지 테스트"""
+    def override_get_db():
+        yield synthetic_session
+
+    cache_config = replace(settings.result_cache, soft_ttl_s=0.0, hard_ttl_s=0.0)
+    app.dependency_overrides[get_db] = override_get_db
+    reset_result_cache()
+    reset_db_breaker()
+    try:
+        with patch.object(type(settings), 'result_cache', cache_config):
+            client = TestClient(app)
+            first = client.post("/recommend_books", json={"user_id": 1})
+            breaker = get_db_breaker()
+            for _ in range(breaker.failure_threshold):
+                breaker.record_failure()
+
+            second = client.post("/recommend_books", json={"user_id": 1})
+            metrics = client.get("/metrics").json()
+
+        assert second.status_code == 200
+        assert first.json()["recommendations"]
+        assert second.json()["recommendations"] == first.json()["recommendations"]
+        assert second.json()["degraded"] == ["database"]
+        assert metrics["circuit_breaker"]["state"] == "open"
+        assert metrics["circuit_breaker"]["rejected"] == 1
+    finally:
+        reset_db_breaker()
+        reset_result_cache()
+        app.dependency_overrides.pop(get_db, None)
+
+
+def test_recommend_endpoint_reports_degraded_stages(synthetic_session):
+    """시간 예산을 넘기면 생략한 단계를 응답에 담고 stale로 저장하는지 테스트"""
+    def override_get_db():
+        yield synthetic_session
+
+    app.dependency_overrides[get_db] = override_get_db
+    reset_result_cache()
+    try:
+        client = TestClient(app)
+        first = client.post(
+            "/recommend_books", json={"user_id": 1, "deadline_ms": 0.000001}
+        )
+        assert first.status_code == 200
+        assert first.json()["degraded"] == ["collaborative"]
+        assert first.json()["recommendations"]
+
+        # 생략된 결과는 다음 요청에서 바로 반환되고 백그라운드로 다시 계산됨
+        second = client.post("/recommend_books", json={"user_id": 1})
+        get_result_cache().close()
+        stats = client.get("/metrics").json()["result_cache"]
+        assert second.json() == first.json()
+        assert stats["stale_hits"] == 1
+        assert stats["refreshes"] == 1
+
+        invalid = client.post("/recommend_books", json={"user_id": 1, "deadline_ms": 0})
+        assert invalid.status_code == 422
+    finally:
+        reset_result_cache()
+        app.dependency_overrides.pop(get_db, None)
@@ -0,0 +1,125 @@
+"""
+모델 레지스트리 테스트
+"""
+import pytest
+import torch
+
+from bookstar.models.recommender import RecommenderModel
+from bookstar.services import model_registry
+from bookstar.services.model_registry import (
+    LocalModelStore,
+    MirroredModelStore,
+    ModelRegistry,
+    ModelRegistryError,
+)
+from bookstar.services.recommendation import cache_model, get_cached_model
+
+
+def _model(seed: int, num_books: int = 12) -> RecommenderModel:
+    torch.manual_seed(seed)
+    return RecommenderModel(num_books)
+
+
+def test_save_is_content_addressed(tmp_path):
+    """같은 가중치는 같은 버전, 다른 가중치는 다른 버전으로 저장되는지 테스트"""
+    registry = ModelRegistry(LocalModelStore(tmp_path))
+
+    version = registry.save(_model(0))
+
+    assert registry.save(_model(0)) == version
+    assert registry.save(_model(1)) != version
+    assert registry.metadata(version)['num_books'] == 12
+
+
+def test_promote_and_load(tmp_path):
+    """참조 승격 후 로드한 모델이 같은 출력을 내는지 테스트"""
+    registry = ModelRegistry(LocalModelStore(tmp_path))
+    model = _model(0)
+    version = registry.save(model)
+
+    assert registry.resolve() is None
+    with pytest.raises(ModelRegistryError):
+        registry.load()
+    with pytest.raises(ModelRegistryError):
+        registry.promote("missing")
+
+    registry.promote(version)
+    loaded = registry.load()
+
+    assert registry.resolve() == version
+    assert not loaded.training
+    x = torch.rand(2, 12)
+    with torch.no_grad():
+        assert torch.equal(loaded(x), model.eval()(x))
+    # 새 레지스트리(다른 워커)에서도 같은 버전을 로드
+    other = ModelRegistry(LocalModelStore(tmp_path))
+    assert other.resolve() == version
+
+
+def test_lru_keeps_loaded_models(tmp_path):
+    """로드한 모델을 재사용하고 최대 개수를 넘으면 오래된 것부터 제거하는지 테스트"""
+    registry = ModelRegistry(LocalModelStore(tmp_path), max_loaded_models=2)
+    versions = [registry.save(_model(seed)) for seed in range(3)]
+
+    first = registry.load(versions[0])
+    assert registry.load(versions[0]) is first
+
+    registry.load(versions[1])
+    registry.load(versions[0])
+    registry.load(versions[2])
+
+    assert registry.loaded_versions() == [versions[0], versions[2]]
+
+
+def test_corrupt_weights_are_rejected(tmp_path):
+    """가중치 파일이 다른 내용으로 바뀌면 로드를 거부하는지 테스트"""
+    store = LocalModelStore(tmp_path)
+    registry = ModelRegistry(store)
+    version = registry.save(_model(0))
+    other = registry.save(_model(1))
+    store.write_bytes(
+        f"versions/{version}/model.pt",
+        store.read_bytes(f"versions/{other}/model.pt"),
+    )
+
+    with pytest.raises(ModelRegistryError, match="해시"):
+        registry.load(version)
+
+
+def test_mirrored_store_backfills_primary(tmp_path):
+    """미러(S3 대역)에만 있는 버전을 받아와 로컬에 채우는지 테스트"""
+    remote = LocalModelStore(tmp_path / "remote")
+    publisher = ModelRegistry(MirroredModelStore(
+        LocalModelStore(tmp_path / "builder"), remote
+    ))
+    version = publisher.save(_model(0))
+    publisher.promote(version)
+
+    local = LocalModelStore(tmp_path / "worker")
+    worker = ModelRegistry(MirroredModelStore(local, remote))
+
+    assert worker.load().fc1.in_features == 12
+    assert local.exists(f"versions/{version}/model.pt")
+    # 참조는 로컬에 캐시하지 않음 (미러에서 승격하면 바로 반영)
+    assert not local.exists("refs/current")
+
+
+def test_local_store_rejects_escaping_keys(tmp_path):
+    """저장소 밖을 가리키는 키를 거부하는지 테스트"""
+    with pytest.raises(ModelRegistryError):
+        LocalModelStore(tmp_path / "store").write_bytes("../outside", b"x")
+
+
+def test_cache_model_round_trip(tmp_path):
+    """cache_model/get_cached_model이 레지스트리를 사용하는지 테스트"""
+    model_registry.set_registry(ModelRegistry(LocalModelStore(tmp_path)))
+    try:
+        assert get_cached_model(None, "current") is None
+
+        version = cache_model("current", _model(0))
+
+        cached = get_cached_model(None, "current")
+        assert cached is get_cached_model(None, version)
+        assert model_registry.get_registry().resolve("current") == version
+    finally:
+        model_registry.set_registry(None)
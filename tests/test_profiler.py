@@ -0,0 +1,130 @@
+"""
+샘플링 프로파일러 테스트
+"""
+import os
+import threading
+import time
+from dataclasses import replace
+from unittest.mock import patch
+
+from bookstar.config import settings
+from bookstar.utils import profiler
+from bookstar.utils.profiler import (
+    StackSampler,
+    _enforce_disk_quota,
+    dump_profile,
+    profile_request,
+)
+
+
+def busy_function(duration_s: float) -> int:
+    """샘플링 대상이 될 CPU 사용 함수"""
+    total = 0
+    end_time = time.perf_counter() + duration_s
+    while time.perf_counter() < end_time:
+        total += 1
+    return total
+
+
+def test_stack_sampler_collects_stacks():
+    """샘플러가 대상 스레드의 콜스택을 수집하는지 테스트"""
+    sampler = StackSampler(threading.get_ident(), interval_ms=1)
+    sampler.start()
+    busy_function(0.05)
+    sampler.stop()
+
+    assert sampler.total_samples > 0
+    top = sampler.top_functions(top_n=1000)
+    hottest = max(top, key=lambda item: item[1])
+    assert "busy_function" in hottest[0]
+    assert "busy_function" in sampler.collapsed()
+
+
+def test_concurrent_samplers_share_one_thread():
+    """동시에 프로파일링하는 스레드들이 샘플링 스레드 하나를 함께 쓰는지 테스트"""
+    ready, release = threading.Barrier(5), threading.Event()
+    samplers = []
+
+    def worker():
+        sampler = StackSampler(threading.get_ident(), interval_ms=1)
+        samplers.append(sampler)
+        sampler.start()
+        ready.wait(5)
+        busy_function(0.03)
+        release.wait(5)
+        sampler.stop()
+
+    def sampler_threads():
+        return [t for t in threading.enumerate() if t.name == "stack-sampler"]
+
+    # 앞선 테스트의 샘플링 스레드가 끝날 때까지 기다림
+    for thread in sampler_threads():
+        thread.join(5)
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    ready.wait(5)
+    running = sampler_threads()
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(running) == 1
+    assert sum(sampler.total_samples for sampler in samplers) > 0
+    assert profiler._shared_sampler.active_count() == 0
+
+
+def test_dump_profile_writes_files(tmp_path):
+    """요약 파일과 collapsed-stack 파일이 요청 ID로 저장되는지 테스트"""
+    sampler = StackSampler(threading.get_ident())
+    sampler.stacks[("main (app.py:1)", "work (app.py:10)")] = 3
+
+    summary_path = dump_profile(sampler, "req123", "recommend_books", 12.5, tmp_path)
+
+    assert summary_path.name.endswith("_req123.txt")
+    assert "work (app.py:10)" in summary_path.read_text(encoding='utf-8')
+    collapsed_path = summary_path.with_suffix(".collapsed")
+    assert collapsed_path.read_text(encoding='utf-8').strip() == (
+        "main (app.py:1);work (app.py:10) 3"
+    )
+
+
+def test_enforce_disk_quota_removes_oldest(tmp_path):
+    """파일 수 한도를 넘으면 오래된 파일부터 삭제되는지 테스트"""
+    for i in range(5):
+        path = tmp_path / f"profile_{i}.txt"
+        path.write_text("x")
+        mtime = time.time() - (10 - i)
+        os.utime(path, (mtime, mtime))
+
+    _enforce_disk_quota(tmp_path, max_files=2, max_total_mb=100)
+
+    remaining = sorted(path.name for path in tmp_path.iterdir())
+    assert remaining == ["profile_3.txt", "profile_4.txt"]
+
+
+def test_profile_request_disabled_writes_nothing(tmp_path):
+    """프로파일러가 꺼져 있으면 파일을 생성하지 않는지 테스트"""
+    config = replace(settings.profiling, enabled=False, output_dir=str(tmp_path))
+    with patch.object(type(settings), 'profiling', config):
+        with profile_request("req1", "test"):
+            busy_function(0.01)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_profile_request_sampled(tmp_path):
+    """샘플링된 요청의 프로파일이 저장되는지 테스트"""
+    config = replace(
+        settings.profiling,
+        enabled=True,
+        sample_rate=1.0,
+        sampling_interval_ms=1,
+        output_dir=str(tmp_path)
+    )
+    with patch.object(type(settings), 'profiling', config):
+        with profile_request("req2", "test"):
+            busy_function(0.02)
+
+    names = sorted(path.suffix for path in tmp_path.iterdir())
+    assert names == [".collapsed", ".txt"]
@@ -0,0 +1,70 @@
+"""
+요청 단위 프로파일링 테스트
+"""
+import time
+
+from fastapi.testclient import TestClient
+
+from bookstar.main import app
+from bookstar.utils.profiling import (
+    end_request_timings,
+    get_current_timings,
+    span,
+    start_request_timings,
+)
+
+
+def test_span_outside_request_is_noop():
+    """요청 컨텍스트 밖에서는 span이 아무 것도 기록하지 않는지 테스트"""
+    assert get_current_timings() is None
+
+    with span("content"):
+        pass
+
+    assert get_current_timings() is None
+
+
+def test_span_accumulates_per_request():
+    """같은 단계가 여러 번 실행되면 소요시간이 합산되는지 테스트"""
+    timings, token = start_request_timings("req-1")
+    try:
+        with span("content"):
+            time.sleep(0.005)
+        with span("content"):
+            time.sleep(0.005)
+        with span("collaborative"):
+            pass
+    finally:
+        end_request_timings(token)
+
+    assert set(timings.spans) == {"content", "collaborative"}
+    assert timings.spans["content"] >= 10
+    assert get_current_timings() is None
+
+
+def test_record_query_and_header():
+    """DB 쿼리 집계와 Server-Timing 헤더 형식 테스트"""
+    timings, token = start_request_timings("req-2")
+    end_request_timings(token)
+
+    timings.add_span("member_book", 1.5)
+    timings.record_query(2.0, 10)
+    timings.record_query(3.0, -1)  # rowcount를 모르는 드라이버
+
+    header = timings.server_timing_header(12.345)
+
+    assert "member_book;dur=1.50" in header
+    assert 'db;desc="2 queries, 10 rows";dur=5.00' in header
+    assert header.endswith("total;dur=12.35")
+    assert timings.to_dict()["db_queries"] == 2
+
+
+def test_server_timing_header_in_response():
+    """HTTP 응답에 Server-Timing 헤더가 포함되는지 테스트"""
+    client = TestClient(app)
+
+    response = client.get("/openapi.json")
+
+    assert response.status_code == 200
+    assert "X-Request-ID" in response.headers
+    assert "total;dur=" in response.headers["Server-Timing"]
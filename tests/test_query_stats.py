@@ -0,0 +1,87 @@
+"""
+SQL 쿼리 지문/통계 테스트
+"""
+from sqlalchemy import create_engine, text
+
+from bookstar.database.query_stats import (
+    QueryStats,
+    fingerprint,
+    format_parameters,
+    query_stats,
+)
+from bookstar.utils.profiling import end_request_timings, start_request_timings
+
+
+def test_fingerprint_collapses_literals_and_in_lists():
+    """리터럴과 길이가 다른 IN 목록이 같은 지문으로 모이는지 테스트"""
+    short = fingerprint(
+        "SELECT book.id FROM book WHERE book.alading_book_id IN "
+        "(%(id_1_1)s, %(id_1_2)s)"
+    )
+    long = fingerprint(
+        "SELECT book.id FROM book\n WHERE book.alading_book_id IN "
+        "(%(id_1_1)s, %(id_1_2)s, %(id_1_3)s, %(id_1_4)s)"
+    )
+    assert short == long
+    assert short == "SELECT book.id FROM book WHERE book.alading_book_id IN (...)"
+
+    assert fingerprint("SELECT * FROM member WHERE id = 42 AND name = 'kim'") == (
+        "SELECT * FROM member WHERE id = ? AND name = ?"
+    )
+    assert fingerprint("SELECT anon_1.id FROM t WHERE x = ?") == (
+        "SELECT anon_1.id FROM t WHERE x = ?"
+    )
+
+
+def test_format_parameters_truncates_large_lists():
+    """큰 파라미터 목록이 앞부분만 요약되는지 테스트"""
+    summary = format_parameters(list(range(100_000)))
+    assert len(summary) < 100
+    assert summary.endswith("...]")
+
+
+def test_query_stats_aggregates():
+    """지문별 횟수, 누적 시간, 최대 시간 집계 테스트"""
+    stats = QueryStats()
+    stats.record("SELECT ?", 1.0)
+    stats.record("SELECT ?", 3.0)
+    stats.record("UPDATE t SET x = ?", 10.0)
+
+    snapshot = stats.snapshot()
+    assert snapshot[0]['fingerprint'] == "UPDATE t SET x = ?"
+    assert snapshot[1] == {
+        'fingerprint': "SELECT ?",
+        'count': 2,
+        'total_ms': 4.0,
+        'avg_ms': 2.0,
+        'max_ms': 3.0,
+    }
+
+    stats.reset()
+    assert stats.snapshot() == []
+
+
+def test_query_stats_caps_fingerprints():
+    """지문 개수 상한을 넘는 새 지문은 무시되는지 테스트"""
+    stats = QueryStats(max_fingerprints=1)
+    stats.record("SELECT 1", 1.0)
+    stats.record("SELECT 2", 1.0)
+    assert len(stats.snapshot()) == 1
+
+
+def test_engine_hooks_record_per_request_queries():
+    """엔진 이벤트 훅이 지문 통계와 요청 단위 쿼리 수를 기록하는지 테스트"""
+    engine = create_engine("sqlite://")
+    query_stats.reset()
+
+    timings, token = start_request_timings("req-n1")
+    try:
+        with engine.connect() as conn:
+            for book_id in range(3):
+                conn.execute(text(f"SELECT {book_id}"))
+    finally:
+        end_request_timings(token)
+
+    assert timings.db_queries == 3
+    assert timings.query_fingerprints == {"SELECT ?": 3}
+    assert query_stats.snapshot()[0]['count'] == 3
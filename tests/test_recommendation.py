@@ -1,19 +1,33 @@
 """
 추천 시스템 테스트
 """
+import time
+from concurrent.futures import Future
+from dataclasses import replace
 from unittest.mock import MagicMock, patch
 
 import pandas as pd
 import pytest
+from sqlalchemy.exc import OperationalError
 
 from bookstar.config import settings
+from bookstar.services import catalog
 from bookstar.services.recommendation import (
+    DegradedRecommendations,
     RecommendationService,
     calculate_author_weight,
     calculate_category_weight,
+    get_db_breaker,
     get_similar_users,
     get_user_preference_categories,
     recommend_books,
+    reset_db_breaker,
+    retry_with_own_budget,
+)
+from bookstar.utils.deadline import (
+    DeadlineExceeded,
+    deadline_scope,
+    get_current_deadline,
 )
 
 
@@ -331,4 +345,184 @@ def test_recommendation_service_caching():
         assert result1 == result2
         # DB 호출이 한 번만 이루어졌는지 확인
         # 캐시 때문에 두 번째는 호출되지 않을 수 있음
-        assert mock_books.call_count <= 2 
\ No newline at end of file
+        assert mock_books.call_count <= 2 
+
+def test_open_circuit_serves_popular_books_without_db(synthetic_session):
+    """DB 오류가 쌓이면 회로가 열려 DB 없이 인기순 대체 추천을 반환하는지 테스트"""
+    catalog.load_snapshots(synthetic_session)
+    failing_db = MagicMock()
+    failing_db.query.side_effect = OperationalError("SELECT", {}, Exception("down"))
+    failing_db.execute.side_effect = failing_db.query.side_effect
+    config = replace(settings.circuit_breaker, failure_threshold=2, open_s=60.0)
+    # 인기순 상위 도서를 이미 읽은 것으로 둠 (제외하지 않으면 그대로 추천됨)
+    snapshot = catalog.get_catalog()
+    read_rows = snapshot.popular_rows[:3]
+    known = [str(aladin_id) for aladin_id in snapshot.aladin_ids[read_rows]]
+    read_book_ids = {int(book_id) for book_id in snapshot.book_ids[read_rows]}
+    reset_db_breaker()
+    try:
+        with patch.object(type(settings), 'circuit_breaker', config):
+            for _ in range(2):
+                result = recommend_books(failing_db, 1, known, [], 5)
+                assert isinstance(result, DegradedRecommendations)
+            assert get_db_breaker().stats()['state'] == 'open'
+
+            calls = failing_db.query.call_count + failing_db.execute.call_count
+            result = recommend_books(failing_db, 1, known, [], 5)
+
+            assert failing_db.query.call_count + failing_db.execute.call_count == calls
+            assert result.degraded == ('database',)
+            assert len(result) == 5
+            assert not {book['book_id'] for book in result} & read_book_ids
+            assert get_db_breaker().stats()['rejected'] == 1
+    finally:
+        reset_db_breaker()
+        catalog.reset_snapshots()
+
+
+def test_slow_computation_is_not_counted_as_slow_db_call(synthetic_session):
+    """추천 계산이 오래 걸려도 회로 차단기의 느린 호출(실패)로 세지 않는지 테스트"""
+    config = replace(
+        settings.circuit_breaker, failure_threshold=1, slow_call_ms=1.0
+    )
+    content = RecommendationService.get_content_based_recommendations
+
+    def slow_content(self, *args):
+        time.sleep(0.01)
+        return content(self, *args)
+
+    reset_db_breaker()
+    try:
+        with patch.object(type(settings), 'circuit_breaker', config), patch.object(
+            RecommendationService, 'get_content_based_recommendations', slow_content
+        ):
+            result = recommend_books(synthetic_session, 1, [], [], 5)
+        assert not isinstance(result, DegradedRecommendations)
+        assert get_db_breaker().stats()['state'] == 'closed'
+        assert get_db_breaker().stats()['slow_calls'] == 0
+    finally:
+        reset_db_breaker()
+
+
+def test_expired_deadline_skips_or_caches_collaborative(synthetic_session):
+    """예산을 다 쓰면 협업 필터링을 캐시로 계산하거나 생략하는지 테스트"""
+    catalog.load_snapshots(synthetic_session)
+    content = RecommendationService.get_content_based_recommendations
+
+    def spend_budget(self, *args):
+        # 콘텐츠 기반 단계가 예산을 모두 쓴 것으로 만듦
+        result = content(self, *args)
+        get_current_deadline().started_at = 0.0
+        return result
+
+    try:
+        service = RecommendationService(synthetic_session)
+        user_id = next(
+            uid for uid in catalog.get_neighbor_index().member_ids.tolist()
+            if service.get_user_books_data(int(uid))[0]
+        )
+        read_list, want_list = service.get_user_books_data(user_id)
+
+        spent = patch.object(
+            RecommendationService, 'get_content_based_recommendations', spend_budget
+        )
+        with spent:
+            skipped = recommend_books(
+                synthetic_session, user_id, read_list, want_list, 10,
+                deadline_ms=60_000,
+            )
+        assert isinstance(skipped, DegradedRecommendations)
+        assert skipped.degraded == ('collaborative',)
+
+        full = recommend_books(synthetic_session, user_id, read_list, want_list, 10)
+        with spent:
+            cached = recommend_books(
+                synthetic_session, user_id, read_list, want_list, 10,
+                deadline_ms=60_000,
+            )
+        assert not isinstance(cached, DegradedRecommendations)
+        assert cached == full
+    finally:
+        catalog.reset_snapshots()
+
+
+def test_small_remaining_budget_skips_heavy_stages(synthetic_session):
+    """남은 예산이 모자라면 콘텐츠 점수 계산과 KNN 구축을 시작하지 않는지 테스트"""
+    service = RecommendationService(synthetic_session)
+    user_id = next(
+        uid for uid in range(1, 50) if service.get_user_books_data(uid)[0]
+    )
+    read_list, want_list = service.get_user_books_data(user_id)
+    with patch.object(
+        RecommendationService, '_build_user_books_data'
+    ) as build_user_books:
+        result = recommend_books(
+            synthetic_session, user_id, read_list, want_list, 10, deadline_ms=1e-6
+        )
+    build_user_books.assert_not_called()
+    assert isinstance(result, DegradedRecommendations)
+    assert result.degraded == ('content', 'collaborative')
+    assert len(result) == 10
+
+
+def test_statement_timeout_skips_only_that_stage(synthetic_session):
+    """쿼리가 시간 예산으로 중단되면 그 단계만 생략하고 차단기에는 안 세는지 테스트"""
+    catalog.load_snapshots(synthetic_session)
+    config = replace(settings.circuit_breaker, failure_threshold=1)
+    reset_db_breaker()
+    try:
+        service = RecommendationService(synthetic_session)
+        user_id = next(
+            uid for uid in catalog.get_neighbor_index().member_ids.tolist()
+            if service.get_user_books_data(int(uid))[0]
+        )
+        read_list, want_list = service.get_user_books_data(user_id)
+        with patch.object(type(settings), 'circuit_breaker', config), patch.object(
+            RecommendationService, 'get_collaborative_recommendations',
+            side_effect=DeadlineExceeded(300, 310),
+        ):
+            result = recommend_books(
+                synthetic_session, user_id, read_list, want_list, 10,
+                deadline_ms=60_000,
+            )
+            assert isinstance(result, DegradedRecommendations)
+            assert result.degraded == ('collaborative',)
+            assert len(result) == 10
+            assert get_db_breaker().stats()['state'] == 'closed'
+            assert get_db_breaker().stats()['failures'] == 0
+    finally:
+        reset_db_breaker()
+        catalog.reset_snapshots()
+
+
+def _done(result=None, error=None):
+    future = Future()
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+    return future
+
+
+def test_coalesced_requests_retry_with_own_budget():
+    """앞선 요청의 예산 부족 결과는 예산이 남은 요청만 다시 계산하는지 테스트"""
+    timed_out = _done(error=DeadlineExceeded(100, 120))
+    skipped = _done(DegradedRecommendations([], degraded=('collaborative',)))
+    breaker_open = _done(DegradedRecommendations([], degraded=('database',)))
+    complete = _done([{'book_id': 1}])
+
+    with deadline_scope(10_000):
+        assert retry_with_own_budget(timed_out)
+        assert retry_with_own_budget(skipped)
+        assert not retry_with_own_budget(breaker_open)
+        assert not retry_with_own_budget(complete)
+        assert not retry_with_own_budget(_done(error=OperationalError("", {}, None)))
+    # 요청 밖(제한 없음)에서도 다시 계산
+    assert retry_with_own_budget(skipped)
+
+    # 이 요청도 예산이 모자라면 받은 결과를 그대로 사용
+    config = replace(settings.recommendation, min_stage_budget_ms=50)
+    with patch.object(type(settings), 'recommendation', config):
+        with deadline_scope(1):
+            time.sleep(0.005)
+            assert not retry_with_own_budget(timed_out)
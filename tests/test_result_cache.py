@@ -0,0 +1,106 @@
+"""
+추천 결과 캐시(stale-while-revalidate) 테스트
+"""
+import threading
+
+import pytest
+
+from bookstar.services.result_cache import ResultCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+    cache = ResultCache(
+        soft_ttl_s=10, hard_ttl_s=60, max_entries=3,
+        refresh_concurrency=1, clock=clock,
+    )
+    yield cache
+    cache.close()
+
+
+def test_lookup_states_follow_soft_and_hard_ttl(cache, clock):
+    """soft TTL 전에는 fresh, 사이에는 stale, hard TTL 후에는 miss인지 테스트"""
+    assert cache.lookup("a") == (None, 'miss')
+    cache.store("a", [1])
+
+    clock.now = 9.9
+    assert cache.lookup("a") == ([1], 'fresh')
+    clock.now = 10
+    assert cache.lookup("a") == ([1], 'stale')
+    clock.now = 60
+    assert cache.lookup("a") == (None, 'miss')
+
+    stats = cache.stats()
+    assert (stats['hits'], stats['stale_hits'], stats['misses']) == (1, 1, 2)
+
+
+def test_refresh_runs_once_per_key_in_background(cache, clock):
+    """stale 항목의 갱신은 키당 하나만 예약되고 끝나면 fresh가 되는지 테스트"""
+    cache.store("a", [1])
+    clock.now = 30
+    started, release, calls = threading.Event(), threading.Event(), []
+
+    def compute():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return [2]
+
+    assert cache.refresh("a", compute)
+    started.wait(5)
+    # 갱신 중에도 오래된 값을 반환하고 같은 키는 다시 예약하지 않음
+    assert cache.lookup("a") == ([1], 'stale')
+    assert not cache.refresh("a", compute)
+    # 동시 갱신 한도(1)에 도달하면 다른 키도 건너뜀
+    assert not cache.refresh("b", compute)
+    release.set()
+    cache.close()
+
+    assert calls == [1]
+    assert cache.lookup("a") == ([2], 'fresh')
+    stats = cache.stats()
+    assert stats['refreshes'] == 1
+    assert stats['refresh_skipped'] == 1
+    assert stats['refreshing'] == 0
+
+
+def test_failed_refresh_keeps_stale_value(cache, clock):
+    """갱신이 실패하면 오래된 값을 유지하고 다음 요청에서 다시 시도하는지 테스트"""
+    cache.store("a", [1])
+    clock.now = 30
+
+    def fail():
+        raise RuntimeError("db down")
+
+    assert cache.refresh("a", fail)
+    cache.close()
+
+    assert cache.lookup("a") == ([1], 'stale')
+    assert cache.stats()['refresh_errors'] == 1
+    assert cache.stats()['refreshing'] == 0
+
+
+def test_expire_marks_entries_stale_and_lru_evicts(cache, clock):
+    """expire()가 항목을 stale로 표시하고 한도 초과 시 LRU로 제거하는지 테스트"""
+    for key in "abc":
+        cache.store(key, [key])
+    cache.expire()
+    assert cache.lookup("a") == (["a"], 'stale')
+
+    cache.store("d", ["d"])  # b가 가장 오래 안 쓴 항목
+    assert cache.lookup("b") == (None, 'miss')
+    assert cache.lookup("a")[1] == 'stale'
+    assert cache.stats()['entries'] == 3
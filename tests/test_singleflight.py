@@ -0,0 +1,145 @@
+"""
+동시 요청 합치기(singleflight) 테스트
+"""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from bookstar.utils import singleflight
+from bookstar.utils.singleflight import SingleFlight
+
+
+def _blocking(started: threading.Event, release: threading.Event, calls: list):
+    def compute(value):
+        calls.append(value)
+        started.set()
+        release.wait(5)
+        return [value]
+    return compute
+
+
+def test_concurrent_calls_share_one_computation():
+    """같은 키의 동시 호출은 한 번만 계산하고 같은 결과를 받는지 테스트"""
+    group = SingleFlight("test")
+    started, release, calls = threading.Event(), threading.Event(), []
+    compute = _blocking(started, release, calls)
+
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        leader = pool.submit(group.do, "user:1", compute, 1)
+        started.wait(5)
+        followers = [pool.submit(group.do, "user:1", compute, 1) for _ in range(3)]
+        other = pool.submit(group.do, "user:2", lambda: "other")
+        assert other.result(5) == "other"
+        while group.stats()['coalesced'] < 3:
+            threading.Event().wait(0.001)
+        release.set()
+        results = [leader.result(5)] + [f.result(5) for f in followers]
+
+    assert calls == [1]
+    assert all(result is results[0] for result in results)
+    assert group.stats() == {
+        'calls': 2, 'coalesced': 3, 'errors': 0, 'retries': 0, 'in_flight': 0
+    }
+
+    # 끝난 뒤의 호출은 새로 계산
+    assert group.do("user:1", lambda: "fresh") == "fresh"
+
+
+def test_errors_propagate_to_waiters():
+    """먼저 시작한 계산의 예외가 기다리던 호출에도 전달되는지 테스트"""
+    group = SingleFlight("test")
+    started, release = threading.Event(), threading.Event()
+
+    def fail():
+        started.set()
+        release.wait(5)
+        raise RuntimeError("db down")
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        leader = pool.submit(group.do, "k", fail)
+        started.wait(5)
+        follower = pool.submit(group.do, "k", fail)
+        while group.stats()['coalesced'] < 1:
+            threading.Event().wait(0.001)
+        release.set()
+        for future in (leader, follower):
+            with pytest.raises(RuntimeError, match="db down"):
+                future.result(5)
+
+    assert group.stats()['errors'] == 1
+    assert group.stats()['in_flight'] == 0
+
+
+def test_waiters_retry_when_retry_if_rejects_result():
+    """retry_if가 True면 기다린 호출이 같은 키로 한 번만 다시 계산하는지 테스트"""
+    group = SingleFlight("test")
+    started, release, calls = threading.Event(), threading.Event(), []
+
+    def compute(budget):
+        calls.append(budget)
+        if budget == "short":
+            started.set()
+            release.wait(5)
+            raise TimeoutError("leader budget")
+        return [budget]
+
+    def retry_if(future):
+        return isinstance(future.exception(), TimeoutError)
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        leader = pool.submit(group.do, "k", compute, "short")
+        started.wait(5)
+        followers = [
+            pool.submit(group.do, "k", compute, "long", retry_if=retry_if)
+            for _ in range(2)
+        ]
+        while group.stats()['coalesced'] < 2:
+            threading.Event().wait(0.001)
+        release.set()
+        with pytest.raises(TimeoutError):
+            leader.result(5)
+        results = [f.result(5) for f in followers]
+
+    assert results == [["long"], ["long"]]
+    assert calls.count("long") <= 2
+    assert group.stats()['retries'] == 2
+
+
+def test_async_callers_coalesce_with_threads():
+    """async 호출과 스레드 호출이 같은 키로 합쳐지는지 테스트"""
+    group = SingleFlight("test")
+    started, release, calls = threading.Event(), threading.Event(), []
+    compute = _blocking(started, release, calls)
+
+    async def scenario():
+        leader = asyncio.create_task(group.do_async("k", compute, 7))
+        await asyncio.to_thread(started.wait, 5)
+        waiters = [asyncio.create_task(group.do_async("k", compute, 7))]
+        await asyncio.sleep(0)
+        thread_waiter = asyncio.create_task(
+            asyncio.to_thread(group.do, "k", compute, 7)
+        )
+        cancelled = asyncio.create_task(group.do_async("k", compute, 7))
+        while group.stats()['coalesced'] < 3:
+            await asyncio.sleep(0.001)
+        cancelled.cancel()
+        release.set()
+        return await asyncio.gather(leader, *waiters, thread_waiter)
+
+    results = asyncio.run(scenario())
+
+    assert calls == [7]
+    assert results == [[7]] * 3
+    assert group.stats()['calls'] == 1
+
+
+def test_registry_snapshot():
+    """이름별 그룹이 한 번만 만들어지고 통계가 노출되는지 테스트"""
+    group = singleflight.get_group("test_registry")
+    assert singleflight.get_group("test_registry") is group
+
+    group.do("k", lambda: None)
+
+    assert singleflight.snapshot()["test_registry"]['calls'] >= 1
@@ -0,0 +1,81 @@
+"""
+합성 데이터 생성기와 벤치마크 도구 테스트
+"""
+from collections import Counter
+
+import pytest
+from sqlalchemy import func
+
+from benchmarks.bench_recommender import compare, summarize
+from benchmarks.synthetic import SCALES, SyntheticConfig
+from bookstar.models.models import Book, Member, MemberBook
+from bookstar.services.recommendation import recommend_books
+
+
+def test_scale_presets():
+    """규모 프리셋으로 설정이 생성되는지 테스트"""
+    for scale, interactions in SCALES.items():
+        config = SyntheticConfig.from_scale(scale)
+        assert config.num_interactions == interactions
+        assert config.num_books < config.num_interactions
+
+    with pytest.raises(ValueError):
+        SyntheticConfig.from_scale("5k")
+
+
+def test_generated_dataset_shape(synthetic_session):
+    """생성된 데이터의 개수와 편향(인기도 쏠림, cold-start 회원)을 테스트"""
+    db = synthetic_session
+    assert db.query(func.count(Book.id)).scalar() == 120
+    assert db.query(func.count(Member.id)).scalar() == 40
+    assert db.query(func.count(MemberBook.id)).scalar() == 600
+
+    # (회원, 도서) 쌍은 중복되지 않음
+    pairs = db.query(MemberBook.member_id, MemberBook.book_id).all()
+    assert len(set(pairs)) == len(pairs)
+
+    # 이력이 없는 cold-start 회원이 존재
+    active = {member_id for member_id, _ in pairs}
+    assert len(active) < 40
+
+    # Zipf 인기도: 가장 인기 있는 도서가 평균보다 훨씬 많이 읽힘
+    popularity = Counter(book_id for _, book_id in pairs)
+    assert popularity.most_common(1)[0][1] > 3 * (600 / 120)
+
+
+def test_recommend_books_on_synthetic_data(synthetic_session):
+    """합성 데이터로 하이브리드 추천이 끝까지 실행되는지 테스트"""
+    db = synthetic_session
+    user_id, = (
+        db.query(MemberBook.member_id)
+        .group_by(MemberBook.member_id)
+        .order_by(func.count().desc())
+        .first()
+    )
+    rows = (
+        db.query(MemberBook.book_id, MemberBook.reading_status)
+        .filter(MemberBook.member_id == user_id)
+        .all()
+    )
+    read_list = [str(bid) for bid, status in rows if status.value != "WANT_TO_READ"]
+    want_list = [str(bid) for bid, status in rows if status.value == "WANT_TO_READ"]
+
+    recommendations = recommend_books(db, user_id, read_list, want_list, 5)
+
+    assert 0 < len(recommendations) <= 5
+    book_ids = {book_id for book_id, in db.query(Book.id).all()}
+    assert all(rec['book_id'] in book_ids for rec in recommendations)
+
+
+def test_summarize_and_compare():
+    """백분위수 요약과 기준선 비교 출력 테스트"""
+    summary = summarize([1.0, 2.0, 3.0, 4.0, 100.0])
+    assert summary['n'] == 5
+    assert summary['p50_ms'] == 3.0
+    assert summary['max_ms'] == 100.0
+
+    current = {'results': {'f': {'cold': summary, 'warm': summary}}}
+    baseline = {'results': {'f': {'cold': summary, 'warm': summary}}}
+    lines = compare(current, baseline)
+    assert len(lines) == 4
+    assert all("+0.0%" in line for line in lines)
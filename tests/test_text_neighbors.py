@@ -0,0 +1,39 @@
+"""
+제목/소개 TF-IDF 유사 도서 목록 테스트
+"""
+import numpy as np
+
+from bookstar.services import catalog, text_neighbors
+
+
+def test_chunked_build_matches_single_chunk(synthetic_session):
+    """작은 청크로 스트리밍해도 한 번에 읽은 것과 같은 행렬이 되는지 테스트"""
+    snapshot = catalog.build_catalog(synthetic_session)
+
+    whole = text_neighbors.tfidf_matrix(synthetic_session, snapshot, chunk_size=1000)
+    chunked = text_neighbors.tfidf_matrix(synthetic_session, snapshot, chunk_size=17)
+
+    assert whole.shape[0] == snapshot.size
+    assert abs(whole - chunked).max() < 1e-6
+    norms = np.sqrt(np.asarray(whole.multiply(whole).sum(axis=1)).ravel())
+    assert np.allclose(norms[norms > 0], 1.0, atol=1e-5)
+
+
+def test_top_similar_matches_dense_cosine(synthetic_session):
+    """미리 계산한 유사 도서가 밀집 코사인 유사도 순위와 같은지 테스트"""
+    snapshot = catalog.build_catalog(synthetic_session)
+    matrix = text_neighbors.tfidf_matrix(synthetic_session, snapshot)
+    dense = (matrix @ matrix.T).toarray()
+
+    neighbors, scores = text_neighbors.top_similar(matrix, 5, block_rows=16)
+
+    assert neighbors.shape == scores.shape == (snapshot.size, 5)
+    assert neighbors.dtype == np.int32 and scores.dtype == np.float16
+    for row in range(0, snapshot.size, 9):
+        similarity = dense[row].copy()
+        similarity[row] = 0
+        candidates = np.flatnonzero(similarity > 0)
+        expected = candidates[np.lexsort((candidates, -similarity[candidates]))][:5]
+        found = neighbors[row][neighbors[row] >= 0]
+        assert found.tolist() == expected.tolist()
+        assert np.allclose(scores[row, :len(found)], similarity[found], atol=1e-3)
@@ -0,0 +1,134 @@
+"""
+RecommenderModel 오프라인 학습 테스트
+"""
+from dataclasses import replace
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from torch.utils.data import DataLoader
+
+from benchmarks.synthetic import SyntheticConfig, create_sqlite_engine, generate_dataset
+from bookstar.config import settings
+from bookstar.jobs import train as train_job
+from bookstar.models.models import Member, MemberBook
+from bookstar.services import model_registry
+from bookstar.services.catalog import build_catalog
+from bookstar.services.model_registry import LocalModelStore, ModelRegistry
+
+
+@pytest.fixture
+def registry(tmp_path):
+    registry = ModelRegistry(LocalModelStore(tmp_path / "models"))
+    model_registry.set_registry(registry)
+    yield registry
+    model_registry.set_registry(None)
+
+
+def _stream_members(engine, split, num_workers=0):
+    with Session(engine) as db:
+        snapshot = build_catalog(db)
+    stream = train_job.InteractionStream(engine, snapshot.aladin_map, split)
+    loader = DataLoader(
+        stream, batch_size=4, num_workers=num_workers,
+        collate_fn=train_job._collate_columns,
+    )
+    return [item for batch in loader for item in batch], snapshot
+
+
+def test_split_holdout_is_deterministic():
+    """같은 회원은 항상 같은 입력/정답으로 나뉘는지 테스트"""
+    columns = np.arange(10)
+
+    inputs, hidden = train_job.split_holdout(3, columns)
+
+    assert len(hidden) == 2
+    assert sorted(np.concatenate([inputs, hidden]).tolist()) == columns.tolist()
+    again_inputs, again_hidden = train_job.split_holdout(3, columns)
+    assert again_hidden.tolist() == hidden.tolist()
+    assert len(train_job.split_holdout(3, np.array([5]))[1]) == 0
+
+
+def test_stream_matches_database(synthetic_engine, synthetic_session):
+    """스트리밍한 회원별 열 번호가 DB 상호작용과 같은지 테스트"""
+    train_rows, snapshot = _stream_members(synthetic_engine, "train")
+    eval_rows, _ = _stream_members(synthetic_engine, "eval")
+
+    pairs = synthetic_session.execute(
+        select(MemberBook.member_id, MemberBook.book_id)
+        .join(Member, Member.id == MemberBook.member_id)
+    ).all()
+    expected: dict[int, set[int]] = {}
+    for member_id, book_id in pairs:
+        row = snapshot.aladin_map.get(book_id)
+        if row is not None:
+            expected.setdefault(member_id, set()).add(row)
+    train_expected = sorted(
+        sorted(columns) for mid, columns in expected.items() if mid % 10 != 0
+    )
+
+    assert sorted(row.tolist() for row in train_rows) == train_expected
+    assert eval_rows
+    for inputs, hidden in eval_rows:
+        assert len(hidden) >= 1
+        assert not set(inputs.tolist()) & set(hidden.tolist())
+
+
+def test_stream_shards_across_workers(tmp_path):
+    """DataLoader 워커들이 회원을 중복/누락 없이 나눠 읽는지 테스트"""
+    engine = create_sqlite_engine(tmp_path / "train.sqlite")
+    generate_dataset(engine, SyntheticConfig(
+        num_interactions=300, num_books=60, num_members=30, num_authors=10, seed=3
+    ))
+    try:
+        single, _ = _stream_members(engine, "train")
+        sharded, _ = _stream_members(engine, "train", num_workers=2)
+    finally:
+        engine.dispose()
+
+    assert sorted(row.tolist() for row in sharded) == sorted(
+        row.tolist() for row in single
+    )
+
+
+def test_train_checkpoints_and_registers_model(tmp_path, synthetic_engine, registry):
+    """학습 결과가 체크포인트/레지스트리에 저장되고 이어서 학습되는지 테스트"""
+    config = replace(settings.training, checkpoint_every=2, num_workers=0)
+    with patch.object(type(settings), 'training', config):
+        summary = train_job.train(
+            synthetic_engine, epochs=3, checkpoint_dir=tmp_path / "ckpt"
+        )
+        assert (tmp_path / "ckpt" / train_job.CHECKPOINT_FILE).exists()
+        assert registry.resolve() == summary['version']
+        meta = registry.metadata(summary['version'])
+        assert meta['metadata']['metrics']['eval_users'] > 0
+        assert 'recall@10' in summary['metrics']
+
+        resumed = train_job.train(
+            synthetic_engine, epochs=4, checkpoint_dir=tmp_path / "ckpt",
+            resume=True, promote=False,
+        )
+    assert resumed['resumed_from_epoch'] == 3
+    assert registry.resolve() == summary['version']
+    assert registry.load(resumed['version']).fc1.in_features == summary['num_books']
+
+
+def test_train_factorization_model(tmp_path, synthetic_engine, registry):
+    """model_type=factorization이면 양자화된 ALS 모델을 저장하는지 테스트"""
+    config = replace(
+        settings.training, num_workers=0, als_iterations=3, factors=8,
+        quantization="int8",
+    )
+    with patch.object(type(settings), 'training', config):
+        summary = train_job.train(
+            synthetic_engine, checkpoint_dir=tmp_path, model_type="factorization"
+        )
+
+    model = registry.load()
+    assert summary['model_type'] == "factorization"
+    assert model.quantization == "int8"
+    assert model.num_books == summary['num_books']
+    assert summary['metrics']['eval_users'] > 0
+    assert not (tmp_path / train_job.CHECKPOINT_FILE).exists()
@@ -0,0 +1,83 @@
+"""
+워밍업 및 준비 상태 테스트
+"""
+from contextlib import contextmanager
+
+from fastapi.testclient import TestClient
+
+from bookstar.config import settings
+from bookstar.main import app
+from bookstar.services import catalog
+from bookstar.services.recommendation import _similar_users_cache
+from bookstar.services.result_cache import get_result_cache, reset_result_cache
+from bookstar.services.warmup import (
+    WarmupState,
+    run_warmup,
+    top_active_members,
+    warmup_state,
+)
+
+
+def test_run_warmup_loads_snapshots(synthetic_session):
+    """워밍업이 스냅샷을 로드하고 상위 회원 추천을 미리 계산하는지 테스트"""
+    @contextmanager
+    def session_scope():
+        yield synthetic_session
+
+    state = WarmupState()
+    reset_result_cache()
+    try:
+        run_warmup(session_scope, precompute_top_members=3, state=state)
+
+        assert state.status == "ready"
+        assert state.is_ready
+        assert catalog.get_catalog() is not None
+        assert catalog.get_neighbor_index() is not None
+        assert state.details['precomputed_members'] == 3
+        assert set(state.steps_ms) == {"imports", "snapshots", "precompute"}
+        assert _similar_users_cache
+        # 미리 계산한 추천은 /recommend_books와 같은 키로 결과 캐시에 저장
+        assert state.details['cached_results'] == 3
+        count = settings.recommendation.default_recommendations_count
+        for member_id in top_active_members(synthetic_session, 3):
+            recommendations, cache_state = get_result_cache().lookup(
+                (member_id, count)
+            )
+            assert cache_state == 'fresh'
+            assert recommendations
+    finally:
+        reset_result_cache()
+        catalog.reset_snapshots()
+
+
+def test_run_warmup_failure_is_degraded():
+    """워밍업이 실패해도 degraded 상태로 준비 완료 처리되는지 테스트"""
+    @contextmanager
+    def broken_scope():
+        raise ConnectionError("db down")
+        yield
+
+    state = WarmupState()
+    run_warmup(broken_scope, state=state)
+
+    assert state.status == "degraded"
+    assert state.is_ready
+    assert "db down" in state.error
+
+
+def test_ready_endpoint():
+    """워밍업 전에는 503, 끝나면 200을 반환하는지 테스트"""
+    client = TestClient(app)
+    try:
+        warmup_state.reset()
+        assert client.get("/ready").status_code == 503
+
+        warmup_state.mark("running")
+        assert client.get("/ready").json()['status'] == "running"
+
+        warmup_state.mark("ready")
+        response = client.get("/ready")
+        assert response.status_code == 200
+        assert response.json()['ready'] is True
+    finally:
+        warmup_state.reset()